@@ -0,0 +1,174 @@
+"""
+Measure repository throughput when several threads share it.
+
+Runs reads (and optionally one writing thread) against a shared task
+repository from 1, 2, 4 and 8 threads, once with the reader/writer lock
+the repositories use and once with a plain exclusive lock in its place.
+In-memory reads are bound by the GIL, so they mostly show the locking
+overhead; SQLite releases the GIL while a statement runs, so file
+databases show how far reads scale.
+
+Usage:
+    python benchmarks/bench_contention.py [--count N] [--seconds S] [--backend memory|sqlite|all]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.config import settings  # noqa: E402
+from todolist.models.task import Task, TaskStatus  # noqa: E402
+from todolist.repositories.sqlite_database import connect  # noqa: E402
+from todolist.repositories.sqlite_task_repository import SQLiteTaskRepository  # noqa: E402
+from todolist.repositories.task_repository import TaskRepository  # noqa: E402
+
+THREAD_COUNTS = (1, 2, 4, 8)
+PROJECTS = 100
+
+
+class ExclusiveLock:
+    """ReadWriteLock stand-in that lets one thread in at a time."""
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._lock = threading.RLock()
+        self._owner = None
+
+    def acquire_read(self) -> None:
+        """Take the lock."""
+        self.acquire_write()
+
+    def release_read(self) -> None:
+        """Release the lock."""
+        self.release_write()
+
+    def acquire_write(self) -> None:
+        """Take the lock."""
+        self._lock.acquire()
+        self._owner = threading.get_ident()
+
+    def release_write(self) -> None:
+        """Release the lock."""
+        self._lock.release()
+
+    def owns_write(self) -> bool:
+        """Return False; reads may use the per-thread SQLite connections."""
+        return False
+
+    @contextmanager
+    def read(self):
+        """Hold the lock for the duration of a with block."""
+        with self._lock:
+            yield
+
+    write = read
+
+
+def _make_tasks(count: int, seed: int = 42) -> list[Task]:
+    """Build tasks spread over a fixed number of projects."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    statuses = TaskStatus.values()
+    return [
+        Task.from_record(
+            id=index + 1,
+            title=f"Task {index}",
+            project_id=index % PROJECTS + 1,
+            description="benchmark task",
+            status=rng.choice(statuses),
+            deadline=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def _run(repository, threads: int, seconds: float, writer: bool) -> tuple[float, float]:
+    """Run reader threads (and one writer) for a while; return reads/s and writes/s."""
+    stop = threading.Event()
+    count = repository.count()
+    reads = [0] * threads
+    writes = [0]
+
+    def read(slot: int) -> None:
+        rng = random.Random(slot)
+        while not stop.is_set():
+            repository.get_by_id(rng.randint(1, count))
+            repository.count_by_status()
+            reads[slot] += 2
+
+    def write() -> None:
+        rng = random.Random(-1)
+        tasks = repository.get_by_project_id(1)
+        while not stop.is_set():
+            task = rng.choice(tasks)
+            task.update_status(rng.choice(TaskStatus.values()))
+            repository.update(task)
+            writes[0] += 1
+
+    workers = [threading.Thread(target=read, args=(slot,)) for slot in range(threads)]
+    if writer:
+        workers.append(threading.Thread(target=write))
+    for worker in workers:
+        worker.start()
+    time.sleep(seconds)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    return sum(reads) / seconds, writes[0] / seconds
+
+
+def _report(name: str, repository, seconds: float) -> None:
+    """Print throughput per thread count for both kinds of lock."""
+    shared_lock = repository._lock
+    print(f"{name}:")
+    print(f"  {'threads':>7} {'lock':>9} {'reads/s':>12} {'mixed reads/s':>14} {'writes/s':>10}")
+    for threads in THREAD_COUNTS:
+        for label, lock in (("rw", shared_lock), ("exclusive", ExclusiveLock())):
+            repository._lock = lock
+            reads, _ = _run(repository, threads, seconds, writer=False)
+            mixed_reads, writes = _run(repository, threads, seconds, writer=True)
+            print(
+                f"  {threads:>7} {label:>9} {reads:>12,.0f} {mixed_reads:>14,.0f} {writes:>10,.0f}"
+            )
+    repository._lock = shared_lock
+
+
+def main() -> None:
+    """Run the measurement and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    parser.add_argument("--backend", choices=("memory", "sqlite", "all"), default="all")
+    args = parser.parse_args()
+    settings.max_number_of_task = args.count
+
+    tasks = _make_tasks(args.count)
+    print(f"tasks: {args.count}, {args.seconds:g} s per run")
+
+    if args.backend in ("memory", "all"):
+        repository = TaskRepository()
+        repository.add_many(tasks)
+        _report("memory", repository, args.seconds)
+        del repository
+
+    if args.backend in ("sqlite", "all"):
+        with tempfile.TemporaryDirectory() as directory:
+            connection = connect(os.path.join(directory, "bench.db"))
+            repository = SQLiteTaskRepository(connection)
+            repository.add_many(tasks)
+            _report("sqlite (file)", repository, args.seconds)
+            connection.close()
+
+
+if __name__ == "__main__":
+    main()
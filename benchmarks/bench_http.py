@@ -0,0 +1,192 @@
+"""
+Generate load against the HTTP API and report throughput and latency.
+
+Opens a number of keep-alive connections and sends requests on each as
+fast as responses come back, optionally pipelining several requests per
+round trip. Without --port a server on the memory backend is started
+in a subprocess for the duration of the run.
+
+Usage:
+    python benchmarks/bench_http.py [--port P] [--connections C] [--seconds S]
+                                    [--pipeline D] [--mix read|write|mixed]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from typing import Optional
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+def _request(method: str, path: str, body: Optional[dict] = None) -> bytes:
+    """Encode a request with an optional JSON body."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: bench\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    ).encode() + payload
+
+
+async def _response(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    """Read one response and return its status and body."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    status = int(head[9:12])
+    length = 0
+    for line in head.split(b"\r\n"):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line[15:])
+    return status, await reader.readexactly(length)
+
+
+@contextmanager
+def _local_server(tasks: int):
+    """Start an API server on a free port in a subprocess."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    env = dict(
+        os.environ,
+        PYTHONPATH=SRC,
+        STORAGE_BACKEND="memory",
+        MAX_NUMBER_OF_TASK=str(max(tasks * 2, 1000)),
+    )
+    process = subprocess.Popen(
+        [sys.executable, "-m", "todolist.api.server", "--port", str(port)],
+        env=env,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while True:
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=1).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline or process.poll() is not None:
+                    raise RuntimeError("API server did not start")
+                time.sleep(0.05)
+        yield port
+    finally:
+        process.terminate()
+        process.wait()
+
+
+async def _populate(host: str, port: int, tasks: int) -> tuple[int, list[int]]:
+    """Create a project with tasks to run the load against."""
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(_request("POST", "/projects", {"title": f"bench {os.getpid()} {time.time()}"}))
+    status, body = await _response(reader)
+    if status != 201:
+        raise RuntimeError(f"Could not create project: {body.decode()}")
+    project_id = json.loads(body)["id"]
+
+    task_ids = []
+    for start in range(0, tasks, 100):
+        batch = range(start, min(start + 100, tasks))
+        writer.write(b"".join(
+            _request("POST", "/tasks", {"title": f"Task {i}", "project_id": project_id})
+            for i in batch
+        ))
+        for _ in batch:
+            status, body = await _response(reader)
+            if status != 201:
+                raise RuntimeError(f"Could not create task: {body.decode()}")
+            task_ids.append(json.loads(body)["id"])
+    writer.close()
+    return project_id, task_ids
+
+
+def _next_request(rng: random.Random, mix: str, project_id: int, task_ids: list[int]) -> bytes:
+    """Pick the next request for the chosen mix."""
+    task_id = rng.choice(task_ids)
+    roll = rng.random()
+    if mix == "write" or (mix == "mixed" and roll < 0.2):
+        return _request("PATCH", f"/tasks/{task_id}", {"status": rng.choice(("TODO", "DOING", "DONE"))})
+    if mix == "mixed" and roll < 0.3:
+        return _request("GET", f"/projects/{project_id}/summary")
+    if mix == "mixed" and roll < 0.4:
+        return _request("GET", "/tasks?status=DOING&limit=20")
+    return _request("GET", f"/tasks/{task_id}")
+
+
+async def _load(
+    host: str, port: int, connections: int, seconds: float, pipeline: int, mix: str,
+    project_id: int, task_ids: list[int],
+) -> tuple[list[float], int]:
+    """Run the load; return per-request latencies in seconds and the error count."""
+    latencies: list[float] = []
+    errors = [0]
+    stop_at = time.perf_counter() + seconds
+
+    async def client(slot: int) -> None:
+        rng = random.Random(slot)
+        reader, writer = await asyncio.open_connection(host, port)
+        while time.perf_counter() < stop_at:
+            writer.write(b"".join(
+                _next_request(rng, mix, project_id, task_ids) for _ in range(pipeline)
+            ))
+            sent = time.perf_counter()
+            for _ in range(pipeline):
+                status, _ = await _response(reader)
+                latencies.append(time.perf_counter() - sent)
+                if status >= 400:
+                    errors[0] += 1
+        writer.close()
+
+    await asyncio.gather(*(client(slot) for slot in range(connections)))
+    return latencies, errors[0]
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    """Return a percentile of sorted values."""
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main() -> None:
+    """Run the load generator and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="port of a running server (default: start one)")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--pipeline", type=int, default=1, help="requests per round trip")
+    parser.add_argument("--mix", choices=("read", "write", "mixed"), default="mixed")
+    parser.add_argument("--tasks", type=int, default=1000)
+    args = parser.parse_args()
+
+    async def run(port: int):
+        project_id, task_ids = await _populate(args.host, port, args.tasks)
+        started = time.perf_counter()
+        latencies, errors = await _load(
+            args.host, port, args.connections, args.seconds, args.pipeline, args.mix,
+            project_id, task_ids,
+        )
+        return latencies, errors, time.perf_counter() - started
+
+    if args.port is None:
+        with _local_server(args.tasks) as port:
+            latencies, errors, elapsed = asyncio.run(run(port))
+    else:
+        latencies, errors, elapsed = asyncio.run(run(args.port))
+
+    latencies.sort()
+    print(
+        f"connections: {args.connections}, pipeline: {args.pipeline}, "
+        f"mix: {args.mix}, {elapsed:.1f} s"
+    )
+    print(f"  requests: {len(latencies):,} ({errors:,} errors)")
+    print(f"  requests/s: {len(latencies) / elapsed:,.0f}")
+    print(f"  p50: {_percentile(latencies, 0.50) * 1000:.2f} ms")
+    print(f"  p99: {_percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
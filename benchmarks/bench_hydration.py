@@ -0,0 +1,69 @@
+"""
+Measure task hydration throughput.
+
+Compares building tasks through the validating constructor with the
+trusted Task.from_record path used by the persistence layers.
+
+Usage:
+    python benchmarks/bench_hydration.py [--count N] [--repeat R]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.models.task import Task, TaskStatus  # noqa: E402
+
+
+def _make_records(count: int) -> list[dict]:
+    """Build stored-task records with a mix of statuses and deadlines."""
+    statuses = TaskStatus.values()
+    now = datetime.now()
+    deadline = now + timedelta(days=30)
+    return [
+        {
+            "id": index + 1,
+            "title": f"Task {index} with a few more words",
+            "project_id": index % 100,
+            "description": "Benchmark task description " * 5,
+            "status": statuses[index % len(statuses)],
+            "deadline": deadline + timedelta(minutes=index) if index % 2 else None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    """Run the measurement and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    records = _make_records(args.count)
+
+    def construct() -> None:
+        for record in records:
+            Task(**record)
+
+    def hydrate() -> None:
+        for record in records:
+            Task.from_record(**record)
+
+    print(f"tasks: {args.count}")
+    results = {}
+    for label, function in (("Task(...)", construct), ("Task.from_record", hydrate)):
+        best = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        results[label] = best
+        print(f"{label:20}{args.count / best:14,.0f} tasks/s")
+    print(f"speedup: {results['Task(...)'] / results['Task.from_record']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
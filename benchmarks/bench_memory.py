@@ -0,0 +1,117 @@
+"""
+Measure memory used per stored task.
+
+Compares the regular Task dataclass with the compact slotted
+representation by filling a TaskRepository and measuring the traced
+allocations.
+
+Usage:
+    python benchmarks/bench_memory.py [--count N]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.config import settings  # noqa: E402
+from todolist.models.compact import CompactTask  # noqa: E402
+from todolist.models.task import Task, TaskStatus  # noqa: E402
+from todolist.repositories.task_repository import TaskRepository  # noqa: E402
+
+
+def _make_tasks(count: int) -> list[Task]:
+    """Build tasks with a mix of statuses and deadlines."""
+    statuses = TaskStatus.values()
+    deadline = datetime.now() + timedelta(days=30)
+    return [
+        Task(
+            title=f"Task {index}",
+            project_id=index % 100,
+            description="Benchmark task",
+            status=statuses[index % len(statuses)],
+            deadline=deadline + timedelta(minutes=index) if index % 2 else None,
+            id=index + 1,
+        )
+        for index in range(count)
+    ]
+
+
+def measure_models(count: int, compact_models: bool) -> float:
+    """
+    Measure bytes per task object, excluding repository indexes.
+
+    Args:
+        count: Number of tasks to build
+        compact_models: Whether to keep compact tasks
+
+    Returns:
+        Average traced bytes per task
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    tasks = _make_tasks(count)
+    if compact_models:
+        tasks = [CompactTask.from_task(task) for task in tasks]
+    gc.collect()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del tasks
+    return (after - before) / count
+
+
+def measure_repository(count: int, compact_models: bool) -> float:
+    """
+    Measure bytes per task held by a repository.
+
+    Args:
+        count: Number of tasks to store
+        compact_models: Whether the repository stores compact tasks
+
+    Returns:
+        Average traced bytes per task (including indexes)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    repository = TaskRepository(compact_models=compact_models)
+    repository.add_many(_make_tasks(count))
+    gc.collect()
+
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del repository
+    return (after - before) / count
+
+
+def main() -> None:
+    """Run the measurement and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=100_000)
+    args = parser.parse_args()
+    settings.max_number_of_task = args.count
+
+    print(f"tasks: {args.count}")
+    print(f"{'':30}{'Task':>10}{'CompactTask':>14}{'saving':>9}")
+    for label, measure in (
+        ("objects only", measure_models),
+        ("TaskRepository", measure_repository),
+    ):
+        regular = measure(args.count, compact_models=False)
+        compact = measure(args.count, compact_models=True)
+        print(
+            f"{label + ' (bytes/task)':30}{regular:10.1f}{compact:14.1f}"
+            f"{(1 - compact / regular) * 100:8.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Measure the overhead of call metrics on service calls.
+
+Runs the same mix of cheap service calls (get_task, count_tasks,
+get_project) three times: on plain services, which is what runs when
+METRICS_ENABLED is off, on instrumented services with recording paused,
+and on instrumented services recording every call. Each call goes
+through an instrumented service and, below it, an instrumented
+repository, so the recording modes pay for two wrappers per call.
+
+Usage:
+    python benchmarks/bench_metrics.py [--tasks N] [--calls N] [--rounds R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.config import settings  # noqa: E402
+from todolist.repositories.project_repository import ProjectRepository  # noqa: E402
+from todolist.repositories.task_repository import TaskRepository  # noqa: E402
+from todolist.services.project_service import ProjectService  # noqa: E402
+from todolist.services.task_service import TaskService  # noqa: E402
+from todolist.utils.id_generator import id_generator  # noqa: E402
+from todolist.utils.metrics import MetricsRegistry, instrument  # noqa: E402
+
+MODES = ("disabled", "paused", "enabled")
+
+
+def build(tasks: int, mode: str) -> tuple[ProjectService, TaskService, MetricsRegistry]:
+    """Create services holding tasks, instrumented according to mode."""
+    # Every mode gets the same IDs
+    id_generator.reset()
+    project_repo, task_repo = ProjectRepository(), TaskRepository()
+    project_service = ProjectService(project_repo, task_repo)
+    task_service = TaskService(task_repo)
+    project_service.create_project("Benchmark")
+    task_service.create_tasks([{"title": f"Task {i}", "project_id": 1} for i in range(tasks)])
+
+    metrics = MetricsRegistry()
+    if mode != "disabled":
+        for name, component in (
+            ("project_repository", project_repo),
+            ("task_repository", task_repo),
+            ("project_service", project_service),
+            ("task_service", task_service),
+        ):
+            instrument(component, name, metrics)
+        metrics.enabled = mode == "enabled"
+    return project_service, task_service, metrics
+
+
+def run(project_service: ProjectService, task_service: TaskService, ids: list[int]) -> float:
+    """Call the services once per ID and return the nanoseconds per call."""
+    get_task = task_service.get_task
+    count_tasks = task_service.count_tasks
+    get_project = project_service.get_project
+    started = time.perf_counter_ns()
+    for index, task_id in enumerate(ids):
+        if index % 4 == 0:
+            count_tasks()
+        elif index % 4 == 1:
+            get_project(1)
+        else:
+            get_task(task_id)
+    return (time.perf_counter_ns() - started) / len(ids)
+
+
+def main() -> None:
+    """Run the benchmark and print the cost per call of each mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tasks", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    settings.max_number_of_task = args.tasks
+
+    rng = random.Random(42)
+    ids = [rng.randint(1, args.tasks) for _ in range(args.calls)]
+    services = {mode: build(args.tasks, mode) for mode in MODES}
+    best = {mode: float("inf") for mode in MODES}
+    # Interleave the modes so that they see the same machine conditions
+    for _ in range(args.rounds):
+        for mode in MODES:
+            project_service, task_service, _ = services[mode]
+            best[mode] = min(best[mode], run(project_service, task_service, ids))
+
+    baseline = best["disabled"]
+    print(f"{args.calls:,} calls x {args.rounds} rounds, best round per mode\n")
+    print(f"{'mode':10} {'ns/call':>9} {'overhead':>10}")
+    for mode in MODES:
+        print(f"{mode:10} {best[mode]:>9,.0f} {best[mode] / baseline - 1:>+10.1%}")
+    recorded = sum(row["calls"] for row in services["enabled"][2].snapshot())
+    print(f"\ncalls recorded while enabled: {recorded:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Measure full-text search latency.
+
+Fills the in-memory and SQLite task repositories with generated tasks
+and times a few representative queries.
+
+Usage:
+    python benchmarks/bench_search.py [--count N] [--backend memory|sqlite|all]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.config import settings  # noqa: E402
+from todolist.models.task import Task, TaskStatus  # noqa: E402
+from todolist.repositories.sqlite_database import connect  # noqa: E402
+from todolist.repositories.sqlite_task_repository import SQLiteTaskRepository  # noqa: E402
+from todolist.repositories.task_repository import TaskRepository  # noqa: E402
+
+# Selective queries first, then broad ones matching a large share of
+# the tasks; latency grows with the number of matches, not with the
+# number of tasks
+QUERIES = [
+    "word4321",
+    "word12 word99",
+    "word123*",
+    "word77 OR word78",
+    "migration database cleanup",
+    "quarterly report",
+    "report",
+    "budget OR invoice",
+]
+
+_WORDS = (
+    "report quarterly budget invoice review meeting plan draft summary "
+    "release deploy migration database cleanup customer onboarding design "
+    "research hiring roadmap feedback support incident backlog sprint"
+).split()
+
+
+def _make_tasks(count: int, seed: int = 42) -> list[Task]:
+    """Build tasks with random titles and descriptions."""
+    rng = random.Random(seed)
+    now = datetime.now()
+    statuses = TaskStatus.values()
+    filler = [f"word{index}" for index in range(5000)]
+    return [
+        Task.from_record(
+            id=index + 1,
+            title=" ".join(rng.choices(_WORDS, k=3)),
+            project_id=index % 100,
+            description=" ".join(rng.choices(filler, k=12) + rng.choices(_WORDS, k=2)),
+            status=statuses[index % len(statuses)],
+            deadline=None,
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+
+
+def _time_queries(repository, repeat: int) -> None:
+    """Print the median latency and number of matches of every query."""
+    for query in QUERIES:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            repository.search(query, limit=20)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        matches = len(repository.search(query))
+        print(f"  {query!r:32} {timings[len(timings) // 2] * 1000:9.2f} ms  {matches:>9} matches")
+
+
+def main() -> None:
+    """Run the measurement and print a small report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--backend", choices=("memory", "sqlite", "all"), default="all")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    settings.max_number_of_task = args.count
+
+    tasks = _make_tasks(args.count)
+    print(f"tasks: {args.count}")
+
+    if args.backend in ("memory", "all"):
+        start = time.perf_counter()
+        repository = TaskRepository()
+        repository.add_many(tasks)
+        print(f"memory: indexed in {time.perf_counter() - start:.1f} s")
+        _time_queries(repository, args.repeat)
+        del repository
+
+    if args.backend in ("sqlite", "all"):
+        connection = connect(":memory:")
+        start = time.perf_counter()
+        repository = SQLiteTaskRepository(connection)
+        repository.add_many(tasks)
+        print(f"sqlite: indexed in {time.perf_counter() - start:.1f} s")
+        _time_queries(repository, args.repeat)
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Measure the cold-start cost of the todolist entry points.
+
+Imports each entry module in a fresh interpreter with ``-X importtime``
+and reports the cumulative import time of the module (median of the
+runs) and the modules that took longest. It also times a complete
+batch run of a one-line script against ``python -c pass``, which is what
+scripts calling the tool repeatedly pay per call.
+
+With --check the script exits with status 1 if importing todolist.main
+takes longer than --budget-ms; tests/unit/cli/test_startup.py checks
+the same budget.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs N] [--top N] [--budget-ms MS] [--check]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+ENTRY_MODULES = ("todolist.main", "todolist.cli.batch", "todolist.api.server")
+
+# Keep in sync with tests/unit/cli/test_startup.py
+DEFAULT_BUDGET_MS = 60
+
+
+def _environment() -> dict:
+    """Return an environment that imports todolist from this checkout."""
+    environment = dict(os.environ, PYTHONPATH=SRC)
+    # Measure starts with cached bytecode, as installed scripts get
+    for variable in ("PYTHONPROFILEIMPORTTIME", "PYTHONDONTWRITEBYTECODE"):
+        environment.pop(variable, None)
+    return environment
+
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Args:
+        module: Module to import
+
+    Returns:
+        Module name -> (self, cumulative) import time in microseconds
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, env=_environment(),
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def _wall_time(arguments: list[str]) -> float:
+    """Run the interpreter with arguments and return the seconds it took."""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, *arguments], check=True, env=_environment(),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    """Run the benchmark and print the report."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--check", action="store_true", help="exit 1 if over budget")
+    args = parser.parse_args()
+
+    medians = {}
+    for module in ENTRY_MODULES:
+        import_times(module)  # warm up the bytecode cache
+        runs = [import_times(module) for _ in range(args.runs)]
+        medians[module] = statistics.median(run[module][1] for run in runs) / 1000
+        print(f"\nimport {module}: {medians[module]:.1f} ms (median of {args.runs})")
+        slowest = sorted(runs[-1].items(), key=lambda item: -item[1][0])[:args.top]
+        for name, (own, cumulative) in slowest:
+            print(f"  {own / 1000:7.2f} ms self  {cumulative / 1000:7.2f} ms total  {name}")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as script:
+        script.write("stats\n")
+    try:
+        batch = [
+            "-c",
+            f"from todolist.main import main; main(['--batch', {script.name!r}])",
+        ]
+        baseline = statistics.median(_wall_time(["-c", "pass"]) for _ in range(args.runs))
+        run = statistics.median(_wall_time(batch) for _ in range(args.runs))
+    finally:
+        os.remove(script.name)
+    print(f"\npython -c pass:        {baseline * 1000:7.1f} ms")
+    print(f"one-command batch run: {run * 1000:7.1f} ms (+{(run - baseline) * 1000:.1f} ms)")
+
+    over = medians["todolist.main"] > args.budget_ms
+    print(
+        f"\nbudget for todolist.main: {args.budget_ms:.0f} ms "
+        + ("(EXCEEDED)" if over else "(ok)")
+    )
+    if args.check and over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,365 @@
+"""
+Run the repository, service and model benchmark suite at several sizes.
+
+Every size runs in a fresh subprocess so that peak RSS and timings of
+one size do not depend on the others. Data and access patterns come
+from a seeded random generator, so runs with the same seed and sizes
+perform the same operations. Results are written as JSON with ops/s,
+p50/p99 latency per operation and peak RSS per size, and can be
+compared against a stored baseline to flag regressions. Each size can
+be repeated; the fastest repeat of every operation is kept, which
+filters out most scheduler noise.
+
+Operations (per size N):
+    model.validate          Task construction with full validation
+    project.create          ProjectService.create_project (N / 100 projects)
+    task.create             TaskService.create_task (N tasks)
+    task.get_by_id          TaskService.get_task on random IDs
+    project.list_tasks      TaskService.get_tasks_by_project on random projects
+    task.filter_status      TaskService.get_tasks_by_status
+    stats.count_by_status   TaskService.count_tasks_by_status
+    stats.project_summary   ProjectService.get_project_summary
+    project.cascade_delete  ProjectService.delete_project with its tasks
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000,100000,1000000] [--seed S]
+                                     [--repeat R] [--output results.json]
+                                     [--compact-models]
+    python benchmarks/bench_suite.py --compare baseline.json [--output results.json]
+    python benchmarks/bench_suite.py --compare baseline.json --current results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from todolist.config import settings  # noqa: E402
+from todolist.models.task import Task, TaskStatus  # noqa: E402
+from todolist.repositories.project_repository import ProjectRepository  # noqa: E402
+from todolist.repositories.task_repository import TaskRepository  # noqa: E402
+from todolist.services.project_service import ProjectService  # noqa: E402
+from todolist.services.task_service import TaskService  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+DEFAULT_SEED = 1234
+DEFAULT_REPEAT = 3
+
+# Calls made for the cheap point operations, whatever the size
+POINT_OPERATIONS = 10_000
+
+# Tasks per project
+TASKS_PER_PROJECT = 100
+
+# Relative changes beyond which compare mode flags a regression; tail
+# latency is noisier than throughput, so it gets more headroom
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_LATENCY_THRESHOLD = 0.50
+
+_WORDS = (
+    "report draft review budget invoice meeting release plan design test "
+    "deploy migrate backup audit summary roadmap hiring onboarding cleanup "
+    "research"
+).split()
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MiB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _percentile(sorted_values: list[int], fraction: float) -> int:
+    """Return a percentile of sorted values."""
+    return sorted_values[min(int(len(sorted_values) * fraction), len(sorted_values) - 1)]
+
+
+def _time_calls(function: Callable, arguments: Iterable[tuple]) -> dict:
+    """Call function once per argument tuple and summarize the latencies."""
+    latencies = []
+    clock = time.perf_counter_ns
+    for args in arguments:
+        started = clock()
+        function(*args)
+        latencies.append(clock() - started)
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "ops": len(latencies),
+        "ops_per_sec": len(latencies) / (total / 1e9) if total else 0.0,
+        "p50_us": _percentile(latencies, 0.50) / 1000,
+        "p99_us": _percentile(latencies, 0.99) / 1000,
+    }
+
+
+def _task_arguments(rng: random.Random, count: int, projects: list[int]) -> list[tuple]:
+    """Build create_task arguments: title, project, description, status, deadline."""
+    statuses = TaskStatus.values()
+    # Deadlines are offsets from the start of the run, so they are always
+    # in the future while the data stays the same from run to run
+    base = datetime.now() + timedelta(days=1)
+    return [
+        (
+            " ".join(rng.choices(_WORDS, k=3)) + f" {index}",
+            projects[index % len(projects)],
+            " ".join(rng.choices(_WORDS, k=rng.randint(0, 12))),
+            rng.choice(statuses),
+            base + timedelta(minutes=rng.randrange(525_600)) if rng.random() < 0.5 else None,
+        )
+        for index in range(count)
+    ]
+
+
+def run_size(size: int, seed: int, compact_models: bool) -> dict:
+    """
+    Run every operation at one size.
+
+    Args:
+        size: Number of tasks
+        seed: Seed of the random generator
+        compact_models: Whether repositories store compact models
+
+    Returns:
+        Dictionary with the size, peak RSS and results per operation
+    """
+    rng = random.Random(seed)
+    project_count = max(size // TASKS_PER_PROJECT, 1)
+    settings.max_number_of_task = size
+    settings.max_number_of_project = project_count
+
+    project_repo = ProjectRepository(compact_models=compact_models)
+    task_repo = TaskRepository(compact_models=compact_models)
+    project_service = ProjectService(project_repo, task_repo)
+    task_service = TaskService(task_repo)
+    results: dict[str, dict] = {}
+
+    validate_arguments = _task_arguments(rng, min(size, POINT_OPERATIONS), [1])
+    results["model.validate"] = _time_calls(
+        lambda title, project_id, description, status, deadline: Task(
+            title=title, project_id=project_id, description=description,
+            status=status, deadline=deadline, id=0,
+        ),
+        validate_arguments,
+    )
+
+    results["project.create"] = _time_calls(
+        project_service.create_project,
+        ((f"Project {index}", "benchmark project") for index in range(project_count)),
+    )
+    project_ids = [project.id for project in project_service.iter_projects()]
+
+    results["task.create"] = _time_calls(
+        task_service.create_task, _task_arguments(rng, size, project_ids)
+    )
+    task_ids = [task.id for task in task_service.iter_tasks()]
+
+    results["task.get_by_id"] = _time_calls(
+        task_service.get_task, ((rng.choice(task_ids),) for _ in range(POINT_OPERATIONS))
+    )
+    results["project.list_tasks"] = _time_calls(
+        task_service.get_tasks_by_project,
+        ((rng.choice(project_ids),) for _ in range(min(POINT_OPERATIONS, 1000))),
+    )
+    results["task.filter_status"] = _time_calls(
+        task_service.get_tasks_by_status,
+        ((rng.choice(TaskStatus.values()),) for _ in range(30)),
+    )
+    results["stats.count_by_status"] = _time_calls(
+        task_service.count_tasks_by_status, (() for _ in range(1000))
+    )
+    results["stats.project_summary"] = _time_calls(
+        project_service.get_project_summary,
+        ((rng.choice(project_ids),) for _ in range(1000)),
+    )
+
+    doomed = rng.sample(project_ids, min(len(project_ids), 100))
+    results["project.cascade_delete"] = _time_calls(
+        project_service.delete_project, ((project_id,) for project_id in doomed)
+    )
+
+    return {"size": size, "peak_rss_mb": _peak_rss_mb(), "operations": results}
+
+
+def _run_in_subprocess(size: int, seed: int, compact_models: bool) -> dict:
+    """Run one size in a fresh interpreter and return its results."""
+    command = [sys.executable, __file__, "--worker", str(size), "--seed", str(seed)]
+    if compact_models:
+        command.append("--compact-models")
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout)
+
+
+def _best_of(runs: list[dict]) -> dict:
+    """Merge repeats of one size, keeping the fastest result of each operation."""
+    peaks = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    operations = {
+        name: max((run["operations"][name] for run in runs), key=lambda r: r["ops_per_sec"])
+        for name in runs[0]["operations"]
+    }
+    return {
+        "size": runs[0]["size"],
+        "repeats": len(runs),
+        "peak_rss_mb": max(peaks) if peaks else None,
+        "operations": operations,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float = DEFAULT_THRESHOLD,
+    latency_threshold: float = DEFAULT_LATENCY_THRESHOLD,
+) -> list[str]:
+    """
+    Compare two result files and describe the regressions.
+
+    An operation regresses when its ops/s drops, or the peak RSS of its
+    size grows, by more than threshold, or when its p99 latency grows by
+    more than latency_threshold.
+
+    Args:
+        baseline: Stored results
+        current: New results
+        threshold: Allowed relative change of ops/s and RSS (0.15 is 15 %)
+        latency_threshold: Allowed relative growth of p99 latency
+
+    Returns:
+        One message per regression (empty if there are none)
+    """
+    regressions = []
+    baseline_sizes = {run["size"]: run for run in baseline["runs"]}
+    for run in current["runs"]:
+        base_run = baseline_sizes.get(run["size"])
+        if base_run is None:
+            continue
+        size = run["size"]
+        if run["peak_rss_mb"] and base_run["peak_rss_mb"]:
+            if run["peak_rss_mb"] > base_run["peak_rss_mb"] * (1 + threshold):
+                regressions.append(
+                    f"N={size:,} peak RSS {base_run['peak_rss_mb']:.0f} -> "
+                    f"{run['peak_rss_mb']:.0f} MiB"
+                )
+        for name, result in run["operations"].items():
+            base = base_run["operations"].get(name)
+            if base is None:
+                continue
+            if result["ops_per_sec"] < base["ops_per_sec"] * (1 - threshold):
+                regressions.append(
+                    f"N={size:,} {name} ops/s {base['ops_per_sec']:,.0f} -> "
+                    f"{result['ops_per_sec']:,.0f}"
+                )
+            if result["p99_us"] > base["p99_us"] * (1 + latency_threshold):
+                regressions.append(
+                    f"N={size:,} {name} p99 {base['p99_us']:,.1f} -> {result['p99_us']:,.1f} us"
+                )
+    return regressions
+
+
+def _print_report(results: dict) -> None:
+    """Print a table per size."""
+    for run in results["runs"]:
+        rss = run["peak_rss_mb"]
+        print(f"\nN = {run['size']:,}" + (f" (peak RSS {rss:,.0f} MiB)" if rss else ""))
+        print(f"  {'operation':24} {'ops':>9} {'ops/s':>12} {'p50 us':>10} {'p99 us':>10}")
+        for name, result in run["operations"].items():
+            print(
+                f"  {name:24} {result['ops']:>9,} {result['ops_per_sec']:>12,.0f} "
+                f"{result['p50_us']:>10,.1f} {result['p99_us']:>10,.1f}"
+            )
+
+
+def main() -> None:
+    """Run the suite, write the results and optionally compare them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="comma-separated task counts",
+    )
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per size")
+    parser.add_argument("--compact-models", action="store_true")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="baseline results to compare with")
+    parser.add_argument(
+        "--current", metavar="RESULTS",
+        help="with --compare, compare this file instead of running the suite",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="allowed relative ops/s drop and RSS growth",
+    )
+    parser.add_argument(
+        "--latency-threshold", type=float, default=DEFAULT_LATENCY_THRESHOLD,
+        help="allowed relative p99 growth",
+    )
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker is not None:
+        json.dump(run_size(args.worker, args.seed, args.compact_models), sys.stdout)
+        return
+
+    if args.current is not None:
+        with open(args.current, encoding="utf-8") as current_file:
+            results: dict[str, Any] = json.load(current_file)
+    else:
+        sizes = [int(size) for size in args.sizes.split(",")]
+        results = {
+            "meta": {
+                "seed": args.seed,
+                "repeat": args.repeat,
+                "sizes": sizes,
+                "compact_models": args.compact_models,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+                "started_at": datetime.now().isoformat(timespec="seconds"),
+            },
+            "runs": [],
+        }
+        for size in sizes:
+            print(f"running N = {size:,} ...", file=sys.stderr)
+            results["runs"].append(_best_of([
+                _run_in_subprocess(size, args.seed, args.compact_models)
+                for _ in range(max(args.repeat, 1))
+            ]))
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(results, output, indent=2)
+        _print_report(results)
+        print(f"\nresults written to {args.output}")
+
+    if args.compare is not None:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        if baseline["meta"].get("seed") != results["meta"].get("seed"):
+            print("warning: baseline was run with a different seed", file=sys.stderr)
+        regressions = compare(baseline, results, args.threshold, args.latency_threshold)
+        print(
+            f"\ncompared with {args.compare} (thresholds {args.threshold:.0%} throughput, "
+            f"{args.latency_threshold:.0%} p99):"
+        )
+        for message in regressions:
+            print(f"  REGRESSION {message}")
+        if not regressions:
+            print("  no regressions")
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
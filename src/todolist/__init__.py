@@ -7,6 +7,12 @@ A CLI-based task management application built with Python OOP principles.
 __version__ = "0.1.0"
 __author__ = "Your Name"
 
-from .main import main
+from .utils.lazy import lazy_exports
 
-__all__ = ["main"]
+# main is imported on first access, so importing a subpackage does not
+# load the application's entry point and everything behind it
+_EXPORTS = {"main": "main"}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,16 @@
+"""API package."""
+
+from ..utils.lazy import lazy_exports
+
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "HTTPError": "http",
+    "Request": "http",
+    "TodoListAPI": "routes",
+    "APIServer": "server",
+    "create_api": "server",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
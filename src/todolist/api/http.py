@@ -0,0 +1,189 @@
+"""
+Minimal HTTP/1.1 message handling on asyncio streams.
+
+This module reads requests from and encodes responses for the API
+server. It supports what a JSON API needs: Content-Length bodies,
+persistent connections and pipelined requests (read one after another
+from the connection's buffer, answered in order). Chunked request
+bodies are not supported.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+from ..utils.exceptions import ValidationError
+
+# Longest accepted request line plus headers, in bytes
+MAX_HEADER_BYTES = 64 * 1024
+
+# Largest accepted request body, in bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    201: "Created",
+    204: "No Content",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    409: "Conflict",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    501: "Not Implemented",
+    505: "HTTP Version Not Supported",
+}
+
+
+class HTTPError(Exception):
+    """Raised when a request cannot be served for a protocol-level reason."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize HTTPError.
+
+        Args:
+            status: HTTP status code of the error response
+            message: Description sent to the client
+        """
+        self.status = status
+        self.message = message
+        super().__init__(message)
+
+
+@dataclass
+class Request:
+    """
+    A parsed HTTP request.
+
+    Attributes:
+        method: Request method, e.g. "GET"
+        path: Decoded path without the query string
+        query: Query string parameters (last value wins)
+        headers: Headers with lower-case names
+        body: Raw request body
+        keep_alive: Whether the connection stays open after the response
+    """
+
+    method: str
+    path: str
+    query: dict[str, str] = field(default_factory=dict)
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    keep_alive: bool = True
+
+    def json(self) -> dict:
+        """
+        Decode the body as a JSON object.
+
+        Returns:
+            Decoded object (empty if the body is empty)
+
+        Raises:
+            ValidationError: If the body is not a JSON object
+        """
+        if not self.body:
+            return {}
+        try:
+            data = json.loads(self.body)
+        except (UnicodeDecodeError, ValueError) as e:
+            raise ValidationError(f"Request body is not valid JSON: {e}")
+        if not isinstance(data, dict):
+            raise ValidationError("Request body must be a JSON object")
+        return data
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """
+    Read the next request from a connection.
+
+    Args:
+        reader: Stream of the client connection; its limit must be at
+            least MAX_HEADER_BYTES
+
+    Returns:
+        The request, or None if the client closed the connection between
+        requests
+
+    Raises:
+        HTTPError: If the request is malformed or too large
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise HTTPError(400, "Incomplete request")
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "Request headers too large")
+
+    lines = head[:-4].decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(400, "Malformed request line")
+    if version not in ("HTTP/1.1", "HTTP/1.0"):
+        raise HTTPError(505, f"Unsupported protocol version {version}")
+
+    headers = {}
+    for line in lines[1:]:
+        name, separator, value = line.partition(":")
+        if not separator or not name or name != name.strip():
+            raise HTTPError(400, "Malformed header line")
+        headers[name.lower()] = value.strip()
+
+    if "transfer-encoding" in headers:
+        raise HTTPError(501, "Transfer-Encoding is not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length < 0:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > MAX_BODY_BYTES:
+        raise HTTPError(413, f"Request body exceeds {MAX_BODY_BYTES} bytes")
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError:
+        raise HTTPError(400, "Incomplete request body")
+
+    connection = headers.get("connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = "close" not in connection
+    else:
+        keep_alive = "keep-alive" in connection
+
+    url = urlsplit(target)
+    return Request(
+        method=method,
+        path=unquote(url.path),
+        query=dict(parse_qsl(url.query)),
+        headers=headers,
+        body=body,
+        keep_alive=keep_alive,
+    )
+
+
+def encode_response(status: int, body: Any = None, keep_alive: bool = True) -> bytes:
+    """
+    Encode a JSON response.
+
+    Args:
+        status: HTTP status code
+        body: JSON-serializable response body (None for no body)
+        keep_alive: Whether the connection stays open after the response
+
+    Returns:
+        Response bytes ready to be written to the connection
+    """
+    payload = b"" if body is None else json.dumps(body, separators=(",", ":")).encode()
+    head = [f"HTTP/1.1 {status} {REASONS.get(status, 'Unknown')}"]
+    if body is not None:
+        head.append("Content-Type: application/json")
+    head.append(f"Content-Length: {len(payload)}")
+    head.append("Connection: keep-alive" if keep_alive else "Connection: close")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload
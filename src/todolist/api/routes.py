@@ -0,0 +1,354 @@
+"""
+JSON API routes.
+
+This module maps HTTP requests to ProjectService and TaskService calls
+and application exceptions to HTTP status codes. Service calls are made
+through a repository runner, so blocking backends run in a thread pool
+instead of on the event loop.
+
+Endpoints::
+
+    GET    /projects                  ?limit=&after_id=
+    POST   /projects                  {"title", "description"}
+    GET    /projects/{id}
+    PATCH  /projects/{id}             {"title", "description", "expected_version"}
+    DELETE /projects/{id}             ?cascade=false
+    GET    /projects/{id}/summary
+    GET    /projects/{id}/tasks       ?limit=&after_id=
+    GET    /tasks                     ?limit=&after_id=, or filtered with
+                                      ?status=A,B&project_id=&q=&sort=&offset=
+    POST   /tasks                     {"title", "project_id", "description",
+                                       "status", "deadline"}
+    GET    /tasks/{id}
+    PATCH  /tasks/{id}                {"title", "description", "deadline",
+                                       "status", "expected_version"}
+    DELETE /tasks/{id}
+    GET    /statistics
+"""
+
+import logging
+import re
+from datetime import datetime
+from typing import Any, Callable, Optional
+from ..models.task import Task
+from ..repositories.async_repository import Runner
+from ..repositories.task_query import TaskQuery
+from ..services.project_service import ProjectService
+from ..services.task_service import TaskService
+from ..utils.exceptions import (
+    DuplicateResourceError,
+    InvalidStatusError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    ToDoListException,
+    ValidationError,
+    VersionConflictError,
+)
+from .http import HTTPError, Request
+
+logger = logging.getLogger(__name__)
+
+# HTTP status of each application exception; subclasses not listed use
+# the status of their nearest listed base class
+ERROR_STATUSES: dict[type, int] = {
+    ValidationError: 400,
+    InvalidStatusError: 400,
+    ResourceNotFoundError: 404,
+    DuplicateResourceError: 409,
+    VersionConflictError: 409,
+    LimitExceededError: 422,
+    ToDoListException: 400,
+}
+
+# Query parameters that turn GET /tasks into a filtered query
+_TASK_FILTERS = ("status", "project_id", "q", "sort", "offset")
+
+Response = tuple[int, Any]
+
+
+def status_for(error: Exception) -> int:
+    """
+    Return the HTTP status code for an exception raised by a handler.
+
+    Args:
+        error: Exception raised while handling a request
+
+    Returns:
+        Status code from ERROR_STATUSES, or 500 for unexpected errors
+    """
+    for cls in type(error).__mro__:
+        if cls in ERROR_STATUSES:
+            return ERROR_STATUSES[cls]
+    return 500
+
+
+def error_body(error: Exception) -> dict:
+    """
+    Build the JSON body of an error response.
+
+    Args:
+        error: Exception raised while handling a request
+
+    Returns:
+        Dictionary with the error type and message
+    """
+    if isinstance(error, (ToDoListException, HTTPError)):
+        message = str(error)
+    else:
+        message = "Internal server error"
+    return {"error": {"type": type(error).__name__, "message": message}}
+
+
+def _int_param(value: Any, name: str) -> int:
+    """Convert a query string or JSON value to an int, or raise ValidationError."""
+    if isinstance(value, bool):
+        raise ValidationError(f"{name} must be an integer")
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"{name} must be an integer")
+
+
+def _optional_int(query: dict, key: str, name: str) -> Optional[int]:
+    """Return an integer query parameter, or None if it is absent."""
+    return _int_param(query[key], name) if key in query else None
+
+
+def _deadline(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 deadline from a request body."""
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError("Deadline must be an ISO 8601 date and time")
+
+
+def _tasks(tasks: list[Task]) -> list[dict]:
+    """Convert tasks to dictionaries."""
+    return [task.to_dict() for task in tasks]
+
+
+class TodoListAPI:
+    """
+    Routes API requests to the services.
+
+    Handlers are plain methods returning ``(status, body)``; ``handle``
+    runs them through the runner and turns exceptions into error
+    responses, so routes never deal with HTTP errors themselves.
+    """
+
+    def __init__(
+        self,
+        project_service: ProjectService,
+        task_service: TaskService,
+        runner: Runner,
+    ) -> None:
+        """
+        Initialize the API.
+
+        Args:
+            project_service: Service for project operations
+            task_service: Service for task operations
+            runner: Runner the service calls are made through
+        """
+        self._project_service = project_service
+        self._task_service = task_service
+        self._runner = runner
+        self._routes: list[tuple[re.Pattern, dict[str, Callable[..., Response]]]] = [
+            (re.compile(r"/projects"), {
+                "GET": self._list_projects, "POST": self._create_project,
+            }),
+            (re.compile(r"/projects/(\d+)"), {
+                "GET": self._get_project,
+                "PATCH": self._update_project,
+                "DELETE": self._delete_project,
+            }),
+            (re.compile(r"/projects/(\d+)/summary"), {"GET": self._project_summary}),
+            (re.compile(r"/projects/(\d+)/tasks"), {"GET": self._project_tasks}),
+            (re.compile(r"/tasks"), {"GET": self._list_tasks, "POST": self._create_task}),
+            (re.compile(r"/tasks/(\d+)"), {
+                "GET": self._get_task,
+                "PATCH": self._update_task,
+                "DELETE": self._delete_task,
+            }),
+            (re.compile(r"/statistics"), {"GET": self._statistics}),
+        ]
+
+    async def handle(self, request: Request) -> Response:
+        """
+        Serve one request.
+
+        Args:
+            request: Parsed request
+
+        Returns:
+            Tuple of (HTTP status, JSON-serializable body or None)
+        """
+        try:
+            handler, arguments = self._resolve(request)
+            return await self._runner.run(handler, request, *arguments)
+        except HTTPError as e:
+            return e.status, error_body(e)
+        except Exception as e:
+            status = status_for(e)
+            if status == 500:
+                logger.exception("Error handling %s %s", request.method, request.path)
+            return status, error_body(e)
+
+    def _resolve(self, request: Request) -> tuple[Callable[..., Response], list[int]]:
+        """
+        Find the handler for a request.
+
+        Raises:
+            HTTPError: If no route matches (404) or the route does not
+                support the method (405)
+        """
+        path = request.path.rstrip("/") or "/"
+        for pattern, methods in self._routes:
+            match = pattern.fullmatch(path)
+            if match is None:
+                continue
+            if request.method not in methods:
+                raise HTTPError(405, f"Method {request.method} not allowed on {path}")
+            return methods[request.method], [int(group) for group in match.groups()]
+        raise HTTPError(404, f"No route for {path}")
+
+    # Projects
+
+    def _list_projects(self, request: Request) -> Response:
+        """List projects one page at a time."""
+        page = self._project_service.get_projects_page(
+            limit=_int_param(request.query.get("limit", 20), "Limit"),
+            after_id=_optional_int(request.query, "after_id", "after_id"),
+        )
+        return 200, {
+            "items": [project.to_dict() for project in page["items"]],
+            "next_after_id": page["next_after_id"],
+        }
+
+    def _create_project(self, request: Request) -> Response:
+        """Create a project."""
+        data = request.json()
+        project = self._project_service.create_project(
+            data.get("title"), data.get("description", "")
+        )
+        return 201, project.to_dict()
+
+    def _get_project(self, request: Request, project_id: int) -> Response:
+        """Return one project."""
+        return 200, self._project_service.get_project(project_id).to_dict()
+
+    def _update_project(self, request: Request, project_id: int) -> Response:
+        """Update a project's title and description."""
+        data = request.json()
+        expected_version = data.get("expected_version")
+        project = self._project_service.update_project(
+            project_id,
+            title=data.get("title"),
+            description=data.get("description"),
+            expected_version=(
+                None if expected_version is None
+                else _int_param(expected_version, "expected_version")
+            ),
+        )
+        return 200, project.to_dict()
+
+    def _delete_project(self, request: Request, project_id: int) -> Response:
+        """Delete a project and, unless cascade=false, its tasks."""
+        cascade = request.query.get("cascade", "true").lower() not in ("0", "false", "no")
+        return 200, self._project_service.delete_project(project_id, cascade=cascade)
+
+    def _project_summary(self, request: Request, project_id: int) -> Response:
+        """Return a project with its task counts per status."""
+        summary = self._project_service.get_project_summary(project_id)
+        return 200, {**summary, "project": summary["project"].to_dict()}
+
+    def _project_tasks(self, request: Request, project_id: int) -> Response:
+        """List the tasks of a project one page at a time."""
+        self._project_service.get_project(project_id)
+        return self._task_page(request, project_id)
+
+    # Tasks
+
+    def _task_page(self, request: Request, project_id: Optional[int] = None) -> Response:
+        """Return one page of tasks in ID order."""
+        page = self._task_service.get_tasks_page(
+            limit=_int_param(request.query.get("limit", 20), "Limit"),
+            after_id=_optional_int(request.query, "after_id", "after_id"),
+            project_id=project_id,
+        )
+        return 200, {"items": _tasks(page["items"]), "next_after_id": page["next_after_id"]}
+
+    def _list_tasks(self, request: Request) -> Response:
+        """List tasks by page, or filtered by status, project and text."""
+        query = request.query
+        if not any(key in query for key in _TASK_FILTERS):
+            return self._task_page(request)
+
+        task_query = TaskQuery().limit(_int_param(query.get("limit", 20), "Limit"))
+        if "status" in query:
+            task_query = task_query.with_status(*query["status"].split(","))
+        if "project_id" in query:
+            task_query = task_query.in_project(_int_param(query["project_id"], "project_id"))
+        if "q" in query:
+            task_query = task_query.matching(query["q"])
+        if "sort" in query:
+            sort_by = query["sort"]
+            task_query = task_query.order_by(sort_by.lstrip("-"), sort_by.startswith("-"))
+        if "offset" in query:
+            task_query = task_query.offset(_int_param(query["offset"], "Offset"))
+        return 200, {"items": _tasks(self._task_service.query_tasks(task_query))}
+
+    def _create_task(self, request: Request) -> Response:
+        """Create a task in an existing project."""
+        data = request.json()
+        project_id = _int_param(data.get("project_id"), "project_id")
+        self._project_service.get_project(project_id)
+        task = self._task_service.create_task(
+            title=data.get("title"),
+            project_id=project_id,
+            description=data.get("description", ""),
+            status=data.get("status", "TODO"),
+            deadline=_deadline(data.get("deadline")),
+        )
+        return 201, task.to_dict()
+
+    def _get_task(self, request: Request, task_id: int) -> Response:
+        """Return one task."""
+        return 200, self._task_service.get_task(task_id).to_dict()
+
+    def _update_task(self, request: Request, task_id: int) -> Response:
+        """Update a task's details and status as one change."""
+        data = request.json()
+        title = data.get("title")
+        description = data.get("description")
+        deadline = _deadline(data.get("deadline"))
+        status = data.get("status")
+        expected_version = data.get("expected_version")
+
+        def change(task: Task) -> None:
+            task.update_details(title=title, description=description, deadline=deadline)
+            if status is not None:
+                task.update_status(status)
+
+        task = self._task_service.modify_task(
+            task_id,
+            change,
+            None if expected_version is None
+            else _int_param(expected_version, "expected_version"),
+        )
+        return 200, task.to_dict()
+
+    def _delete_task(self, request: Request, task_id: int) -> Response:
+        """Delete a task."""
+        self._task_service.delete_task(task_id)
+        return 204, None
+
+    def _statistics(self, request: Request) -> Response:
+        """Return project and task counts."""
+        return 200, {
+            "projects": self._project_service.count_projects(),
+            "tasks": self._task_service.count_tasks(),
+            "tasks_by_status": self._task_service.count_tasks_by_status(),
+        }
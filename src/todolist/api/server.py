@@ -0,0 +1,208 @@
+"""
+Asyncio HTTP server for the JSON API.
+
+This module serves TodoListAPI over HTTP/1.1 on asyncio streams and
+provides the ``todolist-api`` console entry point.
+"""
+
+import argparse
+import asyncio
+import logging
+from contextlib import nullcontext
+from typing import Optional
+from ..config import settings
+from ..repositories.async_repository import InlineRunner, Runner, ThreadPoolRunner
+from ..repositories.factory import create_repositories
+from ..services.project_service import ProjectService
+from ..services.task_service import TaskService
+from ..utils.metrics import exporting, instrument
+from ..utils.profiling import Profiler
+from .http import MAX_HEADER_BYTES, HTTPError, encode_response, read_request
+from .routes import TodoListAPI, error_body
+
+logger = logging.getLogger(__name__)
+
+# Seconds an idle keep-alive connection stays open
+KEEPALIVE_TIMEOUT = 15.0
+
+
+class APIServer:
+    """
+    HTTP/1.1 server for a TodoListAPI.
+
+    Each connection is served by one coroutine that reads requests and
+    writes their responses in order, so clients can keep connections
+    open and pipeline requests. Idle connections are closed after
+    keepalive_timeout seconds.
+    """
+
+    def __init__(
+        self,
+        api: TodoListAPI,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the server without listening yet.
+
+        Args:
+            api: API serving the requests
+            host: Interface to listen on
+            port: TCP port to listen on (0 picks a free port)
+            keepalive_timeout: Seconds before an idle connection is closed
+        """
+        self._api = api
+        self._host = host
+        self._port = port
+        self._keepalive_timeout = keepalive_timeout
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: set[asyncio.StreamWriter] = set()
+
+    @property
+    def port(self) -> int:
+        """Port the server listens on (the chosen one if started with port 0)."""
+        if self._server is None:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """Start listening for connections."""
+        self._server = await asyncio.start_server(
+            self._serve_connection, self._host, self._port, limit=MAX_HEADER_BYTES
+        )
+
+    async def serve_forever(self) -> None:
+        """Start listening if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening and close open connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+
+    async def _serve_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve requests on one connection until either side closes it."""
+        self._connections.add(writer)
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        read_request(reader), self._keepalive_timeout
+                    )
+                except asyncio.TimeoutError:
+                    break
+                except HTTPError as e:
+                    writer.write(encode_response(e.status, error_body(e), keep_alive=False))
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+
+                status, body = await self._api.handle(request)
+                writer.write(encode_response(status, body, request.keep_alive))
+                await writer.drain()
+                if not request.keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+
+def default_runner() -> Runner:
+    """
+    Return the runner suited to the configured backend.
+
+    The memory backend is called directly on the event loop; other
+    backends do I/O, so their calls run in a thread pool of
+    ``settings.async_max_workers`` threads.
+
+    Returns:
+        Runner for service calls
+    """
+    if settings.storage_backend == "memory":
+        return InlineRunner()
+    return ThreadPoolRunner(settings.async_max_workers)
+
+
+def create_api(runner: Runner) -> tuple[TodoListAPI, list]:
+    """
+    Build the API on the repositories of the configured backend.
+
+    Services and repositories are instrumented when metrics are enabled,
+    and service calls are profiled when TODOLIST_PROFILE is set.
+
+    Args:
+        runner: Runner for service calls
+
+    Returns:
+        Tuple of (API, repositories to close on shutdown)
+    """
+    project_repo, task_repo = create_repositories()
+    project_service = ProjectService(project_repo, task_repo)
+    task_service = TaskService(task_repo)
+    profiler = Profiler(
+        settings.profile_mode,
+        settings.profile_dir,
+        settings.profile_sample_every,
+        settings.profile_top,
+    )
+    profiler.wrap(project_service, "project_service")
+    profiler.wrap(task_service, "task_service")
+    if settings.metrics_enabled:
+        instrument(project_repo, "project_repository")
+        instrument(task_repo, "task_repository")
+        instrument(project_service, "project_service")
+        instrument(task_service, "task_service")
+    api = TodoListAPI(project_service, task_service, runner)
+    return api, [project_repo, task_repo]
+
+
+def main() -> None:
+    """Run the API server until interrupted."""
+    parser = argparse.ArgumentParser(description="ToDo List JSON API server")
+    parser.add_argument("--host", default=settings.api_host)
+    parser.add_argument("--port", type=int, default=settings.api_port)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    runner = default_runner()
+    api, repositories = create_api(runner)
+    server = APIServer(api, args.host, args.port)
+
+    async def serve() -> None:
+        await server.start()
+        logger.info(
+            "Serving on http://%s:%d (storage: %s)",
+            args.host, server.port, settings.storage_backend,
+        )
+        await server.serve_forever()
+
+    metrics = (
+        exporting(settings.metrics_port, settings.metrics_file)
+        if settings.metrics_enabled else nullcontext()
+    )
+    try:
+        with metrics:
+            asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        runner.shutdown()
+        for repository in repositories:
+            close = getattr(repository, "close", None)
+            if close is not None:
+                close()
+
+
+if __name__ == "__main__":
+    main()
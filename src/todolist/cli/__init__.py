@@ -1,5 +1,13 @@
 """CLI package."""
 
-from .commands import CLI
+from ..utils.lazy import lazy_exports
 
-__all__ = ["CLI"]
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "CLI": "commands",
+    "BatchRunner": "batch",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,472 @@
+"""
+Non-interactive batch mode for the ToDo List application.
+
+This module runs scripted commands against the services without menus
+or prompts. A script has one command per line, a command name followed
+by ``key=value`` arguments with shell-style quoting::
+
+    # comments and blank lines are skipped
+    project.create title="Q3 launch" description="Everything for the launch"
+    task.create project=1 title="Write announcement" deadline="2030-07-01 09:00"
+    task.status id=1 status=DOING
+    task.list project=1 status=DOING
+    export.tasks path=tasks.csv
+    import.tasks path=more_tasks.ndjson rejects=rejected.ndjson
+
+Every command produces one JSON line, e.g.
+``{"line": 3, "command": "task.status", "ok": true, "result": {...}}`` or
+``{"line": 3, "command": "task.status", "ok": false, "error": {"type":
+"ResourceNotFoundError", "message": "..."}}``. Output is written in
+blocks rather than per line.
+"""
+
+import json
+import shlex
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, TextIO
+from ..models.task import TaskStatus
+from ..repositories.task_query import TaskQuery
+from ..services.project_service import ProjectService
+from ..services.task_service import TaskService
+from ..services.transfer import IMPORT_CHUNK_SIZE, DataTransfer, ProgressCallback, format_for_path
+from ..utils.exceptions import ValidationError
+from ..utils.profiling import Profiler
+
+# Result lines collected before they are written out
+OUTPUT_BUFFER_LINES = 1000
+
+
+def _integer(value: str) -> int:
+    """Parse an integer argument."""
+    try:
+        return int(value)
+    except ValueError:
+        raise ValidationError(f"Expected an integer, got '{value}'")
+
+
+def _boolean(value: str) -> bool:
+    """Parse a boolean argument."""
+    normalized = value.lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off"):
+        return False
+    raise ValidationError(f"Expected true or false, got '{value}'")
+
+
+def _datetime(value: str) -> datetime:
+    """Parse an ISO 8601 date and time argument (e.g. 2030-07-01 09:00)."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValidationError(f"Expected a date and time like 2030-07-01 09:00, got '{value}'")
+
+
+def parse_command(line: str) -> tuple[str, dict[str, str]]:
+    """
+    Split a script line into a command name and its arguments.
+
+    Args:
+        line: One line of a batch script
+
+    Returns:
+        Tuple of (command name, raw argument values by key)
+
+    Raises:
+        ValidationError: If the line cannot be tokenized or an argument
+            is not of the form key=value
+    """
+    try:
+        tokens = shlex.split(line)
+    except ValueError as e:
+        raise ValidationError(f"Cannot parse command: {e}")
+
+    arguments = {}
+    for token in tokens[1:]:
+        key, separator, value = token.partition("=")
+        if not separator or not key:
+            raise ValidationError(f"Expected key=value, got '{token}'")
+        if key in arguments:
+            raise ValidationError(f"Argument '{key}' given more than once")
+        arguments[key] = value
+    return tokens[0], arguments
+
+
+class BatchRunner:
+    """
+    Runs batch scripts against the services.
+
+    Each command is a method taking converted keyword arguments and
+    returning a JSON-serializable result. The table built in __init__
+    lists each command's arguments with their converters; arguments
+    listed as required must be present.
+    """
+
+    def __init__(
+        self,
+        project_service: ProjectService,
+        task_service: TaskService,
+        continue_on_error: bool = False,
+        progress: Optional[ProgressCallback] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """
+        Initialize the batch runner.
+
+        Args:
+            project_service: Service for project operations
+            task_service: Service for task operations
+            continue_on_error: Keep running after a failed command instead
+                of stopping at the first one
+            progress: Called with rows read and rows/s while importing (optional)
+            profiler: Profiler wrapped around each command (optional)
+        """
+        self._project_service = project_service
+        self._task_service = task_service
+        self._continue_on_error = continue_on_error
+        self._transfer = DataTransfer(project_service, task_service)
+        self._progress = progress
+        self._profiler = Profiler() if profiler is None else profiler
+        self._commands: dict[
+            str, tuple[Callable[..., Any], dict[str, Callable[[str], Any]], tuple[str, ...]]
+        ] = {
+            "project.create": (
+                self._create_project, {"title": str, "description": str}, ("title",)
+            ),
+            "project.get": (self._get_project, {"id": _integer}, ("id",)),
+            "project.list": (
+                self._list_projects, {"limit": _integer, "after_id": _integer}, ()
+            ),
+            "project.update": (
+                self._update_project,
+                {"id": _integer, "title": str, "description": str,
+                 "expected_version": _integer},
+                ("id",),
+            ),
+            "project.delete": (
+                self._delete_project, {"id": _integer, "cascade": _boolean}, ("id",)
+            ),
+            "project.summary": (self._project_summary, {"id": _integer}, ("id",)),
+            "task.create": (
+                self._create_task,
+                {"project": _integer, "title": str, "description": str,
+                 "status": str, "deadline": _datetime},
+                ("project", "title"),
+            ),
+            "task.get": (self._get_task, {"id": _integer}, ("id",)),
+            "task.list": (
+                self._list_tasks,
+                {"project": _integer, "status": str, "limit": _integer,
+                 "after_id": _integer},
+                (),
+            ),
+            "task.update": (
+                self._update_task,
+                {"id": _integer, "title": str, "description": str,
+                 "deadline": _datetime, "expected_version": _integer},
+                ("id",),
+            ),
+            "task.status": (
+                self._update_task_status,
+                {"id": _integer, "status": str, "expected_version": _integer},
+                ("id", "status"),
+            ),
+            "task.delete": (self._delete_task, {"id": _integer}, ("id",)),
+            "task.search": (
+                self._search_tasks,
+                {"query": str, "project": _integer, "status": str, "limit": _integer},
+                ("query",),
+            ),
+            "stats": (self._statistics, {}, ()),
+            "export.projects": (
+                self._export_projects, {"path": str, "format": str}, ("path",)
+            ),
+            "export.tasks": (
+                self._export_tasks,
+                {"path": str, "format": str, "project": _integer},
+                ("path",),
+            ),
+            "import.projects": (
+                self._import_projects,
+                {"path": str, "format": str, "rejects": str, "chunk": _integer},
+                ("path",),
+            ),
+            "import.tasks": (
+                self._import_tasks,
+                {"path": str, "format": str, "rejects": str, "chunk": _integer},
+                ("path",),
+            ),
+        }
+
+    @property
+    def commands(self) -> list[str]:
+        """Names of the available commands."""
+        return sorted(self._commands)
+
+    def execute(self, line: str) -> Any:
+        """
+        Run a single command line.
+
+        Args:
+            line: Command with its arguments
+
+        Returns:
+            The command's result
+
+        Raises:
+            ValidationError: If the command or its arguments are invalid
+            ToDoListException: If the command fails
+        """
+        name, raw_arguments = parse_command(line)
+        if name not in self._commands:
+            raise ValidationError(f"Unknown command '{name}'")
+        handler, converters, required = self._commands[name]
+
+        arguments = {}
+        for key, value in raw_arguments.items():
+            if key not in converters:
+                raise ValidationError(f"Unknown argument '{key}' for {name}")
+            arguments[key] = converters[key](value)
+        missing = [key for key in required if key not in arguments]
+        if missing:
+            raise ValidationError(f"Missing argument(s) for {name}: {', '.join(missing)}")
+        with self._profiler.profile(f"batch.{name}"):
+            return handler(**arguments)
+
+    def run(self, lines: Iterable[str], output: TextIO) -> dict:
+        """
+        Run a script and write one JSON result line per command.
+
+        Args:
+            lines: Script lines (e.g. an open file or sys.stdin)
+            output: Stream the results are written to
+
+        Returns:
+            Dictionary with the number of commands that succeeded and
+            failed, and whether the run stopped at an error
+        """
+        buffer: list[str] = []
+        succeeded = failed = 0
+        stopped = False
+
+        try:
+            for number, line in enumerate(lines, start=1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                record: dict[str, Any] = {"line": number, "command": line.split(None, 1)[0]}
+                try:
+                    result = self.execute(line)
+                    record.update(ok=True, result=result)
+                    succeeded += 1
+                except Exception as e:
+                    # Errors other than ToDoListException (a file that is not
+                    # UTF-8, a failed write during export) fail the command too
+                    record.update(ok=False, error={"type": type(e).__name__, "message": str(e)})
+                    failed += 1
+
+                buffer.append(json.dumps(record, separators=(",", ":")))
+                if len(buffer) >= OUTPUT_BUFFER_LINES:
+                    output.write("\n".join(buffer) + "\n")
+                    buffer.clear()
+                if not record["ok"] and not self._continue_on_error:
+                    stopped = True
+                    break
+        finally:
+            # Results of the commands that ran are written even if reading
+            # the script fails or the run is interrupted
+            if buffer:
+                output.write("\n".join(buffer) + "\n")
+            output.flush()
+        return {"succeeded": succeeded, "failed": failed, "stopped": stopped}
+
+    # Projects
+
+    def _create_project(self, title: str, description: str = "") -> dict:
+        """Create a project."""
+        return self._project_service.create_project(title, description).to_dict()
+
+    def _get_project(self, id: int) -> dict:
+        """Return one project."""
+        return self._project_service.get_project(id).to_dict()
+
+    def _list_projects(self, limit: int = 20, after_id: Optional[int] = None) -> dict:
+        """Return one page of projects."""
+        page = self._project_service.get_projects_page(limit, after_id)
+        return {
+            "items": [project.to_dict() for project in page["items"]],
+            "next_after_id": page["next_after_id"],
+        }
+
+    def _update_project(
+        self,
+        id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        """Update a project's title and description."""
+        return self._project_service.update_project(
+            id, title=title, description=description, expected_version=expected_version
+        ).to_dict()
+
+    def _delete_project(self, id: int, cascade: bool = True) -> dict:
+        """Delete a project without asking for confirmation."""
+        return self._project_service.delete_project(id, cascade=cascade)
+
+    def _project_summary(self, id: int) -> dict:
+        """Return a project with its task counts per status."""
+        summary = self._project_service.get_project_summary(id)
+        return {**summary, "project": summary["project"].to_dict()}
+
+    # Tasks
+
+    def _create_task(
+        self,
+        project: int,
+        title: str,
+        description: str = "",
+        status: str = TaskStatus.TODO.value,
+        deadline: Optional[datetime] = None,
+    ) -> dict:
+        """Create a task in an existing project."""
+        self._project_service.get_project(project)
+        return self._task_service.create_task(
+            title, project, description, status=status, deadline=deadline
+        ).to_dict()
+
+    def _get_task(self, id: int) -> dict:
+        """Return one task."""
+        return self._task_service.get_task(id).to_dict()
+
+    def _list_tasks(
+        self,
+        project: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+        after_id: Optional[int] = None,
+    ) -> dict:
+        """Return one page of tasks, or all tasks with any of a comma-separated status list."""
+        if status is not None:
+            task_query = TaskQuery().with_status(*status.split(","))
+            if project is not None:
+                task_query = task_query.in_project(project)
+            return {"items": [task.to_dict() for task in self._task_service.query_tasks(task_query)]}
+
+        page = self._task_service.get_tasks_page(limit, after_id, project)
+        return {
+            "items": [task.to_dict() for task in page["items"]],
+            "next_after_id": page["next_after_id"],
+        }
+
+    def _update_task(
+        self,
+        id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        expected_version: Optional[int] = None,
+    ) -> dict:
+        """Update a task's details."""
+        return self._task_service.update_task(
+            id, title=title, description=description, deadline=deadline,
+            expected_version=expected_version,
+        ).to_dict()
+
+    def _update_task_status(
+        self, id: int, status: str, expected_version: Optional[int] = None
+    ) -> dict:
+        """Change a task's status."""
+        return self._task_service.update_task_status(id, status, expected_version).to_dict()
+
+    def _delete_task(self, id: int) -> dict:
+        """Delete a task without asking for confirmation."""
+        self._task_service.delete_task(id)
+        return {"task_id": id}
+
+    def _search_tasks(
+        self,
+        query: str,
+        project: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+    ) -> dict:
+        """Search task titles and descriptions."""
+        tasks = self._task_service.search(query, project_id=project, status=status, limit=limit)
+        return {"items": [task.to_dict() for task in tasks]}
+
+    def _statistics(self) -> dict:
+        """Return project and task counts."""
+        return {
+            "projects": self._project_service.count_projects(),
+            "tasks": self._task_service.count_tasks(),
+            "tasks_by_status": self._task_service.count_tasks_by_status(),
+        }
+
+    # Import and export
+
+    def _export_projects(self, path: str, format: Optional[str] = None) -> dict:
+        """Write all projects to a file."""
+        fmt = format or format_for_path(path)
+        with _open(path, "w") as output:
+            count = self._transfer.export_projects(output, fmt)
+        return {"path": path, "format": fmt, "exported": count}
+
+    def _export_tasks(
+        self, path: str, format: Optional[str] = None, project: Optional[int] = None
+    ) -> dict:
+        """Write all tasks, or one project's tasks, to a file."""
+        fmt = format or format_for_path(path)
+        with _open(path, "w") as output:
+            count = self._transfer.export_tasks(output, fmt, project)
+        return {"path": path, "format": fmt, "exported": count}
+
+    def _import_projects(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        rejects: Optional[str] = None,
+        chunk: int = IMPORT_CHUNK_SIZE,
+    ) -> dict:
+        """Create projects from a file."""
+        return self._import(self._transfer.import_projects, path, format, rejects, chunk)
+
+    def _import_tasks(
+        self,
+        path: str,
+        format: Optional[str] = None,
+        rejects: Optional[str] = None,
+        chunk: int = IMPORT_CHUNK_SIZE,
+    ) -> dict:
+        """Create tasks from a file."""
+        return self._import(self._transfer.import_tasks, path, format, rejects, chunk)
+
+    def _import(
+        self,
+        import_rows: Callable[..., dict],
+        path: str,
+        format: Optional[str],
+        rejects: Optional[str],
+        chunk: int,
+    ) -> dict:
+        """Run an import from path, writing rejected rows to the rejects file if given."""
+        fmt = format or format_for_path(path)
+        with _open(path, "r") as source, \
+                (_open(rejects, "w") if rejects else nullcontext()) as reject_stream:
+            result = import_rows(source, fmt, reject_stream, chunk, self._progress)
+        return {"path": path, "format": fmt, **result}
+
+
+def _open(path: str, mode: str) -> TextIO:
+    """
+    Open a text file for import or export.
+
+    Raises:
+        ValidationError: If the file cannot be opened
+    """
+    try:
+        return open(path, mode, encoding="utf-8", newline="")
+    except OSError as e:
+        raise ValidationError(f"Cannot open '{path}': {e.strerror}")
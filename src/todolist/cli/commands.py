@@ -5,23 +5,76 @@ This module provides interactive command-line interface for
 managing projects and tasks.
 """
 
-from typing import Optional
+import os
+from typing import Callable, Optional
 from datetime import datetime
 from ..models.task import TaskStatus
 from ..services.project_service import ProjectService
 from ..services.task_service import TaskService
+from ..services.transfer import DataTransfer, format_for_path
+from ..utils.metrics import MetricsRegistry, registry
+from ..utils.profiling import Profiler
 from ..utils.exceptions import (
     ToDoListException,
     ResourceNotFoundError,
     ValidationError,
 )
 
+# Number of items shown per page in listings
+PAGE_SIZE = 10
+
+# Menu choice -> CLI method handling it
+MENU_ACTIONS = {
+    "1": "_create_project",
+    "2": "_list_projects",
+    "3": "_view_project_details",
+    "4": "_update_project",
+    "5": "_delete_project",
+    "6": "_create_task",
+    "7": "_list_all_tasks",
+    "8": "_list_tasks_by_project",
+    "9": "_update_task",
+    "10": "_update_task_status",
+    "11": "_delete_task",
+    "12": "_show_statistics",
+    "13": "_search_tasks",
+    "14": "_export_data",
+    "15": "_import_data",
+    "16": "_show_metrics",
+}
+
+
+# Width of the project progress bars, in characters
+PROGRESS_BAR_WIDTH = 20
+
+
+def progress_bar(done: int, total: int, width: int = PROGRESS_BAR_WIDTH) -> str:
+    """
+    Render the share of done tasks as a text progress bar.
+
+    Args:
+        done: Number of done tasks
+        total: Number of tasks
+        width: Number of characters in the bar
+
+    Returns:
+        Bar followed by the percentage and counts, e.g. "[#####-----] 50% (1/2 done)"
+    """
+    if total == 0:
+        return f"[{'-' * width}] no tasks"
+    filled = round(width * done / total)
+    return f"[{'#' * filled}{'-' * (width - filled)}] {done * 100 // total}% ({done}/{total} done)"
+
 
 class CLI:
     """Command-line interface for ToDo List application."""
 
     def __init__(
-            self, project_service: ProjectService, task_service: TaskService
+            self,
+            project_service: ProjectService,
+            task_service: TaskService,
+            metrics: Optional[MetricsRegistry] = None,
+            profiler: Optional[Profiler] = None,
     ) -> None:
         """
         Initialize CLI.
@@ -29,9 +82,15 @@ class CLI:
         Args:
             project_service: Service for project operations
             task_service: Service for task operations
+            metrics: Registry shown on the metrics screen (default: the
+                global registry)
+            profiler: Profiler wrapped around each menu action (optional)
         """
         self._project_service = project_service
         self._task_service = task_service
+        self._metrics = registry if metrics is None else metrics
+        self._profiler = Profiler() if profiler is None else profiler
+        self._transfer = DataTransfer(project_service, task_service)
 
     def display_menu(self) -> None:
         """Display main menu."""
@@ -53,6 +112,10 @@ class CLI:
         print(" 11. Delete Task")
         print("\nOther:")
         print(" 12. Show Statistics")
+        print(" 13. Search Tasks")
+        print(" 14. Export Data")
+        print(" 15. Import Data")
+        print(" 16. Performance Metrics")
         print("  0. Exit")
         print("=" * 50)
 
@@ -68,30 +131,10 @@ class CLI:
                 if choice == "0":
                     print("\n👋 Goodbye!")
                     break
-                elif choice == "1":
-                    self._create_project()
-                elif choice == "2":
-                    self._list_projects()
-                elif choice == "3":
-                    self._view_project_details()
-                elif choice == "4":
-                    self._update_project()
-                elif choice == "5":
-                    self._delete_project()
-                elif choice == "6":
-                    self._create_task()
-                elif choice == "7":
-                    self._list_all_tasks()
-                elif choice == "8":
-                    self._list_tasks_by_project()
-                elif choice == "9":
-                    self._update_task()
-                elif choice == "10":
-                    self._update_task_status()
-                elif choice == "11":
-                    self._delete_task()
-                elif choice == "12":
-                    self._show_statistics()
+                elif choice in MENU_ACTIONS:
+                    action = MENU_ACTIONS[choice]
+                    with self._profiler.profile(f"cli.{action.lstrip('_')}"):
+                        getattr(self, action)()
                 else:
                     print("\n❌ Invalid choice. Please try again.")
 
@@ -120,6 +163,88 @@ class CLI:
             print("❌ Invalid input. Please enter a valid number.")
             return None
 
+    def _browse_pages(
+        self,
+        fetch_page: Callable[[Optional[int]], dict],
+        show_item: Callable[[int, object], None],
+        empty_message: str,
+    ) -> None:
+        """
+        Show a listing one page at a time with next/previous navigation.
+
+        Args:
+            fetch_page: Returns the page after a cursor (None for the first page)
+            show_item: Prints one item given its position and the item
+            empty_message: Message printed when there is nothing to list
+        """
+        # Cursor of every page shown so far; the last one is the current page
+        cursors: list[Optional[int]] = [None]
+
+        while True:
+            page = fetch_page(cursors[-1])
+            if not page["items"] and len(cursors) == 1:
+                print(empty_message)
+                return
+
+            first = (len(cursors) - 1) * PAGE_SIZE + 1
+            for idx, item in enumerate(page["items"], first):
+                show_item(idx, item)
+
+            options = []
+            if page["next_after_id"] is not None:
+                options.append("n = next")
+            if len(cursors) > 1:
+                options.append("p = previous")
+            if not options:
+                return
+
+            choice = input(f"\n[{', '.join(options)}, Enter = back]: ").strip().lower()
+            if choice == "n" and page["next_after_id"] is not None:
+                cursors.append(page["next_after_id"])
+            elif choice == "p" and len(cursors) > 1:
+                cursors.pop()
+            else:
+                return
+
+    def _select_project(self) -> Optional[int]:
+        """
+        Let the user pick a project by ID or by (part of) its title.
+
+        A number is taken as an ID when a project has that ID, and as a
+        title otherwise, so titles such as "2024" can still be selected.
+
+        Returns:
+            Selected project ID, or None if nothing was selected
+        """
+        text = input("\nProject ID or title: ").strip()
+        if not text:
+            return None
+        if text.isdigit():
+            try:
+                return self._project_service.get_project(int(text)).id
+            except ResourceNotFoundError:
+                pass
+
+        candidates = self._project_service.find_projects(text, limit=PAGE_SIZE)
+        if not candidates:
+            print("❌ No matching projects found.")
+            return None
+        if len(candidates) == 1:
+            print(f"   Project: {candidates[0].title} (ID: {candidates[0].id})")
+            return candidates[0].id
+
+        print("\nMatching Projects:")
+        for idx, project in enumerate(candidates, 1):
+            print(f"  {idx}. {project.title} (ID: {project.id})")
+
+        choice = self._get_integer_input("\nSelect a project number: ")
+        if choice is None:
+            return None
+        if not 1 <= choice <= len(candidates):
+            print("❌ Invalid selection.")
+            return None
+        return candidates[choice - 1].id
+
     def _create_project(self) -> None:
         """Handle project creation."""
         print("\n--- Create New Project ---")
@@ -137,17 +262,21 @@ class CLI:
     def _list_projects(self) -> None:
         """Handle listing all projects."""
         print("\n--- All Projects ---")
-        projects = self._project_service.get_all_projects()
 
-        if not projects:
-            print("No projects found.")
-            return
+        def fetch_page(after_id: Optional[int]) -> dict:
+            page = self._project_service.get_projects_page(PAGE_SIZE, after_id)
+            return {**page, "items": self._project_service.get_project_summaries(page["items"])}
 
-        for idx, project in enumerate(projects, 1):
+        def show_project(idx: int, summary: dict) -> None:
+            project = summary["project"]
+            done = summary["status_breakdown"][TaskStatus.DONE.value]
             print(f"\n{idx}. {project.title}")
             print(f"   ID: {project.id}")
             print(f"   Description: {project.description or '(no description)'}")
             print(f"   Created: {project.created_at.strftime('%Y-%m-%d %H:%M')}")
+            print(f"   Progress: {progress_bar(done, summary['total_tasks'])}")
+
+        self._browse_pages(fetch_page, show_project, "No projects found.")
 
     def _view_project_details(self) -> None:
         """Handle viewing project details with tasks."""
@@ -167,6 +296,7 @@ class CLI:
             print(f"   Created: {project.created_at.strftime('%Y-%m-%d %H:%M')}")
             print(f"\n📊 Task Statistics:")
             print(f"   Total Tasks: {summary['total_tasks']}")
+            print(f"   Progress: {progress_bar(summary['status_breakdown'][TaskStatus.DONE.value], summary['total_tasks'])}")
             for status, count in summary["status_breakdown"].items():
                 print(f"   {status}: {count}")
 
@@ -239,17 +369,11 @@ class CLI:
         """Handle task creation."""
         print("\n--- Create New Task ---")
 
-        # Show available projects
-        projects = self._project_service.get_all_projects()
-        if not projects:
+        if not self._project_service.count_projects():
             print("❌ No projects available. Please create a project first.")
             return
 
-        print("\nAvailable Projects:")
-        for idx, project in enumerate(projects, 1):
-            print(f"  {idx}. {project.title} (ID: {project.id})")
-
-        project_id = self._get_integer_input("\nEnter Project ID: ")
+        project_id = self._select_project()
 
         if project_id is None:
             return
@@ -288,19 +412,20 @@ class CLI:
     def _list_all_tasks(self) -> None:
         """Handle listing all tasks."""
         print("\n--- All Tasks ---")
-        tasks = self._task_service.get_all_tasks()
 
-        if not tasks:
-            print("No tasks found.")
-            return
-
-        for idx, task in enumerate(tasks, 1):
+        def show_task(idx: int, task) -> None:
             deadline_str = f" | 📅 Deadline: {task.deadline.strftime('%Y-%m-%d %H:%M')}" if task.deadline else ""
             print(f"\n{idx}. [{task.status}] {task.title}{deadline_str}")
             print(f"   ID: {task.id}")
             print(f"   Project ID: {task.project_id}")
             print(f"   Description: {task.description or '(no description)'}")
 
+        self._browse_pages(
+            lambda after_id: self._task_service.get_tasks_page(PAGE_SIZE, after_id),
+            show_task,
+            "No tasks found.",
+        )
+
     def _list_tasks_by_project(self) -> None:
         """Handle listing tasks for a specific project."""
         print("\n--- Tasks by Project ---")
@@ -311,24 +436,62 @@ class CLI:
 
         try:
             project = self._project_service.get_project(project_id)
-            tasks = self._task_service.get_tasks_by_project(project_id)
+            task_count = self._task_service.count_tasks_by_project(project_id)
 
             print(f"\n📁 Project: {project.title}")
-            print(f"📝 Tasks ({len(tasks)}):")
-
-            if not tasks:
-                print("   No tasks in this project.")
-                return
+            print(f"📝 Tasks ({task_count}):")
 
-            for idx, task in enumerate(tasks, 1):
+            def show_task(idx: int, task) -> None:
                 deadline_str = f" | 📅 {task.deadline.strftime('%Y-%m-%d %H:%M')}" if task.deadline else ""
                 print(f"\n{idx}. [{task.status}] {task.title}{deadline_str}")
                 print(f"   ID: {task.id}")
                 print(f"   Description: {task.description or '(no description)'}")
 
+            self._browse_pages(
+                lambda after_id: self._task_service.get_tasks_page(
+                    PAGE_SIZE, after_id, project_id=project_id
+                ),
+                show_task,
+                "   No tasks in this project.",
+            )
+
         except ResourceNotFoundError as e:
             print(f"\n❌ {e}")
 
+    def _search_tasks(self) -> None:
+        """Handle full-text search over tasks."""
+        print("\n--- Search Tasks ---")
+        print("Words must all match; use OR for alternatives and * for prefixes.")
+        query = input("Search: ").strip()
+
+        project_id = None
+        project_input = input("Project ID (optional, press Enter to search all): ").strip()
+        if project_input:
+            try:
+                project_id = int(project_input)
+            except ValueError:
+                print("❌ Invalid input. Please enter a valid number.")
+                return
+
+        status = input("Status (optional, press Enter for any): ").strip().upper() or None
+
+        try:
+            tasks = self._task_service.search(query, project_id=project_id, status=status)
+        except ValidationError as e:
+            print(f"\n❌ {e}")
+            return
+
+        if not tasks:
+            print("No matching tasks found.")
+            return
+
+        for idx, task in enumerate(tasks, 1):
+            deadline_str = f" | 📅 {task.deadline.strftime('%Y-%m-%d %H:%M')}" if task.deadline else ""
+            print(f"\n{idx}. [{task.status}] {task.title}{deadline_str}")
+            print(f"   ID: {task.id}")
+            print(f"   Project ID: {task.project_id}")
+            print(f"   Description: {task.description or '(no description)'}")
+
     def _update_task(self) -> None:
         """Handle task update."""
         print("\n--- Update Task ---")
@@ -431,6 +594,98 @@ class CLI:
 
         # Task breakdown by status
         print(f"\n📝 Tasks by Status:")
-        for status in TaskStatus.values():
-            count = len(self._task_service.get_tasks_by_status(status))
+        for status, count in self._task_service.count_tasks_by_status().items():
             print(f"   {status}: {count}")
+
+    def _show_metrics(self) -> None:
+        """Display call counts, errors and latencies of instrumented operations."""
+        print("\n--- Performance Metrics ---")
+
+        operations = self._metrics.snapshot()
+        if not operations:
+            print("No calls recorded. Set METRICS_ENABLED=true to record them.")
+            return
+
+        print(f"\n⏱️  Latency (µs):")
+        print(f"   {'Operation':42} {'Calls':>8} {'Errors':>6} "
+              f"{'p50':>8} {'p90':>8} {'p99':>8} {'Max':>9}")
+        for operation in operations:
+            print(f"   {operation['operation']:42} {operation['calls']:>8,} "
+                  f"{sum(operation['errors'].values()):>6,} "
+                  f"{operation['p50_us']:>8,.1f} {operation['p90_us']:>8,.1f} "
+                  f"{operation['p99_us']:>8,.1f} {operation['max_us']:>9,.1f}")
+
+        errors = [
+            (operation["operation"], error, count)
+            for operation in operations
+            for error, count in operation["errors"].items()
+        ]
+        if errors:
+            print(f"\n❗ Errors:")
+            for name, error, count in errors:
+                print(f"   {name}: {error} x{count}")
+
+    def _select_data_kind(self) -> Optional[str]:
+        """Ask whether to transfer projects or tasks."""
+        kind = input("Projects or tasks? (p/t): ").strip().lower()
+        if kind in ("p", "projects"):
+            return "projects"
+        if kind in ("t", "tasks"):
+            return "tasks"
+        print("❌ Invalid choice. Please enter p or t.")
+        return None
+
+    def _export_data(self) -> None:
+        """Handle exporting projects or tasks to an NDJSON or CSV file."""
+        print("\n--- Export Data ---")
+        kind = self._select_data_kind()
+        if kind is None:
+            return
+        path = input("File (.csv for CSV, anything else for NDJSON): ").strip()
+        if not path:
+            print("❌ A file name is required.")
+            return
+
+        try:
+            with open(path, "w", encoding="utf-8", newline="") as output:
+                if kind == "projects":
+                    count = self._transfer.export_projects(output, format_for_path(path))
+                else:
+                    count = self._transfer.export_tasks(output, format_for_path(path))
+            print(f"\n✅ Exported {count} {kind} to {path}")
+        except OSError as e:
+            print(f"\n❌ Cannot write {path}: {e}")
+
+    def _import_data(self) -> None:
+        """Handle importing projects or tasks from an NDJSON or CSV file."""
+        print("\n--- Import Data ---")
+        kind = self._select_data_kind()
+        if kind is None:
+            return
+        path = input("File (.csv for CSV, anything else for NDJSON): ").strip()
+        reject_path = f"{path}.rejects.ndjson"
+
+        def show_progress(rows: int, rows_per_second: float) -> None:
+            print(f"\r   {rows:,} rows ({rows_per_second:,.0f} rows/s)", end="", flush=True)
+
+        try:
+            with open(path, encoding="utf-8", newline="") as source, \
+                    open(reject_path, "w", encoding="utf-8") as rejects:
+                if kind == "projects":
+                    result = self._transfer.import_projects(
+                        source, format_for_path(path), rejects, progress=show_progress
+                    )
+                else:
+                    result = self._transfer.import_tasks(
+                        source, format_for_path(path), rejects, progress=show_progress
+                    )
+        except OSError as e:
+            print(f"\n❌ Cannot read {path}: {e}")
+            return
+
+        print(f"\n\n✅ Imported {result['imported']} of {result['rows']} rows "
+              f"({result['rows_per_second']:,.0f} rows/s)")
+        if result["rejected"]:
+            print(f"   {result['rejected']} rejected rows written to {reject_path}")
+        else:
+            os.remove(reject_path)
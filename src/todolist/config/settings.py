@@ -2,12 +2,44 @@
 Configuration management module.
 
 This module handles loading and validating environment variables
-from .env file for application configuration.
+from .env file for application configuration. The global ``settings``
+object reads them on first use, not on import, so importing the
+package stays cheap.
 """
 
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import sys
+from typing import Any, Optional
+from ..utils.profiling import PROFILE_MODES
+
+# Storage backends understood by repositories.factory
+STORAGE_BACKENDS = ("memory", "sqlite", "journal", "snapshot")
+
+
+def _find_dotenv() -> Optional[str]:
+    """
+    Find the .env file that load_dotenv() would load.
+
+    Like python-dotenv, look in the current directory when running
+    interactively, and otherwise in this module's directory and its
+    parents.
+
+    Returns:
+        Path of the nearest .env file, or None if there is none
+    """
+    main_module = sys.modules.get("__main__")
+    if main_module is None or not hasattr(main_module, "__file__"):
+        directory = os.getcwd()
+    else:
+        directory = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(directory, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
 
 
 class Settings:
@@ -15,8 +47,13 @@ class Settings:
 
     def __init__(self) -> None:
         """Initialize settings by loading environment variables."""
-        # Load .env file from project root
-        load_dotenv()
+        # Load .env file from project root. python-dotenv is slow to
+        # import, so it is only imported when there is a file to load
+        dotenv_path = _find_dotenv()
+        if dotenv_path is not None:
+            from dotenv import load_dotenv
+
+            load_dotenv(dotenv_path)
 
         # Load configuration with default values
         self.max_number_of_project: int = self._get_int_env(
@@ -25,6 +62,54 @@ class Settings:
         self.max_number_of_task: int = self._get_int_env(
             "MAX_NUMBER_OF_TASK", default=50
         )
+        self.storage_backend: str = self._get_str_env(
+            "STORAGE_BACKEND", default="memory"
+        ).lower()
+        self.sqlite_path: str = self._get_str_env(
+            "SQLITE_PATH", default="todolist.db"
+        )
+        self.journal_dir: str = self._get_str_env(
+            "JOURNAL_DIR", default="todolist_data"
+        )
+        self.journal_fsync_every: int = self._get_int_env(
+            "JOURNAL_FSYNC_EVERY", default=100
+        )
+        self.snapshot_dir: str = self._get_str_env(
+            "SNAPSHOT_DIR", default="todolist_data"
+        )
+        self.compact_models: bool = self._get_bool_env(
+            "COMPACT_MODELS", default=False
+        )
+        self.async_max_workers: int = self._get_int_env(
+            "ASYNC_MAX_WORKERS", default=4
+        )
+        self.api_host: str = self._get_str_env(
+            "API_HOST", default="127.0.0.1"
+        )
+        self.api_port: int = self._get_int_env(
+            "API_PORT", default=8080
+        )
+        self.metrics_enabled: bool = self._get_bool_env(
+            "METRICS_ENABLED", default=False
+        )
+        self.metrics_file: str = self._get_str_env(
+            "METRICS_FILE", default=""
+        )
+        self.metrics_port: int = self._get_int_env(
+            "METRICS_PORT", default=0
+        )
+        self.profile_mode: str = self._get_str_env(
+            "TODOLIST_PROFILE", default="off"
+        ).lower()
+        self.profile_dir: str = self._get_str_env(
+            "TODOLIST_PROFILE_DIR", default="profiles"
+        )
+        self.profile_sample_every: int = self._get_int_env(
+            "TODOLIST_PROFILE_SAMPLE_EVERY", default=1
+        )
+        self.profile_top: int = self._get_int_env(
+            "TODOLIST_PROFILE_TOP", default=25
+        )
 
         # Validate configuration
         self._validate()
@@ -53,6 +138,49 @@ class Settings:
             )
             return default
 
+    def _get_str_env(self, key: str, default: str) -> str:
+        """
+        Get string value from environment variable.
+
+        Args:
+            key: Environment variable name
+            default: Default value if not found or empty
+
+        Returns:
+            String value from environment or default
+        """
+        value: Optional[str] = os.getenv(key)
+        if value is None or not value.strip():
+            return default
+        return value.strip()
+
+    def _get_bool_env(self, key: str, default: bool) -> bool:
+        """
+        Get boolean value from environment variable.
+
+        Args:
+            key: Environment variable name
+            default: Default value if not found or invalid
+
+        Returns:
+            True for 1/true/yes/on, False for 0/false/no/off, default otherwise
+        """
+        value: Optional[str] = os.getenv(key)
+        if value is None:
+            return default
+
+        normalized = value.strip().lower()
+        if normalized in ("1", "true", "yes", "on"):
+            return True
+        if normalized in ("0", "false", "no", "off"):
+            return False
+
+        print(
+            f"Warning: Invalid value for {key}='{value}'. "
+            f"Using default: {default}"
+        )
+        return default
+
     def _validate(self) -> None:
         """
         Validate configuration values.
@@ -72,14 +200,104 @@ class Settings:
                 f"got {self.max_number_of_task}"
             )
 
+        if self.journal_fsync_every < 1:
+            raise ValueError(
+                f"JOURNAL_FSYNC_EVERY must be >= 1, "
+                f"got {self.journal_fsync_every}"
+            )
+
+        if self.async_max_workers < 1:
+            raise ValueError(
+                f"ASYNC_MAX_WORKERS must be >= 1, "
+                f"got {self.async_max_workers}"
+            )
+
+        if not 0 <= self.api_port <= 65535:
+            raise ValueError(
+                f"API_PORT must be between 0 and 65535, "
+                f"got {self.api_port}"
+            )
+
+        if not 0 <= self.metrics_port <= 65535:
+            raise ValueError(
+                f"METRICS_PORT must be between 0 and 65535, "
+                f"got {self.metrics_port}"
+            )
+
+        if self.profile_mode not in PROFILE_MODES:
+            raise ValueError(
+                f"TODOLIST_PROFILE must be one of {', '.join(PROFILE_MODES)}, "
+                f"got '{self.profile_mode}'"
+            )
+
+        if self.profile_sample_every < 1:
+            raise ValueError(
+                f"TODOLIST_PROFILE_SAMPLE_EVERY must be >= 1, "
+                f"got {self.profile_sample_every}"
+            )
+
+        if self.profile_top < 1:
+            raise ValueError(
+                f"TODOLIST_PROFILE_TOP must be >= 1, "
+                f"got {self.profile_top}"
+            )
+
+        if self.storage_backend not in STORAGE_BACKENDS:
+            raise ValueError(
+                f"STORAGE_BACKEND must be one of {', '.join(STORAGE_BACKENDS)}, "
+                f"got '{self.storage_backend}'"
+            )
+
     def __repr__(self) -> str:
         """Return string representation of settings."""
         return (
             f"Settings("
             f"max_number_of_project={self.max_number_of_project}, "
-            f"max_number_of_task={self.max_number_of_task})"
+            f"max_number_of_task={self.max_number_of_task}, "
+            f"storage_backend='{self.storage_backend}')"
         )
 
 
-# Global settings instance
-settings = Settings()
+class LazySettings:
+    """
+    Settings that are loaded on first attribute access.
+
+    Once loaded, the attributes are copied onto the proxy, so reading
+    them costs the same as reading them from Settings. Assignments (for
+    example by tests) go to both the proxy and the loaded settings.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the proxy without loading anything."""
+        object.__setattr__(self, "_settings", None)
+
+    def _load(self) -> Settings:
+        """Load the settings if needed and return them."""
+        loaded = self._settings
+        if loaded is None:
+            loaded = Settings()
+            self.__dict__.update(vars(loaded))
+            object.__setattr__(self, "_settings", loaded)
+        return loaded
+
+    def __getattr__(self, name: str) -> Any:
+        """Load the settings and return one of their attributes."""
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute of the loaded settings."""
+        setattr(self._load(), name, value)
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        """Delete an attribute of the loaded settings."""
+        delattr(self._load(), name)
+        object.__delattr__(self, name)
+
+    def __repr__(self) -> str:
+        """Return string representation of the loaded settings."""
+        return repr(self._load())
+
+
+# Global settings instance, loaded on first use
+settings = LazySettings()
@@ -1,24 +1,166 @@
 """
 Main entry point for the ToDo List application.
 
-This module initializes all components and starts the CLI interface.
+This module initializes all components and starts the CLI interface,
+or runs a batch script when started with --batch. The interactive and
+batch front ends are imported only by the mode that uses them, to keep
+startup short.
 """
 
-from .repositories.project_repository import ProjectRepository
-from .repositories.task_repository import TaskRepository
+import argparse
+import sys
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, ContextManager, Optional
+from .repositories.factory import create_repositories
 from .services.project_service import ProjectService
 from .services.task_service import TaskService
-from .cli.commands import CLI
 from .config import settings
+from .utils.metrics import exporting, instrument
+from .utils.profiling import Profiler
 
+if TYPE_CHECKING:
+    from .cli.batch import BatchRunner
 
-def main() -> None:
+
+def _parse_arguments(argv: Optional[list[str]]) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="ToDo List application")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="run commands from FILE ('-' for stdin) instead of the interactive menu",
+    )
+    parser.add_argument(
+        "--continue-on-error",
+        action="store_true",
+        help="in batch mode, keep going after a failed command",
+    )
+    return parser.parse_args(argv)
+
+
+def _create_profiler(project_service: ProjectService, task_service: TaskService) -> Profiler:
+    """
+    Create the profiler configured by TODOLIST_PROFILE and wrap the services in it.
+
+    Args:
+        project_service: Service for project operations
+        task_service: Service for task operations
+
+    Returns:
+        Profiler for the CLI or batch commands
+    """
+    profiler = Profiler(
+        settings.profile_mode,
+        settings.profile_dir,
+        settings.profile_sample_every,
+        settings.profile_top,
+    )
+    profiler.wrap(project_service, "project_service")
+    profiler.wrap(task_service, "task_service")
+    return profiler
+
+
+def _collect_metrics(components: dict[str, object]) -> ContextManager:
+    """
+    Instrument components if metrics are enabled.
+
+    Args:
+        components: Services and repositories by metric name prefix
+
+    Returns:
+        Context manager that exports the metrics (METRICS_PORT,
+        METRICS_FILE) while the application runs
+    """
+    if not settings.metrics_enabled:
+        return nullcontext()
+    for name, component in components.items():
+        instrument(component, name)
+    return exporting(settings.metrics_port, settings.metrics_file)
+
+
+def _run_script(runner: "BatchRunner", path: str) -> dict:
+    """Run a batch script file, or stdin for "-", and return the summary."""
+    if path == "-":
+        return runner.run(sys.stdin, sys.stdout)
+    with open(path, encoding="utf-8") as script:
+        return runner.run(script, sys.stdout)
+
+
+def run_batch(path: str, continue_on_error: bool = False) -> int:
+    """
+    Run a batch script against the configured storage backend.
+
+    Results are written to stdout as one JSON line per command (see
+    cli.batch), and a summary line to stderr.
+
+    Args:
+        path: Script file, or "-" to read from stdin
+        continue_on_error: Keep going after a failed command
+
+    Returns:
+        Process exit status: 0 if every command succeeded, 1 otherwise
+    """
+    from .cli.batch import BatchRunner
+
+    project_repo, task_repo = create_repositories()
+    last_report = [0.0]
+
+    def show_progress(rows: int, rows_per_second: float) -> None:
+        # Imports report every chunk; print at most once a second
+        now = time.monotonic()
+        if now - last_report[0] >= 1.0:
+            last_report[0] = now
+            print(f"{rows:,} rows ({rows_per_second:,.0f} rows/s)", file=sys.stderr)
+
+    project_service = ProjectService(project_repo, task_repo)
+    task_service = TaskService(task_repo)
+    runner = BatchRunner(
+        project_service,
+        task_service,
+        continue_on_error=continue_on_error,
+        progress=show_progress,
+        profiler=_create_profiler(project_service, task_service),
+    )
+    metrics = _collect_metrics({
+        "project_repository": project_repo,
+        "task_repository": task_repo,
+        "project_service": project_service,
+        "task_service": task_service,
+    })
+    try:
+        with metrics:
+            summary = _run_script(runner, path)
+    finally:
+        for repository in (project_repo, task_repo):
+            close = getattr(repository, "close", None)
+            if close is not None:
+                close()
+
+    print(
+        f"{summary['succeeded']} succeeded, {summary['failed']} failed"
+        + (" (stopped at first error)" if summary["stopped"] else ""),
+        file=sys.stderr,
+    )
+    return 1 if summary["failed"] else 0
+
+
+def main(argv: Optional[list[str]] = None) -> None:
     """
     Main function to start the application.
 
     Initializes repositories, services, and CLI, then starts
-    the interactive interface.
+    the interactive interface, or runs a batch script if requested.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
     """
+    args = _parse_arguments(argv)
+    if args.batch is not None:
+        sys.exit(run_batch(args.batch, args.continue_on_error))
+
+    from .cli.commands import CLI
+
     # Display configuration
     print("=" * 50)
     print("ToDo List Application - Phase 1")
@@ -26,20 +168,33 @@ def main() -> None:
     print("\nConfiguration:")
     print(f"  Max Projects: {settings.max_number_of_project}")
     print(f"  Max Tasks: {settings.max_number_of_task}")
+    print(f"  Storage: {settings.storage_backend}")
+    print(f"  Metrics: {'on' if settings.metrics_enabled else 'off'}")
+    print(f"  Profiling: {settings.profile_mode}")
 
     # Initialize repositories
-    project_repo = ProjectRepository()
-    task_repo = TaskRepository()
+    project_repo, task_repo = create_repositories()
 
     # Initialize services
     project_service = ProjectService(project_repo, task_repo)
     task_service = TaskService(task_repo)
 
     # Initialize and run CLI
-    cli = CLI(project_service, task_service)
+    cli = CLI(
+        project_service,
+        task_service,
+        profiler=_create_profiler(project_service, task_service),
+    )
+    metrics = _collect_metrics({
+        "project_repository": project_repo,
+        "task_repository": task_repo,
+        "project_service": project_service,
+        "task_service": task_service,
+    })
 
     try:
-        cli.run()
+        with metrics:
+            cli.run()
     except KeyboardInterrupt:
         print("\n\nApplication terminated by user.")
     except Exception as e:
@@ -47,6 +202,12 @@ def main() -> None:
         import traceback
 
         traceback.print_exc()
+    finally:
+        # Flush repositories that keep files open (e.g., journal backend)
+        for repository in (project_repo, task_repo):
+            close = getattr(repository, "close", None)
+            if close is not None:
+                close()
 
 
 if __name__ == "__main__":
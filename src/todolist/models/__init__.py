@@ -1,5 +1,15 @@
 # src/todolist/models/__init__.py
-from .task import Task, TaskStatus
-from .project import Project
+from ..utils.lazy import lazy_exports
 
-__all__ = ['Task', 'TaskStatus', 'Project']
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "Task": "task",
+    "TaskStatus": "task",
+    "Project": "project",
+    "CompactTask": "compact",
+    "CompactProject": "compact",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,241 @@
+"""
+Compact domain models.
+
+This module defines slotted variants of Task and Project for storing
+large numbers of entities. Statuses are kept as small integer codes and
+timestamps as integer microseconds since the epoch; they are converted
+back to strings and datetimes only when read. Attribute access and
+behaviour are identical to the regular models.
+"""
+
+from datetime import datetime
+from typing import Optional, Union
+from ..utils.exceptions import ValidationError
+from ..utils.timestamps import datetime_to_micros, micros_to_datetime
+from .project import Project
+from .task import Task, TaskStatus
+
+# Status values indexed by their compact code, and the reverse mapping
+STATUS_VALUES: list[str] = TaskStatus.values()
+STATUS_CODES: dict[str, int] = {status: code for code, status in enumerate(STATUS_VALUES)}
+
+
+class CompactTask:
+    """
+    Slotted Task with integer status code and epoch timestamps.
+
+    Exposes the same attributes and methods as Task, so repositories
+    can store it in place of a Task without callers noticing.
+    """
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "project_id",
+        "_status_code",
+        "_deadline",
+        "_created_at",
+        "_updated_at",
+        "version",
+    )
+
+    # Validation and behaviour are shared with Task; they only use
+    # attribute access, which the properties below provide.
+    _validate_string_word_count = Task._validate_string_word_count
+    _validate_status = Task._validate_status
+    _validate_deadline = Task._validate_deadline
+    update_status = Task.update_status
+    update_details = Task.update_details
+    to_dict = Task.to_dict
+    __str__ = Task.__str__
+    __repr__ = Task.__repr__
+
+    @classmethod
+    def from_task(cls, task: Union[Task, "CompactTask"]) -> "CompactTask":
+        """
+        Build a compact copy of a task.
+
+        Args:
+            task: Task to convert
+
+        Returns:
+            CompactTask with the same data
+        """
+        compact = cls.__new__(cls)
+        compact.id = task.id
+        compact.title = task.title
+        compact.description = task.description
+        compact.project_id = task.project_id
+        compact.status = task.status
+        compact.deadline = task.deadline
+        compact.created_at = task.created_at
+        compact.updated_at = task.updated_at
+        compact.version = task.version
+        return compact
+
+    def to_task(self) -> Task:
+        """
+        Convert back into a regular Task.
+
+        Returns:
+            Task with the same data
+        """
+        return Task.from_record(
+            id=self.id,
+            title=self.title,
+            project_id=self.project_id,
+            description=self.description,
+            status=self.status,
+            deadline=self.deadline,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            version=self.version,
+        )
+
+    @property
+    def status(self) -> str:
+        """Current status value."""
+        return STATUS_VALUES[self._status_code]
+
+    @status.setter
+    def status(self, value: str) -> None:
+        code = STATUS_CODES.get(value)
+        if code is None:
+            raise ValidationError(
+                f"Task status must be one of {STATUS_VALUES}, got '{value}'"
+            )
+        self._status_code = code
+
+    @property
+    def deadline(self) -> Optional[datetime]:
+        """Optional deadline."""
+        if self._deadline is None:
+            return None
+        return micros_to_datetime(self._deadline)
+
+    @deadline.setter
+    def deadline(self, value: Optional[datetime]) -> None:
+        self._deadline = None if value is None else datetime_to_micros(value)
+
+    @property
+    def deadline_micros(self) -> Optional[int]:
+        """Deadline as microseconds since the epoch, without building a datetime."""
+        return self._deadline
+
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp of creation."""
+        return micros_to_datetime(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = datetime_to_micros(value)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Timestamp of last update."""
+        return micros_to_datetime(self._updated_at)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_at = datetime_to_micros(value)
+
+    def _fields(self) -> tuple:
+        """Return the field values in Task field order."""
+        return (
+            self.title, self.project_id, self.description, self.status,
+            self.deadline, self.id, self.created_at, self.updated_at, self.version,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another CompactTask or Task by field values."""
+        if isinstance(other, (Task, CompactTask)):
+            return self._fields() == CompactTask._fields(other)
+        return NotImplemented
+
+    __hash__ = None
+
+
+class CompactProject:
+    """
+    Slotted Project with epoch timestamps.
+
+    Exposes the same attributes and methods as Project.
+    """
+
+    __slots__ = ("id", "title", "description", "_created_at", "_updated_at", "version")
+
+    _validate_string_word_count = Project._validate_string_word_count
+    update_details = Project.update_details
+    to_dict = Project.to_dict
+    __str__ = Project.__str__
+    __repr__ = Project.__repr__
+
+    @classmethod
+    def from_project(cls, project: Union[Project, "CompactProject"]) -> "CompactProject":
+        """
+        Build a compact copy of a project.
+
+        Args:
+            project: Project to convert
+
+        Returns:
+            CompactProject with the same data
+        """
+        compact = cls.__new__(cls)
+        compact.id = project.id
+        compact.title = project.title
+        compact.description = project.description
+        compact.created_at = project.created_at
+        compact.updated_at = project.updated_at
+        compact.version = project.version
+        return compact
+
+    def to_project(self) -> Project:
+        """
+        Convert back into a regular Project.
+
+        Returns:
+            Project with the same data
+        """
+        return Project.from_record(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+            version=self.version,
+        )
+
+    @property
+    def created_at(self) -> datetime:
+        """Timestamp of creation."""
+        return micros_to_datetime(self._created_at)
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at = datetime_to_micros(value)
+
+    @property
+    def updated_at(self) -> datetime:
+        """Timestamp of last update."""
+        return micros_to_datetime(self._updated_at)
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_at = datetime_to_micros(value)
+
+    def _fields(self) -> tuple:
+        """Return the field values in Project field order."""
+        return (
+            self.title, self.description, self.id, self.created_at, self.updated_at, self.version,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with another CompactProject or Project by field values."""
+        if isinstance(other, (Project, CompactProject)):
+            return self._fields() == CompactProject._fields(other)
+        return NotImplemented
+
+    __hash__ = None
@@ -8,6 +8,7 @@ of related tasks.
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
+from ..utils.exceptions import ValidationError
 
 
 def _generate_project_id() -> int:
@@ -30,6 +31,8 @@ class Project:
         description: Detailed description of the project (max 150 words)
         created_at: Timestamp of creation
         updated_at: Timestamp of last update
+        version: Number of stored revisions; repositories increment it on
+            every update and use it to detect concurrent changes
     """
 
     title: str
@@ -37,11 +40,82 @@ class Project:
     id: int = field(default_factory=_generate_project_id)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    version: int = 1
 
     def __post_init__(self) -> None:
         """Validate project data after initialization."""
         self._validate()
 
+    @classmethod
+    def validate_fields(cls, title: str, description: str = "") -> dict:
+        """
+        Run the checks of a new project on its fields without creating it.
+
+        Args:
+            title: Project title
+            description: Project description
+
+        Returns:
+            Dictionary with the validated fields, as keyword arguments of from_record
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        project = cls.__new__(cls)
+        project.title = title
+        project.description = description
+        project._validate()
+        return {"title": title, "description": description}
+
+    @classmethod
+    def from_record(
+        cls,
+        id: int,
+        title: str,
+        description: str,
+        created_at: datetime,
+        updated_at: datetime,
+        version: int = 1,
+    ) -> "Project":
+        """
+        Build a project from trusted stored data.
+
+        Word limits were checked when the project was first created, so
+        they are not run again; only cheap type checks are made.
+
+        Args:
+            id: Project identifier
+            title: Project title
+            description: Project description
+            created_at: Timestamp of creation
+            updated_at: Timestamp of last update
+            version: Stored revision number
+
+        Returns:
+            Project with the given data
+
+        Raises:
+            ValidationError: If a value has the wrong type
+        """
+        if not (
+            type(id) is int
+            and type(title) is str
+            and type(description) is str
+            and isinstance(created_at, datetime)
+            and isinstance(updated_at, datetime)
+            and type(version) is int
+        ):
+            raise ValidationError(f"Invalid project record with id {id!r}")
+
+        project = cls.__new__(cls)
+        project.id = id
+        project.title = title
+        project.description = description
+        project.created_at = created_at
+        project.updated_at = updated_at
+        project.version = version
+        return project
+
     def _validate_string_word_count(
         self,
         value: str,
@@ -61,8 +135,6 @@ class Project:
         Raises:
             ValidationError: If validation fails
         """
-        from ..utils.exceptions import ValidationError
-
         if not isinstance(value, str):
             raise ValidationError(f"{field_name} must be a string")
 
@@ -133,6 +205,24 @@ class Project:
 
         self.updated_at = datetime.now()
 
+    def to_dict(self) -> dict:
+        """
+        Return the project as a JSON-serializable dictionary.
+
+        Timestamps are ISO 8601 strings.
+
+        Returns:
+            Dictionary with one entry per attribute
+        """
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "version": self.version,
+        }
+
     def __str__(self) -> str:
         """Return string representation of project."""
         return f"Project(id={self.id}, title='{self.title}')"
@@ -9,6 +9,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional
+from ..utils.exceptions import ValidationError
 
 
 def _generate_task_id() -> int:
@@ -33,6 +34,10 @@ class TaskStatus(str, Enum):
         return [status.value for status in cls]
 
 
+# Status values accepted by Task.from_record
+_STATUS_VALUES = frozenset(TaskStatus.values())
+
+
 @dataclass
 class Task:
     """
@@ -47,6 +52,8 @@ class Task:
         deadline: Optional deadline for the task
         created_at: Timestamp of creation
         updated_at: Timestamp of last update
+        version: Number of stored revisions; repositories increment it on
+            every update and use it to detect concurrent changes
     """
 
     title: str
@@ -57,11 +64,124 @@ class Task:
     id: int = field(default_factory=_generate_task_id)
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
+    version: int = 1
 
     def __post_init__(self) -> None:
         """Validate task data after initialization."""
         self._validate()
 
+    @classmethod
+    def validate_fields(
+        cls,
+        title: str,
+        project_id: int,
+        description: str = "",
+        status: str = TaskStatus.TODO.value,
+        deadline: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ) -> dict:
+        """
+        Run the checks of a new task on its fields without creating it.
+
+        Batch creation validates every item against one shared now and
+        only then gives IDs to the valid items, building them with
+        from_record.
+
+        Args:
+            title: Task title
+            project_id: ID of the parent project
+            description: Task description
+            status: Task status value
+            deadline: Optional deadline
+            now: Time the deadline may not precede (optional, the current time)
+
+        Returns:
+            Dictionary with the validated fields, as keyword arguments of from_record
+
+        Raises:
+            ValidationError: If validation fails
+        """
+        task = cls.__new__(cls)
+        task.title = title
+        task.project_id = project_id
+        task.description = description
+        task.status = status
+        task.deadline = deadline
+        task._validate(now)
+        # from_record accepts only real ints; keep it from failing later
+        if type(project_id) is not int:
+            raise ValidationError("Project ID must be an integer")
+        return {
+            "title": title,
+            "project_id": project_id,
+            "description": description,
+            "status": status,
+            "deadline": deadline,
+        }
+
+    @classmethod
+    def from_record(
+        cls,
+        id: int,
+        title: str,
+        project_id: int,
+        description: str,
+        status: str,
+        deadline: Optional[datetime],
+        created_at: datetime,
+        updated_at: datetime,
+        version: int = 1,
+    ) -> "Task":
+        """
+        Build a task from trusted stored data.
+
+        Business rules (word limits, deadline in the future) were checked
+        when the task was first created, so they are not run again; only
+        cheap type checks are made. This lets persistence layers load
+        tasks whose deadline has since passed.
+
+        Args:
+            id: Task identifier
+            title: Task title
+            project_id: ID of the parent project
+            description: Task description
+            status: Task status value
+            deadline: Optional deadline
+            created_at: Timestamp of creation
+            updated_at: Timestamp of last update
+            version: Stored revision number
+
+        Returns:
+            Task with the given data
+
+        Raises:
+            ValidationError: If a value has the wrong type
+        """
+        if not (
+            type(id) is int
+            and type(project_id) is int
+            and type(title) is str
+            and type(description) is str
+            and status in _STATUS_VALUES
+            and (deadline is None or isinstance(deadline, datetime))
+            and isinstance(created_at, datetime)
+            and isinstance(updated_at, datetime)
+            and type(version) is int
+        ):
+            raise ValidationError(f"Invalid task record with id {id!r}")
+
+        task = cls.__new__(cls)
+        task.id = id
+        task.title = title
+        task.project_id = project_id
+        task.description = description
+        task.status = status
+        task.deadline = deadline
+        task.created_at = created_at
+        task.updated_at = updated_at
+        task.version = version
+        return task
+
     def _validate_string_word_count(
         self,
         value: str,
@@ -81,8 +201,6 @@ class Task:
         Raises:
             ValidationError: If validation fails
         """
-        from ..utils.exceptions import ValidationError
-
         if not isinstance(value, str):
             raise ValidationError(f"{field_name} must be a string")
 
@@ -107,23 +225,22 @@ class Task:
         Raises:
             ValidationError: If status is invalid
         """
-        from ..utils.exceptions import ValidationError
-
         valid_statuses = TaskStatus.values()
         if status_value not in valid_statuses:
             raise ValidationError(
                 f"{field_name} must be one of {valid_statuses}, got '{status_value}'"
             )
 
-    def _validate(self) -> None:
+    def _validate(self, now: Optional[datetime] = None) -> None:
         """
         Validate task attributes.
 
+        Args:
+            now: Time the deadline may not precede (optional, the current time)
+
         Raises:
             ValidationError: If validation fails
         """
-        from ..utils.exceptions import ValidationError
-
         # Validate title (required, max 30 words)
         self._validate_string_word_count(
             self.title,
@@ -149,17 +266,18 @@ class Task:
             )
 
         # Validate deadline if provided
-        self._validate_deadline()
+        self._validate_deadline(now)
 
-    def _validate_deadline(self) -> None:
+    def _validate_deadline(self, now: Optional[datetime] = None) -> None:
         """
         Validate deadline is in the future.
 
+        Args:
+            now: Time the deadline may not precede (optional, the current time)
+
         Raises:
             ValidationError: If deadline is in the past
         """
-        from ..utils.exceptions import ValidationError
-
         if self.deadline is None:
             return
 
@@ -167,7 +285,7 @@ class Task:
             raise ValidationError("Task deadline must be a datetime object")
 
         # Remove microseconds for fair comparison
-        now = datetime.now().replace(microsecond=0)
+        now = (now or datetime.now()).replace(microsecond=0)
         deadline_normalized = self.deadline.replace(microsecond=0)
 
         if deadline_normalized < now:
@@ -230,6 +348,27 @@ class Task:
 
         self.updated_at = datetime.now()
 
+    def to_dict(self) -> dict:
+        """
+        Return the task as a JSON-serializable dictionary.
+
+        Timestamps and the deadline are ISO 8601 strings.
+
+        Returns:
+            Dictionary with one entry per attribute
+        """
+        return {
+            "id": self.id,
+            "project_id": self.project_id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status,
+            "deadline": self.deadline.isoformat() if self.deadline else None,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "version": self.version,
+        }
+
     def __str__(self) -> str:
         """Return string representation of task."""
         deadline_str = f", deadline={self.deadline.strftime('%Y-%m-%d %H:%M')}" if self.deadline else ""
@@ -1,6 +1,35 @@
 """Repositories package."""
 
-from .task_repository import TaskRepository
-from .project_repository import ProjectRepository
+from ..utils.lazy import lazy_exports
 
-__all__ = ["TaskRepository", "ProjectRepository"]
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "TaskRepository": "task_repository",
+    "ProjectRepository": "project_repository",
+    "TaskQuery": "task_query",
+    "QueryStats": "task_query",
+    "SQLiteTaskRepository": "sqlite_task_repository",
+    "SQLiteProjectRepository": "sqlite_project_repository",
+    "Journal": "journal",
+    "JournaledTaskRepository": "journaled_repository",
+    "JournaledProjectRepository": "journaled_repository",
+    "MappedTaskSnapshot": "columnar",
+    "MappedTaskRepository": "columnar",
+    "SnapshotProjectRepository": "columnar",
+    "write_task_snapshot": "columnar",
+    "write_project_snapshot": "columnar",
+    "AsyncTaskRepository": "async_repository",
+    "AsyncProjectRepository": "async_repository",
+    "AsyncTaskRepositoryAdapter": "async_repository",
+    "AsyncProjectRepositoryAdapter": "async_repository",
+    "InMemoryAsyncTaskRepository": "async_repository",
+    "InMemoryAsyncProjectRepository": "async_repository",
+    "InlineRunner": "async_repository",
+    "ThreadPoolRunner": "async_repository",
+    "create_repositories": "factory",
+    "create_async_repositories": "factory",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,448 @@
+"""
+Async repositories.
+
+This module defines the repository protocols used by the async services,
+an in-memory implementation that runs on the event loop, and adapters
+that run blocking repositories (SQLite, journal, snapshot) in a bounded
+thread pool so that their I/O does not block the event loop.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import partial
+from typing import Any, Callable, Collection, Optional, Protocol, Union
+from ..models.project import Project
+from ..models.task import Task
+from .project_repository import ProjectRepository
+from .task_query import TaskQuery
+from .task_repository import TaskRepository
+
+
+class AsyncTaskRepository(Protocol):
+    """Async counterpart of the task repository interface."""
+
+    async def add(self, task: Task) -> Task: ...
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]: ...
+
+    async def get_by_id(self, task_id: int) -> Task: ...
+
+    async def get_all(self) -> list[Task]: ...
+
+    async def list_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list[Task]: ...
+
+    async def list_by_project_id(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[Task]: ...
+
+    async def get_by_project_id(self, project_id: int) -> list[Task]: ...
+
+    async def get_by_status(self, status: str) -> list[Task]: ...
+
+    async def get_by_deadline_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        statuses: Optional[Collection[str]] = None,
+    ) -> list[Task]: ...
+
+    async def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> list[Task]: ...
+
+    async def query(self, task_query: TaskQuery) -> list[Task]: ...
+
+    async def get_query_stats(self) -> dict: ...
+
+    async def update(self, task: Task, expected_version: Optional[int] = None) -> Task: ...
+
+    async def delete(self, task_id: int) -> None: ...
+
+    async def delete_by_project_id(self, project_id: int) -> int: ...
+
+    async def count(self) -> int: ...
+
+    async def count_by_project_id(self, project_id: int) -> int: ...
+
+    async def count_by_status(self) -> dict[str, int]: ...
+
+    async def count_by_status_in_project(self, project_id: int) -> dict[str, int]: ...
+
+    async def exists(self, task_id: int) -> bool: ...
+
+    async def clear(self) -> None: ...
+
+
+class AsyncProjectRepository(Protocol):
+    """Async counterpart of the project repository interface."""
+
+    async def add(self, project: Project) -> Project: ...
+
+    async def add_many(self, projects: list[Project]) -> list[Project]: ...
+
+    async def add_unique(self, project: Project) -> Project: ...
+
+    async def get_by_id(self, project_id: int) -> Project: ...
+
+    async def get_by_title(self, title: str) -> Optional[Project]: ...
+
+    async def find_by_title(
+        self, text: str, limit: Optional[int] = None
+    ) -> list[Project]: ...
+
+    async def get_all(self) -> list[Project]: ...
+
+    async def list_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list[Project]: ...
+
+    async def update(
+        self, project: Project, expected_version: Optional[int] = None
+    ) -> Project: ...
+
+    async def update_unique(
+        self, project: Project, expected_version: Optional[int] = None
+    ) -> Project: ...
+
+    async def delete(self, project_id: int) -> None: ...
+
+    async def count(self) -> int: ...
+
+    async def exists(self, project_id: int) -> bool: ...
+
+    async def exists_by_title(self, title: str) -> bool: ...
+
+    async def clear(self) -> None: ...
+
+
+class InlineRunner:
+    """Runs repository calls directly on the event loop."""
+
+    async def run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function and return its result.
+
+        Args:
+            function: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value
+        """
+        return function(*args, **kwargs)
+
+    def shutdown(self) -> None:
+        """Release resources (nothing to release)."""
+
+
+class ThreadPoolRunner:
+    """
+    Runs blocking repository calls in a bounded thread pool.
+
+    Calls wait in the pool's queue once all workers are busy, so any
+    number of coroutines can be in flight on a fixed number of threads.
+    The repositories synchronize concurrent calls themselves, so reads
+    run in parallel on the workers while writes take turns.
+    """
+
+    def __init__(self, max_workers: int) -> None:
+        """
+        Start a thread pool.
+
+        Args:
+            max_workers: Maximum number of worker threads
+        """
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="todolist-repository"
+        )
+
+    async def run(self, function: Callable, *args: Any, **kwargs: Any) -> Any:
+        """
+        Call a function in the thread pool and wait for its result.
+
+        Args:
+            function: Function to call
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Stop the worker threads after pending calls finish."""
+        self._executor.shutdown(wait=True)
+
+
+Runner = Union[InlineRunner, ThreadPoolRunner]
+
+
+class AsyncTaskRepositoryAdapter:
+    """
+    AsyncTaskRepository on top of a blocking task repository.
+
+    Every method forwards to the wrapped repository through a runner,
+    which either calls it inline or in a thread pool.
+    """
+
+    def __init__(self, repository: TaskRepository, runner: Runner) -> None:
+        """
+        Wrap a blocking repository.
+
+        Args:
+            repository: Task repository to forward calls to
+            runner: InlineRunner or ThreadPoolRunner
+        """
+        self._repository = repository
+        self._runner = runner
+
+    async def add(self, task: Task) -> Task:
+        """Add a new task."""
+        return await self._runner.run(self._repository.add, task)
+
+    async def add_many(self, tasks: list[Task]) -> list[Task]:
+        """Add several tasks at once; either all of them are added or none."""
+        return await self._runner.run(self._repository.add_many, tasks)
+
+    async def get_by_id(self, task_id: int) -> Task:
+        """Retrieve a task by its ID."""
+        return await self._runner.run(self._repository.get_by_id, task_id)
+
+    async def get_all(self) -> list[Task]:
+        """Retrieve all tasks."""
+        return await self._runner.run(self._repository.get_all)
+
+    def _list_all(self, after_id: Optional[int], limit: Optional[int]) -> list[Task]:
+        """Collect one page of tasks in ascending ID order."""
+        return list(self._repository.iter_all(after_id, limit))
+
+    async def list_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list[Task]:
+        """Retrieve one page of tasks in ascending ID order."""
+        return await self._runner.run(self._list_all, after_id, limit)
+
+    def _list_by_project_id(
+        self, project_id: int, after_id: Optional[int], limit: Optional[int]
+    ) -> list[Task]:
+        """Collect one page of a project's tasks in ascending ID order."""
+        return list(self._repository.iter_by_project_id(project_id, after_id, limit))
+
+    async def list_by_project_id(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> list[Task]:
+        """Retrieve one page of a project's tasks in ascending ID order."""
+        return await self._runner.run(self._list_by_project_id, project_id, after_id, limit)
+
+    async def get_by_project_id(self, project_id: int) -> list[Task]:
+        """Retrieve all tasks belonging to a specific project."""
+        return await self._runner.run(self._repository.get_by_project_id, project_id)
+
+    async def get_by_status(self, status: str) -> list[Task]:
+        """Retrieve all tasks with a specific status."""
+        return await self._runner.run(self._repository.get_by_status, status)
+
+    async def get_by_deadline_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        statuses: Optional[Collection[str]] = None,
+    ) -> list[Task]:
+        """Retrieve tasks whose deadline falls within a range, earliest first."""
+        return await self._runner.run(
+            self._repository.get_by_deadline_range, start, end, limit, statuses
+        )
+
+    async def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> list[Task]:
+        """Search task titles and descriptions, best matches first."""
+        return await self._runner.run(
+            self._repository.search, query, limit=limit, project_id=project_id, status=status
+        )
+
+    async def query(self, task_query: TaskQuery) -> list[Task]:
+        """Run a composed task query."""
+        return await self._runner.run(self._repository.query, task_query)
+
+    async def get_query_stats(self) -> dict:
+        """Get statistics of the queries run through query()."""
+        return await self._runner.run(self._repository.get_query_stats)
+
+    async def update(self, task: Task, expected_version: Optional[int] = None) -> Task:
+        """Update an existing task, if given only while it still has expected_version."""
+        return await self._runner.run(self._repository.update, task, expected_version)
+
+    async def delete(self, task_id: int) -> None:
+        """Delete a task by its ID."""
+        await self._runner.run(self._repository.delete, task_id)
+
+    async def delete_by_project_id(self, project_id: int) -> int:
+        """Delete all tasks belonging to a specific project (cascade delete)."""
+        return await self._runner.run(self._repository.delete_by_project_id, project_id)
+
+    async def count(self) -> int:
+        """Get total count of tasks."""
+        return await self._runner.run(self._repository.count)
+
+    async def count_by_project_id(self, project_id: int) -> int:
+        """Get count of tasks in a specific project."""
+        return await self._runner.run(self._repository.count_by_project_id, project_id)
+
+    async def count_by_status(self) -> dict[str, int]:
+        """Get count of tasks for every status."""
+        return await self._runner.run(self._repository.count_by_status)
+
+    async def count_by_status_in_project(self, project_id: int) -> dict[str, int]:
+        """Get count of a project's tasks for every status."""
+        return await self._runner.run(self._repository.count_by_status_in_project, project_id)
+
+    async def exists(self, task_id: int) -> bool:
+        """Check if a task exists."""
+        return await self._runner.run(self._repository.exists, task_id)
+
+    async def clear(self) -> None:
+        """Remove all tasks from repository."""
+        await self._runner.run(self._repository.clear)
+
+
+class AsyncProjectRepositoryAdapter:
+    """
+    AsyncProjectRepository on top of a blocking project repository.
+
+    Every method forwards to the wrapped repository through a runner,
+    which either calls it inline or in a thread pool.
+    """
+
+    def __init__(self, repository: ProjectRepository, runner: Runner) -> None:
+        """
+        Wrap a blocking repository.
+
+        Args:
+            repository: Project repository to forward calls to
+            runner: InlineRunner or ThreadPoolRunner
+        """
+        self._repository = repository
+        self._runner = runner
+
+    async def add(self, project: Project) -> Project:
+        """Add a new project."""
+        return await self._runner.run(self._repository.add, project)
+
+    async def add_many(self, projects: list[Project]) -> list[Project]:
+        """Add several projects at once; either all of them are added or none."""
+        return await self._runner.run(self._repository.add_many, projects)
+
+    async def add_unique(self, project: Project) -> Project:
+        """Add a new project unless another project has the same title."""
+        return await self._runner.run(self._repository.add_unique, project)
+
+    async def get_by_id(self, project_id: int) -> Project:
+        """Retrieve a project by its ID."""
+        return await self._runner.run(self._repository.get_by_id, project_id)
+
+    async def get_by_title(self, title: str) -> Optional[Project]:
+        """Retrieve a project by its title."""
+        return await self._runner.run(self._repository.get_by_title, title)
+
+    async def find_by_title(
+        self, text: str, limit: Optional[int] = None
+    ) -> list[Project]:
+        """Find projects by title prefix, then by similar spelling."""
+        return await self._runner.run(self._repository.find_by_title, text, limit)
+
+    async def get_all(self) -> list[Project]:
+        """Retrieve all projects."""
+        return await self._runner.run(self._repository.get_all)
+
+    def _list_all(self, after_id: Optional[int], limit: Optional[int]) -> list[Project]:
+        """Collect one page of projects in ascending ID order."""
+        return list(self._repository.iter_all(after_id, limit))
+
+    async def list_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> list[Project]:
+        """Retrieve one page of projects in ascending ID order."""
+        return await self._runner.run(self._list_all, after_id, limit)
+
+    async def update(
+        self, project: Project, expected_version: Optional[int] = None
+    ) -> Project:
+        """Update an existing project, if given only while it still has expected_version."""
+        return await self._runner.run(self._repository.update, project, expected_version)
+
+    async def update_unique(
+        self, project: Project, expected_version: Optional[int] = None
+    ) -> Project:
+        """Update a project unless another project has its title."""
+        return await self._runner.run(self._repository.update_unique, project, expected_version)
+
+    async def delete(self, project_id: int) -> None:
+        """Delete a project by its ID."""
+        await self._runner.run(self._repository.delete, project_id)
+
+    async def count(self) -> int:
+        """Get total count of projects."""
+        return await self._runner.run(self._repository.count)
+
+    async def exists(self, project_id: int) -> bool:
+        """Check if a project exists."""
+        return await self._runner.run(self._repository.exists, project_id)
+
+    async def exists_by_title(self, title: str) -> bool:
+        """Check if a project with the given title exists."""
+        return await self._runner.run(self._repository.exists_by_title, title)
+
+    async def clear(self) -> None:
+        """Remove all projects from repository."""
+        await self._runner.run(self._repository.clear)
+
+
+class InMemoryAsyncTaskRepository(AsyncTaskRepositoryAdapter):
+    """In-memory AsyncTaskRepository; calls never leave the event loop."""
+
+    def __init__(self, compact_models: bool = False) -> None:
+        """
+        Initialize empty task storage.
+
+        Args:
+            compact_models: Store tasks as slotted CompactTask objects to save memory
+        """
+        super().__init__(TaskRepository(compact_models=compact_models), InlineRunner())
+
+
+class InMemoryAsyncProjectRepository(AsyncProjectRepositoryAdapter):
+    """In-memory AsyncProjectRepository; calls never leave the event loop."""
+
+    def __init__(self, compact_models: bool = False) -> None:
+        """
+        Initialize empty project storage.
+
+        Args:
+            compact_models: Store projects as slotted CompactProject objects to save memory
+        """
+        super().__init__(ProjectRepository(compact_models=compact_models), InlineRunner())
@@ -0,0 +1,806 @@
+"""
+Memory-mapped columnar snapshots.
+
+This module writes tasks and projects into a columnar binary file and
+reads it back through mmap, so large snapshots open without building
+any Task or Project objects.
+
+Task file layout (all integer columns are native-endian int64, every
+section starts on an 8-byte boundary, n = rows, m = rows with deadline):
+
+    header           magic, byte order, n, m, blob size
+    ids              n     task IDs, ascending (row order)
+    project_ids      n
+    deadlines        n     microseconds since 1970-01-01, NO_DEADLINE if unset
+    created_at       n     microseconds since 1970-01-01
+    updated_at       n     microseconds since 1970-01-01
+    versions         n
+    project_keys     n     project IDs, ascending
+    project_rows     n     row of each project_keys entry
+    deadline_keys    m     deadlines, ascending
+    deadline_rows    m     row of each deadline_keys entry
+    title_offsets    n + 1 byte offsets into the blob
+    desc_offsets     n + 1 byte offsets into the blob
+    statuses         n     one status code byte per row
+    blob                   UTF-8 titles and descriptions
+
+Project files use the same header followed by ids, created_at,
+updated_at, versions, title_offsets, desc_offsets and the blob.
+
+Files written before entities had versions (magic ending in 1) have no
+versions column; their entities are read with version 1.
+
+Writes are appended to a journal next to the snapshot ("<file>.journal.ndjson",
+see journal.Journal) before they return, so a crash loses no more than
+the journal's unsynced appends. The snapshot is rewritten, and the journal
+truncated, when the journal grows as long as the data and on close; a
+journal left behind by a crash is replayed on the next open.
+"""
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import datetime
+from typing import Collection, Iterable, Iterator, Optional
+from ..models.project import Project
+from ..models.compact import STATUS_CODES, STATUS_VALUES
+from ..models.task import Task
+from ..utils.exceptions import ResourceNotFoundError, ValidationError
+from ..utils.id_generator import id_generator
+from ..utils.locks import ReadWriteLock, read_locked, write_locked
+from ..utils.timestamps import datetime_to_micros, micros_to_datetime
+from .journal import Journal
+from .journaled_repository import JournaledProjectRepository, JournaledTaskRepository
+from .task_query import TaskQuery
+
+TASK_MAGIC = b"TDLTASK2"
+PROJECT_MAGIC = b"TDLPROJ2"
+# Formats without the versions column, still accepted when reading
+_UNVERSIONED_MAGICS = {TASK_MAGIC: b"TDLTASK1", PROJECT_MAGIC: b"TDLPROJ1"}
+
+# magic, byte order, row count, deadline count, blob size
+_HEADER = struct.Struct("<8s8sQQQ")
+_BYTE_ORDER = sys.byteorder.encode("ascii").ljust(8, b"\0")
+
+NO_DEADLINE = -(2 ** 63)
+
+
+def _padding(size: int) -> bytes:
+    """Return the zero bytes needed to align size to 8 bytes."""
+    return b"\0" * (-size % 8)
+
+
+def _encode_strings(values: list[str], blob: bytearray) -> array:
+    """Append strings to the blob and return their n + 1 offsets."""
+    offsets = array("q", [len(blob)])
+    for value in values:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    return offsets
+
+
+def _write_sections(path: str, header: bytes, sections: list[bytes]) -> None:
+    """Write a header and 8-byte aligned sections atomically."""
+    temporary_path = path + ".tmp"
+    with open(temporary_path, "wb") as output:
+        output.write(header)
+        for section in sections:
+            output.write(section)
+            output.write(_padding(len(section)))
+        output.flush()
+        os.fsync(output.fileno())
+    os.replace(temporary_path, path)
+
+
+def write_task_snapshot(path: str, tasks: Iterable[Task]) -> None:
+    """
+    Write tasks into a columnar snapshot file.
+
+    Args:
+        path: Destination file path
+        tasks: Tasks to store
+    """
+    rows = sorted(tasks, key=lambda task: task.id)
+    count = len(rows)
+
+    ids = array("q", (task.id for task in rows))
+    project_ids = array("q", (task.project_id for task in rows))
+    deadlines = array(
+        "q",
+        (NO_DEADLINE if task.deadline is None else datetime_to_micros(task.deadline) for task in rows),
+    )
+    created_at = array("q", (datetime_to_micros(task.created_at) for task in rows))
+    updated_at = array("q", (datetime_to_micros(task.updated_at) for task in rows))
+    versions = array("q", (task.version for task in rows))
+
+    project_order = sorted(range(count), key=project_ids.__getitem__)
+    project_keys = array("q", (project_ids[row] for row in project_order))
+    project_rows = array("q", project_order)
+
+    deadline_order = sorted(
+        (row for row in range(count) if deadlines[row] != NO_DEADLINE),
+        key=deadlines.__getitem__,
+    )
+    deadline_keys = array("q", (deadlines[row] for row in deadline_order))
+    deadline_rows = array("q", deadline_order)
+
+    blob = bytearray()
+    title_offsets = _encode_strings([task.title for task in rows], blob)
+    desc_offsets = _encode_strings([task.description for task in rows], blob)
+    statuses = bytes(STATUS_CODES[task.status] for task in rows)
+
+    header = _HEADER.pack(TASK_MAGIC, _BYTE_ORDER, count, len(deadline_order), len(blob))
+    _write_sections(path, header, [
+        ids.tobytes(), project_ids.tobytes(), deadlines.tobytes(),
+        created_at.tobytes(), updated_at.tobytes(), versions.tobytes(),
+        project_keys.tobytes(), project_rows.tobytes(),
+        deadline_keys.tobytes(), deadline_rows.tobytes(),
+        title_offsets.tobytes(), desc_offsets.tobytes(),
+        statuses, bytes(blob),
+    ])
+
+
+def write_project_snapshot(path: str, projects: Iterable[Project]) -> None:
+    """
+    Write projects into a columnar snapshot file.
+
+    Args:
+        path: Destination file path
+        projects: Projects to store
+    """
+    rows = sorted(projects, key=lambda project: project.id)
+
+    blob = bytearray()
+    title_offsets = _encode_strings([project.title for project in rows], blob)
+    desc_offsets = _encode_strings([project.description for project in rows], blob)
+
+    header = _HEADER.pack(PROJECT_MAGIC, _BYTE_ORDER, len(rows), 0, len(blob))
+    _write_sections(path, header, [
+        array("q", (project.id for project in rows)).tobytes(),
+        array("q", (datetime_to_micros(project.created_at) for project in rows)).tobytes(),
+        array("q", (datetime_to_micros(project.updated_at) for project in rows)).tobytes(),
+        array("q", (project.version for project in rows)).tobytes(),
+        title_offsets.tobytes(), desc_offsets.tobytes(), bytes(blob),
+    ])
+
+
+class _MappedFile:
+    """Read-only mmap of a snapshot file split into typed sections."""
+
+    def __init__(self, path: str, magic: bytes) -> None:
+        """
+        Map a snapshot file and validate its header.
+
+        Args:
+            path: Snapshot file path
+            magic: Expected file magic
+
+        Raises:
+            ValidationError: If the file is not a compatible snapshot
+        """
+        with open(path, "rb") as source:
+            self._mmap = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        if len(self._mmap) < _HEADER.size:
+            raise ValidationError(f"Snapshot '{path}' is truncated")
+        file_magic, byte_order, self.count, self.deadline_count, self.blob_size = (
+            _HEADER.unpack_from(self._mmap)
+        )
+        if file_magic not in (magic, _UNVERSIONED_MAGICS[magic]):
+            raise ValidationError(f"Snapshot '{path}' has an unexpected format")
+        self.has_versions = file_magic == magic
+        if byte_order != _BYTE_ORDER:
+            raise ValidationError(f"Snapshot '{path}' was written on another byte order")
+        self._offset = _HEADER.size
+
+    def int_column(self, length: int) -> memoryview:
+        """Return the next section as an int64 view."""
+        column = self._view[self._offset:self._offset + length * 8].cast("q")
+        self._offset += length * 8
+        return column
+
+    def byte_column(self, length: int) -> memoryview:
+        """Return the next section as a byte view."""
+        column = self._view[self._offset:self._offset + length]
+        self._offset += length + len(_padding(length))
+        return column
+
+    def close(self) -> None:
+        """Release all views and unmap the file."""
+        self._view.release()
+        self._mmap.close()
+
+
+class MappedTaskSnapshot:
+    """
+    Read-only view over a columnar task snapshot.
+
+    Aggregate queries run directly on the mapped columns; Task objects
+    are only built by task_at().
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a task snapshot.
+
+        Args:
+            path: Snapshot file path
+        """
+        self._file = _MappedFile(path, TASK_MAGIC)
+        count = self._file.count
+        self.ids = self._file.int_column(count)
+        self.project_ids = self._file.int_column(count)
+        self.deadlines = self._file.int_column(count)
+        self.created_at = self._file.int_column(count)
+        self.updated_at = self._file.int_column(count)
+        self.versions = self._file.int_column(count) if self._file.has_versions else None
+        self.project_keys = self._file.int_column(count)
+        self.project_rows = self._file.int_column(count)
+        self.deadline_keys = self._file.int_column(self._file.deadline_count)
+        self.deadline_rows = self._file.int_column(self._file.deadline_count)
+        self.title_offsets = self._file.int_column(count + 1)
+        self.desc_offsets = self._file.int_column(count + 1)
+        self.statuses = self._file.byte_column(count)
+        self.blob = self._file.byte_column(self._file.blob_size)
+
+    def __len__(self) -> int:
+        """Return number of tasks in the snapshot."""
+        return self._file.count
+
+    def find_row(self, task_id: int) -> Optional[int]:
+        """
+        Find the row of a task.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Row number, or None if the task is not in the snapshot
+        """
+        row = bisect_left(self.ids, task_id)
+        if row < len(self.ids) and self.ids[row] == task_id:
+            return row
+        return None
+
+    def project_row_range(self, project_id: int) -> tuple[int, int]:
+        """
+        Locate a project's entries in project_rows.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Half-open (low, high) range into project_rows
+        """
+        return (
+            bisect_left(self.project_keys, project_id),
+            bisect_right(self.project_keys, project_id),
+        )
+
+    def deadline_row_range(
+        self, start: Optional[datetime], end: Optional[datetime]
+    ) -> tuple[int, int]:
+        """
+        Locate deadlines within [start, end) in deadline_rows.
+
+        Args:
+            start: Inclusive lower bound (optional)
+            end: Exclusive upper bound (optional)
+
+        Returns:
+            Half-open (low, high) range into deadline_rows
+        """
+        low = 0 if start is None else bisect_left(self.deadline_keys, datetime_to_micros(start))
+        high = (
+            len(self.deadline_keys) if end is None
+            else bisect_left(self.deadline_keys, datetime_to_micros(end))
+        )
+        return low, high
+
+    def status_at(self, row: int) -> str:
+        """Return the status value of a row."""
+        return STATUS_VALUES[self.statuses[row]]
+
+    def count_by_status(self) -> dict[str, int]:
+        """
+        Count tasks per status straight from the status column.
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        statuses = self.statuses.tobytes()
+        return {
+            status: statuses.count(code)
+            for code, status in enumerate(STATUS_VALUES)
+        }
+
+    def count_by_status_in_project(self, project_id: int) -> dict[str, int]:
+        """
+        Count a project's tasks per status without building tasks.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        low, high = self.project_row_range(project_id)
+        statuses = self.statuses
+        codes = Counter(statuses[self.project_rows[index]] for index in range(low, high))
+        return {status: codes[code] for code, status in enumerate(STATUS_VALUES)}
+
+    def _string(self, offsets: memoryview, row: int) -> str:
+        """Decode one string from the blob."""
+        return self.blob[offsets[row]:offsets[row + 1]].tobytes().decode("utf-8")
+
+    def task_at(self, row: int) -> Task:
+        """
+        Build the Task stored in a row.
+
+        Args:
+            row: Row number
+
+        Returns:
+            Task entity
+        """
+        deadline = self.deadlines[row]
+        return Task.from_record(
+            id=self.ids[row],
+            title=self._string(self.title_offsets, row),
+            project_id=self.project_ids[row],
+            description=self._string(self.desc_offsets, row),
+            status=self.status_at(row),
+            deadline=None if deadline == NO_DEADLINE else micros_to_datetime(deadline),
+            created_at=micros_to_datetime(self.created_at[row]),
+            updated_at=micros_to_datetime(self.updated_at[row]),
+            version=1 if self.versions is None else self.versions[row],
+        )
+
+    def close(self) -> None:
+        """Unmap the snapshot file."""
+        for column in (
+            self.ids, self.project_ids, self.deadlines, self.created_at,
+            self.updated_at, self.project_keys, self.project_rows,
+            self.deadline_keys, self.deadline_rows, self.title_offsets,
+            self.desc_offsets, self.statuses, self.blob,
+        ):
+            column.release()
+        if self.versions is not None:
+            self.versions.release()
+        self._file.close()
+
+
+def read_project_snapshot(path: str) -> Iterator[Project]:
+    """
+    Read all projects from a columnar snapshot file.
+
+    Args:
+        path: Snapshot file path
+
+    Returns:
+        Iterator over stored projects, ordered by project ID
+    """
+    mapped = _MappedFile(path, PROJECT_MAGIC)
+    count = mapped.count
+    columns = [mapped.int_column(count) for _ in range(4 if mapped.has_versions else 3)]
+    title_offsets = mapped.int_column(count + 1)
+    desc_offsets = mapped.int_column(count + 1)
+    blob = mapped.byte_column(mapped.blob_size)
+    ids, created_at, updated_at = columns[:3]
+    versions = columns[3] if mapped.has_versions else None
+    try:
+        for row in range(count):
+            yield Project.from_record(
+                id=ids[row],
+                title=blob[title_offsets[row]:title_offsets[row + 1]].tobytes().decode("utf-8"),
+                description=blob[desc_offsets[row]:desc_offsets[row + 1]].tobytes().decode("utf-8"),
+                created_at=micros_to_datetime(created_at[row]),
+                updated_at=micros_to_datetime(updated_at[row]),
+                version=1 if versions is None else versions[row],
+            )
+    finally:
+        for column in (*columns, title_offsets, desc_offsets, blob):
+            column.release()
+        mapped.close()
+
+
+class _JournaledSnapshotTasks(JournaledTaskRepository):
+    """
+    Loaded state of a MappedTaskRepository.
+
+    Starts from the snapshot rows, replays the journal on top and
+    compacts by rewriting the columnar snapshot.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        journal: Journal,
+        tasks: Iterable[Task],
+        compact_models: bool = False,
+    ) -> None:
+        """
+        Initialize repository from snapshot rows and the journal.
+
+        Args:
+            path: Snapshot file path
+            journal: Journal of the writes since the snapshot
+            tasks: Tasks of the snapshot
+            compact_models: Store tasks as slotted CompactTask objects to save memory
+        """
+        self._path = path
+        self._snapshot_tasks = tasks
+        super().__init__(journal, compact_models=compact_models)
+
+    def _recover(self) -> None:
+        """Store the snapshot rows, then replay the journal."""
+        for task in self._snapshot_tasks:
+            self._store(task)
+        self._snapshot_tasks = ()
+        super()._recover()
+
+    @write_locked
+    def compact(self) -> None:
+        """Rewrite the columnar snapshot and truncate the journal."""
+        write_task_snapshot(self._path, self._tasks.values())
+        self._journal.truncate()
+
+
+class MappedTaskRepository:
+    """
+    Task repository served from a memory-mapped snapshot.
+
+    This backend is meant for read-mostly data. Until the first write,
+    counts, status and project breakdowns and deadline scans run on the
+    mapped columns, and Task objects are built only for the rows a query
+    returns. The first write, search or query loads every task into a
+    journaled in-memory repository, which then serves all further calls;
+    each write is journaled before it returns. On close the snapshot is
+    rewritten if anything was loaded. Snapshot reads hold a read lock and
+    loading holds the write lock, so threads never see a half-loaded
+    repository.
+    """
+
+    def __init__(
+        self, path: str, compact_models: bool = False, fsync_every: int = 100
+    ) -> None:
+        """
+        Initialize repository over a snapshot file.
+
+        Args:
+            path: Snapshot file path (need not exist yet)
+            compact_models: Load tasks as slotted CompactTask objects to save memory
+            fsync_every: Journal appends between two fsync calls
+        """
+        self._path = path
+        self._compact_models = compact_models
+        self._lock = ReadWriteLock()
+        self._journal = Journal(
+            os.path.dirname(path) or ".", os.path.basename(path), fsync_every
+        )
+        self._snapshot: Optional[MappedTaskSnapshot] = None
+        self._repository: Optional[JournaledTaskRepository] = None
+
+        # Tasks handed out while still read-only, so that callers always
+        # get the same object for the same task
+        self._materialized: dict[int, Task] = {}
+
+        if os.path.exists(path):
+            self._snapshot = MappedTaskSnapshot(path)
+            if self._snapshot.ids:
+                id_generator.ensure_minimum("task", self._snapshot.ids[-1])
+            if self._journal.has_entries():
+                # Writes made after the snapshot was saved must be replayed
+                self.load()
+        else:
+            self._repository = _JournaledSnapshotTasks(
+                path, self._journal, (), compact_models=compact_models
+            )
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether all tasks have been loaded into memory."""
+        return self._repository is not None
+
+    def _task_at(self, row: int) -> Task:
+        """Return the task of a snapshot row, building it at most once."""
+        task_id = self._snapshot.ids[row]
+        task = self._materialized.get(task_id)
+        if task is None:
+            # Concurrent readers may build the same row; setdefault keeps
+            # the first object so every caller gets the same one
+            task = self._materialized.setdefault(task_id, self._snapshot.task_at(row))
+        return task
+
+    @write_locked
+    def load(self) -> JournaledTaskRepository:
+        """
+        Load every snapshot row into a journaled in-memory repository.
+
+        Returns:
+            Repository now serving all calls
+        """
+        if self._repository is None:
+            self._repository = _JournaledSnapshotTasks(
+                self._path,
+                self._journal,
+                map(self._task_at, range(len(self._snapshot))),
+                compact_models=self._compact_models,
+            )
+            self._materialized.clear()
+            self._snapshot.close()
+            self._snapshot = None
+        return self._repository
+
+    def add(self, task: Task) -> Task:
+        """Add a new task (see TaskRepository.add)."""
+        return self.load().add(task)
+
+    def add_many(self, tasks: list[Task]) -> list[Task]:
+        """Add several tasks at once (see TaskRepository.add_many)."""
+        return self.load().add_many(tasks)
+
+    def update(self, task: Task, expected_version: Optional[int] = None) -> Task:
+        """Update an existing task (see TaskRepository.update)."""
+        return self.load().update(task, expected_version)
+
+    def delete(self, task_id: int) -> None:
+        """Delete a task by its ID."""
+        self.load().delete(task_id)
+
+    def delete_by_project_id(self, project_id: int) -> int:
+        """Delete all tasks belonging to a specific project."""
+        return self.load().delete_by_project_id(project_id)
+
+    def clear(self) -> None:
+        """Remove all tasks."""
+        self.load().clear()
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> list[Task]:
+        """Search task titles and descriptions (see TaskRepository.search)."""
+        return self.load().search(query, limit=limit, project_id=project_id, status=status)
+
+    def query(self, task_query: TaskQuery) -> list[Task]:
+        """Run a composed task query (see TaskRepository.query)."""
+        return self.load().query(task_query)
+
+    def get_query_stats(self) -> dict:
+        """Get statistics of the queries run through query()."""
+        return self.load().get_query_stats()
+
+    @read_locked
+    def get_by_id(self, task_id: int) -> Task:
+        """Retrieve a task by its ID."""
+        if self._repository is not None:
+            return self._repository.get_by_id(task_id)
+
+        row = self._snapshot.find_row(task_id)
+        if row is None:
+            raise ResourceNotFoundError("Task", str(task_id))
+        return self._task_at(row)
+
+    @read_locked
+    def get_all(self) -> list[Task]:
+        """Retrieve all tasks, ordered by ID."""
+        if self._repository is not None:
+            return self._repository.get_all()
+        return [self._task_at(row) for row in range(len(self._snapshot))]
+
+    @read_locked
+    def get_by_status(self, status: str) -> list[Task]:
+        """Retrieve all tasks with a specific status, ordered by ID."""
+        if self._repository is not None:
+            return self._repository.get_by_status(status)
+
+        code = STATUS_CODES.get(status)
+        if code is None:
+            return []
+        statuses = self._snapshot.statuses.tobytes()
+        rows, row = [], statuses.find(code)
+        while row != -1:
+            rows.append(row)
+            row = statuses.find(code, row + 1)
+        return [self._task_at(row) for row in rows]
+
+    @read_locked
+    def exists(self, task_id: int) -> bool:
+        """Check if a task exists."""
+        if self._repository is not None:
+            return self._repository.exists(task_id)
+        return self._snapshot.find_row(task_id) is not None
+
+    @read_locked
+    def get_by_project_id(self, project_id: int) -> list[Task]:
+        """Retrieve all tasks belonging to a specific project, ordered by ID."""
+        if self._repository is not None:
+            return self._repository.get_by_project_id(project_id)
+
+        low, high = self._snapshot.project_row_range(project_id)
+        project_rows = self._snapshot.project_rows
+        return [self._task_at(project_rows[index]) for index in range(low, high)]
+
+    def iter_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ascending ID order.
+
+        Rows are read from the snapshot one at a time; if a write loads
+        the tasks while iterating, the rest comes from the loaded repository.
+        """
+        returned = 0
+        while limit is None or returned < limit:
+            # The snapshot is only read under the lock, which load() waits for
+            with self._lock.read():
+                repository = self._repository
+                if repository is None:
+                    row = 0 if after_id is None else bisect_right(self._snapshot.ids, after_id)
+                    if row >= len(self._snapshot):
+                        return
+                    task = self._task_at(row)
+
+            if repository is not None:
+                remaining = None if limit is None else limit - returned
+                yield from repository.iter_all(after_id, remaining)
+                return
+            after_id = task.id
+            yield task
+            returned += 1
+
+    def iter_by_project_id(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Task]:
+        """Iterate over tasks of a project in ascending ID order."""
+        returned = 0
+        while limit is None or returned < limit:
+            with self._lock.read():
+                repository = self._repository
+                if repository is None:
+                    # Rows of one project are stored in ID order, so the first
+                    # row after the cursor is found by binary search over that range
+                    low, high = self._snapshot.project_row_range(project_id)
+                    ids, project_rows = self._snapshot.ids, self._snapshot.project_rows
+                    position, end = low, high
+                    while after_id is not None and position < end:
+                        middle = (position + end) // 2
+                        if ids[project_rows[middle]] <= after_id:
+                            position = middle + 1
+                        else:
+                            end = middle
+                    if position >= high:
+                        return
+                    task = self._task_at(project_rows[position])
+
+            if repository is not None:
+                remaining = None if limit is None else limit - returned
+                yield from repository.iter_by_project_id(project_id, after_id, remaining)
+                return
+            after_id = task.id
+            yield task
+            returned += 1
+
+    @read_locked
+    def get_by_deadline_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        statuses: Optional[Collection[str]] = None,
+    ) -> list[Task]:
+        """Retrieve tasks whose deadline falls within [start, end), earliest first."""
+        if self._repository is not None:
+            return self._repository.get_by_deadline_range(start, end, limit, statuses)
+
+        low, high = self._snapshot.deadline_row_range(start, end)
+        deadline_rows = self._snapshot.deadline_rows
+        tasks: list[Task] = []
+        for index in range(low, high):
+            if limit is not None and len(tasks) >= limit:
+                break
+            row = deadline_rows[index]
+            if statuses is None or self._snapshot.status_at(row) in statuses:
+                tasks.append(self._task_at(row))
+        return tasks
+
+    @read_locked
+    def count(self) -> int:
+        """Get total count of tasks."""
+        if self._repository is not None:
+            return self._repository.count()
+        return len(self._snapshot)
+
+    @read_locked
+    def count_by_project_id(self, project_id: int) -> int:
+        """Get count of tasks in a specific project."""
+        if self._repository is not None:
+            return self._repository.count_by_project_id(project_id)
+
+        low, high = self._snapshot.project_row_range(project_id)
+        return high - low
+
+    @read_locked
+    def count_by_status(self) -> dict[str, int]:
+        """Get count of tasks for every status."""
+        if self._repository is not None:
+            return self._repository.count_by_status()
+        return self._snapshot.count_by_status()
+
+    @read_locked
+    def count_by_status_in_project(self, project_id: int) -> dict[str, int]:
+        """Get count of a project's tasks for every status."""
+        if self._repository is not None:
+            return self._repository.count_by_status_in_project(project_id)
+        return self._snapshot.count_by_status_in_project(project_id)
+
+    def compact(self) -> None:
+        """Rewrite the snapshot with the journaled writes and truncate the journal."""
+        if self._repository is not None:
+            self._repository.compact()
+
+    @write_locked
+    def close(self) -> None:
+        """Rewrite the snapshot if tasks were loaded, then release the mapping and journal."""
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
+        elif self._repository is not None:
+            self._repository.compact()
+        self._journal.close()
+
+
+class SnapshotProjectRepository(JournaledProjectRepository):
+    """
+    In-memory project repository loaded from and saved to a columnar snapshot.
+
+    Projects are few (bounded by MAX_NUMBER_OF_PROJECT), so they are all
+    loaded at startup. Writes are journaled like the tasks' and the
+    snapshot is rewritten on compaction and on close.
+    """
+
+    def __init__(
+        self, path: str, compact_models: bool = False, fsync_every: int = 100
+    ) -> None:
+        """
+        Initialize repository from a snapshot file and its journal.
+
+        Args:
+            path: Snapshot file path (need not exist yet)
+            compact_models: Store projects as slotted CompactProject objects
+            fsync_every: Journal appends between two fsync calls
+        """
+        self._path = path
+        journal = Journal(os.path.dirname(path) or ".", os.path.basename(path), fsync_every)
+        super().__init__(journal, compact_models=compact_models)
+
+    def _recover(self) -> None:
+        """Load the snapshot, then replay the journal."""
+        if os.path.exists(self._path):
+            for project in read_project_snapshot(self._path):
+                self._store(project)
+        super()._recover()
+
+    @write_locked
+    def compact(self) -> None:
+        """Rewrite the columnar snapshot and truncate the journal."""
+        write_project_snapshot(self._path, self._projects.values())
+        self._journal.truncate()
+
+    @write_locked
+    def close(self) -> None:
+        """Write all projects back to the snapshot file and close the journal."""
+        self.compact()
+        self._journal.close()
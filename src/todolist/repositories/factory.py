@@ -0,0 +1,119 @@
+"""
+Repository factory.
+
+This module builds the repository pair for the storage backend
+selected in the application settings. Each backend's modules (and
+sqlite3, mmap or asyncio behind them) are imported only when that
+backend is selected.
+"""
+
+import os
+from typing import TYPE_CHECKING, Optional
+from ..config import settings
+from .project_repository import ProjectRepository
+from .task_repository import TaskRepository
+
+if TYPE_CHECKING:
+    from .async_repository import (
+        AsyncProjectRepositoryAdapter,
+        AsyncTaskRepositoryAdapter,
+        Runner,
+    )
+
+
+def create_repositories() -> tuple[ProjectRepository, TaskRepository]:
+    """
+    Create project and task repositories for the configured backend.
+
+    Returns:
+        Tuple of (project repository, task repository)
+    """
+    if settings.storage_backend == "sqlite":
+        from .sqlite_database import connect
+        from .sqlite_project_repository import SQLiteProjectRepository
+        from .sqlite_task_repository import SQLiteTaskRepository
+
+        connection = connect(settings.sqlite_path)
+        return SQLiteProjectRepository(connection), SQLiteTaskRepository(connection)
+
+    compact_models = settings.compact_models
+
+    if settings.storage_backend == "journal":
+        from .journal import Journal
+        from .journaled_repository import JournaledProjectRepository, JournaledTaskRepository
+
+        fsync_every = settings.journal_fsync_every
+        return (
+            JournaledProjectRepository(
+                Journal(settings.journal_dir, "projects", fsync_every),
+                compact_models=compact_models,
+            ),
+            JournaledTaskRepository(
+                Journal(settings.journal_dir, "tasks", fsync_every),
+                compact_models=compact_models,
+            ),
+        )
+
+    if settings.storage_backend == "snapshot":
+        from .columnar import MappedTaskRepository, SnapshotProjectRepository
+
+        os.makedirs(settings.snapshot_dir, exist_ok=True)
+        fsync_every = settings.journal_fsync_every
+        return (
+            SnapshotProjectRepository(
+                os.path.join(settings.snapshot_dir, "projects.columns"),
+                compact_models=compact_models,
+                fsync_every=fsync_every,
+            ),
+            MappedTaskRepository(
+                os.path.join(settings.snapshot_dir, "tasks.columns"),
+                compact_models=compact_models,
+                fsync_every=fsync_every,
+            ),
+        )
+
+    return (
+        ProjectRepository(compact_models=compact_models),
+        TaskRepository(compact_models=compact_models),
+    )
+
+
+def create_async_repositories(
+    runner: Optional["Runner"] = None,
+) -> tuple["AsyncProjectRepositoryAdapter", "AsyncTaskRepositoryAdapter"]:
+    """
+    Create async project and task repositories for the configured backend.
+
+    The memory backend runs on the event loop. Other backends do I/O, so
+    their calls run in a thread pool of ``settings.async_max_workers``
+    threads shared by both repositories.
+
+    Args:
+        runner: Runner for blocking backends (optional, a new
+            ThreadPoolRunner if omitted)
+
+    Returns:
+        Tuple of (project repository, task repository)
+    """
+    from .async_repository import (
+        AsyncProjectRepositoryAdapter,
+        AsyncTaskRepositoryAdapter,
+        InMemoryAsyncProjectRepository,
+        InMemoryAsyncTaskRepository,
+        ThreadPoolRunner,
+    )
+
+    if settings.storage_backend == "memory" and runner is None:
+        compact_models = settings.compact_models
+        return (
+            InMemoryAsyncProjectRepository(compact_models=compact_models),
+            InMemoryAsyncTaskRepository(compact_models=compact_models),
+        )
+
+    if runner is None:
+        runner = ThreadPoolRunner(settings.async_max_workers)
+    project_repository, task_repository = create_repositories()
+    return (
+        AsyncProjectRepositoryAdapter(project_repository, runner),
+        AsyncTaskRepositoryAdapter(task_repository, runner),
+    )
@@ -0,0 +1,174 @@
+"""
+Append-only operation journal.
+
+This module provides NDJSON journal files with snapshot compaction,
+used to persist the in-memory repositories between sessions.
+"""
+
+import json
+import os
+from typing import IO, Iterable, Iterator, Optional
+
+
+class Journal:
+    """
+    Append-only NDJSON operation log with snapshot compaction.
+
+    Every write operation is appended as one JSON line. Appends are
+    flushed to the operating system immediately and fsynced in batches.
+    Compaction writes a full snapshot next to the journal and truncates
+    the journal, so recovery only replays the operations recorded since
+    the last snapshot.
+    """
+
+    def __init__(self, directory: str, name: str, fsync_every: int = 100) -> None:
+        """
+        Initialize journal files in a directory.
+
+        Args:
+            directory: Directory holding the snapshot and journal files
+            name: Base name of the files (e.g., "tasks")
+            fsync_every: Number of appends between two fsync calls
+        """
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self.snapshot_path = os.path.join(directory, f"{name}.snapshot.ndjson")
+        self.journal_path = os.path.join(directory, f"{name}.journal.ndjson")
+        self._fsync_every = max(1, fsync_every)
+        self._unsynced = 0
+        self._file: Optional[IO[str]] = None
+
+        # Number of operations in the journal since the last snapshot
+        self.entry_count = 0
+
+    def read_snapshot(self) -> Iterator[dict]:
+        """
+        Read records of the latest snapshot.
+
+        Returns:
+            Iterator over snapshot records (empty if there is no snapshot)
+        """
+        if not os.path.exists(self.snapshot_path):
+            return
+
+        with open(self.snapshot_path, encoding="utf-8") as snapshot:
+            for line in snapshot:
+                yield json.loads(line)
+
+    def read_entries(self) -> Iterator[dict]:
+        """
+        Read operations appended since the latest snapshot.
+
+        A torn last line left by a crash is discarded and cut off the
+        file so that later appends start on a clean line.
+
+        Returns:
+            Iterator over journal entries in append order
+        """
+        self.entry_count = 0
+        if not os.path.exists(self.journal_path):
+            return
+
+        valid_size = 0
+        with open(self.journal_path, "rb") as journal:
+            for line in journal:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                valid_size += len(line)
+                self.entry_count += 1
+                yield entry
+
+        if valid_size < os.path.getsize(self.journal_path):
+            os.truncate(self.journal_path, valid_size)
+
+    def append(self, entry: dict) -> None:
+        """
+        Append one operation to the journal.
+
+        Args:
+            entry: JSON-serializable operation record
+        """
+        if self._file is None:
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+
+        self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+        self._file.flush()
+        self.entry_count += 1
+        self._unsynced += 1
+        if self._unsynced >= self._fsync_every:
+            self.sync()
+
+    def sync(self) -> None:
+        """Force appended operations to stable storage."""
+        if self._file is not None and self._unsynced:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._unsynced = 0
+
+    def write_snapshot(self, records: Iterable[dict]) -> None:
+        """
+        Replace the snapshot with the given records and truncate the journal.
+
+        The snapshot is written to a temporary file and renamed into
+        place, so a crash never leaves a partial snapshot behind. If a
+        crash happens between the rename and the truncation, the old
+        journal is replayed on top of the new snapshot, which is safe
+        because replaying operations is idempotent.
+
+        Args:
+            records: JSON-serializable records describing the full state
+        """
+        temporary_path = self.snapshot_path + ".tmp"
+        with open(temporary_path, "w", encoding="utf-8") as snapshot:
+            for record in records:
+                snapshot.write(json.dumps(record, separators=(",", ":")) + "\n")
+            snapshot.flush()
+            os.fsync(snapshot.fileno())
+        os.replace(temporary_path, self.snapshot_path)
+        self.truncate()
+
+    def truncate(self) -> None:
+        """
+        Drop every journaled operation.
+
+        Called once the operations are part of a snapshot, which may be
+        kept outside this journal (see columnar.MappedTaskRepository).
+        """
+        self.close()
+        with open(self.journal_path, "w", encoding="utf-8") as journal:
+            os.fsync(journal.fileno())
+        self._fsync_directory()
+        self.entry_count = 0
+
+    def has_entries(self) -> bool:
+        """
+        Check whether operations were journaled since the latest snapshot.
+
+        Returns:
+            True if the journal file is not empty
+        """
+        return os.path.exists(self.journal_path) and os.path.getsize(self.journal_path) > 0
+
+    def _fsync_directory(self) -> None:
+        """Persist renames in the journal directory where supported."""
+        try:
+            descriptor = os.open(self._directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(descriptor)
+        except OSError:
+            pass
+        finally:
+            os.close(descriptor)
+
+    def close(self) -> None:
+        """Sync and close the journal file."""
+        if self._file is not None:
+            self.sync()
+            self._file.close()
+            self._file = None
@@ -0,0 +1,292 @@
+"""
+Journaled in-memory repositories.
+
+This module extends the in-memory repositories with an append-only
+journal so that their contents survive restarts.
+"""
+
+from datetime import datetime
+from typing import Optional
+from ..models.project import Project
+from ..models.task import Task
+from ..utils.id_generator import id_generator
+from ..utils.locks import write_locked
+from .journal import Journal
+from .project_repository import ProjectRepository
+from .task_repository import TaskRepository
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    """Convert a datetime into an ISO-8601 string."""
+    return None if value is None else value.isoformat()
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Convert an ISO-8601 string back into a datetime."""
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _task_to_record(task: Task) -> dict:
+    """Convert a task into a JSON-serializable record."""
+    return {
+        "id": task.id,
+        "project_id": task.project_id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "deadline": _format_datetime(task.deadline),
+        "created_at": _format_datetime(task.created_at),
+        "updated_at": _format_datetime(task.updated_at),
+        "version": task.version,
+    }
+
+
+def _record_to_task(record: dict) -> Task:
+    """Convert a journal record into a task."""
+    return Task.from_record(
+        id=record["id"],
+        title=record["title"],
+        project_id=record["project_id"],
+        description=record["description"],
+        status=record["status"],
+        deadline=_parse_datetime(record["deadline"]),
+        created_at=_parse_datetime(record["created_at"]),
+        updated_at=_parse_datetime(record["updated_at"]),
+        # Records journaled before entities had versions start at 1
+        version=record.get("version", 1),
+    )
+
+
+def _project_to_record(project: Project) -> dict:
+    """Convert a project into a JSON-serializable record."""
+    return {
+        "id": project.id,
+        "title": project.title,
+        "description": project.description,
+        "created_at": _format_datetime(project.created_at),
+        "updated_at": _format_datetime(project.updated_at),
+        "version": project.version,
+    }
+
+
+def _record_to_project(record: dict) -> Project:
+    """Convert a journal record into a project."""
+    return Project.from_record(
+        id=record["id"],
+        title=record["title"],
+        description=record["description"],
+        created_at=_parse_datetime(record["created_at"]),
+        updated_at=_parse_datetime(record["updated_at"]),
+        # Records journaled before entities had versions start at 1
+        version=record.get("version", 1),
+    )
+
+
+class JournaledTaskRepository(TaskRepository):
+    """
+    In-memory task repository persisted through an operation journal.
+
+    Each write is appended to the journal as one record, under the same
+    write lock as the in-memory change, so the journal order matches the
+    order in which concurrent writes were applied. Once the journal
+    holds at least as many operations as there are tasks (and no fewer
+    than ``compact_min_entries``), a snapshot is written and the journal
+    truncated, which keeps writes O(1) amortized and bounds recovery by
+    the snapshot size.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        compact_min_entries: int = 1000,
+        compact_models: bool = False,
+    ) -> None:
+        """
+        Initialize repository and recover its state from the journal.
+
+        Args:
+            journal: Journal holding the task snapshot and operations
+            compact_min_entries: Minimum journal length before compaction
+            compact_models: Store tasks as slotted compact objects to save memory
+        """
+        super().__init__(compact_models=compact_models)
+        self._journal = journal
+        self._compact_min_entries = compact_min_entries
+        self._recover()
+
+    def _recover(self) -> None:
+        """Load the latest snapshot and replay the journal tail."""
+        for record in self._journal.read_snapshot():
+            self._store(_record_to_task(record))
+
+        for entry in self._journal.read_entries():
+            operation = entry["op"]
+            if operation in ("add", "update"):
+                self._store(_record_to_task(entry["task"]))
+            elif operation == "delete":
+                if entry["id"] in self._tasks:
+                    self._remove(entry["id"])
+            elif operation == "delete_by_project_id":
+                super().delete_by_project_id(entry["project_id"])
+            elif operation == "clear":
+                super().clear()
+
+        if self._tasks:
+            id_generator.ensure_minimum("task", max(self._tasks))
+
+    def _append(self, entry: dict) -> None:
+        """Append an operation and compact the journal when it grows too long."""
+        self._journal.append(entry)
+        if self._journal.entry_count >= max(self._compact_min_entries, len(self._tasks)):
+            self.compact()
+
+    @write_locked
+    def add(self, task: Task) -> Task:
+        """Add a new task and journal the operation."""
+        task = super().add(task)
+        self._append({"op": "add", "task": _task_to_record(task)})
+        return task
+
+    @write_locked
+    def add_many(self, tasks: list[Task]) -> list[Task]:
+        """Add several tasks and journal one operation per task."""
+        tasks = super().add_many(tasks)
+        for task in tasks:
+            self._append({"op": "add", "task": _task_to_record(task)})
+        return tasks
+
+    @write_locked
+    def update(self, task: Task, expected_version: Optional[int] = None) -> Task:
+        """Update an existing task (see TaskRepository.update) and journal the operation."""
+        task = super().update(task, expected_version)
+        self._append({"op": "update", "task": _task_to_record(task)})
+        return task
+
+    @write_locked
+    def delete(self, task_id: int) -> None:
+        """Delete a task and journal the operation."""
+        super().delete(task_id)
+        self._append({"op": "delete", "id": task_id})
+
+    @write_locked
+    def delete_by_project_id(self, project_id: int) -> int:
+        """Delete all tasks of a project and journal the operation."""
+        deleted = super().delete_by_project_id(project_id)
+        if deleted:
+            self._append({"op": "delete_by_project_id", "project_id": project_id})
+        return deleted
+
+    @write_locked
+    def clear(self) -> None:
+        """Remove all tasks and journal the operation."""
+        super().clear()
+        self._append({"op": "clear"})
+
+    @write_locked
+    def compact(self) -> None:
+        """Write a snapshot of all tasks and truncate the journal."""
+        self._journal.write_snapshot(
+            _task_to_record(task) for task in self._tasks.values()
+        )
+
+    @write_locked
+    def close(self) -> None:
+        """Flush pending journal writes and close the journal."""
+        self._journal.close()
+
+
+class JournaledProjectRepository(ProjectRepository):
+    """
+    In-memory project repository persisted through an operation journal.
+
+    Works like JournaledTaskRepository for Project entities.
+    """
+
+    def __init__(
+        self,
+        journal: Journal,
+        compact_min_entries: int = 1000,
+        compact_models: bool = False,
+    ) -> None:
+        """
+        Initialize repository and recover its state from the journal.
+
+        Args:
+            journal: Journal holding the project snapshot and operations
+            compact_min_entries: Minimum journal length before compaction
+            compact_models: Store projects as slotted compact objects to save memory
+        """
+        super().__init__(compact_models=compact_models)
+        self._journal = journal
+        self._compact_min_entries = compact_min_entries
+        self._recover()
+
+    def _recover(self) -> None:
+        """Load the latest snapshot and replay the journal tail."""
+        for record in self._journal.read_snapshot():
+            self._store(_record_to_project(record))
+
+        for entry in self._journal.read_entries():
+            operation = entry["op"]
+            if operation in ("add", "update"):
+                self._store(_record_to_project(entry["project"]))
+            elif operation == "delete":
+                if entry["id"] in self._projects:
+                    self._remove(entry["id"])
+            elif operation == "clear":
+                super().clear()
+
+        if self._projects:
+            id_generator.ensure_minimum("project", max(self._projects))
+
+    def _append(self, entry: dict) -> None:
+        """Append an operation and compact the journal when it grows too long."""
+        self._journal.append(entry)
+        if self._journal.entry_count >= max(self._compact_min_entries, len(self._projects)):
+            self.compact()
+
+    @write_locked
+    def add(self, project: Project) -> Project:
+        """Add a new project and journal the operation."""
+        project = super().add(project)
+        self._append({"op": "add", "project": _project_to_record(project)})
+        return project
+
+    @write_locked
+    def add_many(self, projects: list[Project]) -> list[Project]:
+        """Add several projects and journal one operation per project."""
+        projects = super().add_many(projects)
+        for project in projects:
+            self._append({"op": "add", "project": _project_to_record(project)})
+        return projects
+
+    @write_locked
+    def update(self, project: Project, expected_version: Optional[int] = None) -> Project:
+        """Update an existing project (see ProjectRepository.update) and journal the operation."""
+        project = super().update(project, expected_version)
+        self._append({"op": "update", "project": _project_to_record(project)})
+        return project
+
+    @write_locked
+    def delete(self, project_id: int) -> None:
+        """Delete a project and journal the operation."""
+        super().delete(project_id)
+        self._append({"op": "delete", "id": project_id})
+
+    @write_locked
+    def clear(self) -> None:
+        """Remove all projects and journal the operation."""
+        super().clear()
+        self._append({"op": "clear"})
+
+    @write_locked
+    def compact(self) -> None:
+        """Write a snapshot of all projects and truncate the journal."""
+        self._journal.write_snapshot(
+            _project_to_record(project) for project in self._projects.values()
+        )
+
+    @write_locked
+    def close(self) -> None:
+        """Flush pending journal writes and close the journal."""
+        self._journal.close()
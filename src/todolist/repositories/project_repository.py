@@ -5,10 +5,19 @@ This module provides in-memory storage and retrieval operations
 for Project entities.
 """
 
-from typing import Optional
+from bisect import bisect_left, bisect_right, insort
+from typing import ContextManager, Iterator, Optional
+from ..models.compact import CompactProject
 from ..models.project import Project
-from ..utils.exceptions import ResourceNotFoundError, LimitExceededError
+from ..utils.exceptions import (
+    DuplicateResourceError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
 from ..config import settings
+from ..utils.locks import ReadWriteLock, read_locked, write_locked
+from .title_index import TitleIndex
 
 
 class ProjectRepository:
@@ -16,13 +25,124 @@ class ProjectRepository:
     Repository for managing Project entities in memory.
 
     This class provides CRUD operations for projects and enforces
-    business constraints like maximum project count.
+    business constraints like maximum project count. It is safe to share
+    between threads: reads run concurrently under a reader/writer lock,
+    writes run alone, and add_unique checks and inserts atomically.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty project storage."""
+    def __init__(self, compact_models: bool = False) -> None:
+        """
+        Initialize empty project storage.
+
+        Args:
+            compact_models: Store projects as slotted CompactProject objects to save memory
+        """
+        self._compact_models = compact_models
+        self._lock = ReadWriteLock()
         self._projects: dict[int, Project] = {}
 
+        # All project ids in ascending order, for cursor pagination
+        self._ids: list[int] = []
+
+        # Secondary index: normalized title -> ids of projects with that title.
+        # _indexed_titles remembers the key each project was indexed under,
+        # because projects are renamed in place before update() is called.
+        self._project_ids_by_title: dict[str, set[int]] = {}
+        self._indexed_titles: dict[int, str] = {}
+
+        # Prefix and fuzzy title lookups; re-adding a project replaces
+        # its entry, so _unindex_project leaves it alone
+        self._title_index = TitleIndex()
+
+    @staticmethod
+    def _normalize_title(title: str) -> str:
+        """
+        Normalize a title for case-insensitive comparison.
+
+        Args:
+            title: Project title
+
+        Returns:
+            Case-folded title
+        """
+        return title.casefold()
+
+    def _index_project(self, project: Project) -> None:
+        """
+        Add a project to the title index.
+
+        Args:
+            project: Project entity to index
+        """
+        key = self._normalize_title(project.title)
+        self._project_ids_by_title.setdefault(key, set()).add(project.id)
+        self._indexed_titles[project.id] = key
+        self._title_index.add(project.id, project.title)
+
+    def _unindex_project(self, project_id: int) -> None:
+        """
+        Remove a project from the title index.
+
+        Args:
+            project_id: Project identifier
+        """
+        key = self._indexed_titles.pop(project_id, None)
+        if key is None:
+            return
+
+        project_ids = self._project_ids_by_title[key]
+        project_ids.discard(project_id)
+        if not project_ids:
+            del self._project_ids_by_title[key]
+
+    def _store(self, project: Project) -> Project:
+        """
+        Store a project and (re)index it without any limit checks.
+
+        Args:
+            project: Project entity to store
+
+        Returns:
+            The stored project (a CompactProject copy when compact_models is set)
+        """
+        if self._compact_models and not isinstance(project, CompactProject):
+            project = CompactProject.from_project(project)
+        if project.id not in self._projects:
+            insort(self._ids, project.id)
+        self._unindex_project(project.id)
+        self._projects[project.id] = project
+        self._index_project(project)
+        return project
+
+    def _remove(self, project_id: int) -> None:
+        """
+        Remove a stored project and its index entries.
+
+        Args:
+            project_id: Project identifier
+        """
+        self._unindex_project(project_id)
+        self._title_index.remove(project_id)
+        del self._projects[project_id]
+        del self._ids[bisect_left(self._ids, project_id)]
+
+    def _check_new_ids(self, project_ids: list[int]) -> None:
+        """
+        Make sure none of the ids is stored or repeated.
+
+        Args:
+            project_ids: Ids of the projects about to be added
+
+        Raises:
+            DuplicateResourceError: For the first id that is taken
+        """
+        seen: set[int] = set()
+        for project_id in project_ids:
+            if project_id in self._projects or project_id in seen:
+                raise DuplicateResourceError("Project", str(project_id))
+            seen.add(project_id)
+
+    @write_locked
     def add(self, project: Project) -> Project:
         """
         Add a new project to the repository.
@@ -34,14 +154,97 @@ class ProjectRepository:
             The added project
 
         Raises:
+            DuplicateResourceError: If a project with the same ID is stored
             LimitExceededError: If maximum project limit is reached
         """
         if len(self._projects) >= settings.max_number_of_project:
             raise LimitExceededError("Project", settings.max_number_of_project)
+        self._check_new_ids([project.id])
 
-        self._projects[project.id] = project
-        return project
+        return self._store(project)
+
+    @write_locked
+    def add_many(self, projects: list[Project]) -> list[Project]:
+        """
+        Add several projects at once; either all of them are added or none.
 
+        Args:
+            projects: Project entities to add
+
+        Returns:
+            The added projects
+
+        Raises:
+            DuplicateResourceError: If a project ID is stored or repeated in the batch
+            LimitExceededError: If the batch would exceed the maximum project limit
+        """
+        if len(self._projects) + len(projects) > settings.max_number_of_project:
+            raise LimitExceededError("Project", settings.max_number_of_project)
+        self._check_new_ids([project.id for project in projects])
+
+        return [self._store(project) for project in projects]
+
+    @write_locked
+    def add_unique(self, project: Project) -> Project:
+        """
+        Add a new project unless another project has the same title.
+
+        The title check and the insert happen under one write lock, so
+        concurrent callers cannot both add the same title.
+
+        Args:
+            project: Project entity to add
+
+        Returns:
+            The added project
+
+        Raises:
+            DuplicateResourceError: If a project with the same title exists
+            LimitExceededError: If maximum project limit is reached
+        """
+        if self._project_ids_by_title.get(self._normalize_title(project.title)):
+            raise DuplicateResourceError("Project", project.title)
+
+        return self.add(project)
+
+    @write_locked
+    def update_unique(self, project: Project, expected_version: Optional[int] = None) -> Project:
+        """
+        Update a project unless another project has its title.
+
+        The title check and the update happen under one write lock, so a
+        concurrent create or rename cannot take the title in between.
+
+        Args:
+            project: Project entity with updated data
+            expected_version: Version the changes were based on (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            DuplicateResourceError: If another project has the same title
+            ResourceNotFoundError: If project is not found
+            VersionConflictError: If the stored version differs from expected_version
+        """
+        project_ids = self._project_ids_by_title.get(self._normalize_title(project.title), ())
+        if any(project_id != project.id for project_id in project_ids):
+            raise DuplicateResourceError("Project", project.title)
+        return self.update(project, expected_version)
+
+    def locked(self) -> ContextManager[None]:
+        """
+        Hold the write lock for a compound operation.
+
+        Reads and writes by other threads wait until the with block ends;
+        the current thread can keep calling repository methods inside it.
+
+        Returns:
+            Context manager holding the write lock
+        """
+        return self._lock.write()
+
+    @read_locked
     def get_by_id(self, project_id: int) -> Project:
         """
         Retrieve a project by its ID.
@@ -60,6 +263,7 @@ class ProjectRepository:
             raise ResourceNotFoundError("Project", str(project_id))
         return project
 
+    @read_locked
     def get_by_title(self, title: str) -> Optional[Project]:
         """
         Retrieve a project by its title.
@@ -70,11 +274,30 @@ class ProjectRepository:
         Returns:
             Project entity if found, None otherwise
         """
-        for project in self._projects.values():
-            if project.title.lower() == title.lower():
-                return project
-        return None
+        project_ids = self._project_ids_by_title.get(self._normalize_title(title))
+        if not project_ids:
+            return None
+        return self._projects[min(project_ids)]
+
+    @read_locked
+    def find_by_title(self, text: str, limit: Optional[int] = None) -> list[Project]:
+        """
+        Find projects whose title (or a word of it) starts with a text,
+        followed by projects whose title is spelled similarly.
+
+        Args:
+            text: Title prefix or approximate title
+            limit: Maximum number of projects to return (optional)
+
+        Returns:
+            List of candidate projects, best matches first
+        """
+        return [
+            self._projects[project_id]
+            for project_id in self._title_index.find(text, limit)
+        ]
 
+    @read_locked
     def get_all(self) -> list[Project]:
         """
         Retrieve all projects.
@@ -84,25 +307,64 @@ class ProjectRepository:
         """
         return list(self._projects.values())
 
-    def update(self, project: Project) -> Project:
+    def iter_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Project]:
+        """
+        Iterate over projects in ascending ID order.
+
+        Args:
+            after_id: Only return projects with a greater ID (optional cursor)
+            limit: Maximum number of projects to return (optional)
+
+        Returns:
+            Iterator over projects, ordered by project ID
+        """
+        returned = 0
+        while limit is None or returned < limit:
+            # The lock is taken per project, never across a yield
+            with self._lock.read():
+                ids = self._ids
+                position = 0 if after_id is None else bisect_right(ids, after_id)
+                if position >= len(ids):
+                    return
+                after_id = ids[position]
+                project = self._projects[after_id]
+            yield project
+            returned += 1
+
+    @write_locked
+    def update(self, project: Project, expected_version: Optional[int] = None) -> Project:
         """
-        Update an existing project.
+        Update an existing project and increment its version.
+
+        With expected_version the update is a compare-and-swap: it only
+        succeeds if the stored project still has that version, so an update
+        based on a stale copy cannot overwrite a concurrent change.
 
         Args:
             project: Project entity with updated data
+            expected_version: Version the changes were based on (optional)
 
         Returns:
             Updated project
 
         Raises:
             ResourceNotFoundError: If project is not found
+            VersionConflictError: If the stored version differs from expected_version
         """
-        if project.id not in self._projects:
+        stored = self._projects.get(project.id)
+        if stored is None:
             raise ResourceNotFoundError("Project", str(project.id))
+        if expected_version is not None and stored.version != expected_version:
+            raise VersionConflictError(
+                "Project", str(project.id), expected_version, stored.version
+            )
 
-        self._projects[project.id] = project
-        return project
+        project.version = stored.version + 1
+        return self._store(project)
 
+    @write_locked
     def delete(self, project_id: int) -> None:
         """
         Delete a project by its ID.
@@ -116,8 +378,9 @@ class ProjectRepository:
         if project_id not in self._projects:
             raise ResourceNotFoundError("Project", str(project_id))
 
-        del self._projects[project_id]
+        self._remove(project_id)
 
+    @read_locked
     def count(self) -> int:
         """
         Get total count of projects.
@@ -127,6 +390,7 @@ class ProjectRepository:
         """
         return len(self._projects)
 
+    @read_locked
     def exists(self, project_id: int) -> bool:
         """
         Check if a project exists.
@@ -139,6 +403,7 @@ class ProjectRepository:
         """
         return project_id in self._projects
 
+    @read_locked
     def exists_by_title(self, title: str) -> bool:
         """
         Check if a project with given title exists.
@@ -149,8 +414,13 @@ class ProjectRepository:
         Returns:
             True if project exists, False otherwise
         """
-        return self.get_by_title(title) is not None
+        return bool(self._project_ids_by_title.get(self._normalize_title(title)))
 
+    @write_locked
     def clear(self) -> None:
         """Remove all projects from repository (for testing purposes)."""
         self._projects.clear()
+        self._ids.clear()
+        self._project_ids_by_title.clear()
+        self._indexed_titles.clear()
+        self._title_index.clear()
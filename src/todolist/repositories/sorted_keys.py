@@ -0,0 +1,162 @@
+"""
+Sorted set of keys.
+
+This module provides the ordered index used for cursor pagination over
+task ids. Keys are kept in sorted buckets of bounded size, so adding or
+removing one key costs a binary search plus a shift within one bucket,
+instead of shifting a list of every key.
+"""
+
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from typing import Any, Iterable, Iterator, Optional
+
+# Buckets are split once they hold twice this many keys
+BUCKET_SIZE = 1000
+
+
+class SortedKeys:
+    """
+    Sorted collection of unique, mutually comparable keys.
+
+    The keys are stored in ascending buckets; _maxes holds the largest
+    key of every bucket, so the bucket holding a key is found by bisection.
+    """
+
+    def __init__(self, keys: Iterable[Any] = ()) -> None:
+        """
+        Initialize the collection.
+
+        Args:
+            keys: Initial keys (optional, need not be sorted)
+        """
+        self._buckets: list[list[Any]] = []
+        self._maxes: list[Any] = []
+        self._length = 0
+        for key in sorted(keys):
+            self.add(key)
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over the keys in ascending order."""
+        return chain.from_iterable(self._buckets)
+
+    def __reversed__(self) -> Iterator[Any]:
+        """Iterate over the keys in descending order."""
+        return chain.from_iterable(reversed(bucket) for bucket in reversed(self._buckets))
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is in the collection."""
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return False
+        bucket = self._buckets[index]
+        return bucket[bisect_left(bucket, key)] == key
+
+    def add(self, key: Any) -> None:
+        """
+        Add a key; adding a key that is already present does nothing.
+
+        Args:
+            key: Key to add
+        """
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            self._length = 1
+            return
+
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            # Keys are usually generated in ascending order
+            index -= 1
+            bucket = self._buckets[index]
+            bucket.append(key)
+            self._maxes[index] = key
+        else:
+            bucket = self._buckets[index]
+            position = bisect_left(bucket, key)
+            if bucket[position] == key:
+                return
+            bucket.insert(position, key)
+        self._length += 1
+
+        if len(bucket) > 2 * BUCKET_SIZE:
+            self._buckets[index:index + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes.insert(index, bucket[BUCKET_SIZE - 1])
+
+    def discard(self, key: Any) -> None:
+        """
+        Remove a key if it is present.
+
+        Args:
+            key: Key to remove
+        """
+        index = bisect_left(self._maxes, key)
+        if index == len(self._maxes):
+            return
+        bucket = self._buckets[index]
+        position = bisect_left(bucket, key)
+        if bucket[position] != key:
+            return
+
+        del bucket[position]
+        self._length -= 1
+        if not bucket:
+            del self._buckets[index]
+            del self._maxes[index]
+        else:
+            self._maxes[index] = bucket[-1]
+
+    def next_after(self, after: Optional[Any] = None) -> Optional[Any]:
+        """
+        Find the smallest key greater than a cursor.
+
+        Args:
+            after: Cursor (optional, the first key if omitted)
+
+        Returns:
+            The next key, or None if there is none
+        """
+        if not self._buckets:
+            return None
+        if after is None:
+            return self._buckets[0][0]
+        index = bisect_right(self._maxes, after)
+        if index == len(self._maxes):
+            return None
+        bucket = self._buckets[index]
+        return bucket[bisect_right(bucket, after)]
+
+    def first(self, count: Optional[int] = None) -> list[Any]:
+        """
+        Return the smallest keys in ascending order.
+
+        Args:
+            count: Number of keys (optional, all if omitted)
+
+        Returns:
+            List of keys
+        """
+        return list(islice(self, count))
+
+    def last(self, count: Optional[int] = None) -> list[Any]:
+        """
+        Return the largest keys in descending order.
+
+        Args:
+            count: Number of keys (optional, all if omitted)
+
+        Returns:
+            List of keys
+        """
+        return list(islice(reversed(self), count))
+
+    def clear(self) -> None:
+        """Remove all keys."""
+        self._buckets.clear()
+        self._maxes.clear()
+        self._length = 0
@@ -0,0 +1,304 @@
+"""
+SQLite database setup.
+
+This module opens SQLite connections configured for the repository
+backends and creates the schema they rely on.
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+from ..utils.exceptions import DuplicateResourceError
+from ..utils.locks import ReadWriteLock
+
+# Rows fetched per query by the iterators, which release the lock between pages
+PAGE_SIZE = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS projects (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE INDEX IF NOT EXISTS idx_projects_title_key ON projects (title_key);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    project_id INTEGER NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL,
+    deadline TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1
+);
+
+CREATE INDEX IF NOT EXISTS idx_tasks_project_id ON tasks (project_id);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks (project_id, status);
+CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline);
+"""
+
+# Full-text index over task titles and descriptions, kept in sync with
+# the tasks table by triggers. Requires SQLite built with FTS5.
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE tasks_fts USING fts5(
+    title, description,
+    content='tasks', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 0'
+);
+
+CREATE TRIGGER tasks_fts_insert AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts (rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+
+CREATE TRIGGER tasks_fts_delete AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+
+CREATE TRIGGER tasks_fts_update AFTER UPDATE OF title, description ON tasks
+WHEN old.title IS NOT new.title OR old.description IS NOT new.description
+BEGIN
+    INSERT INTO tasks_fts (tasks_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO tasks_fts (rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+"""
+
+
+class Connection(sqlite3.Connection):
+    """
+    SQLite connection shared by the repositories of one database.
+
+    The repositories hold ``lock`` for reading or writing around every
+    call, so a connection can be shared between threads. Writes run on
+    this connection; reads of a file database run on a separate
+    connection per thread (see reader), which WAL mode lets proceed in
+    parallel with each other and with the writer.
+    """
+
+    def __init__(self, path: str, *args, **kwargs) -> None:
+        """
+        Open the connection.
+
+        Args:
+            path: Database file path, or ":memory:"
+            *args: Further arguments of sqlite3.connect
+            **kwargs: Further keyword arguments of sqlite3.connect
+        """
+        super().__init__(path, *args, **kwargs)
+        self.lock = ReadWriteLock()
+        self._path = str(path)
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Get the connection reads of the current thread should use.
+
+        In-memory databases are private to one connection, and a thread
+        holding the write lock must see its own uncommitted changes, so
+        both read through this connection.
+
+        Returns:
+            Connection for reading
+        """
+        if self._path in (":memory:", "") or self.lock.owns_write():
+            return self
+
+        reader = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = sqlite3.connect(
+                self._path, cached_statements=256, check_same_thread=False
+            )
+            self._local.reader = reader
+            with self._readers_lock:
+                self._readers.append(reader)
+        return reader
+
+    def close(self) -> None:
+        """Close the per-thread reading connections and this connection."""
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
+        super().close()
+
+
+def connect(path: str) -> Connection:
+    """
+    Open a SQLite connection and make sure the schema exists.
+
+    File databases are switched to WAL mode so readers do not block
+    the writer. The connection may be shared between threads (e.g. the
+    async adapters' thread pool); repositories on it synchronize through
+    its lock.
+
+    Args:
+        path: Database file path, or ":memory:" for a private in-memory database
+
+    Returns:
+        Configured SQLite connection
+    """
+    connection = sqlite3.connect(
+        path, cached_statements=256, check_same_thread=False, factory=Connection
+    )
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    with connection:
+        connection.executescript(SCHEMA)
+    _add_version_columns(connection)
+    _create_search_index(connection)
+    return connection
+
+
+def _add_version_columns(connection: sqlite3.Connection) -> None:
+    """
+    Add the version columns to databases created before they existed.
+
+    Rows stored until then start at version 1.
+
+    Args:
+        connection: Open connection with the base schema
+    """
+    for table in ("projects", "tasks"):
+        columns = {row[1] for row in connection.execute(f"PRAGMA table_info({table})")}
+        if "version" not in columns:
+            with connection:
+                connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+                )
+
+
+def _create_search_index(connection: sqlite3.Connection) -> None:
+    """
+    Create the full-text index if it is missing and SQLite supports it.
+
+    Tasks stored before the index existed are indexed once on creation.
+
+    Args:
+        connection: Open connection with the base schema
+    """
+    if has_search_index(connection):
+        return
+
+    try:
+        with connection:
+            connection.executescript(SEARCH_SCHEMA)
+            connection.execute("INSERT INTO tasks_fts (tasks_fts) VALUES ('rebuild')")
+    except sqlite3.OperationalError:
+        # SQLite was built without FTS5; searches fall back to a scan
+        pass
+
+
+def has_search_index(connection: sqlite3.Connection) -> bool:
+    """
+    Check whether the database has the full-text index.
+
+    Args:
+        connection: Open connection
+
+    Returns:
+        True if the tasks_fts table exists, False otherwise
+    """
+    cursor = connection.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+    )
+    return cursor.fetchone() is not None
+
+
+def format_datetime(value: Optional[datetime]) -> Optional[str]:
+    """
+    Convert a datetime into a sortable ISO-8601 string.
+
+    Args:
+        value: Datetime to convert (optional)
+
+    Returns:
+        ISO-8601 string with microseconds, or None
+    """
+    if value is None:
+        return None
+    return value.isoformat(timespec="microseconds")
+
+
+def parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    Convert an ISO-8601 string stored by format_datetime back into a datetime.
+
+    Args:
+        value: ISO-8601 string (optional)
+
+    Returns:
+        Parsed datetime, or None
+    """
+    if value is None:
+        return None
+    return datetime.fromisoformat(value)
+
+
+def page_parameters(after_id: Optional[int], limit: Optional[int]) -> tuple[int, int]:
+    """
+    Convert a pagination cursor into parameters for "id > ? ... LIMIT ?".
+
+    IDs are positive, so -1 stands for "from the start"; SQLite treats a
+    negative LIMIT as no limit.
+
+    Args:
+        after_id: Only select rows with a greater ID (optional)
+        limit: Maximum number of rows (optional)
+
+    Returns:
+        Tuple of (after_id, limit) parameters
+    """
+    return (
+        -1 if after_id is None else after_id,
+        -1 if limit is None else limit,
+    )
+
+
+def insert_rows(
+    connection: sqlite3.Connection,
+    statement: str,
+    rows: list[tuple],
+    table: str,
+    resource_type: str,
+) -> None:
+    """
+    Insert rows in one transaction; either all of them are inserted or none.
+
+    Args:
+        connection: Connection holding the write lock
+        statement: INSERT statement whose first parameter is the row ID
+        rows: Parameter tuples of the rows
+        table: Table the rows are inserted into
+        resource_type: Entity name used in errors (e.g. "Task")
+
+    Raises:
+        DuplicateResourceError: If an ID is already stored or repeated in rows
+    """
+    try:
+        with connection:
+            connection.executemany(statement, rows)
+    except sqlite3.IntegrityError:
+        # The transaction was rolled back; find the offending ID to report
+        seen: set[int] = set()
+        for row in rows:
+            stored = connection.execute(
+                f"SELECT 1 FROM {table} WHERE id = ?", (row[0],)
+            ).fetchone()
+            if stored is not None or row[0] in seen:
+                raise DuplicateResourceError(resource_type, str(row[0])) from None
+            seen.add(row[0])
+        raise
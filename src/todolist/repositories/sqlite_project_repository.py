@@ -0,0 +1,429 @@
+"""
+SQLite-backed project repository.
+
+This module provides persistent storage and retrieval operations
+for Project entities with the same interface as ProjectRepository.
+"""
+
+from typing import ContextManager, Iterable, Iterator, Optional
+from ..models.project import Project
+from ..utils.exceptions import (
+    DuplicateResourceError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
+from ..utils.id_generator import id_generator
+from ..utils.locks import read_locked, write_locked
+from ..config import settings
+from .sqlite_database import (
+    PAGE_SIZE,
+    Connection,
+    format_datetime,
+    insert_rows,
+    page_parameters,
+    parse_datetime,
+)
+from .title_index import TitleIndex
+
+_COLUMNS = "id, title, description, created_at, updated_at, version"
+_INSERT = f"INSERT INTO projects ({_COLUMNS}, title_key) VALUES (?, ?, ?, ?, ?, ?, ?)"
+_SELECT = f"SELECT {_COLUMNS} FROM projects"
+_UPDATE = (
+    "UPDATE projects SET title = ?, description = ?, created_at = ?, "
+    "updated_at = ?, version = ?, title_key = ? WHERE id = ?"
+)
+
+
+def _normalize_title(title: str) -> str:
+    """Normalize a title for case-insensitive comparison."""
+    return title.casefold()
+
+
+def _project_to_row(project: Project, version: Optional[int] = None) -> tuple:
+    """Convert a project into a row tuple in _INSERT order, optionally with another version."""
+    return (
+        project.id,
+        project.title,
+        project.description,
+        format_datetime(project.created_at),
+        format_datetime(project.updated_at),
+        project.version if version is None else version,
+        _normalize_title(project.title),
+    )
+
+
+def _row_to_project(row: tuple) -> Project:
+    """Convert a row in _COLUMNS order into a project."""
+    return Project.from_record(
+        id=row[0],
+        title=row[1],
+        description=row[2],
+        created_at=parse_datetime(row[3]),
+        updated_at=parse_datetime(row[4]),
+        version=row[5],
+    )
+
+
+class SQLiteProjectRepository:
+    """
+    Repository for managing Project entities in a SQLite database.
+
+    This class mirrors ProjectRepository so that services can use either
+    backend. Title lookups use an index on the case-folded title. It
+    shares the lock of its connection with the task repository, so the
+    two stay consistent when used from several threads.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Initialize repository on an open connection.
+
+        Args:
+            connection: Connection returned by sqlite_database.connect
+        """
+        self._connection = connection
+        self._lock = connection.lock
+
+        # Continue numbering after the highest stored ID
+        max_id = self._connection.execute("SELECT MAX(id) FROM projects").fetchone()[0]
+        id_generator.ensure_minimum("project", max_id or 0)
+
+        # Row count, kept up to date by the writes (which hold the write
+        # lock) so that limit checks and count() need no table scan
+        self._count = self._connection.execute("SELECT COUNT(*) FROM projects").fetchone()[0]
+
+        # Prefix and fuzzy title lookups are served from memory; projects
+        # are few, so the index is built once from the stored titles
+        self._title_index = TitleIndex()
+        for project_id, title in self._connection.execute("SELECT id, title FROM projects"):
+            self._title_index.add(project_id, title)
+
+    def _select(self, where: str = "", parameters: Iterable = ()) -> list[Project]:
+        """Run a SELECT over projects and convert the rows."""
+        cursor = self._connection.reader().execute(f"{_SELECT} {where}", tuple(parameters))
+        return [_row_to_project(row) for row in cursor]
+
+    @write_locked
+    def add(self, project: Project) -> Project:
+        """
+        Add a new project to the repository.
+
+        Args:
+            project: Project entity to add
+
+        Returns:
+            The added project
+
+        Raises:
+            DuplicateResourceError: If a project with the same ID is stored
+            LimitExceededError: If maximum project limit is reached
+        """
+        if self._count >= settings.max_number_of_project:
+            raise LimitExceededError("Project", settings.max_number_of_project)
+
+        insert_rows(
+            self._connection, _INSERT, [_project_to_row(project)], "projects", "Project"
+        )
+        self._count += 1
+        self._title_index.add(project.id, project.title)
+        return project
+
+    @write_locked
+    def add_many(self, projects: list[Project]) -> list[Project]:
+        """
+        Add several projects at once; either all of them are added or none.
+
+        Args:
+            projects: Project entities to add
+
+        Returns:
+            The added projects
+
+        Raises:
+            DuplicateResourceError: If a project ID is stored or repeated in the batch
+            LimitExceededError: If the batch would exceed the maximum project limit
+        """
+        if self._count + len(projects) > settings.max_number_of_project:
+            raise LimitExceededError("Project", settings.max_number_of_project)
+
+        insert_rows(
+            self._connection,
+            _INSERT,
+            [_project_to_row(project) for project in projects],
+            "projects",
+            "Project",
+        )
+        self._count += len(projects)
+        for project in projects:
+            self._title_index.add(project.id, project.title)
+        return projects
+
+    @write_locked
+    def add_unique(self, project: Project) -> Project:
+        """
+        Add a new project unless another project has the same title.
+
+        The title check and the insert happen under one write lock, so
+        concurrent callers cannot both add the same title.
+
+        Args:
+            project: Project entity to add
+
+        Returns:
+            The added project
+
+        Raises:
+            DuplicateResourceError: If a project with the same title exists
+            LimitExceededError: If maximum project limit is reached
+        """
+        if self.exists_by_title(project.title):
+            raise DuplicateResourceError("Project", project.title)
+
+        return self.add(project)
+
+    @write_locked
+    def update_unique(self, project: Project, expected_version: Optional[int] = None) -> Project:
+        """
+        Update a project unless another project has its title.
+
+        The title check and the update happen under one write lock, so a
+        concurrent create or rename cannot take the title in between.
+
+        Args:
+            project: Project entity with updated data
+            expected_version: Version the changes were based on (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            DuplicateResourceError: If another project has the same title
+            ResourceNotFoundError: If project is not found
+            VersionConflictError: If the stored version differs from expected_version
+        """
+        cursor = self._connection.execute(
+            "SELECT 1 FROM projects WHERE title_key = ? AND id != ? LIMIT 1",
+            (_normalize_title(project.title), project.id),
+        )
+        if cursor.fetchone() is not None:
+            raise DuplicateResourceError("Project", project.title)
+        return self.update(project, expected_version)
+
+    def locked(self) -> ContextManager[None]:
+        """
+        Hold the write lock for a compound operation.
+
+        Reads and writes by other threads, including those of the task
+        repository on the same connection, wait until the with block ends.
+
+        Returns:
+            Context manager holding the write lock
+        """
+        return self._lock.write()
+
+    @read_locked
+    def get_by_id(self, project_id: int) -> Project:
+        """
+        Retrieve a project by its ID.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Project entity
+
+        Raises:
+            ResourceNotFoundError: If project is not found
+        """
+        projects = self._select("WHERE id = ?", (project_id,))
+        if not projects:
+            raise ResourceNotFoundError("Project", str(project_id))
+        return projects[0]
+
+    @read_locked
+    def get_by_title(self, title: str) -> Optional[Project]:
+        """
+        Retrieve a project by its title.
+
+        Args:
+            title: Project title
+
+        Returns:
+            Project entity if found, None otherwise
+        """
+        projects = self._select(
+            "WHERE title_key = ? ORDER BY id LIMIT 1", (_normalize_title(title),)
+        )
+        return projects[0] if projects else None
+
+    @read_locked
+    def find_by_title(self, text: str, limit: Optional[int] = None) -> list[Project]:
+        """
+        Find projects whose title (or a word of it) starts with a text,
+        followed by projects whose title is spelled similarly.
+
+        Args:
+            text: Title prefix or approximate title
+            limit: Maximum number of projects to return (optional)
+
+        Returns:
+            List of candidate projects, best matches first
+        """
+        project_ids = self._title_index.find(text, limit)
+        if not project_ids:
+            return []
+
+        placeholders = ", ".join("?" * len(project_ids))
+        by_id = {
+            project.id: project
+            for project in self._select(f"WHERE id IN ({placeholders})", project_ids)
+        }
+        return [by_id[project_id] for project_id in project_ids if project_id in by_id]
+
+    @read_locked
+    def get_all(self) -> list[Project]:
+        """
+        Retrieve all projects.
+
+        Returns:
+            List of all projects, ordered by project ID
+        """
+        return self._select("ORDER BY id")
+
+    def iter_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Project]:
+        """
+        Iterate over projects in ascending ID order.
+
+        Args:
+            after_id: Only return projects with a greater ID (optional cursor)
+            limit: Maximum number of projects to return (optional)
+
+        Returns:
+            Iterator over projects, ordered by project ID
+        """
+        returned = 0
+        while limit is None or returned < limit:
+            size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - returned)
+            # The lock is taken per page, never across a yield
+            with self._lock.read():
+                projects = self._select(
+                    "WHERE id > ? ORDER BY id LIMIT ?", page_parameters(after_id, size)
+                )
+            yield from projects
+            if len(projects) < size:
+                return
+            returned += len(projects)
+            after_id = projects[-1].id
+
+    @write_locked
+    def update(self, project: Project, expected_version: Optional[int] = None) -> Project:
+        """
+        Update an existing project and increment its version.
+
+        With expected_version the update is a compare-and-swap (see
+        ProjectRepository.update).
+
+        Args:
+            project: Project entity with updated data
+            expected_version: Version the changes were based on (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            ResourceNotFoundError: If project is not found
+            VersionConflictError: If the stored version differs from expected_version
+        """
+        stored = self._connection.execute(
+            "SELECT version FROM projects WHERE id = ?", (project.id,)
+        ).fetchone()
+        if stored is None:
+            raise ResourceNotFoundError("Project", str(project.id))
+        if expected_version is not None and stored[0] != expected_version:
+            raise VersionConflictError("Project", str(project.id), expected_version, stored[0])
+
+        row = _project_to_row(project, version=stored[0] + 1)
+        with self._connection:
+            self._connection.execute(_UPDATE, row[1:] + row[:1])
+        project.version = stored[0] + 1
+        self._title_index.add(project.id, project.title)
+        return project
+
+    @write_locked
+    def delete(self, project_id: int) -> None:
+        """
+        Delete a project by its ID.
+
+        Args:
+            project_id: Project identifier
+
+        Raises:
+            ResourceNotFoundError: If project is not found
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM projects WHERE id = ?", (project_id,)
+            )
+        if cursor.rowcount == 0:
+            raise ResourceNotFoundError("Project", str(project_id))
+        self._count -= 1
+        self._title_index.remove(project_id)
+
+    @read_locked
+    def count(self) -> int:
+        """
+        Get total count of projects.
+
+        Returns:
+            Number of projects in repository
+        """
+        return self._count
+
+    @read_locked
+    def exists(self, project_id: int) -> bool:
+        """
+        Check if a project exists.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            True if project exists, False otherwise
+        """
+        cursor = self._connection.reader().execute(
+            "SELECT 1 FROM projects WHERE id = ?", (project_id,)
+        )
+        return cursor.fetchone() is not None
+
+    @read_locked
+    def exists_by_title(self, title: str) -> bool:
+        """
+        Check if a project with given title exists.
+
+        Args:
+            title: Project title
+
+        Returns:
+            True if project exists, False otherwise
+        """
+        cursor = self._connection.reader().execute(
+            "SELECT 1 FROM projects WHERE title_key = ? LIMIT 1",
+            (_normalize_title(title),),
+        )
+        return cursor.fetchone() is not None
+
+    @write_locked
+    def clear(self) -> None:
+        """Remove all projects from repository (for testing purposes)."""
+        with self._connection:
+            self._connection.execute("DELETE FROM projects")
+        self._count = 0
+        self._title_index.clear()
+
+    @write_locked
+    def close(self) -> None:
+        """Close the connection, which the task repository shares, and its readers."""
+        self._connection.close()
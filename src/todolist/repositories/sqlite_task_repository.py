@@ -0,0 +1,679 @@
+"""
+SQLite-backed task repository.
+
+This module provides persistent storage and retrieval operations
+for Task entities with the same interface as TaskRepository.
+"""
+
+from datetime import datetime
+from time import perf_counter
+from typing import Collection, Iterable, Iterator, Optional
+from ..models.task import Task, TaskStatus
+from ..utils.exceptions import (
+    LimitExceededError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
+from ..utils.id_generator import id_generator
+from ..utils.locks import read_locked, write_locked
+from ..config import settings
+from .sqlite_database import (
+    PAGE_SIZE,
+    Connection,
+    format_datetime,
+    has_search_index,
+    insert_rows,
+    page_parameters,
+    parse_datetime,
+)
+from .task_query import QueryStats, QueryStatsRecorder, TaskQuery
+from .task_repository import TaskRepository
+from .text_index import DESCRIPTION_WEIGHT, TITLE_WEIGHT, TextIndex, parse_query
+
+_COLUMNS = (
+    "id, project_id, title, description, status, deadline, created_at, updated_at, version"
+)
+_INSERT = f"INSERT INTO tasks ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+_SELECT = f"SELECT {_COLUMNS} FROM tasks"
+_RELEVANCE = f"bm25(tasks_fts, {TITLE_WEIGHT}.0, {DESCRIPTION_WEIGHT}.0)"
+_SEARCH_SOURCE = "tasks_fts JOIN tasks ON tasks.id = tasks_fts.rowid"
+_QUALIFIED_COLUMNS = ", ".join(f"tasks.{column.strip()}" for column in _COLUMNS.split(","))
+_SEARCH = (
+    f"SELECT {_QUALIFIED_COLUMNS} FROM {_SEARCH_SOURCE}"
+    " WHERE tasks_fts MATCH ?"
+    " AND (? IS NULL OR tasks.project_id = ?) AND (? IS NULL OR tasks.status = ?)"
+    f" ORDER BY {_RELEVANCE}, tasks.id"
+    " LIMIT ?"
+)
+# ORDER BY expressions of the TaskQuery sort fields other than relevance
+_SORT_COLUMNS = {
+    "id": "tasks.id",
+    "deadline": "tasks.deadline",
+    "created_at": "tasks.created_at",
+    "updated_at": "tasks.updated_at",
+    "title": "tasks.title COLLATE NOCASE",
+}
+_UPDATE = (
+    "UPDATE tasks SET project_id = ?, title = ?, description = ?, status = ?, "
+    "deadline = ?, created_at = ?, updated_at = ?, version = ? WHERE id = ?"
+)
+
+
+def _task_to_row(task: Task, version: Optional[int] = None) -> tuple:
+    """Convert a task into a row tuple in _COLUMNS order, optionally with another version."""
+    return (
+        task.id,
+        task.project_id,
+        task.title,
+        task.description,
+        task.status,
+        format_datetime(task.deadline),
+        format_datetime(task.created_at),
+        format_datetime(task.updated_at),
+        task.version if version is None else version,
+    )
+
+
+def _match_expression(query: str) -> str:
+    """
+    Translate a search query into an FTS5 MATCH expression.
+
+    Args:
+        query: Search query (see text_index.parse_query)
+
+    Returns:
+        MATCH expression, or an empty string if the query has no terms
+    """
+    return " OR ".join(
+        "(" + " AND ".join(f'"{term}"' + ("*" if prefix else "") for term, prefix in group) + ")"
+        for group in parse_query(query)
+    )
+
+
+def _row_to_task(row: tuple) -> Task:
+    """Convert a row in _COLUMNS order into a task."""
+    return Task.from_record(
+        id=row[0],
+        title=row[2],
+        project_id=row[1],
+        description=row[3],
+        status=row[4],
+        deadline=parse_datetime(row[5]),
+        created_at=parse_datetime(row[6]),
+        updated_at=parse_datetime(row[7]),
+        version=row[8],
+    )
+
+
+class SQLiteTaskRepository:
+    """
+    Repository for managing Task entities in a SQLite database.
+
+    This class mirrors TaskRepository so that services can use either
+    backend. Lookups by project, status and deadline are served by
+    indexes, and cascade delete runs as a single statement. Calls hold
+    the reader/writer lock of the connection, so the repository can be
+    shared between threads.
+    """
+
+    def __init__(self, connection: Connection) -> None:
+        """
+        Initialize repository on an open connection.
+
+        Args:
+            connection: Connection returned by sqlite_database.connect
+        """
+        self._connection = connection
+        self._lock = connection.lock
+
+        # Continue numbering after the highest stored ID
+        max_id = self._connection.execute("SELECT MAX(id) FROM tasks").fetchone()[0]
+        id_generator.ensure_minimum("task", max_id or 0)
+
+        # Row count, kept up to date by the writes (which hold the write
+        # lock) so that limit checks and count() need no table scan
+        self._count = self._connection.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+        # Without FTS5, searches build a temporary index from a table scan
+        self._has_search_index = has_search_index(connection)
+
+        self._query_stats = QueryStatsRecorder()
+        # EXPLAIN QUERY PLAN output per statement, reported as query plans
+        self._query_plans: dict[str, str] = {}
+
+    def _select(self, where: str = "", parameters: Iterable = ()) -> list[Task]:
+        """Run a SELECT over tasks and convert the rows."""
+        cursor = self._connection.reader().execute(f"{_SELECT} {where}", tuple(parameters))
+        return [_row_to_task(row) for row in cursor]
+
+    def _iter_pages(
+        self,
+        condition: str,
+        parameters: tuple,
+        after_id: Optional[int],
+        limit: Optional[int],
+    ) -> Iterator[Task]:
+        """
+        Iterate over the tasks matching a condition in ascending ID order.
+
+        Tasks are fetched a page at a time under the read lock, which is
+        released while they are handed out, so a slow consumer never
+        blocks writers.
+        """
+        returned = 0
+        while limit is None or returned < limit:
+            size = PAGE_SIZE if limit is None else min(PAGE_SIZE, limit - returned)
+            with self._lock.read():
+                tasks = self._select(
+                    f"WHERE {condition} AND id > ? ORDER BY id LIMIT ?",
+                    (*parameters, *page_parameters(after_id, size)),
+                )
+            yield from tasks
+            if len(tasks) < size:
+                return
+            returned += len(tasks)
+            after_id = tasks[-1].id
+
+    @write_locked
+    def add(self, task: Task) -> Task:
+        """
+        Add a new task to the repository.
+
+        Args:
+            task: Task entity to add
+
+        Returns:
+            The added task
+
+        Raises:
+            DuplicateResourceError: If a task with the same ID is stored
+            LimitExceededError: If maximum task limit is reached
+        """
+        if self._count >= settings.max_number_of_task:
+            raise LimitExceededError("Task", settings.max_number_of_task)
+
+        insert_rows(self._connection, _INSERT, [_task_to_row(task)], "tasks", "Task")
+        self._count += 1
+        return task
+
+    @write_locked
+    def add_many(self, tasks: list[Task]) -> list[Task]:
+        """
+        Add several tasks at once; either all of them are added or none.
+
+        Args:
+            tasks: Task entities to add
+
+        Returns:
+            The added tasks
+
+        Raises:
+            DuplicateResourceError: If a task ID is stored or repeated in the batch
+            LimitExceededError: If the batch would exceed the maximum task limit
+        """
+        if self._count + len(tasks) > settings.max_number_of_task:
+            raise LimitExceededError("Task", settings.max_number_of_task)
+
+        insert_rows(
+            self._connection, _INSERT, [_task_to_row(task) for task in tasks], "tasks", "Task"
+        )
+        self._count += len(tasks)
+        return tasks
+
+    @read_locked
+    def get_by_id(self, task_id: int) -> Task:
+        """
+        Retrieve a task by its ID.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task entity
+
+        Raises:
+            ResourceNotFoundError: If task is not found
+        """
+        tasks = self._select("WHERE id = ?", (task_id,))
+        if not tasks:
+            raise ResourceNotFoundError("Task", str(task_id))
+        return tasks[0]
+
+    @read_locked
+    def get_all(self) -> list[Task]:
+        """
+        Retrieve all tasks.
+
+        Returns:
+            List of all tasks, ordered by task ID
+        """
+        return self._select("ORDER BY id")
+
+    def iter_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ascending ID order.
+
+        Rows are fetched lazily in pages, and the cursor is a primary key
+        range, so every page costs the same no matter how deep it is.
+
+        Args:
+            after_id: Only return tasks with a greater ID (optional cursor)
+            limit: Maximum number of tasks to return (optional)
+
+        Returns:
+            Iterator over tasks, ordered by task ID
+        """
+        return self._iter_pages("1", (), after_id, limit)
+
+    def iter_by_project_id(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks of a project in ascending ID order.
+
+        Args:
+            project_id: Project identifier
+            after_id: Only return tasks with a greater ID (optional cursor)
+            limit: Maximum number of tasks to return (optional)
+
+        Returns:
+            Iterator over tasks in the project, ordered by task ID
+        """
+        return self._iter_pages("project_id = ?", (project_id,), after_id, limit)
+
+    @read_locked
+    def get_by_project_id(self, project_id: int) -> list[Task]:
+        """
+        Retrieve all tasks belonging to a specific project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            List of tasks in the project, ordered by task ID
+        """
+        return self._select("WHERE project_id = ? ORDER BY id", (project_id,))
+
+    @read_locked
+    def get_by_status(self, status: str) -> list[Task]:
+        """
+        Retrieve all tasks with a specific status.
+
+        Args:
+            status: Status value
+
+        Returns:
+            List of tasks with the given status, ordered by task ID
+        """
+        return self._select("WHERE status = ? ORDER BY id", (status,))
+
+    @read_locked
+    def get_by_deadline_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        statuses: Optional[Collection[str]] = None,
+    ) -> list[Task]:
+        """
+        Retrieve tasks whose deadline falls within a range, earliest first.
+
+        Tasks without a deadline are never returned.
+
+        Args:
+            start: Inclusive lower bound (optional, unbounded if omitted)
+            end: Exclusive upper bound (optional, unbounded if omitted)
+            limit: Maximum number of tasks to return (optional)
+            statuses: Only return tasks with one of these statuses (optional)
+
+        Returns:
+            List of tasks ordered by deadline, then by task ID
+        """
+        conditions = ["deadline IS NOT NULL"]
+        parameters: list = []
+        if start is not None:
+            conditions.append("deadline >= ?")
+            parameters.append(format_datetime(start))
+        if end is not None:
+            conditions.append("deadline < ?")
+            parameters.append(format_datetime(end))
+        if statuses is not None:
+            statuses = list(statuses)
+            conditions.append(f"status IN ({', '.join('?' * len(statuses))})")
+            parameters.extend(statuses)
+
+        where = f"WHERE {' AND '.join(conditions)} ORDER BY deadline, id"
+        if limit is not None:
+            where += " LIMIT ?"
+            parameters.append(limit)
+        return self._select(where, parameters)
+
+    @read_locked
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions, best matches first.
+
+        Args:
+            query: Search query; words are AND-ed, ``OR`` separates
+                alternatives and a trailing ``*`` matches a prefix
+            limit: Maximum number of tasks to return (optional)
+            project_id: Only return tasks of this project (optional)
+            status: Only return tasks with this status (optional)
+
+        Returns:
+            List of matching tasks ordered by relevance, then by task ID
+        """
+        expression = _match_expression(query)
+        if not expression:
+            return []
+
+        if not self._has_search_index:
+            tasks = {
+                task.id: task
+                for task in self._select(
+                    "WHERE (? IS NULL OR project_id = ?) AND (? IS NULL OR status = ?)",
+                    (project_id, project_id, status, status),
+                )
+            }
+            index = TextIndex()
+            for task in tasks.values():
+                index.add(task.id, task.title, task.description)
+            return [tasks[task_id] for task_id in index.search(query, limit=limit)]
+
+        cursor = self._connection.reader().execute(_SEARCH, (
+            expression, project_id, project_id, status, status,
+            -1 if limit is None else limit,
+        ))
+        return [_row_to_task(row) for row in cursor]
+
+    def _query_statement(
+        self, task_query: TaskQuery, use_text: bool
+    ) -> tuple[str, list]:
+        """
+        Translate a query into a SELECT statement.
+
+        Args:
+            task_query: Query to translate
+            use_text: Whether to apply the text filter through FTS5
+
+        Returns:
+            Statement and its parameters
+        """
+        conditions: list[str] = []
+        parameters: list = []
+        source = "tasks"
+        if use_text:
+            source = _SEARCH_SOURCE
+            conditions.append("tasks_fts MATCH ?")
+            parameters.append(_match_expression(task_query.text))
+        if task_query.project_id is not None:
+            conditions.append("tasks.project_id = ?")
+            parameters.append(task_query.project_id)
+        if task_query.statuses is not None:
+            conditions.append(f"tasks.status IN ({', '.join('?' * len(task_query.statuses))})")
+            parameters.extend(sorted(task_query.statuses))
+        if task_query.deadline_start is not None:
+            conditions.append("tasks.deadline >= ?")
+            parameters.append(format_datetime(task_query.deadline_start))
+        if task_query.deadline_end is not None:
+            conditions.append("tasks.deadline < ?")
+            parameters.append(format_datetime(task_query.deadline_end))
+
+        sort_by = task_query.effective_sort
+        direction = "DESC" if task_query.descending else "ASC"
+        if sort_by == "relevance":
+            order = f"{_RELEVANCE}, tasks.id"
+        elif sort_by == "deadline":
+            order = f"tasks.deadline IS NULL, tasks.deadline {direction}, tasks.id {direction}"
+        else:
+            order = f"{_SORT_COLUMNS[sort_by]} {direction}, tasks.id {direction}"
+
+        statement = f"SELECT {_QUALIFIED_COLUMNS} FROM {source}"
+        if conditions:
+            statement += f" WHERE {' AND '.join(conditions)}"
+        statement += f" ORDER BY {order} LIMIT ? OFFSET ?"
+        parameters.extend((
+            -1 if task_query.max_results is None else task_query.max_results,
+            task_query.skip,
+        ))
+        return statement, parameters
+
+    def _explain(self, statement: str, parameters: list) -> str:
+        """Return SQLite's plan for a statement, cached per statement."""
+        plan = self._query_plans.get(statement)
+        if plan is None:
+            rows = self._connection.reader().execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            plan = self._query_plans[statement] = "; ".join(row[-1] for row in rows)
+        return plan
+
+    @read_locked
+    def query(self, task_query: TaskQuery) -> list[Task]:
+        """
+        Run a composed task query.
+
+        The query is translated into one SELECT, so SQLite's planner picks
+        the index and only the returned rows are converted into tasks. The
+        plan reported in the query statistics is SQLite's EXPLAIN QUERY
+        PLAN output. Without FTS5, text queries load the rows matching the
+        other filters into a temporary in-memory repository instead.
+
+        Args:
+            task_query: Query to run
+
+        Returns:
+            List of matching tasks in the requested order
+
+        Raises:
+            ValidationError: If the query sorts by relevance without a text filter
+        """
+        task_query.validate()
+        started = perf_counter()
+
+        if task_query.text is not None and not self._has_search_index:
+            unfiltered = TaskQuery(
+                project_id=task_query.project_id,
+                statuses=task_query.statuses,
+                deadline_start=task_query.deadline_start,
+                deadline_end=task_query.deadline_end,
+            )
+            statement, parameters = self._query_statement(unfiltered, use_text=False)
+            fallback = TaskRepository()
+            fallback.add_many([
+                _row_to_task(row) for row in self._connection.reader().execute(statement, parameters)
+            ])
+            tasks = fallback.query(task_query)
+            plan = f"{self._explain(statement, parameters)}; text index scan"
+        elif task_query.text is not None and not _match_expression(task_query.text):
+            tasks, plan = [], "empty text query"
+        else:
+            statement, parameters = self._query_statement(
+                task_query, use_text=task_query.text is not None
+            )
+            tasks = [_row_to_task(row) for row in self._connection.reader().execute(statement, parameters)]
+            plan = self._explain(statement, parameters)
+
+        self._query_stats.record(QueryStats(
+            plan=plan,
+            returned=len(tasks),
+            elapsed_ms=(perf_counter() - started) * 1000,
+        ))
+        return tasks
+
+    @read_locked
+    def get_query_stats(self) -> dict:
+        """
+        Get statistics of the queries run through query().
+
+        Returns:
+            Dictionary with the number of queries per plan and the
+            statistics of the most recent queries
+        """
+        return self._query_stats.summary()
+
+    @write_locked
+    def update(self, task: Task, expected_version: Optional[int] = None) -> Task:
+        """
+        Update an existing task and increment its version.
+
+        With expected_version the update is a compare-and-swap (see
+        TaskRepository.update).
+
+        Args:
+            task: Task entity with updated data
+            expected_version: Version the changes were based on (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            ResourceNotFoundError: If task is not found
+            VersionConflictError: If the stored version differs from expected_version
+        """
+        stored = self._connection.execute(
+            "SELECT version FROM tasks WHERE id = ?", (task.id,)
+        ).fetchone()
+        if stored is None:
+            raise ResourceNotFoundError("Task", str(task.id))
+        if expected_version is not None and stored[0] != expected_version:
+            raise VersionConflictError("Task", str(task.id), expected_version, stored[0])
+
+        row = _task_to_row(task, version=stored[0] + 1)
+        with self._connection:
+            self._connection.execute(_UPDATE, row[1:] + row[:1])
+        task.version = stored[0] + 1
+        return task
+
+    @write_locked
+    def delete(self, task_id: int) -> None:
+        """
+        Delete a task by its ID.
+
+        Args:
+            task_id: Task identifier
+
+        Raises:
+            ResourceNotFoundError: If task is not found
+        """
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+        if cursor.rowcount == 0:
+            raise ResourceNotFoundError("Task", str(task_id))
+        self._count -= 1
+
+    @write_locked
+    def delete_by_project_id(self, project_id: int) -> int:
+        """
+        Delete all tasks belonging to a specific project (cascade delete).
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Number of tasks deleted
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM tasks WHERE project_id = ?", (project_id,)
+            )
+        self._count -= cursor.rowcount
+        return cursor.rowcount
+
+    @read_locked
+    def count(self) -> int:
+        """
+        Get total count of tasks.
+
+        Returns:
+            Number of tasks in repository
+        """
+        return self._count
+
+    @read_locked
+    def count_by_project_id(self, project_id: int) -> int:
+        """
+        Get count of tasks in a specific project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Number of tasks in the project
+        """
+        return self._connection.reader().execute(
+            "SELECT COUNT(*) FROM tasks WHERE project_id = ?", (project_id,)
+        ).fetchone()[0]
+
+    @read_locked
+    def count_by_status(self) -> dict[str, int]:
+        """
+        Get count of tasks for every status.
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        counts = {status: 0 for status in TaskStatus.values()}
+        cursor = self._connection.reader().execute(
+            "SELECT status, COUNT(*) FROM tasks GROUP BY status"
+        )
+        counts.update(cursor)
+        return counts
+
+    @read_locked
+    def count_by_status_in_project(self, project_id: int) -> dict[str, int]:
+        """
+        Get count of a project's tasks for every status.
+
+        The (project_id, status) index covers the query, so the task
+        rows themselves are not read.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+            in the project
+        """
+        counts = {status: 0 for status in TaskStatus.values()}
+        cursor = self._connection.reader().execute(
+            "SELECT status, COUNT(*) FROM tasks WHERE project_id = ? GROUP BY status",
+            (project_id,),
+        )
+        counts.update(cursor)
+        return counts
+
+    @read_locked
+    def exists(self, task_id: int) -> bool:
+        """
+        Check if a task exists.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            True if task exists, False otherwise
+        """
+        cursor = self._connection.reader().execute("SELECT 1 FROM tasks WHERE id = ?", (task_id,))
+        return cursor.fetchone() is not None
+
+    @write_locked
+    def clear(self) -> None:
+        """Remove all tasks from repository (for testing purposes)."""
+        with self._connection:
+            self._connection.execute("DELETE FROM tasks")
+        self._count = 0
+
+    @write_locked
+    def close(self) -> None:
+        """Close the connection, which the project repository shares, and its readers."""
+        self._connection.close()
@@ -0,0 +1,192 @@
+"""
+Composable task queries.
+
+This module defines the TaskQuery builder used to combine task filters,
+sorting and paging in one request, and the statistics recorded for each
+executed query.
+"""
+
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Optional
+from ..models.task import TaskStatus
+from ..utils.exceptions import ValidationError
+from ..utils.validators import (
+    validate_non_empty_string,
+    validate_page_size,
+    validate_positive_integer,
+    validate_status,
+)
+
+# Fields a query can be sorted by; "relevance" requires a text filter
+SORT_FIELDS = ("id", "deadline", "created_at", "updated_at", "title", "relevance")
+
+
+@dataclass(frozen=True)
+class TaskQuery:
+    """
+    Immutable description of a task query.
+
+    Every builder method returns a new query, so partial queries can be
+    shared and extended safely::
+
+        TaskQuery().in_project(7).with_status("DOING") \\
+            .due_between(monday, next_monday).order_by("deadline").limit(20)
+
+    Attributes:
+        project_id: Only tasks of this project (optional)
+        statuses: Only tasks with one of these statuses (optional)
+        deadline_start: Inclusive lower bound on the deadline (optional)
+        deadline_end: Exclusive upper bound on the deadline (optional)
+        text: Full-text search query (optional)
+        sort_by: Sort field (default: relevance with text, id otherwise)
+        descending: Whether to sort in descending order
+        max_results: Maximum number of tasks to return (optional)
+        skip: Number of tasks to skip before returning results
+    """
+
+    project_id: Optional[int] = None
+    statuses: Optional[frozenset[str]] = None
+    deadline_start: Optional[datetime] = None
+    deadline_end: Optional[datetime] = None
+    text: Optional[str] = None
+    sort_by: Optional[str] = None
+    descending: bool = False
+    max_results: Optional[int] = None
+    skip: int = 0
+
+    def in_project(self, project_id: int) -> "TaskQuery":
+        """Return a copy limited to one project."""
+        validate_positive_integer(project_id, "Project ID")
+        return replace(self, project_id=project_id)
+
+    def with_status(self, *statuses: str) -> "TaskQuery":
+        """Return a copy limited to tasks with any of the given statuses."""
+        if not statuses:
+            raise ValidationError("At least one status is required")
+        for status in statuses:
+            validate_status(status, TaskStatus.values())
+        return replace(self, statuses=frozenset(statuses))
+
+    def due_between(
+        self, start: Optional[datetime] = None, end: Optional[datetime] = None
+    ) -> "TaskQuery":
+        """Return a copy limited to deadlines within [start, end)."""
+        if start is not None and end is not None and start > end:
+            raise ValidationError("Start of the time window must not be after its end")
+        return replace(self, deadline_start=start, deadline_end=end)
+
+    def matching(self, text: str) -> "TaskQuery":
+        """Return a copy limited to tasks matching a full-text search query."""
+        validate_non_empty_string(text, "Search query")
+        return replace(self, text=text)
+
+    def order_by(self, sort_by: str, descending: bool = False) -> "TaskQuery":
+        """
+        Return a copy sorted by a field (see SORT_FIELDS).
+
+        Ties are broken by task ID in the same direction. Tasks without a
+        deadline come last when sorting by deadline, and relevance is
+        always best match first.
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValidationError(
+                f"Sort field must be one of {list(SORT_FIELDS)}, got '{sort_by}'"
+            )
+        return replace(self, sort_by=sort_by, descending=descending)
+
+    def limit(self, max_results: int) -> "TaskQuery":
+        """Return a copy returning at most max_results tasks."""
+        validate_page_size(max_results, "Limit")
+        return replace(self, max_results=max_results)
+
+    def offset(self, skip: int) -> "TaskQuery":
+        """Return a copy skipping the first tasks of the result."""
+        validate_positive_integer(skip, "Offset")
+        return replace(self, skip=skip)
+
+    @property
+    def effective_sort(self) -> str:
+        """Sort field actually used when executing the query."""
+        if self.sort_by is not None:
+            return self.sort_by
+        return "relevance" if self.text is not None else "id"
+
+    def validate(self) -> None:
+        """
+        Check that the combination of settings can be executed.
+
+        Raises:
+            ValidationError: If sorting by relevance without a text filter
+        """
+        if self.effective_sort == "relevance" and self.text is None:
+            raise ValidationError("Sorting by relevance requires a text filter")
+
+
+@dataclass
+class QueryStats:
+    """
+    Statistics of one executed query.
+
+    Attributes:
+        plan: Name of the index that drove the query ("scan" if none), or
+            the database's own plan description
+        estimates: Estimated number of matches of each usable index
+        candidates: Number of task ids examined after choosing the plan
+            (0 when the backend does not report it)
+        returned: Number of tasks returned
+        elapsed_ms: Execution time in milliseconds
+    """
+
+    plan: str
+    estimates: dict[str, int] = field(default_factory=dict)
+    candidates: int = 0
+    returned: int = 0
+    elapsed_ms: float = 0.0
+
+
+class QueryStatsRecorder:
+    """
+    Keeps per-plan counters and the most recent query statistics.
+
+    Queries run under a repository's read lock, concurrently with each
+    other, so recording has a lock of its own.
+    """
+
+    def __init__(self, history: int = 100) -> None:
+        """
+        Initialize an empty recorder.
+
+        Args:
+            history: Number of recent queries to keep
+        """
+        self._lock = threading.Lock()
+        self._plan_counts: Counter = Counter()
+        self._recent: deque = deque(maxlen=history)
+
+    def record(self, stats: QueryStats) -> None:
+        """
+        Record the statistics of one query.
+
+        Args:
+            stats: Statistics to record
+        """
+        with self._lock:
+            self._plan_counts[stats.plan] += 1
+            self._recent.append(stats)
+
+    def summary(self) -> dict:
+        """
+        Summarize the recorded statistics.
+
+        Returns:
+            Dictionary with the number of queries per plan and the most
+            recent QueryStats, oldest first
+        """
+        with self._lock:
+            return {
+                "plans": dict(self._plan_counts),
+                "recent": list(self._recent),
+            }
@@ -5,10 +5,43 @@ This module provides in-memory storage and retrieval operations
 for Task entities.
 """
 
-from typing import Optional
-from ..models.task import Task
-from ..utils.exceptions import ResourceNotFoundError, LimitExceededError
+from bisect import bisect_left, insort
+from datetime import datetime
+from heapq import merge, nlargest, nsmallest
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Collection, Iterator, NamedTuple, Optional, Union
+from ..models.compact import CompactTask
+from ..models.task import Task, TaskStatus
+from ..utils.exceptions import (
+    DuplicateResourceError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
 from ..config import settings
+from ..utils.locks import ReadWriteLock, read_locked, write_locked
+from ..utils.timestamps import datetime_to_micros
+from .task_query import QueryStats, QueryStatsRecorder, TaskQuery
+from .sorted_keys import SortedKeys
+from .text_index import TextIndex
+
+
+class _IndexFilter(NamedTuple):
+    """
+    One query filter as served by a secondary index.
+
+    Attributes:
+        estimate: Number of tasks the index matches (an upper bound for text)
+        ids: Returns the matching task ids when the filter drives the query
+        id_set: Set of matching ids ready for intersection, if the index has one
+        contains: Checks a single task id against the filter
+    """
+
+    estimate: int
+    ids: Callable[[], Collection[int]]
+    id_set: Optional[set[int]]
+    contains: Optional[Callable[[int], bool]]
 
 
 class TaskRepository:
@@ -16,13 +49,195 @@ class TaskRepository:
     Repository for managing Task entities in memory.
 
     This class provides CRUD operations for tasks and enforces
-    business constraints like maximum task count.
+    business constraints like maximum task count. It is safe to share
+    between threads: reads run concurrently under a reader/writer lock,
+    writes (including cascade delete) run alone.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty task storage."""
+    def __init__(self, compact_models: bool = False) -> None:
+        """
+        Initialize empty task storage.
+
+        Args:
+            compact_models: Store tasks as slotted CompactTask objects to save memory
+        """
+        self._compact_models = compact_models
+        self._lock = ReadWriteLock()
         self._tasks: dict[int, Task] = {}
 
+        # All task ids in ascending order, for cursor pagination
+        self._ids = SortedKeys()
+
+        # Secondary indexes: project_id / status -> ids of matching tasks.
+        # The _indexed_* maps remember the keys each task was indexed under,
+        # because tasks are mutated in place before update() is called.
+        self._task_ids_by_project: dict[int, set[int]] = {}
+        self._indexed_project_ids: dict[int, int] = {}
+        self._task_ids_by_status: dict[str, set[int]] = {
+            status: set() for status in TaskStatus.values()
+        }
+        self._indexed_statuses: dict[int, str] = {}
+
+        # project_id -> {status: number of tasks}, kept in step with the
+        # indexes above so per-project summaries need no scan
+        self._status_counts_by_project: dict[int, dict[str, int]] = {}
+
+        # Sorted (deadline, task_id) pairs for tasks that have a deadline.
+        # In compact mode deadlines are kept as epoch microseconds, so the
+        # index does not hold a datetime per task.
+        self._deadline_index: list[tuple[Union[datetime, int], int]] = []
+        # The same pairs split by status, so queries for open tasks do
+        # not step over every done task in the range
+        self._deadline_index_by_status: dict[str, list[tuple[Union[datetime, int], int]]] = {
+            status: [] for status in TaskStatus.values()
+        }
+        self._indexed_deadlines: dict[int, Union[datetime, int]] = {}
+
+        # Full-text index over titles and descriptions. It is not cleared
+        # by _unindex_task: re-adding a task replaces its entry and skips
+        # the work when the text did not change.
+        self._text_index = TextIndex()
+
+        self._query_stats = QueryStatsRecorder()
+
+    def _index_task(self, task: Task) -> None:
+        """
+        Add a task to the secondary indexes.
+
+        Args:
+            task: Task entity to index
+        """
+        self._task_ids_by_project.setdefault(task.project_id, set()).add(task.id)
+        self._indexed_project_ids[task.id] = task.project_id
+        self._task_ids_by_status.setdefault(task.status, set()).add(task.id)
+        self._indexed_statuses[task.id] = task.status
+        status_counts = self._status_counts_by_project.get(task.project_id)
+        if status_counts is None:
+            status_counts = self._status_counts_by_project[task.project_id] = dict.fromkeys(
+                TaskStatus.values(), 0
+            )
+        status_counts[task.status] = status_counts.get(task.status, 0) + 1
+        deadline = task.deadline_micros if self._compact_models else task.deadline
+        if deadline is not None:
+            entry = (deadline, task.id)
+            insort(self._deadline_index, entry)
+            insort(self._deadline_index_by_status.setdefault(task.status, []), entry)
+            self._indexed_deadlines[task.id] = deadline
+        self._text_index.add(task.id, task.title, task.description)
+
+    def _unindex_task(self, task_id: int) -> None:
+        """
+        Remove a task from the secondary indexes.
+
+        Args:
+            task_id: Task identifier
+        """
+        project_id = self._indexed_project_ids.pop(task_id, None)
+        if project_id is None:
+            return
+
+        task_ids = self._task_ids_by_project.get(project_id)
+        if task_ids is not None:
+            task_ids.discard(task_id)
+            if not task_ids:
+                del self._task_ids_by_project[project_id]
+
+        status = self._indexed_statuses.pop(task_id)
+        self._task_ids_by_status[status].discard(task_id)
+
+        if project_id in self._task_ids_by_project:
+            self._status_counts_by_project[project_id][status] -= 1
+        else:
+            self._status_counts_by_project.pop(project_id, None)
+
+        deadline = self._indexed_deadlines.pop(task_id, None)
+        if deadline is not None:
+            for index in (self._deadline_index, self._deadline_index_by_status[status]):
+                del index[bisect_left(index, (deadline, task_id))]
+
+    def _deadline_key(self, value: datetime) -> Union[datetime, int]:
+        """
+        Convert a datetime into the key type used by the deadline index.
+
+        Args:
+            value: Datetime to convert
+
+        Returns:
+            Epoch microseconds in compact mode, the datetime otherwise
+        """
+        return datetime_to_micros(value) if self._compact_models else value
+
+    def _deadline_bounds(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        index: Optional[list[tuple[Union[datetime, int], int]]] = None,
+    ) -> tuple[int, int]:
+        """
+        Locate a deadline range in a deadline index.
+
+        Args:
+            start: Inclusive lower bound (optional)
+            end: Exclusive upper bound (optional)
+            index: Index to search (optional, the index of all statuses if omitted)
+
+        Returns:
+            Start and end positions of the range in the index
+        """
+        if index is None:
+            index = self._deadline_index
+        low = 0 if start is None else bisect_left(index, (self._deadline_key(start),))
+        high = len(index) if end is None else bisect_left(index, (self._deadline_key(end),))
+        return low, high
+
+    def _store(self, task: Task) -> Task:
+        """
+        Store a task and (re)index it without any limit checks.
+
+        Args:
+            task: Task entity to store
+
+        Returns:
+            The stored task (a CompactTask copy when compact_models is set)
+        """
+        if self._compact_models and not isinstance(task, CompactTask):
+            task = CompactTask.from_task(task)
+        if task.id not in self._tasks:
+            self._ids.add(task.id)
+        self._unindex_task(task.id)
+        self._tasks[task.id] = task
+        self._index_task(task)
+        return task
+
+    def _remove(self, task_id: int) -> None:
+        """
+        Remove a stored task and its index entries.
+
+        Args:
+            task_id: Task identifier
+        """
+        self._unindex_task(task_id)
+        self._text_index.remove(task_id)
+        del self._tasks[task_id]
+        self._ids.discard(task_id)
+
+    def _check_new_ids(self, task_ids: list[int]) -> None:
+        """
+        Make sure none of the ids is stored or repeated.
+
+        Args:
+            task_ids: Ids of the tasks about to be added
+
+        Raises:
+            DuplicateResourceError: For the first id that is taken
+        """
+        seen: set[int] = set()
+        for task_id in task_ids:
+            if task_id in self._tasks or task_id in seen:
+                raise DuplicateResourceError("Task", str(task_id))
+            seen.add(task_id)
+
+    @write_locked
     def add(self, task: Task) -> Task:
         """
         Add a new task to the repository.
@@ -34,14 +249,37 @@ class TaskRepository:
             The added task
 
         Raises:
+            DuplicateResourceError: If a task with the same ID is stored
             LimitExceededError: If maximum task limit is reached
         """
         if len(self._tasks) >= settings.max_number_of_task:
             raise LimitExceededError("Task", settings.max_number_of_task)
+        self._check_new_ids([task.id])
 
-        self._tasks[task.id] = task
-        return task
+        return self._store(task)
+
+    @write_locked
+    def add_many(self, tasks: list[Task]) -> list[Task]:
+        """
+        Add several tasks at once; either all of them are added or none.
+
+        Args:
+            tasks: Task entities to add
+
+        Returns:
+            The added tasks
+
+        Raises:
+            DuplicateResourceError: If a task ID is stored or repeated in the batch
+            LimitExceededError: If the batch would exceed the maximum task limit
+        """
+        if len(self._tasks) + len(tasks) > settings.max_number_of_task:
+            raise LimitExceededError("Task", settings.max_number_of_task)
+        self._check_new_ids([task.id for task in tasks])
 
+        return [self._store(task) for task in tasks]
+
+    @read_locked
     def get_by_id(self, task_id: int) -> Task:
         """
         Retrieve a task by its ID.
@@ -60,6 +298,7 @@ class TaskRepository:
             raise ResourceNotFoundError("Task", str(task_id))
         return task
 
+    @read_locked
     def get_all(self) -> list[Task]:
         """
         Retrieve all tasks.
@@ -69,6 +308,66 @@ class TaskRepository:
         """
         return list(self._tasks.values())
 
+    def iter_all(
+        self, after_id: Optional[int] = None, limit: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ascending ID order.
+
+        The position is looked up again from the last returned ID for
+        every task, so tasks may be added or deleted while iterating
+        without any task being returned twice.
+
+        Args:
+            after_id: Only return tasks with a greater ID (optional cursor)
+            limit: Maximum number of tasks to return (optional)
+
+        Returns:
+            Iterator over tasks, ordered by task ID
+        """
+        returned = 0
+        while limit is None or returned < limit:
+            # The lock is taken per task, never across a yield
+            with self._lock.read():
+                after_id = self._ids.next_after(after_id)
+                if after_id is None:
+                    return
+                task = self._tasks[after_id]
+            yield task
+            returned += 1
+
+    def iter_by_project_id(
+        self,
+        project_id: int,
+        after_id: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks of a project in ascending ID order.
+
+        Args:
+            project_id: Project identifier
+            after_id: Only return tasks with a greater ID (optional cursor)
+            limit: Maximum number of tasks to return (optional)
+
+        Returns:
+            Iterator over tasks in the project, ordered by task ID
+        """
+        with self._lock.read():
+            task_ids = self._task_ids_by_project.get(project_id, ())
+            if after_id is not None:
+                task_ids = [task_id for task_id in task_ids if task_id > after_id]
+            task_ids = sorted(task_ids) if limit is None else nsmallest(limit, task_ids)
+
+        for task_id in task_ids:
+            with self._lock.read():
+                # Skip tasks deleted or moved since iteration started
+                if self._indexed_project_ids.get(task_id) != project_id:
+                    continue
+                task = self._tasks[task_id]
+            yield task
+
+    @read_locked
     def get_by_project_id(self, project_id: int) -> list[Task]:
         """
         Retrieve all tasks belonging to a specific project.
@@ -77,31 +376,339 @@ class TaskRepository:
             project_id: Project identifier
 
         Returns:
-            List of tasks in the project
+            List of tasks in the project, ordered by task ID
         """
-        return [
-            task for task in self._tasks.values() if task.project_id == project_id
-        ]
+        task_ids = self._task_ids_by_project.get(project_id, ())
+        return [self._tasks[task_id] for task_id in sorted(task_ids)]
 
-    def update(self, task: Task) -> Task:
+    @read_locked
+    def get_by_status(self, status: str) -> list[Task]:
         """
-        Update an existing task.
+        Retrieve all tasks with a specific status.
+
+        Args:
+            status: Status value
+
+        Returns:
+            List of tasks with the given status, ordered by task ID
+        """
+        task_ids = self._task_ids_by_status.get(status, ())
+        return [self._tasks[task_id] for task_id in sorted(task_ids)]
+
+    @read_locked
+    def get_by_deadline_range(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        statuses: Optional[Collection[str]] = None,
+    ) -> list[Task]:
+        """
+        Retrieve tasks whose deadline falls within a range, earliest first.
+
+        Tasks without a deadline are never returned.
+
+        Args:
+            start: Inclusive lower bound (optional, unbounded if omitted)
+            end: Exclusive upper bound (optional, unbounded if omitted)
+            limit: Maximum number of tasks to return (optional)
+            statuses: Only return tasks with one of these statuses (optional)
+
+        Returns:
+            List of tasks ordered by deadline, then by task ID
+        """
+        if statuses is None:
+            indexes = [self._deadline_index]
+        else:
+            indexes = [self._deadline_index_by_status.get(status, []) for status in set(statuses)]
+
+        # Each index is bisected separately and only the entries returned
+        # are read, so tasks with other statuses cost nothing
+        ranges = []
+        for index in indexes:
+            low, high = self._deadline_bounds(start, end, index)
+            ranges.append(map(index.__getitem__, range(low, high)))
+        entries = merge(*ranges) if len(ranges) != 1 else ranges[0]
+        return [self._tasks[task_id] for _, task_id in islice(entries, limit)]
+
+    @read_locked
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions, best matches first.
+
+        Args:
+            query: Search query; words are AND-ed, ``OR`` separates
+                alternatives and a trailing ``*`` matches a prefix
+            limit: Maximum number of tasks to return (optional)
+            project_id: Only return tasks of this project (optional)
+            status: Only return tasks with this status (optional)
+
+        Returns:
+            List of matching tasks ordered by relevance, then by task ID
+        """
+        project_ids, statuses = self._indexed_project_ids, self._indexed_statuses
+
+        def accept(task_id: int) -> bool:
+            return (
+                (project_id is None or project_ids[task_id] == project_id)
+                and (status is None or statuses[task_id] == status)
+            )
+
+        task_ids = self._text_index.search(
+            query,
+            limit=limit,
+            accept=None if project_id is None and status is None else accept,
+        )
+        return [self._tasks[task_id] for task_id in task_ids]
+
+    def _query_filters(self, task_query: TaskQuery) -> dict[str, _IndexFilter]:
+        """
+        Describe the index behind each filter of a query.
+
+        Args:
+            task_query: Query to plan
+
+        Returns:
+            Dictionary mapping index names to their filters
+        """
+        filters: dict[str, _IndexFilter] = {}
+
+        if task_query.project_id is not None:
+            project_id, project_ids = task_query.project_id, self._indexed_project_ids
+            task_ids = self._task_ids_by_project.get(project_id, set())
+            filters["project"] = _IndexFilter(
+                len(task_ids),
+                lambda: task_ids,
+                task_ids,
+                lambda task_id: project_ids.get(task_id) == project_id,
+            )
+
+        if task_query.statuses is not None:
+            wanted, statuses = task_query.statuses, self._indexed_statuses
+            status_sets = [self._task_ids_by_status[status] for status in wanted]
+            filters["status"] = _IndexFilter(
+                sum(map(len, status_sets)),
+                lambda: set().union(*status_sets),
+                status_sets[0] if len(status_sets) == 1 else None,
+                lambda task_id: statuses.get(task_id) in wanted,
+            )
+
+        if task_query.deadline_start is not None or task_query.deadline_end is not None:
+            index, deadlines = self._deadline_index, self._indexed_deadlines
+            low, high = self._deadline_bounds(task_query.deadline_start, task_query.deadline_end)
+            start = None if task_query.deadline_start is None else self._deadline_key(task_query.deadline_start)
+            end = None if task_query.deadline_end is None else self._deadline_key(task_query.deadline_end)
+
+            def in_range(task_id: int) -> bool:
+                deadline = deadlines.get(task_id)
+                return (
+                    deadline is not None
+                    and (start is None or deadline >= start)
+                    and (end is None or deadline < end)
+                )
+
+            filters["deadline"] = _IndexFilter(
+                high - low,
+                lambda: {index[position][1] for position in range(low, high)},
+                None,
+                in_range,
+            )
+
+        if task_query.text is not None:
+            text = task_query.text
+            filters["text"] = _IndexFilter(
+                self._text_index.estimate(text),
+                lambda: self._text_index.search(text),
+                None,
+                None,
+            )
+
+        return filters
+
+    def _sort_ids(
+        self,
+        task_ids: Collection[int],
+        sort_by: str,
+        descending: bool,
+        stop: Optional[int],
+    ) -> list[int]:
+        """
+        Order task ids by a sort field, keeping only the first ones.
+
+        Args:
+            task_ids: Ids to order
+            sort_by: Sort field other than relevance
+            descending: Whether to sort in descending order
+            stop: Number of leading ids needed (optional, all if omitted)
+
+        Returns:
+            Ordered ids, ties broken by ID; tasks without a deadline come
+            last when sorting by deadline
+        """
+        select = nlargest if descending else nsmallest
+        if sort_by == "id":
+            return sorted(task_ids, reverse=descending) if stop is None else select(stop, task_ids)
+
+        missing: list[int] = []
+        if sort_by == "deadline":
+            deadlines = self._indexed_deadlines
+            keyed = [(deadlines[task_id], task_id) for task_id in task_ids if task_id in deadlines]
+            missing = sorted(
+                (task_id for task_id in task_ids if task_id not in deadlines),
+                reverse=descending,
+            )
+        elif sort_by == "title":
+            keyed = [(self._tasks[task_id].title.casefold(), task_id) for task_id in task_ids]
+        else:
+            keyed = [(getattr(self._tasks[task_id], sort_by), task_id) for task_id in task_ids]
+
+        ordered = sorted(keyed, reverse=descending) if stop is None else select(stop, keyed)
+        return [task_id for _, task_id in ordered] + missing
+
+    @read_locked
+    def query(self, task_query: TaskQuery) -> list[Task]:
+        """
+        Run a composed task query.
+
+        The planner estimates how many tasks each filter's index matches
+        and drives the query from the most selective one. Its candidate
+        ids are intersected with the id sets of the other filters, or
+        checked against the keys each task was indexed under where no
+        single set exists. Tasks are only looked up for the rows returned
+        and for sort keys that no index holds. Every run is recorded in
+        the query statistics (see get_query_stats).
+
+        Args:
+            task_query: Query to run
+
+        Returns:
+            List of matching tasks in the requested order
+
+        Raises:
+            ValidationError: If the query sorts by relevance without a text filter
+        """
+        task_query.validate()
+        started = perf_counter()
+        sort_by, descending = task_query.effective_sort, task_query.descending
+        stop = None if task_query.max_results is None else task_query.skip + task_query.max_results
+
+        filters = self._query_filters(task_query)
+        estimates = {name: index_filter.estimate for name, index_filter in filters.items()}
+        plan = min(estimates, key=estimates.__getitem__) if estimates else "scan"
+        others = sorted(
+            (index_filter for name, index_filter in filters.items() if name not in (plan, "text")),
+            key=lambda index_filter: index_filter.estimate,
+        )
+        relevance_limit = stop if sort_by == "relevance" else None
+
+        presorted = False
+        if plan == "scan" and sort_by == "id":
+            # The id list already holds the requested order
+            task_ids = self._ids.last(stop) if descending else self._ids.first(stop)
+            candidates, presorted = len(task_ids), True
+        elif plan == "deadline" and sort_by == "deadline" and "text" not in filters:
+            # Walk the deadline index in order and stop once enough
+            # tasks passed the other filters
+            index = self._deadline_index
+            low, high = self._deadline_bounds(task_query.deadline_start, task_query.deadline_end)
+            positions = range(high - 1, low - 1, -1) if descending else range(low, high)
+            task_ids, candidates, presorted = [], 0, True
+            for position in positions:
+                if stop is not None and len(task_ids) >= stop:
+                    break
+                candidates += 1
+                task_id = index[position][1]
+                if all(index_filter.contains(task_id) for index_filter in others):
+                    task_ids.append(task_id)
+        elif plan == "text":
+            accept: Optional[Callable[[int], bool]] = None
+            if others:
+                def accept(task_id: int) -> bool:
+                    return all(index_filter.contains(task_id) for index_filter in others)
+            task_ids = self._text_index.search(
+                task_query.text, limit=relevance_limit, accept=accept
+            )
+            candidates = estimates["text"]
+        elif plan == "scan":
+            task_ids = self._ids
+            candidates = len(task_ids)
+        else:
+            matches = filters[plan].ids()
+            candidates = len(matches)
+            for index_filter in others:
+                if index_filter.id_set is not None:
+                    matches = index_filter.id_set & matches
+                else:
+                    matches = {task_id for task_id in matches if index_filter.contains(task_id)}
+            if "text" in filters:
+                task_ids = self._text_index.search(
+                    task_query.text, limit=relevance_limit, accept=matches.__contains__
+                )
+            else:
+                task_ids = matches
+
+        if sort_by != "relevance" and not presorted:
+            task_ids = self._sort_ids(task_ids, sort_by, descending, stop)
+
+        tasks = [self._tasks[task_id] for task_id in task_ids[task_query.skip:stop]]
+        self._query_stats.record(QueryStats(
+            plan=plan,
+            estimates=estimates,
+            candidates=candidates,
+            returned=len(tasks),
+            elapsed_ms=(perf_counter() - started) * 1000,
+        ))
+        return tasks
+
+    @read_locked
+    def get_query_stats(self) -> dict:
+        """
+        Get statistics of the queries run through query().
+
+        Returns:
+            Dictionary with the number of queries per plan and the
+            statistics of the most recent queries
+        """
+        return self._query_stats.summary()
+
+    @write_locked
+    def update(self, task: Task, expected_version: Optional[int] = None) -> Task:
+        """
+        Update an existing task and increment its version.
+
+        With expected_version the update is a compare-and-swap: it only
+        succeeds if the stored task still has that version, so an update
+        based on a stale copy cannot overwrite a concurrent change.
 
         Args:
             task: Task entity with updated data
+            expected_version: Version the changes were based on (optional)
 
         Returns:
             Updated task
 
         Raises:
             ResourceNotFoundError: If task is not found
+            VersionConflictError: If the stored version differs from expected_version
         """
-        if task.id not in self._tasks:
+        stored = self._tasks.get(task.id)
+        if stored is None:
             raise ResourceNotFoundError("Task", str(task.id))
+        if expected_version is not None and stored.version != expected_version:
+            raise VersionConflictError(
+                "Task", str(task.id), expected_version, stored.version
+            )
 
-        self._tasks[task.id] = task
-        return task
+        task.version = stored.version + 1
+        return self._store(task)
 
+    @write_locked
     def delete(self, task_id: int) -> None:
         """
         Delete a task by its ID.
@@ -115,8 +722,9 @@ class TaskRepository:
         if task_id not in self._tasks:
             raise ResourceNotFoundError("Task", str(task_id))
 
-        del self._tasks[task_id]
+        self._remove(task_id)
 
+    @write_locked
     def delete_by_project_id(self, project_id: int) -> int:
         """
         Delete all tasks belonging to a specific project (cascade delete).
@@ -127,17 +735,15 @@ class TaskRepository:
         Returns:
             Number of tasks deleted
         """
-        tasks_to_delete = [
-            task_id
-            for task_id, task in self._tasks.items()
-            if task.project_id == project_id
-        ]
+        tasks_to_delete = list(self._task_ids_by_project.get(project_id, ()))
 
+        # Only the project's own entries are touched, never all tasks
         for task_id in tasks_to_delete:
-            del self._tasks[task_id]
+            self._remove(task_id)
 
         return len(tasks_to_delete)
 
+    @read_locked
     def count(self) -> int:
         """
         Get total count of tasks.
@@ -147,6 +753,7 @@ class TaskRepository:
         """
         return len(self._tasks)
 
+    @read_locked
     def count_by_project_id(self, project_id: int) -> int:
         """
         Get count of tasks in a specific project.
@@ -157,8 +764,42 @@ class TaskRepository:
         Returns:
             Number of tasks in the project
         """
-        return sum(1 for task in self._tasks.values() if task.project_id == project_id)
+        return len(self._task_ids_by_project.get(project_id, ()))
+
+    @read_locked
+    def count_by_status(self) -> dict[str, int]:
+        """
+        Get count of tasks for every status.
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        return {
+            status: len(task_ids)
+            for status, task_ids in self._task_ids_by_status.items()
+        }
+
+    @read_locked
+    def count_by_status_in_project(self, project_id: int) -> dict[str, int]:
+        """
+        Get count of a project's tasks for every status.
+
+        The counts are updated by every write, so this does not look at
+        the project's tasks.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+            in the project
+        """
+        status_counts = self._status_counts_by_project.get(project_id)
+        if status_counts is None:
+            return dict.fromkeys(TaskStatus.values(), 0)
+        return dict(status_counts)
 
+    @read_locked
     def exists(self, task_id: int) -> bool:
         """
         Check if a task exists.
@@ -171,6 +812,19 @@ class TaskRepository:
         """
         return task_id in self._tasks
 
+    @write_locked
     def clear(self) -> None:
         """Remove all tasks from repository (for testing purposes)."""
         self._tasks.clear()
+        self._ids.clear()
+        self._task_ids_by_project.clear()
+        self._indexed_project_ids.clear()
+        for task_ids in self._task_ids_by_status.values():
+            task_ids.clear()
+        self._indexed_statuses.clear()
+        self._status_counts_by_project.clear()
+        self._deadline_index.clear()
+        for index in self._deadline_index_by_status.values():
+            index.clear()
+        self._indexed_deadlines.clear()
+        self._text_index.clear()
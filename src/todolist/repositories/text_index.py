@@ -0,0 +1,263 @@
+"""
+Inverted full-text index.
+
+This module provides the term index used to search task titles and
+descriptions without scanning every task.
+"""
+
+import math
+import re
+import threading
+from bisect import bisect_left, insort
+from heapq import nsmallest
+from operator import neg
+from typing import Callable, Optional
+
+# Words are runs of letters and digits; matching ignores case
+_WORD = re.compile(r"\w+")
+
+# New terms merged one by one into the sorted term list; more are
+# appended and the list is re-sorted
+_INSORT_MAX = 32
+
+# Weight of one occurrence of a term in the title and in the description
+TITLE_WEIGHT = 2
+DESCRIPTION_WEIGHT = 1
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into case-folded search terms.
+
+    Args:
+        text: Text to split
+
+    Returns:
+        List of terms in order of appearance
+    """
+    return _WORD.findall(text.casefold())
+
+
+def parse_query(query: str) -> list[list[tuple[str, bool]]]:
+    """
+    Parse a search query into OR-ed groups of AND-ed terms.
+
+    Words are AND-ed together; the keyword ``OR`` starts a new group, and
+    a trailing ``*`` turns a word into a prefix match. For example
+    ``"report draft OR summ*"`` means (report AND draft) OR summ*.
+
+    Args:
+        query: Search query
+
+    Returns:
+        List of groups, each a list of (term, is_prefix) pairs
+    """
+    groups: list[list[tuple[str, bool]]] = [[]]
+    for word in query.split():
+        if word == "OR":
+            groups.append([])
+            continue
+
+        terms = tokenize(word)
+        if not terms:
+            continue
+        prefix = word.endswith("*")
+        groups[-1].extend((term, False) for term in terms[:-1])
+        groups[-1].append((terms[-1], prefix))
+
+    return [group for group in groups if group]
+
+
+class TextIndex:
+    """
+    Inverted index mapping each term to the documents containing it.
+
+    Postings store a weight per document (title occurrences count
+    double), which is combined with the term's inverse document frequency
+    to rank results. Terms are also kept in a sorted list so that prefix
+    queries only visit matching terms. New terms are collected unsorted
+    and merged into that list when it is next needed, so bulk inserts of
+    many distinct terms do not pay for an insertion into the sorted list
+    each.
+
+    Writes must be exclusive, as under the repositories' write lock;
+    concurrent reads are safe.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, dict[int, int]] = {}
+        self._terms: list[str] = []
+        # Terms in _postings that are not yet in _terms
+        self._new_terms: list[str] = []
+        # Taken by readers merging _new_terms into _terms
+        self._merge_lock = threading.Lock()
+
+        # Terms each document was indexed under, because documents are
+        # changed in place before they are re-indexed
+        self._indexed_terms: dict[int, tuple[str, ...]] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed documents."""
+        return len(self._indexed_terms)
+
+    def add(self, doc_id: int, title: str, description: str) -> None:
+        """
+        Index a document, replacing any earlier entry for the same ID.
+
+        Args:
+            doc_id: Document identifier
+            title: Document title
+            description: Document description
+        """
+        weights: dict[str, int] = {}
+        for term in tokenize(title):
+            weights[term] = weights.get(term, 0) + TITLE_WEIGHT
+        for term in tokenize(description):
+            weights[term] = weights.get(term, 0) + DESCRIPTION_WEIGHT
+
+        old_terms = self._indexed_terms.get(doc_id)
+        if old_terms is not None:
+            if len(old_terms) == len(weights) and all(
+                self._postings[term][doc_id] == weights.get(term) for term in old_terms
+            ):
+                return
+            self.remove(doc_id)
+
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._new_terms.append(term)
+            postings[doc_id] = weight
+        self._indexed_terms[doc_id] = tuple(weights)
+
+    def remove(self, doc_id: int) -> None:
+        """
+        Remove a document from the index.
+
+        Args:
+            doc_id: Document identifier
+        """
+        for term in self._indexed_terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+                terms = self._sorted_terms()
+                del terms[bisect_left(terms, term)]
+
+    def clear(self) -> None:
+        """Remove all documents from the index."""
+        self._postings.clear()
+        self._terms.clear()
+        self._new_terms.clear()
+        self._indexed_terms.clear()
+
+    def _sorted_terms(self) -> list[str]:
+        """Return all indexed terms in sorted order, merging new ones first."""
+        if self._new_terms:
+            # Writers are excluded while readers run, so _new_terms only
+            # empties here; readers that find it empty see the merged list
+            with self._merge_lock:
+                new_terms = self._new_terms
+                if new_terms:
+                    if len(new_terms) <= _INSORT_MAX:
+                        for term in new_terms:
+                            insort(self._terms, term)
+                    else:
+                        self._terms.extend(new_terms)
+                        self._terms.sort()
+                    self._new_terms = []
+        return self._terms
+
+    def _expand(self, term: str, prefix: bool) -> list[str]:
+        """Return the indexed terms matched by a query term."""
+        if not prefix:
+            return [term] if term in self._postings else []
+
+        terms = self._sorted_terms()
+        matches = []
+        position = bisect_left(terms, term)
+        while position < len(terms) and terms[position].startswith(term):
+            matches.append(terms[position])
+            position += 1
+        return matches
+
+    def estimate(self, query: str) -> int:
+        """
+        Estimate the number of documents matching a query without scoring.
+
+        Args:
+            query: Search query (see parse_query)
+
+        Returns:
+            Upper bound on the number of matches: the rarest term of each
+            group, summed over the groups
+        """
+        estimate = 0
+        for group in parse_query(query):
+            estimate += min(
+                sum(len(self._postings[match]) for match in self._expand(term, prefix))
+                for term, prefix in group
+            )
+        return min(estimate, len(self._indexed_terms))
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> list[int]:
+        """
+        Find documents matching a query, best matches first.
+
+        Args:
+            query: Search query (see parse_query)
+            limit: Maximum number of results (optional)
+            accept: Extra filter on document IDs (optional)
+
+        Returns:
+            Matching document IDs ordered by relevance, then by ID
+        """
+        total = len(self._indexed_terms)
+        scores: dict[int, float] = {}
+
+        for group in parse_query(query):
+            expanded = [self._expand(term, prefix) for term, prefix in group]
+            if not all(expanded):
+                continue
+
+            # Intersect the documents of every term, rarest first; set
+            # operations on dict key views run without a Python-level loop
+            matches = sorted(
+                (
+                    self._postings[terms[0]].keys() if len(terms) == 1
+                    else set().union(*(self._postings[term] for term in terms))
+                    for terms in expanded
+                ),
+                key=len,
+            )
+            candidates = matches[0]
+            for match in matches[1:]:
+                candidates = candidates & match
+            if accept is not None:
+                candidates = {doc_id for doc_id in candidates if accept(doc_id)}
+
+            for terms in expanded:
+                for term in terms:
+                    postings = self._postings[term]
+                    idf = math.log(1 + total / len(postings))
+                    if len(terms) == 1 and len(candidates) == len(postings):
+                        weights = postings.items()
+                    elif len(postings) < len(candidates):
+                        weights = [(d, w) for d, w in postings.items() if d in candidates]
+                    else:
+                        weights = [(d, postings[d]) for d in candidates if d in postings]
+                    for doc_id, weight in weights:
+                        scores[doc_id] = scores.get(doc_id, 0.0) + weight * idf
+
+        # Highest score first, ties broken by ID
+        ranked = zip(map(neg, scores.values()), scores.keys())
+        top = sorted(ranked) if limit is None else nsmallest(limit, ranked)
+        return [doc_id for _, doc_id in top]
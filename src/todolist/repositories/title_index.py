@@ -0,0 +1,251 @@
+"""
+Prefix and fuzzy title index.
+
+This module provides the index used to look up projects by the start of
+their title, or by an approximate spelling of it, without scanning every
+project.
+"""
+
+from heapq import nlargest
+from typing import Optional
+
+# Minimum trigram similarity of the whole title, and minimum share of the
+# query's trigrams found in the title, for a fuzzy match (same defaults
+# as PostgreSQL's pg_trgm similarity and word_similarity)
+SIMILARITY_THRESHOLD = 0.3
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+# Rank of a prefix match on the whole title and on a later word
+_TITLE_RANK = 0
+_WORD_RANK = 1
+
+
+def normalize(text: str) -> str:
+    """
+    Normalize text for case- and whitespace-insensitive comparison.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Case-folded text with single spaces between words
+    """
+    return " ".join(text.casefold().split())
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Split normalized text into character trigrams of its padded words.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        Set of trigrams
+    """
+    result = set()
+    for word in text.split():
+        padded = f"  {word} "
+        result.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return result
+
+
+class _TrieNode:
+    """Node of the prefix trie."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, "_TrieNode"] = {}
+        # Ids of titles (or title words) ending here, with their match rank
+        self.ids: dict[int, int] = {}
+
+
+class TitleIndex:
+    """
+    Prefix trie plus trigram index over titles.
+
+    The trie holds the whole title and every suffix starting at a word,
+    so a prefix finds both "Groceries" and "Weekly groceries". The
+    trigram index maps each three-character sequence to the titles that
+    contain it and catches misspellings. Lookups only touch the trie
+    path of the prefix and the postings of the query's trigrams.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._root = _TrieNode()
+        self._trigram_postings: dict[str, set[int]] = {}
+        self._trigram_counts: dict[int, int] = {}
+
+        # Normalized title each id was indexed under, because titles are
+        # changed in place before they are re-indexed
+        self._indexed_titles: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed titles."""
+        return len(self._indexed_titles)
+
+    @staticmethod
+    def _word_suffixes(key: str) -> list[tuple[str, int]]:
+        """Return the title and each suffix starting at a later word, with ranks."""
+        suffixes = [(key, _TITLE_RANK)]
+        suffixes.extend(
+            (key[index + 1:], _WORD_RANK)
+            for index, char in enumerate(key) if char == " "
+        )
+        return suffixes
+
+    def add(self, doc_id: int, title: str) -> None:
+        """
+        Index a title, replacing any earlier entry for the same ID.
+
+        Args:
+            doc_id: Identifier of the titled entity
+            title: Title to index
+        """
+        key = normalize(title)
+        if self._indexed_titles.get(doc_id) == key:
+            return
+        self.remove(doc_id)
+
+        for suffix, rank in self._word_suffixes(key):
+            node = self._root
+            for char in suffix:
+                node = node.children.setdefault(char, _TrieNode())
+            if node.ids.get(doc_id, rank) >= rank:
+                node.ids[doc_id] = rank
+
+        title_trigrams = trigrams(key)
+        for trigram in title_trigrams:
+            self._trigram_postings.setdefault(trigram, set()).add(doc_id)
+        self._trigram_counts[doc_id] = len(title_trigrams)
+        self._indexed_titles[doc_id] = key
+
+    def remove(self, doc_id: int) -> None:
+        """
+        Remove a title from the index.
+
+        Args:
+            doc_id: Identifier of the titled entity
+        """
+        key = self._indexed_titles.pop(doc_id, None)
+        if key is None:
+            return
+
+        for suffix, _ in self._word_suffixes(key):
+            path = [self._root]
+            for char in suffix:
+                path.append(path[-1].children[char])
+            path[-1].ids.pop(doc_id, None)
+            # Prune nodes left without titles or children
+            for depth in range(len(suffix), 0, -1):
+                node = path[depth]
+                if node.ids or node.children:
+                    break
+                del path[depth - 1].children[suffix[depth - 1]]
+
+        for trigram in trigrams(key):
+            postings = self._trigram_postings[trigram]
+            postings.discard(doc_id)
+            if not postings:
+                del self._trigram_postings[trigram]
+        del self._trigram_counts[doc_id]
+
+    def clear(self) -> None:
+        """Remove all titles from the index."""
+        self._root = _TrieNode()
+        self._trigram_postings.clear()
+        self._trigram_counts.clear()
+        self._indexed_titles.clear()
+
+    def find_prefix(self, prefix: str, limit: Optional[int] = None) -> list[int]:
+        """
+        Find titles that start with a prefix, or have a word that does.
+
+        Args:
+            prefix: Text the title or one of its words starts with
+            limit: Maximum number of results (optional)
+
+        Returns:
+            Matching IDs, shortest completions first; at equal length,
+            whole-title matches come before word matches, then by ID
+        """
+        node = self._root
+        for char in normalize(prefix):
+            node = node.children.get(char)
+            if node is None:
+                return []
+
+        # Walk the subtree breadth first so that shorter completions are
+        # found first, and stop once a level has produced enough results
+        found: dict[int, tuple[int, int, int]] = {}
+        level = [node]
+        depth = 0
+        while level and (limit is None or len(found) < limit):
+            next_level = []
+            for current in level:
+                for doc_id, rank in current.ids.items():
+                    if doc_id not in found:
+                        found[doc_id] = (depth, rank, doc_id)
+                next_level.extend(current.children.values())
+            level = next_level
+            depth += 1
+
+        ranked = sorted(found, key=found.__getitem__)
+        return ranked if limit is None else ranked[:limit]
+
+    def find_similar(
+        self, text: str, limit: Optional[int] = None
+    ) -> list[tuple[int, float]]:
+        """
+        Find titles similar to a text by trigram overlap.
+
+        A title matches if its trigrams overlap enough with the text's
+        (Jaccard similarity), or if most of the text's trigrams occur in
+        it, so that a misspelled word still finds a longer title. The
+        similarity reported is the larger of the two measures.
+
+        Args:
+            text: Text to compare against
+            limit: Maximum number of results (optional)
+
+        Returns:
+            List of (ID, similarity) pairs, most similar first
+        """
+        query = trigrams(normalize(text))
+        shared: dict[int, int] = {}
+        for trigram in query:
+            for doc_id in self._trigram_postings.get(trigram, ()):
+                shared[doc_id] = shared.get(doc_id, 0) + 1
+
+        matches = []
+        for doc_id, count in shared.items():
+            similarity = count / (len(query) + self._trigram_counts[doc_id] - count)
+            word_similarity = count / len(query)
+            if similarity >= SIMILARITY_THRESHOLD or word_similarity >= WORD_SIMILARITY_THRESHOLD:
+                matches.append((max(similarity, word_similarity), -doc_id))
+
+        top = sorted(matches, reverse=True) if limit is None else nlargest(limit, matches)
+        return [(-negative_id, similarity) for similarity, negative_id in top]
+
+    def find(self, text: str, limit: Optional[int] = None) -> list[int]:
+        """
+        Find titles by prefix first, then by similarity.
+
+        Args:
+            text: Prefix or approximate title
+            limit: Maximum number of results (optional)
+
+        Returns:
+            Matching IDs, best candidates first
+        """
+        results = self.find_prefix(text, limit)
+        if limit is None or len(results) < limit:
+            seen = set(results)
+            for doc_id, _ in self.find_similar(text):
+                if doc_id not in seen:
+                    results.append(doc_id)
+                    if limit is not None and len(results) >= limit:
+                        break
+        return results
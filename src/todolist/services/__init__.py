@@ -1,6 +1,16 @@
 """Services package."""
 
-from .task_service import TaskService
-from .project_service import ProjectService
+from ..utils.lazy import lazy_exports
 
-__all__ = ["TaskService", "ProjectService"]
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "TaskService": "task_service",
+    "ProjectService": "project_service",
+    "AsyncTaskService": "async_task_service",
+    "AsyncProjectService": "async_project_service",
+    "DataTransfer": "transfer",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
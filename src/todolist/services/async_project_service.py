@@ -0,0 +1,344 @@
+"""
+Async project service for business logic.
+
+This module provides the asyncio counterpart of ProjectService. It
+applies the same business rules, including the duplicate-title check and
+cascade delete, on top of async repositories.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import Callable, Iterable, Mapping, Optional
+from ..models.project import Project
+from ..repositories.async_repository import AsyncProjectRepository, AsyncTaskRepository
+from ..utils.exceptions import DuplicateResourceError, ValidationError
+from ..utils.id_generator import id_generator
+from ..utils.validators import validate_non_empty_string, validate_page_size
+from .optimistic import update_with_retry_async
+
+
+class AsyncProjectService:
+    """
+    Async service layer for project management operations.
+
+    Methods mirror ProjectService one to one and are coroutines. Single
+    creates and renames check the title atomically in the repository
+    (add_unique, update_unique), so they are safe against writers on
+    other threads, and updates use optimistic versioning. Batch creates
+    and cascade deletes hold a per-service lock: other coroutines of this
+    service may run while a repository call is awaited, and must not slip
+    in between the check and the write.
+    """
+
+    def __init__(
+        self,
+        project_repository: AsyncProjectRepository,
+        task_repository: AsyncTaskRepository,
+    ) -> None:
+        """
+        Initialize async project service.
+
+        Args:
+            project_repository: Async repository for project persistence
+            task_repository: Async repository for task persistence (for cascade operations)
+        """
+        self._project_repo = project_repository
+        self._task_repo = task_repository
+        self._lock: Optional[asyncio.Lock] = None
+
+    @property
+    def _write_lock(self) -> asyncio.Lock:
+        """Lock serializing check-then-write operations."""
+        # Created on first use so that it belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def create_project(self, title: str, description: str = "") -> Project:
+        """
+        Create a new project.
+
+        Args:
+            title: Project title
+            description: Project description (optional)
+
+        Returns:
+            Created project
+
+        Raises:
+            ValidationError: If validation fails
+            DuplicateResourceError: If project with same title exists
+            LimitExceededError: If project limit is reached
+        """
+        project = Project(title=title, description=description)
+        return await self._project_repo.add_unique(project)
+
+    async def create_projects(self, items: Iterable[Mapping]) -> dict:
+        """
+        Create many projects in one batch (see ProjectService.create_projects).
+
+        Args:
+            items: Mappings with the keyword arguments of create_project
+
+        Returns:
+            Dictionary with the created projects and per-item errors
+            (``{"index": position in items, "error": exception}``)
+
+        Raises:
+            LimitExceededError: If the valid projects do not fit within the
+                project limit (nothing is inserted)
+        """
+        now = datetime.now()
+
+        async with self._write_lock:
+            valid: list[dict] = []
+            errors: list[dict] = []
+            batch_titles: set[str] = set()
+            for index, item in enumerate(items):
+                try:
+                    fields = Project.validate_fields(**item)
+                except ValidationError as e:
+                    errors.append({"index": index, "error": e})
+                    continue
+                except TypeError as e:
+                    errors.append({"index": index, "error": ValidationError(str(e))})
+                    continue
+
+                title_key = fields["title"].casefold()
+                if title_key in batch_titles or await self._project_repo.exists_by_title(
+                    fields["title"]
+                ):
+                    errors.append({
+                        "index": index,
+                        "error": DuplicateResourceError("Project", fields["title"]),
+                    })
+                    continue
+
+                batch_titles.add(title_key)
+                valid.append(fields)
+
+            # Only the valid projects get IDs, so they form one contiguous block
+            project_ids = id_generator.generate_block("project", len(valid))
+            projects = [
+                Project.from_record(id=project_id, created_at=now, updated_at=now, **fields)
+                for project_id, fields in zip(project_ids, valid)
+            ]
+
+            return {
+                "created": await self._project_repo.add_many(projects),
+                "errors": errors,
+            }
+
+    async def get_project(self, project_id: int) -> Project:
+        """
+        Retrieve a project by ID.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Project entity
+
+        Raises:
+            ResourceNotFoundError: If project not found
+        """
+        return await self._project_repo.get_by_id(project_id)
+
+    async def get_project_by_title(self, title: str) -> Optional[Project]:
+        """
+        Retrieve a project by title.
+
+        Args:
+            title: Project title
+
+        Returns:
+            Project entity if found, None otherwise
+        """
+        return await self._project_repo.get_by_title(title)
+
+    async def find_projects(self, prefix_or_fuzzy: str, limit: int = 10) -> list[Project]:
+        """
+        Find candidate projects for a partial or misspelled title.
+
+        Args:
+            prefix_or_fuzzy: Title prefix or approximate title
+            limit: Maximum number of candidates
+
+        Returns:
+            List of candidate projects, best matches first
+
+        Raises:
+            ValidationError: If the text is empty or limit is not positive
+        """
+        validate_non_empty_string(prefix_or_fuzzy, "Search text")
+        validate_page_size(limit, "Limit")
+
+        return await self._project_repo.find_by_title(prefix_or_fuzzy, limit)
+
+    async def get_all_projects(self) -> list[Project]:
+        """
+        Retrieve all projects.
+
+        Returns:
+            List of all projects
+        """
+        return await self._project_repo.get_all()
+
+    async def get_projects_page(
+        self, limit: int = 20, after_id: Optional[int] = None
+    ) -> dict:
+        """
+        Retrieve one page of projects in ascending ID order.
+
+        Args:
+            limit: Maximum number of projects on the page
+            after_id: Cursor returned with the previous page (optional)
+
+        Returns:
+            Dictionary with the page items and the cursor of the next page
+            (None when this is the last page)
+
+        Raises:
+            ValidationError: If limit is not a positive integer
+        """
+        validate_page_size(limit)
+        projects = await self._project_repo.list_all(after_id, limit + 1)
+
+        has_more = len(projects) > limit
+        projects = projects[:limit]
+        return {
+            "items": projects,
+            "next_after_id": projects[-1].id if has_more else None,
+        }
+
+    async def modify_project(
+        self,
+        project_id: int,
+        change: Callable[[Project], None],
+        expected_version: Optional[int] = None,
+    ) -> Project:
+        """
+        Apply a change to a copy of a project and store it optimistically
+        (see TaskService.modify_task).
+
+        Args:
+            project_id: Project identifier
+            change: Applies the changes to the project copy in place
+            expected_version: Only update this version of the project,
+                without retrying (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            ResourceNotFoundError: If project not found
+            ValidationError: If change rejects the update
+            VersionConflictError: If the project no longer has expected_version,
+                or concurrent writers kept winning
+        """
+        return await update_with_retry_async(
+            lambda: self._project_repo.get_by_id(project_id),
+            self._project_repo.update,
+            change,
+            expected_version,
+        )
+
+    async def update_project(
+        self,
+        project_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        expected_version: Optional[int] = None,
+    ) -> Project:
+        """
+        Update project details.
+
+        Args:
+            project_id: Project identifier
+            title: New title (optional)
+            description: New description (optional)
+            expected_version: Only update this version of the project (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            ResourceNotFoundError: If project not found
+            ValidationError: If validation fails
+            DuplicateResourceError: If new title conflicts with existing project
+            VersionConflictError: If the project was modified concurrently
+        """
+        def change(project: Project) -> None:
+            project.update_details(title=title, description=description)
+
+        if title is None:
+            return await self.modify_project(project_id, change, expected_version)
+
+        # The repository checks the title and stores the project under its
+        # write lock, so no create or rename can take the title in between
+        return await update_with_retry_async(
+            lambda: self._project_repo.get_by_id(project_id),
+            self._project_repo.update_unique,
+            change,
+            expected_version,
+        )
+
+    async def delete_project(self, project_id: int, cascade: bool = True) -> dict:
+        """
+        Delete a project.
+
+        Args:
+            project_id: Project identifier
+            cascade: If True, also delete all tasks in the project (default: True)
+
+        Returns:
+            Dictionary with deletion statistics
+
+        Raises:
+            ResourceNotFoundError: If project not found
+        """
+        async with self._write_lock:
+            await self._project_repo.get_by_id(project_id)
+
+            deleted_tasks = 0
+            if cascade:
+                deleted_tasks = await self._task_repo.delete_by_project_id(project_id)
+
+            await self._project_repo.delete(project_id)
+
+        return {
+            "project_id": project_id,
+            "deleted_tasks": deleted_tasks,
+            "cascade": cascade,
+        }
+
+    async def count_projects(self) -> int:
+        """
+        Get total project count.
+
+        Returns:
+            Number of projects
+        """
+        return await self._project_repo.count()
+
+    async def get_project_summary(self, project_id: int) -> dict:
+        """
+        Get summary information about a project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Dictionary with project details and task statistics
+
+        Raises:
+            ResourceNotFoundError: If project not found
+        """
+        project = await self._project_repo.get_by_id(project_id)
+        status_counts = await self._task_repo.count_by_status_in_project(project_id)
+
+        return {
+            "project": project,
+            "total_tasks": sum(status_counts.values()),
+            "status_breakdown": status_counts,
+        }
@@ -0,0 +1,446 @@
+"""
+Async task service for business logic.
+
+This module provides the asyncio counterpart of TaskService. It applies
+the same business rules on top of an AsyncTaskRepository, so it can be
+used from an event loop without blocking it.
+"""
+
+from typing import Callable, Iterable, Mapping, Optional
+from datetime import datetime
+from ..models.task import Task, TaskStatus
+from ..repositories.async_repository import AsyncTaskRepository
+from ..repositories.task_query import TaskQuery
+from ..utils.exceptions import ValidationError
+from ..utils.validators import (
+    validate_non_empty_string,
+    validate_page_size,
+    validate_status,
+)
+from .optimistic import update_with_retry_async
+from .task_service import _OPEN_STATUSES, _build_tasks
+
+
+class AsyncTaskService:
+    """
+    Async service layer for task management operations.
+
+    Methods mirror TaskService one to one and are coroutines.
+    """
+
+    def __init__(self, task_repository: AsyncTaskRepository) -> None:
+        """
+        Initialize async task service.
+
+        Args:
+            task_repository: Async repository for task persistence
+        """
+        self._task_repo = task_repository
+
+    async def create_task(
+        self,
+        title: str,
+        project_id: int,
+        description: str = "",
+        status: str = TaskStatus.TODO.value,
+        deadline: Optional[datetime] = None,
+    ) -> Task:
+        """
+        Create a new task.
+
+        Args:
+            title: Task title
+            project_id: ID of parent project
+            description: Task description (optional)
+            status: Initial status (default: TODO)
+            deadline: Task deadline (optional)
+
+        Returns:
+            Created task
+
+        Raises:
+            ValidationError: If validation fails
+            LimitExceededError: If task limit is reached
+        """
+        task = Task(
+            title=title,
+            project_id=project_id,
+            description=description,
+            status=status,
+            deadline=deadline,
+        )
+
+        return await self._task_repo.add(task)
+
+    async def create_tasks(self, items: Iterable[Mapping]) -> dict:
+        """
+        Create many tasks in one batch (see TaskService.create_tasks).
+
+        Args:
+            items: Mappings with the keyword arguments of create_task
+
+        Returns:
+            Dictionary with the created tasks and per-item errors
+
+        Raises:
+            LimitExceededError: If the valid tasks do not fit within the
+                task limit (nothing is inserted)
+        """
+        tasks, errors = _build_tasks(items)
+        return {
+            "created": await self._task_repo.add_many(tasks),
+            "errors": errors,
+        }
+
+    async def get_task(self, task_id: int) -> Task:
+        """
+        Retrieve a task by ID.
+
+        Args:
+            task_id: Task identifier
+
+        Returns:
+            Task entity
+
+        Raises:
+            ResourceNotFoundError: If task not found
+        """
+        return await self._task_repo.get_by_id(task_id)
+
+    async def get_all_tasks(self) -> list[Task]:
+        """
+        Retrieve all tasks.
+
+        Returns:
+            List of all tasks
+        """
+        return await self._task_repo.get_all()
+
+    async def get_tasks_by_project(self, project_id: int) -> list[Task]:
+        """
+        Retrieve all tasks for a specific project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            List of tasks in the project
+        """
+        return await self._task_repo.get_by_project_id(project_id)
+
+    async def get_tasks_page(
+        self,
+        limit: int = 20,
+        after_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+    ) -> dict:
+        """
+        Retrieve one page of tasks in ascending ID order.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            after_id: Cursor returned with the previous page (optional)
+            project_id: Only return tasks of this project (optional)
+
+        Returns:
+            Dictionary with the page items and the cursor of the next page
+            (None when this is the last page)
+
+        Raises:
+            ValidationError: If limit is not a positive integer
+        """
+        validate_page_size(limit)
+        if project_id is None:
+            tasks = await self._task_repo.list_all(after_id, limit + 1)
+        else:
+            tasks = await self._task_repo.list_by_project_id(project_id, after_id, limit + 1)
+
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+        return {
+            "items": tasks,
+            "next_after_id": tasks[-1].id if has_more else None,
+        }
+
+    async def search(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions (see TaskService.search).
+
+        Args:
+            query: Search query
+            project_id: Only return tasks of this project (optional)
+            status: Only return tasks with this status (optional)
+            limit: Maximum number of tasks to return
+
+        Returns:
+            List of matching tasks, most relevant first
+
+        Raises:
+            ValidationError: If query is empty, status is invalid or
+                limit is not a positive integer
+        """
+        validate_non_empty_string(query, "Search query")
+        if status is not None:
+            validate_status(status, TaskStatus.values())
+        validate_page_size(limit, "Limit")
+
+        return await self._task_repo.search(
+            query, limit=limit, project_id=project_id, status=status
+        )
+
+    async def query_tasks(self, task_query: TaskQuery) -> list[Task]:
+        """
+        Run a query combining filters, sorting and paging.
+
+        Args:
+            task_query: Query built with TaskQuery
+
+        Returns:
+            List of matching tasks in the requested order
+
+        Raises:
+            ValidationError: If task_query is not a TaskQuery or sorts by
+                relevance without a text filter
+        """
+        if not isinstance(task_query, TaskQuery):
+            raise ValidationError("Query must be a TaskQuery")
+
+        return await self._task_repo.query(task_query)
+
+    async def get_query_stats(self) -> dict:
+        """
+        Get statistics of the queries run through query_tasks.
+
+        Returns:
+            Dictionary with the number of queries per plan and the
+            statistics of the most recent queries
+        """
+        return await self._task_repo.get_query_stats()
+
+    async def get_tasks_due_between(
+        self, start: datetime, end: datetime
+    ) -> list[Task]:
+        """
+        Retrieve tasks whose deadline falls within a time window.
+
+        Args:
+            start: Inclusive start of the window
+            end: Exclusive end of the window
+
+        Returns:
+            List of tasks ordered by deadline
+
+        Raises:
+            ValidationError: If start is after end
+        """
+        if start > end:
+            raise ValidationError("Start of the deadline window must not be after its end")
+
+        return await self._task_repo.get_by_deadline_range(start=start, end=end)
+
+    async def get_overdue_tasks(self, now: Optional[datetime] = None) -> list[Task]:
+        """
+        Retrieve unfinished tasks whose deadline has already passed.
+
+        Args:
+            now: Reference time (default: current time)
+
+        Returns:
+            List of overdue tasks ordered by deadline
+        """
+        if now is None:
+            now = datetime.now()
+
+        return await self._task_repo.get_by_deadline_range(
+            end=now, statuses=_OPEN_STATUSES
+        )
+
+    async def get_next_due_tasks(
+        self, count: int, now: Optional[datetime] = None
+    ) -> list[Task]:
+        """
+        Retrieve the next unfinished tasks that are due.
+
+        Args:
+            count: Maximum number of tasks to return
+            now: Reference time (default: current time)
+
+        Returns:
+            List of up to ``count`` tasks ordered by deadline
+
+        Raises:
+            ValidationError: If count is not a positive integer
+        """
+        validate_page_size(count, "Count")
+        if now is None:
+            now = datetime.now()
+
+        return await self._task_repo.get_by_deadline_range(
+            start=now, limit=count, statuses=_OPEN_STATUSES
+        )
+
+    async def modify_task(
+        self,
+        task_id: int,
+        change: Callable[[Task], None],
+        expected_version: Optional[int] = None,
+    ) -> Task:
+        """
+        Apply a change to a copy of a task and store it optimistically
+        (see TaskService.modify_task).
+
+        Args:
+            task_id: Task identifier
+            change: Applies the changes to the task copy in place
+            expected_version: Only update this version of the task, without
+                retrying (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            ResourceNotFoundError: If task not found
+            ValidationError: If change rejects the update
+            VersionConflictError: If the task no longer has expected_version,
+                or concurrent writers kept winning
+        """
+        return await update_with_retry_async(
+            lambda: self._task_repo.get_by_id(task_id),
+            self._task_repo.update,
+            change,
+            expected_version,
+        )
+
+    async def update_task(
+        self,
+        task_id: int,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        deadline: Optional[datetime] = None,
+        expected_version: Optional[int] = None,
+    ) -> Task:
+        """
+        Update task details.
+
+        Args:
+            task_id: Task identifier
+            title: New title (optional)
+            description: New description (optional)
+            deadline: New deadline (optional)
+            expected_version: Only update this version of the task (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            ResourceNotFoundError: If task not found
+            ValidationError: If validation fails
+            VersionConflictError: If the task was modified concurrently
+        """
+        return await self.modify_task(
+            task_id,
+            lambda task: task.update_details(
+                title=title, description=description, deadline=deadline
+            ),
+            expected_version,
+        )
+
+    async def update_task_status(
+        self, task_id: int, new_status: str, expected_version: Optional[int] = None
+    ) -> Task:
+        """
+        Update task status.
+
+        Args:
+            task_id: Task identifier
+            new_status: New status value
+            expected_version: Only update this version of the task (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            ResourceNotFoundError: If task not found
+            ValidationError: If status is invalid
+            VersionConflictError: If the task was modified concurrently
+        """
+        return await self.modify_task(
+            task_id, lambda task: task.update_status(new_status), expected_version
+        )
+
+    async def delete_task(self, task_id: int) -> None:
+        """
+        Delete a task.
+
+        Args:
+            task_id: Task identifier
+
+        Raises:
+            ResourceNotFoundError: If task not found
+        """
+        await self._task_repo.delete(task_id)
+
+    async def delete_tasks_by_project(self, project_id: int) -> int:
+        """
+        Delete all tasks belonging to a project (cascade delete).
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Number of tasks deleted
+        """
+        return await self._task_repo.delete_by_project_id(project_id)
+
+    async def count_tasks(self) -> int:
+        """
+        Get total task count.
+
+        Returns:
+            Number of tasks
+        """
+        return await self._task_repo.count()
+
+    async def count_tasks_by_project(self, project_id: int) -> int:
+        """
+        Get task count for a specific project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            Number of tasks in project
+        """
+        return await self._task_repo.count_by_project_id(project_id)
+
+    async def get_tasks_by_status(self, status: str) -> list[Task]:
+        """
+        Get all tasks with a specific status.
+
+        Args:
+            status: Status to filter by
+
+        Returns:
+            List of tasks with the given status
+
+        Raises:
+            ValidationError: If status is invalid
+        """
+        validate_status(status, TaskStatus.values())
+
+        return await self._task_repo.get_by_status(status)
+
+    async def count_tasks_by_status(self) -> dict[str, int]:
+        """
+        Get task count for every status.
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        return await self._task_repo.count_by_status()
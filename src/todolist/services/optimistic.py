@@ -0,0 +1,109 @@
+"""
+Optimistic updates for the service layer.
+
+This module provides the copy-on-write update loop the services use:
+read an entity, apply the changes to a copy, and store the copy only if
+no other writer stored a newer version in the meantime. On a conflict
+the loop starts over from the current version, so concurrent updates of
+different fields are all kept without holding a lock while changes are
+computed.
+"""
+
+import copy
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+from ..utils.exceptions import VersionConflictError
+
+# Attempts before a VersionConflictError reaches the caller
+UPDATE_ATTEMPTS = 8
+
+_Entity = TypeVar("_Entity")
+
+
+def _backoff(attempt: int) -> float:
+    """Return a randomized delay in seconds before retry number attempt."""
+    return random.random() * min(0.001 * 2 ** attempt, 0.05)
+
+
+def update_with_retry(
+    read: Callable[[], _Entity],
+    write: Callable[[_Entity, int], _Entity],
+    change: Callable[[_Entity], None],
+    expected_version: Optional[int] = None,
+    attempts: int = UPDATE_ATTEMPTS,
+) -> _Entity:
+    """
+    Apply a change to a copy of an entity and store it with compare-and-swap.
+
+    Args:
+        read: Returns the current entity
+        write: Repository update, called with the changed copy and the
+            version it must replace
+        change: Applies the changes to the copy in place
+        expected_version: Version the caller's changes were based on; if
+            given, the update is attempted once against that version
+        attempts: Maximum number of attempts
+
+    Returns:
+        The stored entity
+
+    Raises:
+        VersionConflictError: If the entity no longer has expected_version,
+            or every attempt conflicted with another writer
+    """
+    attempt = 0
+    while True:
+        current = read()
+        entity = copy.copy(current)
+        change(entity)
+        try:
+            return write(entity, current.version if expected_version is None else expected_version)
+        except VersionConflictError:
+            attempt += 1
+            if expected_version is not None or attempt >= attempts:
+                raise
+        time.sleep(_backoff(attempt))
+
+
+async def update_with_retry_async(
+    read: Callable[[], Awaitable[_Entity]],
+    write: Callable[[_Entity, int], Awaitable[_Entity]],
+    change: Callable[[_Entity], None],
+    expected_version: Optional[int] = None,
+    attempts: int = UPDATE_ATTEMPTS,
+) -> _Entity:
+    """
+    Coroutine version of update_with_retry for the async repositories.
+
+    Args:
+        read: Coroutine function returning the current entity
+        write: Async repository update
+        change: Applies the changes to the copy in place
+        expected_version: Version the caller's changes were based on (optional)
+        attempts: Maximum number of attempts
+
+    Returns:
+        The stored entity
+
+    Raises:
+        VersionConflictError: If the entity no longer has expected_version,
+            or every attempt conflicted with another writer
+    """
+    # Imported here so that the synchronous services do not load asyncio
+    import asyncio
+
+    attempt = 0
+    while True:
+        current = await read()
+        entity = copy.copy(current)
+        change(entity)
+        try:
+            return await write(
+                entity, current.version if expected_version is None else expected_version
+            )
+        except VersionConflictError:
+            attempt += 1
+            if expected_version is not None or attempt >= attempts:
+                raise
+        await asyncio.sleep(_backoff(attempt))
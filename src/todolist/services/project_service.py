@@ -5,7 +5,8 @@ This module provides high-level operations for project management,
 coordinating between repositories and enforcing business rules.
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import Callable, Iterable, Iterator, Mapping, Optional
 from ..models.project import Project
 from ..repositories.project_repository import ProjectRepository
 from ..repositories.task_repository import TaskRepository
@@ -14,6 +15,9 @@ from ..utils.exceptions import (
     ValidationError,
     DuplicateResourceError,
 )
+from ..utils.id_generator import id_generator
+from ..utils.validators import validate_non_empty_string, validate_page_size
+from .optimistic import update_with_retry
 
 
 class ProjectService:
@@ -21,7 +25,9 @@ class ProjectService:
     Service layer for project management operations.
 
     This class provides business logic for creating, updating,
-    and managing projects, including cascade operations.
+    and managing projects, including cascade operations. Operations that
+    check and then write hold the project repository's write lock, so the
+    service can be shared between threads.
     """
 
     def __init__(
@@ -55,12 +61,69 @@ class ProjectService:
             DuplicateResourceError: If project with same title exists
             LimitExceededError: If project limit is reached
         """
-        # Check for duplicate title
-        if self._project_repo.exists_by_title(title):
-            raise DuplicateResourceError("Project", title)
-
+        # The repository checks for a duplicate title and adds atomically
         project = Project(title=title, description=description)
-        return self._project_repo.add(project)
+        return self._project_repo.add_unique(project)
+
+    def create_projects(self, items: Iterable[Mapping]) -> dict:
+        """
+        Create many projects in one batch.
+
+        Every item is validated (including title uniqueness against the
+        repository and within the batch) before anything is stored. Items
+        that fail are reported and skipped; the remaining projects get a
+        contiguous block of IDs and are inserted all at once.
+
+        Args:
+            items: Mappings with the keyword arguments of create_project
+
+        Returns:
+            Dictionary with the created projects and per-item errors
+            (``{"index": position in items, "error": exception}``)
+
+        Raises:
+            LimitExceededError: If the valid projects do not fit within the
+                project limit (nothing is inserted)
+        """
+        now = datetime.now()
+
+        # Titles must not change between the checks and the insert
+        with self._project_repo.locked():
+            valid: list[dict] = []
+            errors: list[dict] = []
+            batch_titles: set[str] = set()
+            for index, item in enumerate(items):
+                try:
+                    fields = Project.validate_fields(**item)
+                except ValidationError as e:
+                    errors.append({"index": index, "error": e})
+                    continue
+                except TypeError as e:
+                    errors.append({"index": index, "error": ValidationError(str(e))})
+                    continue
+
+                title_key = fields["title"].casefold()
+                if title_key in batch_titles or self._project_repo.exists_by_title(fields["title"]):
+                    errors.append({
+                        "index": index,
+                        "error": DuplicateResourceError("Project", fields["title"]),
+                    })
+                    continue
+
+                batch_titles.add(title_key)
+                valid.append(fields)
+
+            # Only the valid projects get IDs, so they form one contiguous block
+            project_ids = id_generator.generate_block("project", len(valid))
+            projects = [
+                Project.from_record(id=project_id, created_at=now, updated_at=now, **fields)
+                for project_id, fields in zip(project_ids, valid)
+            ]
+
+            return {
+                "created": self._project_repo.add_many(projects),
+                "errors": errors,
+            }
 
     def get_project(self, project_id: int) -> Project:
         """
@@ -89,6 +152,29 @@ class ProjectService:
         """
         return self._project_repo.get_by_title(title)
 
+    def find_projects(self, prefix_or_fuzzy: str, limit: int = 10) -> list[Project]:
+        """
+        Find candidate projects for a partial or misspelled title.
+
+        Projects whose title, or a word of it, starts with the text come
+        first (shortest titles first); projects with a similar spelling
+        follow. Matching ignores case.
+
+        Args:
+            prefix_or_fuzzy: Title prefix or approximate title
+            limit: Maximum number of candidates
+
+        Returns:
+            List of candidate projects, best matches first
+
+        Raises:
+            ValidationError: If the text is empty or limit is not positive
+        """
+        validate_non_empty_string(prefix_or_fuzzy, "Search text")
+        validate_page_size(limit, "Limit")
+
+        return self._project_repo.find_by_title(prefix_or_fuzzy, limit)
+
     def get_all_projects(self) -> list[Project]:
         """
         Retrieve all projects.
@@ -98,11 +184,83 @@ class ProjectService:
         """
         return self._project_repo.get_all()
 
+    def iter_projects(self, after_id: Optional[int] = None) -> Iterator[Project]:
+        """
+        Iterate over projects in ascending ID order without building a list.
+
+        Args:
+            after_id: Only return projects with a greater ID (optional cursor)
+
+        Returns:
+            Iterator over projects, ordered by project ID
+        """
+        return self._project_repo.iter_all(after_id)
+
+    def get_projects_page(
+        self, limit: int = 20, after_id: Optional[int] = None
+    ) -> dict:
+        """
+        Retrieve one page of projects in ascending ID order.
+
+        Args:
+            limit: Maximum number of projects on the page
+            after_id: Cursor returned with the previous page (optional)
+
+        Returns:
+            Dictionary with the page items and the cursor of the next page
+            (None when this is the last page)
+
+        Raises:
+            ValidationError: If limit is not a positive integer
+        """
+        validate_page_size(limit)
+        projects = list(self._project_repo.iter_all(after_id, limit + 1))
+
+        has_more = len(projects) > limit
+        projects = projects[:limit]
+        return {
+            "items": projects,
+            "next_after_id": projects[-1].id if has_more else None,
+        }
+
+    def modify_project(
+        self,
+        project_id: int,
+        change: Callable[[Project], None],
+        expected_version: Optional[int] = None,
+    ) -> Project:
+        """
+        Apply a change to a copy of a project and store it optimistically
+        (see TaskService.modify_task).
+
+        Args:
+            project_id: Project identifier
+            change: Applies the changes to the project copy in place
+            expected_version: Only update this version of the project,
+                without retrying (optional)
+
+        Returns:
+            Updated project
+
+        Raises:
+            ResourceNotFoundError: If project not found
+            ValidationError: If change rejects the update
+            VersionConflictError: If the project no longer has expected_version,
+                or concurrent writers kept winning
+        """
+        return update_with_retry(
+            lambda: self._project_repo.get_by_id(project_id),
+            self._project_repo.update,
+            change,
+            expected_version,
+        )
+
     def update_project(
         self,
         project_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
+        expected_version: Optional[int] = None,
     ) -> Project:
         """
         Update project details.
@@ -111,6 +269,7 @@ class ProjectService:
             project_id: Project identifier
             title: New title (optional)
             description: New description (optional)
+            expected_version: Only update this version of the project (optional)
 
         Returns:
             Updated project
@@ -119,17 +278,23 @@ class ProjectService:
             ResourceNotFoundError: If project not found
             ValidationError: If validation fails
             DuplicateResourceError: If new title conflicts with existing project
+            VersionConflictError: If the project was modified concurrently
         """
-        project = self._project_repo.get_by_id(project_id)
-
-        # Check for duplicate title if updating title
-        if title is not None and title != project.title:
-            existing = self._project_repo.get_by_title(title)
-            if existing and existing.id != project_id:
-                raise DuplicateResourceError("Project", title)
-
-        project.update_details(title=title, description=description)
-        return self._project_repo.update(project)
+        def change(project: Project) -> None:
+            project.update_details(title=title, description=description)
+
+        if title is None:
+            return self.modify_project(project_id, change, expected_version)
+
+        # The repository checks the title and stores the project under its
+        # write lock, so two projects cannot be renamed to the same title
+        # at once, and no lock is held across a retry backoff
+        return update_with_retry(
+            lambda: self._project_repo.get_by_id(project_id),
+            self._project_repo.update_unique,
+            change,
+            expected_version,
+        )
 
     def delete_project(self, project_id: int, cascade: bool = True) -> dict:
         """
@@ -145,16 +310,19 @@ class ProjectService:
         Raises:
             ResourceNotFoundError: If project not found
         """
-        # Verify project exists
-        self._project_repo.get_by_id(project_id)
+        # Other threads must not see the project without its tasks, or
+        # delete it a second time, while the cascade runs
+        with self._project_repo.locked():
+            # Verify project exists
+            self._project_repo.get_by_id(project_id)
 
-        deleted_tasks = 0
-        if cascade:
-            # Cascade delete: remove all tasks in this project
-            deleted_tasks = self._task_repo.delete_by_project_id(project_id)
+            deleted_tasks = 0
+            if cascade:
+                # Cascade delete: remove all tasks in this project
+                deleted_tasks = self._task_repo.delete_by_project_id(project_id)
 
-        # Delete the project
-        self._project_repo.delete(project_id)
+            # Delete the project
+            self._project_repo.delete(project_id)
 
         return {
             "project_id": project_id,
@@ -175,6 +343,9 @@ class ProjectService:
         """
         Get summary information about a project.
 
+        The task counts are maintained by the task repository as tasks
+        are written, so the project's tasks are not loaded.
+
         Args:
             project_id: Project identifier
 
@@ -185,17 +356,24 @@ class ProjectService:
             ResourceNotFoundError: If project not found
         """
         project = self._project_repo.get_by_id(project_id)
-        tasks = self._task_repo.get_by_project_id(project_id)
+        return self.get_project_summaries([project])[0]
 
-        # Count tasks by status
-        from ..models.task import TaskStatus
+    def get_project_summaries(self, projects: Iterable[Project]) -> list[dict]:
+        """
+        Get the summaries of several projects, e.g. one page of a listing.
 
-        status_counts = {status.value: 0 for status in TaskStatus}
-        for task in tasks:
-            status_counts[task.status] += 1
+        Args:
+            projects: Projects to summarize
 
-        return {
-            "project": project,
-            "total_tasks": len(tasks),
-            "status_breakdown": status_counts,
-        }
+        Returns:
+            List of summaries in the order of projects (see get_project_summary)
+        """
+        summaries = []
+        for project in projects:
+            status_counts = self._task_repo.count_by_status_in_project(project.id)
+            summaries.append({
+                "project": project,
+                "total_tasks": sum(status_counts.values()),
+                "status_breakdown": status_counts,
+            })
+        return summaries
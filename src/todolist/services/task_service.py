@@ -5,11 +5,55 @@ This module provides high-level operations for task management,
 coordinating between repositories and enforcing business rules.
 """
 
-from typing import Optional
+from typing import Callable, Iterable, Iterator, Mapping, Optional
 from datetime import datetime
 from ..models.task import Task, TaskStatus
+from ..repositories.task_query import TaskQuery
 from ..repositories.task_repository import TaskRepository
 from ..utils.exceptions import ResourceNotFoundError, ValidationError
+from ..utils.id_generator import id_generator
+from ..utils.validators import (
+    validate_non_empty_string,
+    validate_page_size,
+    validate_status,
+)
+from .optimistic import update_with_retry
+
+# Statuses of tasks that still count towards overdue / upcoming deadlines
+_OPEN_STATUSES = frozenset({TaskStatus.TODO.value, TaskStatus.DOING.value})
+
+
+def _build_tasks(items: Iterable[Mapping]) -> tuple[list[Task], list[dict]]:
+    """
+    Validate a batch of task items and build their tasks.
+
+    All items are checked against one timestamp, which also becomes
+    the creation time of the tasks. IDs are reserved only for the items
+    that passed, so they form one contiguous block.
+
+    Args:
+        items: Mappings with the keyword arguments of create_task
+
+    Returns:
+        Tuple of (valid tasks with a contiguous block of IDs, per-item errors)
+    """
+    now = datetime.now()
+    valid: list[dict] = []
+    errors: list[dict] = []
+    for index, item in enumerate(items):
+        try:
+            valid.append(Task.validate_fields(now=now, **item))
+        except ValidationError as e:
+            errors.append({"index": index, "error": e})
+        except TypeError as e:
+            errors.append({"index": index, "error": ValidationError(str(e))})
+
+    task_ids = id_generator.generate_block("task", len(valid))
+    tasks = [
+        Task.from_record(id=task_id, created_at=now, updated_at=now, **fields)
+        for task_id, fields in zip(task_ids, valid)
+    ]
+    return tasks, errors
 
 
 class TaskService:
@@ -64,6 +108,31 @@ class TaskService:
 
         return self._task_repo.add(task)
 
+    def create_tasks(self, items: Iterable[Mapping]) -> dict:
+        """
+        Create many tasks in one batch.
+
+        Every item is validated before anything is stored. Items that
+        fail validation are reported and skipped; the remaining tasks
+        get a contiguous block of IDs and are inserted all at once.
+
+        Args:
+            items: Mappings with the keyword arguments of create_task
+
+        Returns:
+            Dictionary with the created tasks and per-item errors
+            (``{"index": position in items, "error": exception}``)
+
+        Raises:
+            LimitExceededError: If the valid tasks do not fit within the
+                task limit (nothing is inserted)
+        """
+        tasks, errors = _build_tasks(items)
+        return {
+            "created": self._task_repo.add_many(tasks),
+            "errors": errors,
+        }
+
     def get_task(self, task_id: int) -> Task:
         """
         Retrieve a task by ID.
@@ -100,12 +169,233 @@ class TaskService:
         """
         return self._task_repo.get_by_project_id(project_id)
 
+    def iter_tasks(
+        self, project_id: Optional[int] = None, after_id: Optional[int] = None
+    ) -> Iterator[Task]:
+        """
+        Iterate over tasks in ascending ID order without building a list.
+
+        Args:
+            project_id: Only return tasks of this project (optional)
+            after_id: Only return tasks with a greater ID (optional cursor)
+
+        Returns:
+            Iterator over tasks, ordered by task ID
+        """
+        if project_id is None:
+            return self._task_repo.iter_all(after_id)
+        return self._task_repo.iter_by_project_id(project_id, after_id)
+
+    def get_tasks_page(
+        self,
+        limit: int = 20,
+        after_id: Optional[int] = None,
+        project_id: Optional[int] = None,
+    ) -> dict:
+        """
+        Retrieve one page of tasks in ascending ID order.
+
+        Args:
+            limit: Maximum number of tasks on the page
+            after_id: Cursor returned with the previous page (optional)
+            project_id: Only return tasks of this project (optional)
+
+        Returns:
+            Dictionary with the page items and the cursor of the next page
+            (None when this is the last page)
+
+        Raises:
+            ValidationError: If limit is not a positive integer
+        """
+        validate_page_size(limit)
+        if project_id is None:
+            tasks = list(self._task_repo.iter_all(after_id, limit + 1))
+        else:
+            tasks = list(self._task_repo.iter_by_project_id(project_id, after_id, limit + 1))
+
+        has_more = len(tasks) > limit
+        tasks = tasks[:limit]
+        return {
+            "items": tasks,
+            "next_after_id": tasks[-1].id if has_more else None,
+        }
+
+    def search(
+        self,
+        query: str,
+        project_id: Optional[int] = None,
+        status: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[Task]:
+        """
+        Search task titles and descriptions.
+
+        Words in the query must all match; ``OR`` separates alternatives
+        and a trailing ``*`` matches any word with that prefix, e.g.
+        ``"report draft OR summ*"``. Matching ignores case.
+
+        Args:
+            query: Search query
+            project_id: Only return tasks of this project (optional)
+            status: Only return tasks with this status (optional)
+            limit: Maximum number of tasks to return
+
+        Returns:
+            List of matching tasks, most relevant first
+
+        Raises:
+            ValidationError: If query is empty, status is invalid or
+                limit is not a positive integer
+        """
+        validate_non_empty_string(query, "Search query")
+        if status is not None:
+            validate_status(status, TaskStatus.values())
+        validate_page_size(limit, "Limit")
+
+        return self._task_repo.search(
+            query, limit=limit, project_id=project_id, status=status
+        )
+
+    def query_tasks(self, task_query: TaskQuery) -> list[Task]:
+        """
+        Run a query combining filters, sorting and paging.
+
+        Example: the first 20 DOING tasks of project 7 due this week::
+
+            service.query_tasks(
+                TaskQuery().in_project(7).with_status("DOING")
+                .due_between(monday, next_monday).order_by("deadline").limit(20)
+            )
+
+        Args:
+            task_query: Query built with TaskQuery
+
+        Returns:
+            List of matching tasks in the requested order
+
+        Raises:
+            ValidationError: If task_query is not a TaskQuery or sorts by
+                relevance without a text filter
+        """
+        if not isinstance(task_query, TaskQuery):
+            raise ValidationError("Query must be a TaskQuery")
+
+        return self._task_repo.query(task_query)
+
+    def get_query_stats(self) -> dict:
+        """
+        Get statistics of the queries run through query_tasks.
+
+        Returns:
+            Dictionary with the number of queries per plan and the
+            statistics of the most recent queries
+        """
+        return self._task_repo.get_query_stats()
+
+    def get_tasks_due_between(
+        self, start: datetime, end: datetime
+    ) -> list[Task]:
+        """
+        Retrieve tasks whose deadline falls within a time window.
+
+        Args:
+            start: Inclusive start of the window
+            end: Exclusive end of the window
+
+        Returns:
+            List of tasks ordered by deadline
+
+        Raises:
+            ValidationError: If start is after end
+        """
+        if start > end:
+            raise ValidationError("Start of the deadline window must not be after its end")
+
+        return self._task_repo.get_by_deadline_range(start=start, end=end)
+
+    def get_overdue_tasks(self, now: Optional[datetime] = None) -> list[Task]:
+        """
+        Retrieve unfinished tasks whose deadline has already passed.
+
+        Args:
+            now: Reference time (default: current time)
+
+        Returns:
+            List of overdue tasks ordered by deadline
+        """
+        if now is None:
+            now = datetime.now()
+
+        return self._task_repo.get_by_deadline_range(
+            end=now, statuses=_OPEN_STATUSES
+        )
+
+    def get_next_due_tasks(
+        self, count: int, now: Optional[datetime] = None
+    ) -> list[Task]:
+        """
+        Retrieve the next unfinished tasks that are due.
+
+        Args:
+            count: Maximum number of tasks to return
+            now: Reference time (default: current time)
+
+        Returns:
+            List of up to ``count`` tasks ordered by deadline
+
+        Raises:
+            ValidationError: If count is not a positive integer
+        """
+        validate_page_size(count, "Count")
+        if now is None:
+            now = datetime.now()
+
+        return self._task_repo.get_by_deadline_range(
+            start=now, limit=count, statuses=_OPEN_STATUSES
+        )
+
+    def modify_task(
+        self,
+        task_id: int,
+        change: Callable[[Task], None],
+        expected_version: Optional[int] = None,
+    ) -> Task:
+        """
+        Apply a change to a copy of a task and store it optimistically.
+
+        The stored task is never mutated in place. If another writer
+        updates the task between the read and the write, the change is
+        applied again to the new version (see optimistic.update_with_retry).
+
+        Args:
+            task_id: Task identifier
+            change: Applies the changes to the task copy in place
+            expected_version: Only update this version of the task, without
+                retrying (optional)
+
+        Returns:
+            Updated task
+
+        Raises:
+            ResourceNotFoundError: If task not found
+            ValidationError: If change rejects the update
+            VersionConflictError: If the task no longer has expected_version,
+                or concurrent writers kept winning
+        """
+        return update_with_retry(
+            lambda: self._task_repo.get_by_id(task_id),
+            self._task_repo.update,
+            change,
+            expected_version,
+        )
+
     def update_task(
         self,
         task_id: int,
         title: Optional[str] = None,
         description: Optional[str] = None,
         deadline: Optional[datetime] = None,
+        expected_version: Optional[int] = None,
     ) -> Task:
         """
         Update task details.
@@ -115,6 +405,7 @@ class TaskService:
             title: New title (optional)
             description: New description (optional)
             deadline: New deadline (optional)
+            expected_version: Only update this version of the task (optional)
 
         Returns:
             Updated task
@@ -122,18 +413,26 @@ class TaskService:
         Raises:
             ResourceNotFoundError: If task not found
             ValidationError: If validation fails
+            VersionConflictError: If the task was modified concurrently
         """
-        task = self._task_repo.get_by_id(task_id)
-        task.update_details(title=title, description=description, deadline=deadline)
-        return self._task_repo.update(task)
+        return self.modify_task(
+            task_id,
+            lambda task: task.update_details(
+                title=title, description=description, deadline=deadline
+            ),
+            expected_version,
+        )
 
-    def update_task_status(self, task_id: int, new_status: str) -> Task:
+    def update_task_status(
+        self, task_id: int, new_status: str, expected_version: Optional[int] = None
+    ) -> Task:
         """
         Update task status.
 
         Args:
             task_id: Task identifier
             new_status: New status value
+            expected_version: Only update this version of the task (optional)
 
         Returns:
             Updated task
@@ -141,10 +440,11 @@ class TaskService:
         Raises:
             ResourceNotFoundError: If task not found
             ValidationError: If status is invalid
+            VersionConflictError: If the task was modified concurrently
         """
-        task = self._task_repo.get_by_id(task_id)
-        task.update_status(new_status)
-        return self._task_repo.update(task)
+        return self.modify_task(
+            task_id, lambda task: task.update_status(new_status), expected_version
+        )
 
     def delete_task(self, task_id: int) -> None:
         """
@@ -204,8 +504,15 @@ class TaskService:
         Raises:
             ValidationError: If status is invalid
         """
-        from ..utils.validators import validate_status
-
         validate_status(status, TaskStatus.values())
 
-        return [task for task in self._task_repo.get_all() if task.status == status]
+        return self._task_repo.get_by_status(status)
+
+    def count_tasks_by_status(self) -> dict[str, int]:
+        """
+        Get task count for every status.
+
+        Returns:
+            Dictionary mapping each status value to its number of tasks
+        """
+        return self._task_repo.count_by_status()
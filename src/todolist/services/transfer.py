@@ -0,0 +1,389 @@
+"""
+Streaming import and export of projects and tasks.
+
+This module moves data in and out of the services as NDJSON (one JSON
+object per line) or CSV with a header row. Both directions stream:
+export walks the repositories' paged iterators and writes one record
+per line, and import reads a chunk of rows at a time and stores it
+through the bulk create path, so memory use does not grow with the
+size of the file.
+
+Imported rows are validated like any other create. Rows that fail are
+skipped and, if a reject stream is given, written to it as NDJSON
+objects with the line number, the error and the original row.
+"""
+
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional, TextIO
+from ..utils.exceptions import ToDoListException, ValidationError
+from .project_service import ProjectService
+from .task_service import TaskService
+
+FORMATS = ("ndjson", "csv")
+
+# Rows validated and inserted together
+IMPORT_CHUNK_SIZE = 1000
+
+PROJECT_FIELDS = ("id", "title", "description", "created_at", "updated_at", "version")
+TASK_FIELDS = (
+    "id", "project_id", "title", "description", "status", "deadline",
+    "created_at", "updated_at", "version",
+)
+
+# Called after every chunk with the rows read so far and the rows per second
+ProgressCallback = Callable[[int, float], None]
+
+
+def format_for_path(path: str) -> str:
+    """
+    Guess the format of a file from its extension.
+
+    Args:
+        path: File path
+
+    Returns:
+        "csv" for .csv files, "ndjson" otherwise
+    """
+    return "csv" if path.lower().endswith(".csv") else "ndjson"
+
+
+def _check_format(fmt: str) -> None:
+    """Raise ValidationError for an unknown format."""
+    if fmt not in FORMATS:
+        raise ValidationError(f"Format must be one of {', '.join(FORMATS)}, got '{fmt}'")
+
+
+def iter_lines(records: Iterable[dict], fields: tuple[str, ...], fmt: str) -> Iterator[str]:
+    """
+    Encode records as lines of NDJSON or CSV.
+
+    Args:
+        records: Dictionaries to encode
+        fields: Field names, in CSV column order
+        fmt: "ndjson" or "csv" (CSV starts with a header line)
+
+    Returns:
+        Iterator over newline-terminated lines
+    """
+    _check_format(fmt)
+    if fmt == "ndjson":
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    # Flush the header when there were no records
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _read_rows(source: TextIO, fmt: str) -> Iterator[tuple[int, Any]]:
+    """
+    Read raw rows one at a time.
+
+    Returns:
+        Iterator over (line number, row) where row is a dict for CSV and
+        the unparsed line for NDJSON; blank NDJSON lines are skipped
+    """
+    _check_format(fmt)
+    if fmt == "ndjson":
+        for number, line in enumerate(source, start=1):
+            if line.strip():
+                yield number, line.rstrip("\n")
+        return
+
+    reader = csv.DictReader(source)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def _decode(row: Any) -> dict:
+    """Return a row as a dictionary, decoding NDJSON lines."""
+    if isinstance(row, dict):
+        return row
+    try:
+        record = json.loads(row)
+    except ValueError as e:
+        raise ValidationError(f"Invalid JSON: {e}")
+    if not isinstance(record, dict):
+        raise ValidationError("Each line must be a JSON object")
+    return record
+
+
+def _text(record: dict, key: str, default: str = "") -> str:
+    """Return a text field, treating missing and null values as default."""
+    value = record.get(key)
+    return default if value is None else value
+
+
+def _optional_text(record: dict, key: str) -> Optional[str]:
+    """Return a text field, treating missing, null and empty values as None."""
+    value = record.get(key)
+    return None if value in (None, "") else value
+
+
+def _project_item(record: dict) -> dict:
+    """Convert an imported row to create_project arguments."""
+    return {"title": _text(record, "title"), "description": _text(record, "description")}
+
+
+def _task_item(record: dict) -> dict:
+    """Convert an imported row to create_task arguments."""
+    project_id = record.get("project_id")
+    try:
+        project_id = int(project_id)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid project_id {project_id!r}")
+
+    deadline = _optional_text(record, "deadline")
+    if deadline is not None:
+        try:
+            deadline = datetime.fromisoformat(deadline)
+        except (TypeError, ValueError):
+            raise ValidationError(f"Invalid deadline {deadline!r}")
+
+    item = {
+        "title": _text(record, "title"),
+        "project_id": project_id,
+        "description": _text(record, "description"),
+        "deadline": deadline,
+    }
+    status = _optional_text(record, "status")
+    if status is not None:
+        item["status"] = status
+    return item
+
+
+class DataTransfer:
+    """
+    Streams projects and tasks between files and the services.
+
+    Exports write one record per line while iterating the repositories
+    page by page. Imports read IMPORT_CHUNK_SIZE rows, validate them and
+    store the valid ones with create_projects/create_tasks, then move on
+    to the next chunk.
+    """
+
+    def __init__(self, project_service: ProjectService, task_service: TaskService) -> None:
+        """
+        Initialize the transfer helper.
+
+        Args:
+            project_service: Service for project operations
+            task_service: Service for task operations
+        """
+        self._project_service = project_service
+        self._task_service = task_service
+
+    # Export
+
+    def export_projects(self, output: TextIO, fmt: str = "ndjson") -> int:
+        """
+        Write all projects to a stream.
+
+        Args:
+            output: Text stream to write to
+            fmt: "ndjson" or "csv"
+
+        Returns:
+            Number of projects written
+
+        Raises:
+            ValidationError: If fmt is unknown
+        """
+        return self._export(
+            (project.to_dict() for project in self._project_service.iter_projects()),
+            PROJECT_FIELDS, output, fmt,
+        )
+
+    def export_tasks(
+        self, output: TextIO, fmt: str = "ndjson", project_id: Optional[int] = None
+    ) -> int:
+        """
+        Write all tasks, or the tasks of one project, to a stream.
+
+        Args:
+            output: Text stream to write to
+            fmt: "ndjson" or "csv"
+            project_id: Only export this project's tasks (optional)
+
+        Returns:
+            Number of tasks written
+
+        Raises:
+            ValidationError: If fmt is unknown
+        """
+        return self._export(
+            (task.to_dict() for task in self._task_service.iter_tasks(project_id)),
+            TASK_FIELDS, output, fmt,
+        )
+
+    @staticmethod
+    def _export(records: Iterator[dict], fields: tuple[str, ...], output: TextIO, fmt: str) -> int:
+        """Write encoded records and return how many there were."""
+        count = 0
+
+        def counted() -> Iterator[dict]:
+            nonlocal count
+            for record in records:
+                count += 1
+                yield record
+
+        output.writelines(iter_lines(counted(), fields, fmt))
+        return count
+
+    # Import
+
+    def import_projects(
+        self,
+        source: TextIO,
+        fmt: str = "ndjson",
+        rejects: Optional[TextIO] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        """
+        Create projects from a stream of rows with title and description.
+
+        Args:
+            source: Text stream to read from
+            fmt: "ndjson" or "csv"
+            rejects: Stream receiving rows that could not be imported (optional)
+            chunk_size: Rows validated and inserted together
+            progress: Called after every chunk with rows read and rows/s (optional)
+
+        Returns:
+            Dictionary with the number of rows read, imported and rejected,
+            the elapsed seconds and the rows per second
+
+        Raises:
+            ValidationError: If fmt is unknown
+        """
+        return self._import(
+            source, fmt, rejects, chunk_size, progress,
+            _project_item, self._project_service.create_projects,
+        )
+
+    def import_tasks(
+        self,
+        source: TextIO,
+        fmt: str = "ndjson",
+        rejects: Optional[TextIO] = None,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict:
+        """
+        Create tasks from a stream of rows.
+
+        Rows need a title and the project_id of an existing project, and
+        may have a description, status and ISO 8601 deadline. Other
+        fields (such as those of an export) are ignored, so imported
+        tasks get new IDs and timestamps.
+
+        Args:
+            source: Text stream to read from
+            fmt: "ndjson" or "csv"
+            rejects: Stream receiving rows that could not be imported (optional)
+            chunk_size: Rows validated and inserted together
+            progress: Called after every chunk with rows read and rows/s (optional)
+
+        Returns:
+            Dictionary with the number of rows read, imported and rejected,
+            the elapsed seconds and the rows per second
+
+        Raises:
+            ValidationError: If fmt is unknown
+        """
+        known_projects: set[int] = set()
+
+        def task_item(record: dict) -> dict:
+            item = _task_item(record)
+            if item["project_id"] not in known_projects:
+                self._project_service.get_project(item["project_id"])
+                known_projects.add(item["project_id"])
+            return item
+
+        return self._import(
+            source, fmt, rejects, chunk_size, progress,
+            task_item, self._task_service.create_tasks,
+        )
+
+    @staticmethod
+    def _import(
+        source: TextIO,
+        fmt: str,
+        rejects: Optional[TextIO],
+        chunk_size: int,
+        progress: Optional[ProgressCallback],
+        to_item: Callable[[dict], dict],
+        create_many: Callable[[list[dict]], dict],
+    ) -> dict:
+        """Read, validate and store rows chunk by chunk."""
+        if chunk_size < 1:
+            raise ValidationError("Chunk size must be a positive integer")
+        rows = _read_rows(source, fmt)
+        started = time.perf_counter()
+        read = imported = rejected = 0
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            read += len(chunk)
+
+            items: list[dict] = []
+            positions: list[tuple[int, Any]] = []
+            failures: list[tuple[int, Any, Exception]] = []
+            for number, row in chunk:
+                try:
+                    items.append(to_item(_decode(row)))
+                    positions.append((number, row))
+                except ToDoListException as e:
+                    failures.append((number, row, e))
+
+            if items:
+                try:
+                    result = create_many(items)
+                except ToDoListException as e:
+                    # The whole chunk failed (e.g. it exceeds the limit)
+                    failures.extend((number, row, e) for number, row in positions)
+                else:
+                    imported += len(result["created"])
+                    for error in result["errors"]:
+                        number, row = positions[error["index"]]
+                        failures.append((number, row, error["error"]))
+
+            rejected += len(failures)
+            if rejects is not None and failures:
+                failures.sort(key=lambda failure: failure[0])
+                rejects.writelines(
+                    json.dumps(
+                        {"line": number, "error": str(error), "row": row},
+                        ensure_ascii=False, separators=(",", ":"),
+                    ) + "\n"
+                    for number, row, error in failures
+                )
+
+            if progress is not None:
+                progress(read, read / max(time.perf_counter() - started, 1e-9))
+
+        elapsed = time.perf_counter() - started
+        return {
+            "rows": read,
+            "imported": imported,
+            "rejected": rejected,
+            "elapsed": elapsed,
+            "rows_per_second": read / elapsed if elapsed else 0.0,
+        }
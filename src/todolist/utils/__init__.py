@@ -1,30 +1,30 @@
 """Utils package."""
 
-from .exceptions import (
-    ToDoListException,
-    ValidationError,
-    ResourceNotFoundError,
-    LimitExceededError,
-    DuplicateResourceError,
-    InvalidStatusError,
-)
-from .validators import (
-    validate_non_empty_string,
-    validate_positive_integer,
-    validate_status,
-)
-from .id_generator import id_generator, IDGenerator
+from .lazy import lazy_exports
 
-__all__ = [
-    "ToDoListException",
-    "ValidationError",
-    "ResourceNotFoundError",
-    "LimitExceededError",
-    "DuplicateResourceError",
-    "InvalidStatusError",
-    "validate_non_empty_string",
-    "validate_positive_integer",
-    "validate_status",
-    "id_generator",
-    "IDGenerator",
-]
+# Public name -> submodule defining it, imported on first access
+_EXPORTS = {
+    "ToDoListException": "exceptions",
+    "ValidationError": "exceptions",
+    "ResourceNotFoundError": "exceptions",
+    "LimitExceededError": "exceptions",
+    "DuplicateResourceError": "exceptions",
+    "InvalidStatusError": "exceptions",
+    "VersionConflictError": "exceptions",
+    "validate_non_empty_string": "validators",
+    "validate_positive_integer": "validators",
+    "validate_page_size": "validators",
+    "validate_status": "validators",
+    "id_generator": "id_generator",
+    "IDGenerator": "id_generator",
+    "datetime_to_micros": "timestamps",
+    "micros_to_datetime": "timestamps",
+    "MetricsRegistry": "metrics",
+    "instrument": "metrics",
+    "registry": "metrics",
+    "Profiler": "profiling",
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
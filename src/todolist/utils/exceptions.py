@@ -89,4 +89,28 @@ class InvalidStatusError(ToDoListException):
         super().__init__(
             f"Invalid status '{provided_status}'. "
             f"Valid statuses are: {', '.join(valid_statuses)}"
-        )
\ No newline at end of file
+        )
+
+class VersionConflictError(ToDoListException):
+    """Raised when an update was based on an outdated version of a resource."""
+
+    def __init__(
+        self, resource_type: str, identifier: str, expected_version: int, actual_version: int
+    ) -> None:
+        """
+        Initialize VersionConflictError.
+
+        Args:
+            resource_type: Type of resource (e.g., "Project", "Task")
+            identifier: Identifier of the resource
+            expected_version: Version the update was based on
+            actual_version: Version currently stored
+        """
+        self.resource_type = resource_type
+        self.identifier = identifier
+        self.expected_version = expected_version
+        self.actual_version = actual_version
+        super().__init__(
+            f"{resource_type} with identifier '{identifier}' was modified concurrently "
+            f"(expected version {expected_version}, found {actual_version})"
+        )
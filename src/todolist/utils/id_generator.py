@@ -5,6 +5,7 @@ This module provides a simple counter-based ID generator
 for projects and tasks.
 """
 
+import threading
 from typing import Dict
 
 
@@ -12,17 +13,21 @@ class IDGenerator:
     """
     Singleton ID generator for creating sequential integer IDs.
 
-    Maintains separate counters for different entity types.
+    Maintains separate counters for different entity types. Every
+    read-modify-write of a counter holds a lock, so IDs stay unique when
+    several threads allocate at once.
     """
 
     _instance = None
     _counters: Dict[str, int] = {}
+    _lock = threading.Lock()
 
     def __new__(cls):
         """Ensure singleton instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._counters = {}
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+                cls._counters = {}
         return cls._instance
 
     def generate(self, entity_type: str) -> int:
@@ -35,11 +40,41 @@ class IDGenerator:
         Returns:
             Next sequential integer ID
         """
-        if entity_type not in self._counters:
-            self._counters[entity_type] = 0
+        with self._lock:
+            value = self._counters.get(entity_type, 0) + 1
+            self._counters[entity_type] = value
+        return value
 
-        self._counters[entity_type] += 1
-        return self._counters[entity_type]
+    def generate_block(self, entity_type: str, count: int) -> range:
+        """
+        Reserve a contiguous block of IDs for given entity type.
+
+        Args:
+            entity_type: Type of entity (e.g., 'project', 'task')
+            count: Number of IDs to reserve
+
+        Returns:
+            Range of reserved sequential integer IDs
+        """
+        with self._lock:
+            start = self._counters.get(entity_type, 0) + 1
+            self._counters[entity_type] = start + count - 1
+        return range(start, start + count)
+
+    def ensure_minimum(self, entity_type: str, value: int) -> None:
+        """
+        Make sure future IDs are greater than a given value.
+
+        Used by persistent repositories so that new IDs do not collide
+        with IDs that were stored in a previous session.
+
+        Args:
+            entity_type: Type of entity
+            value: Highest ID already in use
+        """
+        with self._lock:
+            if self._counters.get(entity_type, 0) < value:
+                self._counters[entity_type] = value
 
     def reset(self, entity_type: str = None) -> None:
         """
@@ -48,10 +83,11 @@ class IDGenerator:
         Args:
             entity_type: Specific entity type to reset, or None for all
         """
-        if entity_type is None:
-            self._counters.clear()
-        elif entity_type in self._counters:
-            self._counters[entity_type] = 0
+        with self._lock:
+            if entity_type is None:
+                self._counters.clear()
+            elif entity_type in self._counters:
+                self._counters[entity_type] = 0
 
     def get_current(self, entity_type: str) -> int:
         """
@@ -0,0 +1,42 @@
+"""
+Lazy re-exports for package __init__ modules.
+
+Packages list the names they re-export and the submodule defining each
+one; the submodule is imported the first time one of its names is
+accessed, so importing a package (or one of its submodules) does not
+import all of its siblings.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build the module __getattr__ and __dir__ of a package.
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> submodule (relative to the package) defining it
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions for the package
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f"{package}.{submodule}"), name)
+        # Later lookups find the name without calling __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,167 @@
+"""
+Locking utilities.
+
+This module provides the reader/writer lock that makes repositories safe
+to share between threads, and decorators that apply it to methods.
+"""
+
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
+
+_Method = TypeVar("_Method", bound=Callable)
+
+
+class ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+
+    The lock is phase-fair. Once a writer waits, new readers wait as
+    well, so a steady stream of reads cannot starve writes; when a writer
+    releases the lock, the readers that were waiting for it go before the
+    next writer, so a steady stream of writes cannot starve reads. The
+    write lock is reentrant, and its owner may also take the read lock,
+    so write methods can call read methods. Read locks are not reentrant:
+    a thread holding one must not take it again, or it could deadlock
+    behind a waiting writer.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an unlocked lock."""
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+        self._waiting_readers = 0
+        # Incremented on every write release; readers that saw an older
+        # value were waiting for that writer and have been let in
+        self._generation = 0
+        # Readers let in by the last write release that have not entered yet
+        self._admitted = 0
+
+    def acquire_read(self) -> None:
+        """Block until no writer holds or waits for the lock, then read-lock it."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if self._writer is not None or self._waiting_writers:
+                generation = self._generation
+                self._waiting_readers += 1
+                try:
+                    while self._writer is not None or (
+                        self._waiting_writers and self._generation == generation
+                    ):
+                        self._condition.wait()
+                finally:
+                    self._waiting_readers -= 1
+                    if self._generation != generation:
+                        self._admitted -= 1
+                        if not self._admitted:
+                            self._condition.notify_all()
+            self._readers += 1
+
+    def release_read(self) -> None:
+        """Release a read lock taken by the current thread."""
+        with self._condition:
+            if self._writer == threading.get_ident():
+                self._writer_depth -= 1
+                return
+            self._readers -= 1
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Block until no other thread holds the lock, then write-lock it."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers or self._admitted:
+                    self._condition.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Release a write lock taken by the current thread."""
+        with self._condition:
+            self._writer_depth -= 1
+            if not self._writer_depth:
+                self._writer = None
+                self._generation += 1
+                self._admitted = self._waiting_readers
+                self._condition.notify_all()
+
+    def owns_write(self) -> bool:
+        """Return whether the current thread holds the write lock."""
+        return self._writer == threading.get_ident()
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the read lock for the duration of a with block."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the write lock for the duration of a with block."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+def read_locked(method: _Method) -> _Method:
+    """
+    Run a method while holding ``self._lock`` for reading.
+
+    Args:
+        method: Method of an object with a ``_lock`` ReadWriteLock
+
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_read()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_read()
+
+    return wrapper
+
+
+def write_locked(method: _Method) -> _Method:
+    """
+    Run a method while holding ``self._lock`` for writing.
+
+    Args:
+        method: Method of an object with a ``_lock`` ReadWriteLock
+
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        lock = self._lock
+        lock.acquire_write()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            lock.release_write()
+
+    return wrapper
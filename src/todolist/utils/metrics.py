@@ -0,0 +1,519 @@
+"""
+Opt-in instrumentation of service and repository calls.
+
+instrument() wraps the public methods of a service or repository so
+that every call records its latency, and its exception class if it
+raises, in a MetricsRegistry. The registry keeps a call counter, error
+counters and a latency histogram per operation, and renders them as a
+table for the CLI or in the Prometheus text format for a file or a
+scrape endpoint.
+
+Components that are not instrumented run their own methods directly,
+so metrics cost nothing unless they are enabled (see METRICS_ENABLED).
+An instrumented component can be paused by clearing the registry's
+``enabled`` flag, which leaves a single attribute check per call.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# Values below 2**_SIGNIFICANT_BITS ns get a bucket each; above that,
+# each power of two is split into 2**(_SIGNIFICANT_BITS - 1) buckets,
+# so a recorded value is off by at most about 3 %
+_SIGNIFICANT_BITS = 6
+_LINEAR_BUCKETS = 1 << _SIGNIFICANT_BITS
+_BUCKETS_PER_OCTAVE = _LINEAR_BUCKETS >> 1
+
+# Upper bounds (seconds) of the buckets in the Prometheus output
+PROMETHEUS_BUCKETS = (
+    0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _bucket_index(value: int) -> int:
+    """Return the histogram bucket of a value in nanoseconds."""
+    if value < _LINEAR_BUCKETS:
+        return value
+    shift = value.bit_length() - _SIGNIFICANT_BITS
+    return shift * _BUCKETS_PER_OCTAVE + (value >> shift)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """Return the [lower, upper) range of values in a histogram bucket."""
+    if index < _LINEAR_BUCKETS:
+        return index, index + 1
+    shift = index // _BUCKETS_PER_OCTAVE - 1
+    mantissa = index - shift * _BUCKETS_PER_OCTAVE
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the style of HdrHistogram.
+
+    Bucket widths grow with the values they hold, so the relative error
+    is the same from nanoseconds to minutes while recording stays a few
+    integer operations. The histogram is not thread-safe; OperationMetrics
+    gives each thread its own.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts: list[int] = []
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Record one value.
+
+        Args:
+            value: Latency in nanoseconds (negative values count as 0)
+        """
+        value = max(value, 0)
+        index = _bucket_index(value)
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Return the value below which a fraction of the values fall.
+
+        Args:
+            fraction: Fraction between 0 and 1 (0.99 for p99)
+
+        Returns:
+            Highest value of the matching bucket, in nanoseconds (0 if
+            the histogram is empty)
+        """
+        if not self.count:
+            return 0
+        rank = max(int(fraction * self.count + 0.5), 1)
+        seen = 0
+        for index, bucket_count in enumerate(self._counts):
+            seen += bucket_count
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1] - 1, self.max)
+        return self.max
+
+    def cumulative_counts(self, limits: tuple[int, ...]) -> list[int]:
+        """
+        Count the values at or below each limit.
+
+        A bucket is counted under a limit when all of its values are, so
+        the counts are exact at bucket boundaries and may undercount by
+        one bucket elsewhere.
+
+        Args:
+            limits: Ascending limits in nanoseconds
+
+        Returns:
+            One cumulative count per limit
+        """
+        result = []
+        seen = 0
+        index = 0
+        counts = self._counts
+        for limit in limits:
+            while index < len(counts) and _bucket_bounds(index)[1] - 1 <= limit:
+                seen += counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Add the values of another histogram to this one.
+
+        Args:
+            other: Histogram to add
+        """
+        counts = self._counts
+        other_counts = list(other._counts)
+        if len(other_counts) > len(counts):
+            counts.extend([0] * (len(other_counts) - len(counts)))
+        for index, count in enumerate(other_counts):
+            counts[index] += count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def copy(self) -> "LatencyHistogram":
+        """Return an independent copy of the histogram."""
+        duplicate = LatencyHistogram()
+        duplicate._counts = self._counts.copy()
+        duplicate.count = self.count
+        duplicate.total = self.total
+        duplicate.max = self.max
+        return duplicate
+
+
+class _ThreadRecorder(LatencyHistogram):
+    """Latencies and errors of one operation recorded by one thread."""
+
+    def __init__(self) -> None:
+        """Initialize an empty recorder."""
+        super().__init__()
+        self.errors: dict[str, int] = {}
+
+
+class OperationMetrics:
+    """
+    Call count, errors by exception class and latencies of one operation.
+
+    Each thread records into its own recorder, so recording takes no
+    lock; reading merges the recorders. A read made while other threads
+    record may miss the calls they are recording at that moment.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty metrics."""
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._recorders: list[_ThreadRecorder] = []
+
+    def _recorder(self) -> _ThreadRecorder:
+        """Return the calling thread's recorder, creating it if needed."""
+        try:
+            return self._local.recorder
+        except AttributeError:
+            recorder = _ThreadRecorder()
+            with self._lock:
+                self._local.recorder = recorder
+                self._recorders.append(recorder)
+            return recorder
+
+    def record(self, elapsed: int, error: Optional[str] = None) -> None:
+        """
+        Record one call.
+
+        Args:
+            elapsed: Duration of the call in nanoseconds
+            error: Exception class name if the call raised (optional)
+        """
+        try:
+            recorder = self._local.recorder
+        except AttributeError:
+            recorder = self._recorder()
+        # LatencyHistogram.record inlined: this runs on every call
+        if elapsed < _LINEAR_BUCKETS:
+            index = elapsed if elapsed > 0 else 0
+        else:
+            shift = elapsed.bit_length() - _SIGNIFICANT_BITS
+            index = shift * _BUCKETS_PER_OCTAVE + (elapsed >> shift)
+        counts = recorder._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        recorder.count += 1
+        recorder.total += elapsed
+        if elapsed > recorder.max:
+            recorder.max = elapsed
+        if error is not None:
+            recorder.errors[error] = recorder.errors.get(error, 0) + 1
+
+    def clear(self) -> None:
+        """Forget every recorded call."""
+        with self._lock:
+            # Threads find no recorder in the new local and start afresh
+            self._local = threading.local()
+            self._recorders = []
+
+    def copy(self) -> "OperationMetrics":
+        """Return a copy with the recorders of all threads merged."""
+        with self._lock:
+            recorders = list(self._recorders)
+        duplicate = OperationMetrics()
+        merged = duplicate._recorder()
+        for recorder in recorders:
+            merged.merge(recorder)
+            for error, count in list(recorder.errors.items()):
+                merged.errors[error] = merged.errors.get(error, 0) + count
+        return duplicate
+
+    @property
+    def calls(self) -> int:
+        """Number of recorded calls."""
+        with self._lock:
+            return sum(recorder.count for recorder in self._recorders)
+
+    @property
+    def errors(self) -> dict[str, int]:
+        """Number of calls that raised, by exception class name."""
+        return dict(self.copy()._recorders[0].errors)
+
+    @property
+    def histogram(self) -> LatencyHistogram:
+        """Latencies of all recorded calls."""
+        return self.copy()._recorders[0].copy()
+
+
+class MetricsRegistry:
+    """
+    Metrics of all instrumented operations, by operation name.
+
+    Operation names are "<component>.<method>", for example
+    "task_service.create_task".
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry that records calls."""
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._operations: dict[str, OperationMetrics] = {}
+
+    def operation(self, name: str) -> OperationMetrics:
+        """
+        Return the metrics of an operation, creating them if needed.
+
+        Args:
+            name: Operation name
+
+        Returns:
+            Metrics of the operation
+        """
+        with self._lock:
+            metrics = self._operations.get(name)
+            if metrics is None:
+                metrics = self._operations[name] = OperationMetrics()
+            return metrics
+
+    def reset(self) -> None:
+        """Clear the metrics of every operation."""
+        with self._lock:
+            operations = list(self._operations.values())
+        for metrics in operations:
+            metrics.clear()
+
+    def _copies(self) -> list[tuple[str, OperationMetrics]]:
+        """Return copies of the operations that were called, sorted by name."""
+        with self._lock:
+            operations = sorted(self._operations.items())
+        return [(name, metrics.copy()) for name, metrics in operations if metrics.calls]
+
+    def snapshot(self) -> list[dict]:
+        """
+        Summarize every operation that was called.
+
+        Returns:
+            One dictionary per operation, sorted by name, with the calls,
+            errors by exception class, and the mean, p50, p90, p99 and
+            maximum latency in microseconds
+        """
+        result = []
+        for name, metrics in self._copies():
+            histogram = metrics.histogram
+            result.append({
+                "operation": name,
+                "calls": metrics.calls,
+                "errors": metrics.errors,
+                "mean_us": histogram.total / histogram.count / 1000,
+                "p50_us": histogram.percentile(0.50) / 1000,
+                "p90_us": histogram.percentile(0.90) / 1000,
+                "p99_us": histogram.percentile(0.99) / 1000,
+                "max_us": histogram.max / 1000,
+            })
+        return result
+
+    def to_prometheus(self) -> str:
+        """
+        Render the metrics in the Prometheus text exposition format.
+
+        Returns:
+            todolist_calls_total and todolist_errors_total counters and
+            the todolist_call_duration_seconds histogram, labelled by
+            operation (and error class)
+        """
+        operations = self._copies()
+        limits = tuple(int(bound * 1e9) for bound in PROMETHEUS_BUCKETS)
+        lines = [
+            "# HELP todolist_calls_total Calls of instrumented methods.",
+            "# TYPE todolist_calls_total counter",
+        ]
+        lines.extend(
+            f'todolist_calls_total{{operation="{name}"}} {metrics.calls}'
+            for name, metrics in operations
+        )
+        lines += [
+            "# HELP todolist_errors_total Calls of instrumented methods that raised.",
+            "# TYPE todolist_errors_total counter",
+        ]
+        lines.extend(
+            f'todolist_errors_total{{operation="{name}",error="{error}"}} {count}'
+            for name, metrics in operations
+            for error, count in sorted(metrics.errors.items())
+        )
+        lines += [
+            "# HELP todolist_call_duration_seconds Duration of instrumented method calls.",
+            "# TYPE todolist_call_duration_seconds histogram",
+        ]
+        for name, metrics in operations:
+            histogram = metrics.histogram
+            label = f'operation="{name}"'
+            for bound, count in zip(PROMETHEUS_BUCKETS, histogram.cumulative_counts(limits)):
+                lines.append(f'todolist_call_duration_seconds_bucket{{{label},le="{bound}"}} {count}')
+            lines += [
+                f'todolist_call_duration_seconds_bucket{{{label},le="+Inf"}} {histogram.count}',
+                f"todolist_call_duration_seconds_sum{{{label}}} {histogram.total / 1e9:.9f}",
+                f"todolist_call_duration_seconds_count{{{label}}} {histogram.count}",
+            ]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str) -> None:
+        """
+        Write the metrics in the Prometheus text format to a file.
+
+        The file is replaced atomically, so a collector reading it (such
+        as the node exporter's textfile collector) never sees a partial
+        file.
+
+        Args:
+            path: File to write
+        """
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as output:
+            output.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+
+# Global registry used by the application
+registry = MetricsRegistry()
+
+
+def _timed(method: Callable, metrics: OperationMetrics, owner: MetricsRegistry) -> Callable:
+    """Wrap a bound method so that its calls are recorded."""
+    clock = time.perf_counter_ns
+    record = metrics.record
+
+    @functools.wraps(method)
+    def timed(*args, **kwargs):
+        if not owner.enabled:
+            return method(*args, **kwargs)
+        started = clock()
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            record(clock() - started, type(e).__name__)
+            raise
+        record(clock() - started)
+        return result
+
+    return timed
+
+
+def instrument(component: object, name: str, metrics: Optional[MetricsRegistry] = None) -> object:
+    """
+    Record the calls of a component's public methods.
+
+    Every public method defined by the component's class is replaced,
+    on this instance only, by a wrapper that records the call as
+    "<name>.<method>". Calls between the component's own methods go
+    through the wrappers too. Coroutine methods are left alone, and a
+    method returning an iterator is timed until it returns, not while
+    the iterator is consumed. Instrumenting a component twice has no
+    further effect.
+
+    Args:
+        component: Service or repository to instrument
+        name: Prefix of the operation names
+        metrics: Registry to record in (default: the global registry)
+
+    Returns:
+        The component
+    """
+    if getattr(component, "_instrumented", False):
+        return component
+    import inspect
+
+    owner = registry if metrics is None else metrics
+    for attribute, function in inspect.getmembers(type(component), inspect.isfunction):
+        if attribute.startswith("_") or inspect.iscoroutinefunction(function):
+            continue
+        method = getattr(component, attribute)
+        setattr(component, attribute, _timed(method, owner.operation(f"{name}.{attribute}"), owner))
+    component._instrumented = True
+    return component
+
+
+def serve_prometheus(
+    port: int, host: str = "127.0.0.1", metrics: Optional[MetricsRegistry] = None
+) -> "ThreadingHTTPServer":
+    """
+    Serve the metrics in the Prometheus text format from a background thread.
+
+    Every GET request, whatever its path, returns the current metrics.
+
+    Args:
+        port: Port to listen on (0 picks a free port)
+        host: Address to listen on
+        metrics: Registry to serve (default: the global registry)
+
+    Returns:
+        The running server; call shutdown() and server_close() to stop it
+    """
+    # Imported here: only needed when serving, and slow to import
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    owner = registry if metrics is None else metrics
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            body = owner.to_prometheus().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", PROMETHEUS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
+
+
+@contextmanager
+def exporting(
+    port: int = 0, path: Optional[str] = None, metrics: Optional[MetricsRegistry] = None
+) -> Iterator[MetricsRegistry]:
+    """
+    Export metrics while a block runs.
+
+    Args:
+        port: Serve the metrics on this local port during the block (0: don't)
+        path: Write the metrics to this file when the block ends (optional)
+        metrics: Registry to export (default: the global registry)
+
+    Yields:
+        The exported registry
+    """
+    owner = registry if metrics is None else metrics
+    server = serve_prometheus(port, metrics=owner) if port else None
+    try:
+        yield owner
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+        if path:
+            owner.write_prometheus(path)
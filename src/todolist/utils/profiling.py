@@ -0,0 +1,191 @@
+"""
+Sampled per-command CPU and memory profiling.
+
+A Profiler wraps CLI commands, batch commands and service calls (see
+TODOLIST_PROFILE). In "cpu" mode each profiled call is run under
+cProfile and its statistics are saved as a .pstats file; in "mem" mode
+tracemalloc snapshots are taken before and after the call and the
+top-N allocation differences are saved as a text report. Only one call
+in sample_every of each name is profiled, so the profiler can stay on
+under real load. cProfile and tracemalloc are imported when first
+used, so a disabled profiler adds nothing to startup.
+
+Profiles do not nest: while a call is being profiled, the calls it
+makes are not profiled again, so a profiled command's file covers the
+service calls it made.
+"""
+
+import functools
+import itertools
+import os
+import threading
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Iterator
+
+PROFILE_MODES = ("off", "cpu", "mem")
+
+# Stack frames kept per allocation in "mem" mode
+TRACEMALLOC_FRAMES = 10
+
+# Held while a call is profiled, so that profiles do not nest
+_active = threading.Lock()
+
+
+class Profiler:
+    """
+    Profiles one call in every sample_every calls of each name.
+
+    Files are named "<name>.<pid>.<call>.pstats" (cpu) or
+    "<name>.<pid>.<call>.txt" (mem), where call counts the calls of that
+    name since the profiler was created.
+    """
+
+    def __init__(
+        self,
+        mode: str = "off",
+        directory: str = "profiles",
+        sample_every: int = 1,
+        top: int = 25,
+    ) -> None:
+        """
+        Initialize the profiler.
+
+        Args:
+            mode: "off", "cpu" or "mem"
+            directory: Directory the profiles are written to
+            sample_every: Profile one call in this many of each name
+            top: Allocation differences listed per "mem" report
+
+        Raises:
+            ValueError: If mode is unknown or sample_every or top is not positive
+        """
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Profile mode must be one of {', '.join(PROFILE_MODES)}, got '{mode}'")
+        if sample_every < 1 or top < 1:
+            raise ValueError("sample_every and top must be >= 1")
+        self.mode = mode
+        self.directory = directory
+        self.sample_every = sample_every
+        self.top = top
+        self._lock = threading.Lock()
+        self._counters: dict[str, Iterator[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether calls are profiled at all."""
+        return self.mode != "off"
+
+    def _next_call(self, name: str) -> int:
+        """Return the number of this call of name, counting from 1."""
+        with self._lock:
+            counter = self._counters.get(name)
+            if counter is None:
+                counter = self._counters[name] = itertools.count(1)
+            return next(counter)
+
+    def profile(self, name: str) -> ContextManager:
+        """
+        Profile the block if this call of name is sampled.
+
+        Args:
+            name: Command or operation name, used in the file name
+
+        Returns:
+            Context manager around the call
+        """
+        if not self.enabled:
+            return nullcontext()
+        call = self._next_call(name)
+        if (call - 1) % self.sample_every:
+            return nullcontext()
+        return self._profiled(name, call)
+
+    @contextmanager
+    def _profiled(self, name: str, call: int) -> Iterator[None]:
+        """Profile the block unless another profile is running."""
+        if not _active.acquire(blocking=False):
+            yield
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{name}.{os.getpid()}.{call}")
+            with (self._cpu(path) if self.mode == "cpu" else self._memory(path, name, call)):
+                yield
+        finally:
+            _active.release()
+
+    @contextmanager
+    def _cpu(self, path: str) -> Iterator[None]:
+        """Run the block under cProfile and save the statistics."""
+        import cProfile
+
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            profile.dump_stats(f"{path}.pstats")
+
+    @contextmanager
+    def _memory(self, path: str, name: str, call: int) -> Iterator[None]:
+        """Trace the block's allocations and save the largest differences."""
+        import tracemalloc
+
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        ignore = (tracemalloc.Filter(False, tracemalloc.__file__),)
+        before = tracemalloc.take_snapshot().filter_traces(ignore)
+        try:
+            yield
+        finally:
+            after = tracemalloc.take_snapshot().filter_traces(ignore)
+            _, peak = tracemalloc.get_traced_memory()
+            if started_tracing:
+                tracemalloc.stop()
+            differences = after.compare_to(before, "lineno")
+            net = sum(difference.size_diff for difference in differences)
+            with open(f"{path}.txt", "w", encoding="utf-8") as report:
+                report.write(
+                    f"# {name} call {call}: {net / 1024:+,.1f} KiB retained, "
+                    f"peak {peak / 1024:,.1f} KiB traced\n"
+                )
+                for difference in differences[:self.top]:
+                    report.write(f"{difference}\n")
+
+    def wrap(self, component: object, name: str) -> object:
+        """
+        Profile the calls of a component's public methods.
+
+        Like metrics.instrument, every public method defined by the
+        component's class is replaced on this instance by a wrapper; a
+        call is profiled under the name "<name>.<method>".
+
+        Args:
+            component: Service (or repository) to profile
+            name: Prefix of the profile names
+
+        Returns:
+            The component
+        """
+        if not self.enabled:
+            return component
+        import inspect
+
+        for attribute, function in inspect.getmembers(type(component), inspect.isfunction):
+            if attribute.startswith("_") or inspect.iscoroutinefunction(function):
+                continue
+            method = getattr(component, attribute)
+            setattr(component, attribute, self._profiled_method(method, f"{name}.{attribute}"))
+        return component
+
+    def _profiled_method(self, method: Callable, name: str) -> Callable:
+        """Wrap a bound method so that its sampled calls are profiled."""
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            with self.profile(name):
+                return method(*args, **kwargs)
+
+        return profiled
@@ -0,0 +1,38 @@
+"""
+Timestamp conversion utilities.
+
+This module converts naive datetimes to and from integer microseconds
+since 1970-01-01, the representation used by compact models and
+columnar snapshots.
+"""
+
+from datetime import datetime, timedelta
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def datetime_to_micros(value: datetime) -> int:
+    """
+    Convert a naive datetime into microseconds since the epoch.
+
+    Args:
+        value: Datetime to convert
+
+    Returns:
+        Microseconds since 1970-01-01
+    """
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def micros_to_datetime(value: int) -> datetime:
+    """
+    Convert microseconds since the epoch back into a naive datetime.
+
+    Args:
+        value: Microseconds since 1970-01-01
+
+    Returns:
+        Corresponding datetime
+    """
+    return _EPOCH + timedelta(microseconds=value)
@@ -54,6 +54,21 @@ def validate_positive_integer(value: int, field_name: str) -> None:
         raise ValidationError(f"{field_name} must be non-negative")
 
 
+def validate_page_size(value: int, field_name: str = "Page size") -> None:
+    """
+    Validate a page size or result limit.
+
+    Args:
+        value: Requested number of items
+        field_name: Name of the field (for error messages)
+
+    Raises:
+        ValidationError: If value is not an integer of at least 1
+    """
+    if not isinstance(value, int) or value < 1:
+        raise ValidationError(f"{field_name} must be a positive integer")
+
+
 def validate_status(
     status: str, valid_statuses: list[str], field_name: str = "Status"
 ) -> None:
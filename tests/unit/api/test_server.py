@@ -0,0 +1,219 @@
+"""
+Unit tests for the HTTP API server.
+"""
+
+import asyncio
+import json
+import pytest
+from src.todolist.api.routes import TodoListAPI, status_for
+from src.todolist.api.server import APIServer
+from src.todolist.repositories.async_repository import InlineRunner
+from src.todolist.repositories.project_repository import ProjectRepository
+from src.todolist.repositories.task_repository import TaskRepository
+from src.todolist.services.project_service import ProjectService
+from src.todolist.services.task_service import TaskService
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    InvalidStatusError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    ToDoListException,
+    VersionConflictError,
+)
+
+
+def _request(method, path, body=None, headers=""):
+    """Encode a request with an optional JSON body."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n{headers}"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    ).encode() + payload
+
+
+async def _read_response(reader):
+    """Read one response and return (status, headers, decoded body)."""
+    head = (await reader.readuntil(b"\r\n\r\n")).decode()
+    lines = head.split("\r\n")
+    status = int(lines[0].split(" ")[1])
+    headers = dict(line.split(": ", 1) for line in lines[1:] if line)
+    body = await reader.readexactly(int(headers["Content-Length"]))
+    return status, headers, json.loads(body) if body else None
+
+
+@pytest.fixture
+def api(project_service, task_service):
+    """Provide the API on in-memory services."""
+    return TodoListAPI(project_service, task_service, InlineRunner())
+
+
+def _run(api, scenario):
+    """Run a scenario coroutine against a server on a free port."""
+    async def main():
+        server = APIServer(api, port=0)
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+
+        async def call(method, path, body=None):
+            writer.write(_request(method, path, body))
+            return await _read_response(reader)
+
+        try:
+            return await scenario(call, reader, writer)
+        finally:
+            writer.close()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAPIServer:
+    """Test suite for the API server."""
+
+    def test_project_and_task_crud(self, api):
+        """Test creating, reading, updating and deleting over one connection."""
+        async def scenario(call, reader, writer):
+            _, _, project = await call("POST", "/projects", {"title": "Launch"})
+            status, _, task = await call(
+                "POST", "/tasks", {"title": "Write post", "project_id": project["id"]}
+            )
+            assert status == 201
+            _, _, updated = await call("PATCH", f"/tasks/{task['id']}", {"status": "DONE"})
+            _, _, summary = await call("GET", f"/projects/{project['id']}/summary")
+            deleted = await call("DELETE", f"/tasks/{task['id']}")
+            missing = await call("GET", f"/tasks/{task['id']}")
+            return updated, summary, deleted, missing
+
+        updated, summary, deleted, missing = _run(api, scenario)
+
+        assert updated["status"] == "DONE"
+        assert updated["version"] == 2
+        assert summary["project"]["title"] == "Launch"
+        assert summary["status_breakdown"]["DONE"] == 1
+        assert deleted[0] == 204
+        assert missing[0] == 404
+        assert missing[2]["error"]["type"] == "ResourceNotFoundError"
+
+    def test_status_filter_and_statistics(self, api):
+        """Test filtering tasks by status and reading statistics."""
+        async def scenario(call, reader, writer):
+            _, _, project = await call("POST", "/projects", {"title": "Launch"})
+            for i in range(3):
+                await call("POST", "/tasks", {"title": f"Task {i}", "project_id": project["id"]})
+            await call("PATCH", "/tasks/2", {"status": "DOING"})
+            _, _, doing = await call("GET", "/tasks?status=DOING")
+            _, _, page = await call("GET", "/tasks?limit=2")
+            _, _, statistics = await call("GET", "/statistics")
+            return doing, page, statistics
+
+        doing, page, statistics = _run(api, scenario)
+
+        assert [task["id"] for task in doing["items"]] == [2]
+        assert page["next_after_id"] == 2
+        assert statistics == {
+            "projects": 1,
+            "tasks": 3,
+            "tasks_by_status": {"TODO": 2, "DOING": 1, "DONE": 0},
+        }
+
+    def test_compact_models(self):
+        """Test that compact tasks and projects serialize like the regular ones."""
+        task_repo = TaskRepository(compact_models=True)
+        api = TodoListAPI(
+            ProjectService(ProjectRepository(compact_models=True), task_repo),
+            TaskService(task_repo),
+            InlineRunner(),
+        )
+
+        async def scenario(call, reader, writer):
+            _, _, project = await call("POST", "/projects", {"title": "Launch"})
+            _, _, task = await call(
+                "POST", "/tasks",
+                {"title": "Write post", "project_id": project["id"], "deadline": "2999-01-01T09:00:00"},
+            )
+            return project, task, await call("GET", f"/tasks/{task['id']}")
+
+        project, task, (status, _, fetched) = _run(api, scenario)
+
+        assert project["title"] == "Launch"
+        assert status == 200 and fetched == task
+        assert task["deadline"] == "2999-01-01T09:00:00"
+
+    def test_error_statuses(self, api):
+        """Test that application errors map to HTTP status codes."""
+        async def scenario(call, reader, writer):
+            await call("POST", "/projects", {"title": "Launch"})
+            return [
+                (await call("POST", "/projects", {"title": "Launch"}))[0],
+                (await call("PATCH", "/projects/1", {"title": "New", "expected_version": 5}))[0],
+                (await call("POST", "/tasks", {"title": "", "project_id": 1}))[0],
+                (await call("POST", "/tasks", {"title": "Orphan", "project_id": 99}))[0],
+                (await call("GET", "/tasks?status=LATER"))[0],
+                (await call("PUT", "/projects/1"))[0],
+                (await call("GET", "/nowhere"))[0],
+            ]
+
+        assert _run(api, scenario) == [409, 409, 400, 404, 400, 405, 404]
+
+    def test_error_mapping_uses_nearest_base_class(self):
+        """Test the status chosen for each exception class."""
+        class CustomError(ToDoListException):
+            pass
+
+        assert status_for(VersionConflictError("Task", "1", 1, 2)) == 409
+        assert status_for(DuplicateResourceError("Project", "x")) == 409
+        assert status_for(ResourceNotFoundError("Task", "1")) == 404
+        assert status_for(LimitExceededError("Task", 50)) == 422
+        assert status_for(InvalidStatusError("LATER", ["TODO"])) == 400
+        assert status_for(CustomError()) == 400
+        assert status_for(RuntimeError()) == 500
+
+    def test_pipelined_requests(self, api):
+        """Test that requests sent back to back are answered in order."""
+        async def scenario(call, reader, writer):
+            writer.write(
+                b"".join(
+                    _request("POST", "/projects", {"title": f"Project {i}"}) for i in range(5)
+                )
+                + _request("GET", "/statistics")
+            )
+            return [await _read_response(reader) for _ in range(6)]
+
+        responses = _run(api, scenario)
+
+        assert [body["id"] for _, _, body in responses[:5]] == [1, 2, 3, 4, 5]
+        assert responses[5][2]["projects"] == 5
+        assert all(headers["Connection"] == "keep-alive" for _, headers, _ in responses)
+
+    def test_connection_close_and_malformed_requests(self, api):
+        """Test Connection: close and a malformed request both end the connection."""
+        async def scenario(call, reader, writer):
+            writer.write(_request("GET", "/statistics", headers="Connection: close\r\n"))
+            closed = await _read_response(reader)
+            at_eof = await reader.read() == b""
+
+            bad_reader, bad_writer = await asyncio.open_connection(
+                "127.0.0.1", writer.get_extra_info("peername")[1]
+            )
+            bad_writer.write(b"NONSENSE\r\n\r\n")
+            malformed = await _read_response(bad_reader)
+            bad_writer.close()
+
+            json_reader, json_writer = await asyncio.open_connection(
+                "127.0.0.1", writer.get_extra_info("peername")[1]
+            )
+            json_writer.write(
+                b"POST /projects HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}"
+            )
+            bad_json = await _read_response(json_reader)
+            json_writer.close()
+            return closed, at_eof, malformed, bad_json
+
+        closed, at_eof, malformed, bad_json = _run(api, scenario)
+
+        assert closed[1]["Connection"] == "close"
+        assert at_eof
+        assert malformed[0] == 400
+        assert malformed[1]["Connection"] == "close"
+        assert bad_json[0] == 400
+        assert bad_json[1]["Connection"] == "keep-alive"
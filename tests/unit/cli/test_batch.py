@@ -0,0 +1,174 @@
+"""
+Unit tests for the batch command mode.
+"""
+
+import io
+import json
+import pytest
+from src.todolist.cli.batch import BatchRunner, parse_command
+from src.todolist.config import settings
+from src.todolist.utils.exceptions import ValidationError
+
+
+def _run(runner, script):
+    """Run a script and return the summary and decoded result lines."""
+    output = io.StringIO()
+    summary = runner.run(io.StringIO(script), output)
+    return summary, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+@pytest.fixture
+def runner(project_service, task_service):
+    """Provide a batch runner that stops at the first error."""
+    return BatchRunner(project_service, task_service)
+
+
+class TestBatchRunner:
+    """Test suite for BatchRunner."""
+
+    def test_parse_command(self):
+        """Test splitting a line into a command and quoted arguments."""
+        assert parse_command('task.create project=3 title="Write the post"') == (
+            "task.create", {"project": "3", "title": "Write the post"}
+        )
+        with pytest.raises(ValidationError):
+            parse_command("task.create project")
+        with pytest.raises(ValidationError):
+            parse_command('task.create title="unterminated')
+
+    def test_script_results(self, runner):
+        """Test that each command yields one machine-readable result line."""
+        summary, results = _run(runner, """
+            # set up a project
+            project.create title="Q3 launch"
+            task.create project=1 title="Write post" deadline="2030-07-01 09:00"
+
+            task.status id=1 status=DOING
+            task.list project=1 status=DOING
+            stats
+        """)
+
+        assert summary == {"succeeded": 5, "failed": 0, "stopped": False}
+        assert [result["line"] for result in results] == [3, 4, 6, 7, 8]
+        assert all(result["ok"] for result in results)
+        assert results[1]["result"]["deadline"] == "2030-07-01T09:00:00"
+        assert results[2]["result"]["version"] == 2
+        assert [task["id"] for task in results[3]["result"]["items"]] == [1]
+        assert results[4]["result"]["tasks_by_status"]["DOING"] == 1
+
+    def test_stops_at_first_error(self, runner):
+        """Test that a failed command ends the run by default."""
+        summary, results = _run(runner, "task.get id=1\nproject.create title=Never\n")
+
+        assert summary == {"succeeded": 0, "failed": 1, "stopped": True}
+        assert results == [{
+            "line": 1,
+            "command": "task.get",
+            "ok": False,
+            "error": {
+                "type": "ResourceNotFoundError",
+                "message": "Task with identifier '1' not found",
+            },
+        }]
+
+    def test_continue_on_error(self, project_service, task_service):
+        """Test that errors are reported and later commands still run."""
+        runner = BatchRunner(project_service, task_service, continue_on_error=True)
+
+        summary, results = _run(runner, "\n".join([
+            "project.create title=Launch",
+            "project.create title=Launch",
+            "task.create project=99 title=Orphan",
+            "task.create project=1",
+            "task.delete id=notanumber",
+            "bogus.command",
+            "project.create title=Other colour=blue",
+            "project.get id=1",
+        ]))
+
+        assert summary == {"succeeded": 2, "failed": 6, "stopped": False}
+        assert [result.get("error", {}).get("type") for result in results] == [
+            None,
+            "DuplicateResourceError",
+            "ResourceNotFoundError",
+            "ValidationError",
+            "ValidationError",
+            "ValidationError",
+            "ValidationError",
+            None,
+        ]
+
+    def test_output_is_buffered(self, runner, monkeypatch):
+        """Test that results are written in blocks, not per command."""
+        monkeypatch.setattr(settings, "max_number_of_task", 1000)
+        writes = []
+
+        class Recorder(io.StringIO):
+            def write(self, text):
+                writes.append(text)
+                return super().write(text)
+
+        script = "project.create title=Bulk\n" + "task.create project=1 title=Task\n" * 999
+        summary = runner.run(io.StringIO(script), Recorder())
+
+        assert summary["succeeded"] == 1000
+        assert len(writes) == 1
+        assert writes[0].count("\n") == 1000
+
+    def test_import_and_export_commands(self, runner, tmp_path):
+        """Test exporting and importing files from a script."""
+        source = tmp_path / "tasks.csv"
+        source.write_text("project_id,title\n1,First\n1,\n1,Second\n")
+        rejects = tmp_path / "rejects.ndjson"
+        exported = tmp_path / "export.ndjson"
+
+        summary, results = _run(runner, "\n".join([
+            "project.create title=Launch",
+            f"import.tasks path={source} rejects={rejects}",
+            f"export.tasks path={exported} project=1",
+        ]))
+
+        assert summary["failed"] == 0
+        assert results[1]["result"]["imported"] == 2
+        assert results[1]["result"]["rejected"] == 1
+        assert json.loads(rejects.read_text())["line"] == 3
+        assert results[2]["result"] == {"path": str(exported), "format": "ndjson", "exported": 2}
+        assert [json.loads(line)["title"] for line in exported.read_text().splitlines()] == [
+            "First", "Second"
+        ]
+
+    def test_missing_import_file_is_reported(self, runner, tmp_path):
+        """Test that an unreadable file is a command error, not a crash."""
+        _, results = _run(runner, f"import.projects path={tmp_path / 'missing.csv'}")
+
+        assert results[0]["error"]["type"] == "ValidationError"
+
+    def test_unexpected_errors_are_reported(self, project_service, task_service, tmp_path):
+        """Test that errors outside ToDoListException fail only their command."""
+        source = tmp_path / "latin1.csv"
+        source.write_bytes("project_id,title\n1,Caf\xe9\n".encode("latin-1"))
+        runner = BatchRunner(project_service, task_service, continue_on_error=True)
+
+        summary, results = _run(runner, "\n".join([
+            "project.create title=Launch",
+            f"import.tasks path={source}",
+            f"export.tasks path={tmp_path / 'missing' / 'tasks.ndjson'}",
+            "project.get id=1",
+        ]))
+
+        assert summary == {"succeeded": 2, "failed": 2, "stopped": False}
+        assert [result.get("error", {}).get("type") for result in results] == [
+            None, "UnicodeDecodeError", "ValidationError", None
+        ]
+
+    def test_results_written_when_script_fails(self, runner):
+        """Test that results of earlier commands are written if reading the script fails."""
+        def lines():
+            yield "project.create title=Launch"
+            raise OSError("script went away")
+
+        output = io.StringIO()
+        with pytest.raises(OSError):
+            runner.run(lines(), output)
+
+        assert json.loads(output.getvalue())["ok"] is True
@@ -0,0 +1,45 @@
+"""
+Unit tests for the interactive CLI.
+"""
+
+from src.todolist.cli.commands import CLI, progress_bar
+
+
+class TestProjectListing:
+    """Test suite for the project list and its progress bars."""
+
+    def test_progress_bar(self):
+        """Test the bar, percentage and counts for done tasks."""
+        assert progress_bar(1, 4, width=8) == "[##------] 25% (1/4 done)"
+        assert progress_bar(3, 3, width=4) == "[####] 100% (3/3 done)"
+        assert progress_bar(0, 0, width=4) == "[----] no tasks"
+
+    def test_list_projects_shows_progress(self, project_service, task_service, capsys):
+        """Test that every listed project shows its share of done tasks."""
+        launch = project_service.create_project("Launch")
+        project_service.create_project("Empty")
+        for i in range(2):
+            task = task_service.create_task(f"Task {i}", launch.id)
+        task_service.update_task_status(task.id, "DONE")
+
+        CLI(project_service, task_service)._list_projects()
+
+        progress = [line.strip() for line in capsys.readouterr().out.splitlines() if "Progress" in line]
+        assert progress == [
+            "Progress: [##########----------] 50% (1/2 done)",
+            "Progress: [--------------------] no tasks",
+        ]
+
+
+class TestProjectSelection:
+    """Test suite for picking a project by ID or title."""
+
+    def test_number_is_id_or_title(self, project_service, task_service, monkeypatch):
+        """Test that a number selects by ID first and falls back to titles."""
+        first = project_service.create_project("First")
+        year = project_service.create_project("2024")
+        answers = iter([str(first.id), "2024", "999"])
+        monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+        cli = CLI(project_service, task_service)
+
+        assert [cli._select_project() for _ in range(3)] == [first.id, year.id, None]
@@ -0,0 +1,74 @@
+"""
+Startup cost tests for the application entry point.
+"""
+
+import os
+import subprocess
+import sys
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "src"))
+
+# Cumulative -X importtime of todolist.main, in milliseconds (see
+# benchmarks/bench_startup.py, which reports the same measurement)
+IMPORT_BUDGET_MS = 60
+
+# Modules only some modes need; importing the entry point must not load them
+DEFERRED_MODULES = (
+    "asyncio", "sqlite3", "mmap", "csv", "http.server", "dotenv",
+    "cProfile", "tracemalloc", "concurrent.futures",
+    "todolist.cli.commands", "todolist.cli.batch", "todolist.services.transfer",
+)
+
+
+def _import(code: str, *options: str) -> subprocess.CompletedProcess:
+    """Run code in a fresh interpreter that imports todolist from src."""
+    environment = dict(os.environ, PYTHONPATH=SRC)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True, text=True, check=True, env=environment,
+    )
+
+
+def _import_time_ms() -> float:
+    """Return the cumulative import time of todolist.main in milliseconds."""
+    for line in _import("import todolist.main", "-X", "importtime").stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3 and fields[2].strip() == "todolist.main":
+            return int(fields[1]) / 1000
+    raise AssertionError("todolist.main missing from -X importtime output")
+
+
+class TestStartup:
+    """Test suite for the cost of importing the entry point."""
+
+    def test_entry_point_defers_optional_modules(self):
+        """Test that importing main loads neither front end nor optional backends."""
+        loaded = _import(
+            "import sys, todolist.main; "
+            f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+        ).stdout.split()
+
+        assert loaded == []
+
+    def test_settings_load_on_first_use(self):
+        """Test that importing settings does not read the environment yet."""
+        output = _import(
+            "from todolist.config import settings; "
+            "print('_settings' in vars(settings) and settings._settings is None); "
+            "print(settings.max_number_of_task > 0, settings._settings is not None)"
+        ).stdout.split()
+
+        assert output == ["True", "True", "True"]
+
+    def test_import_time_within_budget(self):
+        """Test the import time of todolist.main against the budget."""
+        _import("import todolist.main")  # warm up the bytecode cache
+        # Noise only ever adds time, so one run within budget is enough
+        times = []
+        while len(times) < 10 and (not times or min(times) > IMPORT_BUDGET_MS):
+            times.append(_import_time_ms())
+
+        assert min(times) <= IMPORT_BUDGET_MS, (
+            f"importing todolist.main took {min(times):.1f} ms (best of {len(times)})"
+        )
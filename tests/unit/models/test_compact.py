@@ -0,0 +1,80 @@
+"""
+Unit tests for the compact models.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from src.todolist.models.compact import CompactProject, CompactTask
+from src.todolist.models.project import Project
+from src.todolist.models.task import Task, TaskStatus
+from src.todolist.repositories.project_repository import ProjectRepository
+from src.todolist.repositories.task_repository import TaskRepository
+from src.todolist.services.task_service import TaskService
+from src.todolist.utils.exceptions import ValidationError
+
+
+class TestCompactTask:
+    """Test CompactTask functionality."""
+
+    def test_round_trip(self):
+        """Test conversion keeps every attribute."""
+        task = Task(
+            title="Test", project_id=1, description="Desc",
+            deadline=datetime.now() + timedelta(days=1),
+        )
+        compact = CompactTask.from_task(task)
+
+        assert compact == task
+        assert compact.deadline == task.deadline
+        assert compact.created_at == task.created_at
+        assert compact.to_task() == task
+
+    def test_has_no_instance_dict(self):
+        """Test that compact tasks are slotted."""
+        compact = CompactTask.from_task(Task(title="Test", project_id=1))
+        assert not hasattr(compact, "__dict__")
+
+    def test_update_status_and_details(self):
+        """Test that behaviour matches Task."""
+        compact = CompactTask.from_task(Task(title="Test", project_id=1))
+        compact.update_status(TaskStatus.DONE.value)
+        compact.update_details(title="Renamed")
+
+        assert compact.status == TaskStatus.DONE.value
+        assert compact.title == "Renamed"
+        with pytest.raises(ValidationError):
+            compact.update_status("INVALID")
+        with pytest.raises(ValidationError, match="cannot be in the past"):
+            compact.update_details(deadline=datetime.now() - timedelta(days=1))
+
+
+class TestCompactRepositories:
+    """Test repositories running in compact mode."""
+
+    def test_task_repository_stores_compact_tasks(self):
+        """Test that compact mode converts tasks and keeps indexes working."""
+        repo = TaskRepository(compact_models=True)
+        deadline = datetime.now() + timedelta(days=1)
+        stored = repo.add(Task(title="Test", project_id=1, deadline=deadline))
+
+        assert isinstance(stored, CompactTask)
+        assert repo.get_by_id(stored.id) is stored
+        assert repo.get_by_deadline_range(end=deadline + timedelta(seconds=1)) == [stored]
+        assert repo.get_by_deadline_range(end=deadline) == []
+
+    def test_service_updates_in_compact_mode(self):
+        """Test that service updates reach the stored compact task."""
+        service = TaskService(TaskRepository(compact_models=True))
+        task = service.create_task("Test", 1)
+        service.update_task_status(task.id, TaskStatus.DOING.value)
+
+        assert service.count_tasks_by_status()[TaskStatus.DOING.value] == 1
+        assert service.get_task(task.id).status == TaskStatus.DOING.value
+
+    def test_project_repository_stores_compact_projects(self):
+        """Test that compact mode works for projects."""
+        repo = ProjectRepository(compact_models=True)
+        stored = repo.add(Project(title="My Project"))
+
+        assert isinstance(stored, CompactProject)
+        assert repo.get_by_title("my project") is stored
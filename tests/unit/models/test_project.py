@@ -3,6 +3,7 @@ Unit tests for Project model.
 """
 
 import pytest
+from datetime import datetime
 from src.todolist.models.project import Project
 from src.todolist.utils.exceptions import ValidationError
 
@@ -96,3 +97,27 @@ class TestProject:
 
         with pytest.raises(ValidationError, match="must not exceed 150 words"):
             project.update_details(description=long_desc)
+
+    def test_from_record(self):
+        """Test trusted hydration builds a project and type-checks fields."""
+        now = datetime.now()
+        project = Project.from_record(
+            id=3, title="Stored", description="", created_at=now, updated_at=now
+        )
+
+        assert project.id == 3
+        assert project.created_at == now
+        with pytest.raises(ValidationError):
+            Project.from_record(
+                id="3", title="Stored", description="", created_at=now, updated_at=now
+            )
+
+    def test_to_dict(self):
+        """Test converting a project to a JSON-serializable dictionary."""
+        project = Project(title="Export me", description="All of it")
+
+        data = project.to_dict()
+
+        assert data["title"] == "Export me"
+        assert data["created_at"] == project.created_at.isoformat()
+        assert data["version"] == 1
@@ -2,6 +2,7 @@
 Unit tests for Task model.
 """
 
+import json
 import pytest
 from datetime import datetime, timedelta
 from src.todolist.models.task import Task, TaskStatus
@@ -167,3 +168,47 @@ class TestTask:
 
         with pytest.raises(ValidationError, match="must not exceed 150 words"):
             task.update_details(description=long_desc)
+
+    def test_from_record_skips_business_validation(self):
+        """Test trusted hydration accepts a deadline that has passed."""
+        now = datetime.now()
+        task = Task.from_record(
+            id=7,
+            title="Stored",
+            project_id=1,
+            description="",
+            status=TaskStatus.DONE.value,
+            deadline=now - timedelta(days=1),
+            created_at=now,
+            updated_at=now,
+        )
+
+        assert task.id == 7
+        assert task.deadline < now
+        assert task == Task.from_record(**vars(task))
+
+    def test_from_record_rejects_wrong_types(self):
+        """Test trusted hydration still type-checks fields."""
+        now = datetime.now()
+        record = dict(
+            id=1, title="Stored", project_id=1, description="",
+            status=TaskStatus.TODO.value, deadline=None,
+            created_at=now, updated_at=now,
+        )
+
+        for field_name, value in (("project_id", "1"), ("status", "LATER"), ("deadline", "tomorrow")):
+            with pytest.raises(ValidationError):
+                Task.from_record(**{**record, field_name: value})
+
+    def test_to_dict(self):
+        """Test converting a task to a JSON-serializable dictionary."""
+        deadline = datetime.now() + timedelta(days=1)
+        task = Task(title="Export me", project_id=2, deadline=deadline)
+
+        data = task.to_dict()
+
+        assert data["title"] == "Export me"
+        assert data["project_id"] == 2
+        assert data["deadline"] == deadline.isoformat()
+        assert data["version"] == 1
+        assert json.loads(json.dumps(data)) == data
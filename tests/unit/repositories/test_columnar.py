@@ -0,0 +1,209 @@
+"""
+Unit tests for the memory-mapped columnar snapshots.
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from src.todolist.models.project import Project
+from src.todolist.models.task import Task, TaskStatus
+from src.todolist.repositories.columnar import (
+    MappedTaskRepository,
+    MappedTaskSnapshot,
+    SnapshotProjectRepository,
+    write_task_snapshot,
+)
+from src.todolist.services.task_service import TaskService
+from src.todolist.utils.exceptions import ResourceNotFoundError, ValidationError
+from src.todolist.utils.metrics import MetricsRegistry, instrument
+
+
+@pytest.fixture
+def tasks():
+    """Provide tasks spread over two projects."""
+    base = datetime.now() + timedelta(days=1)
+    return [
+        Task(title="Task 1", project_id=2, description="First", deadline=base + timedelta(days=2)),
+        Task(title="Tâche 2", project_id=1, status=TaskStatus.DONE.value),
+        Task(title="Task 3", project_id=2, status=TaskStatus.DOING.value, deadline=base),
+        Task(title="Task 4", project_id=1),
+    ]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, tasks):
+    """Provide a snapshot file containing the sample tasks."""
+    path = str(tmp_path / "tasks.columns")
+    write_task_snapshot(path, tasks)
+    return path
+
+
+class TestMappedTaskSnapshot:
+    """Test suite for MappedTaskSnapshot."""
+
+    def test_round_trip(self, snapshot_path, tasks):
+        """Test that every row materializes back into the same task."""
+        snapshot = MappedTaskSnapshot(snapshot_path)
+
+        assert [snapshot.task_at(row) for row in range(len(snapshot))] == tasks
+        snapshot.close()
+
+    def test_breakdowns_from_columns(self, snapshot_path):
+        """Test status and per-project breakdowns on the mapped columns."""
+        snapshot = MappedTaskSnapshot(snapshot_path)
+
+        assert snapshot.count_by_status() == {"TODO": 2, "DOING": 1, "DONE": 1}
+        assert snapshot.count_by_status_in_project(1) == {"TODO": 1, "DOING": 0, "DONE": 1}
+        snapshot.close()
+
+    def test_versions_round_trip(self, tmp_path, tasks):
+        """Test that task versions are stored in the snapshot."""
+        tasks[0].version = 7
+        path = str(tmp_path / "tasks.columns")
+        write_task_snapshot(path, tasks)
+        snapshot = MappedTaskSnapshot(path)
+
+        assert snapshot.task_at(0).version == 7
+        snapshot.close()
+
+    def test_reads_snapshot_without_versions(self, snapshot_path, tasks):
+        """Test that snapshots written before versions existed still open."""
+        with open(snapshot_path, "rb") as source:
+            data = source.read()
+        # Drop the versions column that follows the five leading int64 columns
+        start = 48 + 5 * 8 * len(tasks)
+        with open(snapshot_path, "wb") as target:
+            target.write(b"TDLTASK1" + data[8:start] + data[start + 8 * len(tasks):])
+        snapshot = MappedTaskSnapshot(snapshot_path)
+
+        assert [snapshot.task_at(row) for row in range(len(snapshot))] == tasks
+        assert {snapshot.task_at(row).version for row in range(len(snapshot))} == {1}
+        snapshot.close()
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Test that a file with another format is rejected."""
+        path = tmp_path / "other.columns"
+        path.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValidationError):
+            MappedTaskSnapshot(str(path))
+
+
+class TestMappedTaskRepository:
+    """Test suite for MappedTaskRepository."""
+
+    def test_reads_served_from_snapshot(self, snapshot_path, tasks):
+        """Test read queries without loading the whole snapshot."""
+        repo = MappedTaskRepository(snapshot_path)
+
+        assert repo.count() == 4
+        assert repo.count_by_project_id(2) == 2
+        assert repo.count_by_status()["DONE"] == 1
+        assert repo.count_by_status_in_project(1) == {"TODO": 1, "DOING": 0, "DONE": 1}
+        assert repo.get_by_project_id(1) == [tasks[1], tasks[3]]
+        assert repo.get_by_deadline_range() == [tasks[2], tasks[0]]
+        assert repo.get_by_id(tasks[0].id) is repo.get_by_id(tasks[0].id)
+        assert repo.get_by_status(TaskStatus.TODO.value) == [tasks[0], tasks[3]]
+        assert repo.get_by_status("UNKNOWN") == []
+        assert repo.get_all() == tasks
+        assert not repo.is_loaded
+        with pytest.raises(ResourceNotFoundError):
+            repo.get_by_id(999)
+        repo.close()
+
+    def test_iter_from_snapshot(self, snapshot_path, tasks):
+        """Test cursor iteration runs on the snapshot and survives a load."""
+        repo = MappedTaskRepository(snapshot_path)
+
+        assert list(repo.iter_all(after_id=tasks[0].id, limit=2)) == tasks[1:3]
+        assert list(repo.iter_by_project_id(2, after_id=tasks[0].id)) == [tasks[2]]
+        assert not repo.is_loaded
+
+        iterator = repo.iter_all()
+        assert next(iterator) == tasks[0]
+        repo.delete(tasks[1].id)
+        assert list(iterator) == tasks[2:]
+        repo.close()
+
+    def test_write_loads_and_close_saves(self, snapshot_path, tasks):
+        """Test that a write switches to memory and close persists it."""
+        repo = MappedTaskRepository(snapshot_path)
+        task = repo.get_by_id(tasks[0].id)
+        task.update_status(TaskStatus.DONE.value)
+        repo.update(task)
+        repo.delete(tasks[1].id)
+
+        assert repo.is_loaded
+        assert repo.count_by_status()["DONE"] == 1
+        repo.close()
+
+        reopened = MappedTaskRepository(snapshot_path)
+        assert reopened.count() == 3
+        assert reopened.get_by_id(tasks[0].id).status == TaskStatus.DONE.value
+        reopened.close()
+
+    def test_writes_survive_crash(self, snapshot_path, tasks):
+        """Test that journaled writes are replayed when the repository was not closed."""
+        repo = MappedTaskRepository(snapshot_path)
+        repo.delete(tasks[1].id)
+        added = repo.add(Task(title="Task 5", project_id=1))
+        repo._journal.close()  # crash: the snapshot is not rewritten
+
+        reopened = MappedTaskRepository(snapshot_path)
+
+        assert reopened.is_loaded
+        assert [task.id for task in reopened.get_all()] == [
+            tasks[0].id, tasks[2].id, tasks[3].id, added.id
+        ]
+        reopened.close()
+        compacted = MappedTaskRepository(snapshot_path)
+        assert not compacted.is_loaded
+        compacted.close()
+
+    def test_instrument_sees_delegated_methods(self, snapshot_path, tasks):
+        """Test that writes and queries are recorded by instrument()."""
+        metrics = MetricsRegistry()
+        repo = instrument(MappedTaskRepository(snapshot_path), "task_repository", metrics)
+
+        repo.delete(tasks[0].id)
+        repo.search("task")
+
+        operations = {row["operation"] for row in metrics.snapshot()}
+        assert {"task_repository.delete", "task_repository.search"} <= operations
+        repo.close()
+
+    def test_service_search(self, snapshot_path, tasks):
+        """Test that TaskService.search passes its filters through to the snapshot backend."""
+        service = TaskService(MappedTaskRepository(snapshot_path))
+
+        assert service.search("task", limit=10, project_id=2) == [tasks[0], tasks[2]]
+        assert service.search("task", status=TaskStatus.DOING.value) == [tasks[2]]
+        assert service.search("first", limit=1) == [tasks[0]]
+
+
+class TestSnapshotProjectRepository:
+    """Test suite for SnapshotProjectRepository."""
+
+    def test_projects_survive_reopen(self, tmp_path):
+        """Test that projects are written on close and read back."""
+        path = str(tmp_path / "projects.columns")
+        repo = SnapshotProjectRepository(path)
+        project = Project(title="My Project", description="Desc")
+        repo.add(project)
+        repo.close()
+
+        reopened = SnapshotProjectRepository(path)
+
+        assert reopened.get_all() == [project]
+        assert reopened.get_by_title("my project") == project
+
+    def test_projects_survive_crash(self, tmp_path):
+        """Test that journaled project writes are replayed on the next open."""
+        path = str(tmp_path / "projects.columns")
+        repo = SnapshotProjectRepository(path)
+        project = repo.add(Project(title="My Project"))
+        repo._journal.close()  # crash: the snapshot is never written
+
+        reopened = SnapshotProjectRepository(path)
+
+        assert reopened.get_all() == [project]
+        reopened.close()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the journaled repositories.
+"""
+
+import os
+import pytest
+from datetime import datetime, timedelta
+from src.todolist.models.project import Project
+from src.todolist.models.task import Task, TaskStatus
+from src.todolist.repositories.journal import Journal
+from src.todolist.repositories.journaled_repository import (
+    JournaledProjectRepository,
+    JournaledTaskRepository,
+)
+
+
+def _open_tasks(directory, **kwargs):
+    """Open a journaled task repository in a directory."""
+    return JournaledTaskRepository(Journal(str(directory), "tasks"), **kwargs)
+
+
+class TestJournaledTaskRepository:
+    """Test suite for JournaledTaskRepository."""
+
+    def test_state_survives_reopen(self, tmp_path):
+        """Test that replaying the journal restores every write."""
+        repo = _open_tasks(tmp_path)
+        task1 = Task(title="Task 1", project_id=1, deadline=datetime.now() + timedelta(days=1))
+        task2 = Task(title="Task 2", project_id=1)
+        task3 = Task(title="Task 3", project_id=2)
+        repo.add_many([task1, task2])
+        repo.add(task3)
+        task1.update_status(TaskStatus.DONE.value)
+        repo.update(task1)
+        repo.delete(task2.id)
+        repo.delete_by_project_id(2)
+        repo.close()
+
+        reopened = _open_tasks(tmp_path)
+
+        assert reopened.get_all() == [task1]
+        assert reopened.count_by_status()[TaskStatus.DONE.value] == 1
+
+    def test_compaction_writes_snapshot_and_truncates(self, tmp_path):
+        """Test that compaction moves state into the snapshot."""
+        repo = _open_tasks(tmp_path, compact_min_entries=3)
+        tasks = [Task(title=f"Task {i}", project_id=1) for i in range(4)]
+        for task in tasks:
+            repo.add(task)
+        repo.close()
+
+        journal = Journal(str(tmp_path), "tasks")
+        assert len(list(journal.read_snapshot())) == 3
+        assert len(list(journal.read_entries())) == 1
+        assert _open_tasks(tmp_path).count() == 4
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """Test that a partially written record is dropped on recovery."""
+        repo = _open_tasks(tmp_path)
+        task = Task(title="Task 1", project_id=1)
+        repo.add(task)
+        repo.close()
+        with open(os.path.join(tmp_path, "tasks.journal.ndjson"), "a") as journal:
+            journal.write('{"op":"add","task":{"id":')
+
+        reopened = _open_tasks(tmp_path)
+        reopened.add(Task(title="Task 2", project_id=1))
+        reopened.close()
+
+        assert _open_tasks(tmp_path).count() == 2
+
+    def test_ids_continue_after_reopen(self, tmp_path):
+        """Test that a new session does not reuse stored IDs."""
+        from src.todolist.utils.id_generator import id_generator
+
+        repo = _open_tasks(tmp_path)
+        task = Task(title="Task 1", project_id=1)
+        repo.add(task)
+        repo.close()
+        id_generator.reset()
+
+        _open_tasks(tmp_path)
+
+        assert Task(title="Task 2", project_id=1).id == task.id + 1
+
+
+class TestJournaledProjectRepository:
+    """Test suite for JournaledProjectRepository."""
+
+    def test_rename_survives_reopen(self, tmp_path):
+        """Test that renames are replayed into the title index."""
+        repo = JournaledProjectRepository(Journal(str(tmp_path), "projects"))
+        project = Project(title="Old Name")
+        repo.add(project)
+        project.update_details(title="New Name")
+        repo.update(project)
+        repo.close()
+
+        reopened = JournaledProjectRepository(Journal(str(tmp_path), "projects"))
+
+        assert reopened.get_by_title("new name") == project
+        assert not reopened.exists_by_title("Old Name")
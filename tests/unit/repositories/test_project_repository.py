@@ -0,0 +1,121 @@
+"""
+Unit tests for ProjectRepository.
+"""
+
+import copy
+import pytest
+from src.todolist.models.project import Project
+from src.todolist.repositories.project_repository import ProjectRepository
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
+
+
+class TestProjectRepository:
+    """Test suite for ProjectRepository."""
+
+    def test_add_project(self, project_repo, sample_project):
+        """Test adding a project."""
+        added = project_repo.add(sample_project)
+        assert added.id == sample_project.id
+        assert project_repo.count() == 1
+
+    def test_get_by_id_not_exists(self, project_repo):
+        """Test getting project by ID when it doesn't exist."""
+        with pytest.raises(ResourceNotFoundError):
+            project_repo.get_by_id(999)
+
+    def test_get_by_title_case_insensitive(self, project_repo, sample_project):
+        """Test title lookup ignores case."""
+        project_repo.add(sample_project)
+
+        assert project_repo.get_by_title("test project") is sample_project
+        assert project_repo.get_by_title("TEST PROJECT") is sample_project
+        assert project_repo.get_by_title("Other") is None
+
+    def test_exists_by_title(self, project_repo, sample_project):
+        """Test checking project existence by title."""
+        assert not project_repo.exists_by_title("Test Project")
+        project_repo.add(sample_project)
+        assert project_repo.exists_by_title("test PROJECT")
+
+    def test_title_index_follows_rename(self, project_repo, sample_project):
+        """Test that renaming a project updates the title index."""
+        project_repo.add(sample_project)
+
+        sample_project.update_details(title="Renamed")
+        project_repo.update(sample_project)
+
+        assert project_repo.get_by_title("Test Project") is None
+        assert project_repo.get_by_title("renamed") is sample_project
+
+    def test_update_unique(self, project_repo):
+        """Test that update_unique rejects another project's title but keeps its own."""
+        garden = project_repo.add(Project(title="Garden"))
+        kitchen = project_repo.add(Project(title="Kitchen"))
+
+        renamed = copy.copy(kitchen)
+        renamed.update_details(title="GARDEN")
+        with pytest.raises(DuplicateResourceError):
+            project_repo.update_unique(renamed)
+        garden.update_details(description="Same title")
+        project_repo.update_unique(garden, expected_version=1)
+
+        assert project_repo.get_by_title("kitchen") == kitchen
+        assert kitchen.version == 1
+        assert project_repo.get_by_title("garden").version == 2
+
+    def test_title_index_after_delete(self, project_repo, sample_project):
+        """Test that deleted projects disappear from the title index."""
+        project_repo.add(sample_project)
+        project_repo.delete(sample_project.id)
+
+        assert not project_repo.exists_by_title("Test Project")
+
+    def test_clear(self, project_repo):
+        """Test clearing all projects."""
+        project_repo.add(Project(title="Project 1"))
+        project_repo.add(Project(title="Project 2"))
+        project_repo.clear()
+
+        assert project_repo.count() == 0
+        assert project_repo.get_by_title("Project 1") is None
+
+    def test_iter_all_with_cursor(self, project_repo):
+        """Test iterating projects by ID from a cursor with a limit."""
+        projects = project_repo.add_many([Project(title=f"Project {i}") for i in range(4)])
+
+        assert list(project_repo.iter_all()) == projects
+        assert list(project_repo.iter_all(after_id=projects[0].id, limit=2)) == projects[1:3]
+
+    def test_find_by_title(self, project_repo):
+        """Test prefix and fuzzy lookups follow renames and deletes."""
+        groceries = project_repo.add(Project(title="Weekly groceries"))
+        garden = project_repo.add(Project(title="Garden"))
+
+        assert project_repo.find_by_title("groc") == [groceries]
+        assert project_repo.find_by_title("gardn") == [garden]
+
+        garden.update_details(title="Backyard")
+        project_repo.update(garden)
+        project_repo.delete(groceries.id)
+
+        assert project_repo.find_by_title("back") == [garden]
+        assert project_repo.find_by_title("groc") == []
+
+    @pytest.mark.parametrize("compact_models", [False, True])
+    def test_compare_and_swap_update(self, compact_models):
+        """Test versioned updates on regular and compact storage."""
+        project_repo = ProjectRepository(compact_models=compact_models)
+        project_repo.add(Project(title="Garden"))
+        first = copy.copy(project_repo.get_by_id(1))
+
+        first.update_details(title="Backyard")
+        assert project_repo.update(first, expected_version=1).version == 2
+        with pytest.raises(VersionConflictError):
+            project_repo.update(first, expected_version=1)
+
+        assert project_repo.get_by_id(1).title == "Backyard"
+        assert project_repo.get_by_id(1).version == 2
@@ -0,0 +1,47 @@
+"""
+Unit tests for SortedKeys.
+"""
+
+import random
+from src.todolist.repositories import sorted_keys
+from src.todolist.repositories.sorted_keys import SortedKeys
+
+
+class TestSortedKeys:
+    """Test suite for SortedKeys."""
+
+    def test_order_and_cursor(self):
+        """Test ordered reads and the cursor lookup."""
+        keys = SortedKeys([5, 1, 3])
+        keys.add(3)
+
+        assert list(keys) == [1, 3, 5]
+        assert keys.last(2) == [5, 3]
+        assert keys.first(1) == [1]
+        assert [keys.next_after(), keys.next_after(1), keys.next_after(4)] == [1, 3, 5]
+        assert keys.next_after(5) is None
+        assert len(keys) == 3
+
+    def test_matches_sorted_set_across_buckets(self, monkeypatch):
+        """Test random adds and discards against a sorted set with tiny buckets."""
+        monkeypatch.setattr(sorted_keys, "BUCKET_SIZE", 4)
+        generator = random.Random(7)
+        keys, expected = SortedKeys(), set()
+
+        for _ in range(2000):
+            key = generator.randrange(200)
+            if generator.random() < 0.6:
+                keys.add(key)
+                expected.add(key)
+            else:
+                keys.discard(key)
+                expected.discard(key)
+
+        assert list(keys) == sorted(expected)
+        assert list(reversed(keys)) == sorted(expected, reverse=True)
+        assert len(keys) == len(expected)
+        assert all(key in keys for key in expected)
+        assert keys.next_after(100) == min(key for key in expected if key > 100)
+
+        keys.clear()
+        assert list(keys) == [] and keys.next_after() is None
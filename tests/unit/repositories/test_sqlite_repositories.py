@@ -0,0 +1,391 @@
+"""
+Unit tests for the SQLite repositories.
+"""
+
+import pytest
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from src.todolist.models.project import Project
+from src.todolist.models.task import Task, TaskStatus
+from src.todolist.repositories.sqlite_database import connect
+from src.todolist.repositories.sqlite_project_repository import SQLiteProjectRepository
+from src.todolist.repositories.sqlite_task_repository import SQLiteTaskRepository
+from src.todolist.services.project_service import ProjectService
+from src.todolist.services.task_service import TaskService
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    LimitExceededError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
+from src.todolist.utils.id_generator import id_generator
+
+
+@pytest.fixture
+def connection():
+    """Provide an in-memory SQLite connection with the schema."""
+    connection = connect(":memory:")
+    yield connection
+    connection.close()
+
+
+@pytest.fixture
+def sqlite_task_repo(connection):
+    """Provide a SQLite task repository."""
+    return SQLiteTaskRepository(connection)
+
+
+@pytest.fixture
+def sqlite_project_repo(connection):
+    """Provide a SQLite project repository."""
+    return SQLiteProjectRepository(connection)
+
+
+class TestSQLiteTaskRepository:
+    """Test suite for SQLiteTaskRepository."""
+
+    def test_add_and_get_round_trip(self, sqlite_task_repo):
+        """Test that a stored task comes back unchanged."""
+        deadline = datetime.now() + timedelta(days=1)
+        task = Task(title="Task 1", project_id=1, description="Desc", deadline=deadline)
+        sqlite_task_repo.add(task)
+
+        loaded = sqlite_task_repo.get_by_id(task.id)
+
+        assert loaded == task
+
+    def test_get_by_id_not_exists(self, sqlite_task_repo):
+        """Test getting task by ID when it doesn't exist."""
+        with pytest.raises(ResourceNotFoundError):
+            sqlite_task_repo.get_by_id(999)
+
+    def test_project_queries_and_cascade(self, sqlite_task_repo):
+        """Test per-project listing, counting and cascade delete."""
+        sqlite_task_repo.add_many([
+            Task(title="Task 1", project_id=1),
+            Task(title="Task 2", project_id=1),
+            Task(title="Task 3", project_id=2),
+        ])
+
+        assert [t.title for t in sqlite_task_repo.get_by_project_id(1)] == ["Task 1", "Task 2"]
+        assert sqlite_task_repo.count_by_project_id(1) == 2
+        assert sqlite_task_repo.delete_by_project_id(1) == 2
+        assert sqlite_task_repo.count() == 1
+
+    def test_iter_with_cursor(self, sqlite_task_repo):
+        """Test keyset iteration over all tasks and over one project."""
+        tasks = sqlite_task_repo.add_many([
+            Task(title=f"Task {i}", project_id=1 + i % 2) for i in range(5)
+        ])
+
+        assert list(sqlite_task_repo.iter_all()) == tasks
+        assert list(sqlite_task_repo.iter_all(after_id=tasks[0].id, limit=2)) == tasks[1:3]
+        assert list(sqlite_task_repo.iter_by_project_id(1, after_id=tasks[0].id)) == [
+            tasks[2], tasks[4],
+        ]
+
+    def test_status_queries(self, sqlite_task_repo):
+        """Test status filtering and counters."""
+        task = Task(title="Task 1", project_id=1)
+        sqlite_task_repo.add(task)
+        task.update_status(TaskStatus.DONE.value)
+        sqlite_task_repo.update(task)
+
+        assert sqlite_task_repo.get_by_status(TaskStatus.DONE.value) == [task]
+        assert sqlite_task_repo.count_by_status() == {
+            TaskStatus.TODO.value: 0,
+            TaskStatus.DOING.value: 0,
+            TaskStatus.DONE.value: 1,
+        }
+        assert sqlite_task_repo.count_by_status_in_project(1) == {
+            TaskStatus.TODO.value: 0,
+            TaskStatus.DOING.value: 0,
+            TaskStatus.DONE.value: 1,
+        }
+        assert sqlite_task_repo.count_by_status_in_project(2)[TaskStatus.DONE.value] == 0
+
+    def test_get_by_deadline_range(self, sqlite_task_repo):
+        """Test deadline range queries."""
+        base = datetime.now() + timedelta(days=1)
+        late = Task(title="Late", project_id=1, deadline=base + timedelta(days=2))
+        early = Task(title="Early", project_id=1, deadline=base)
+        sqlite_task_repo.add_many([late, early, Task(title="None", project_id=1)])
+
+        assert sqlite_task_repo.get_by_deadline_range() == [early, late]
+        assert sqlite_task_repo.get_by_deadline_range(end=base + timedelta(days=1)) == [early]
+        assert sqlite_task_repo.get_by_deadline_range(limit=1) == [early]
+
+    def test_search(self, sqlite_task_repo):
+        """Test full-text search with filters, ranking and updates."""
+        task1 = Task(title="Plan", project_id=1, description="budget meeting")
+        task2 = Task(title="Budget review", project_id=2)
+        sqlite_task_repo.add_many([task1, task2])
+
+        assert [t.id for t in sqlite_task_repo.search("budget")] == [task2.id, task1.id]
+        assert [t.id for t in sqlite_task_repo.search("budget", project_id=1)] == [task1.id]
+        assert [t.id for t in sqlite_task_repo.search("meet* OR nothing")] == [task1.id]
+
+        task1.update_details(description="team lunch")
+        sqlite_task_repo.update(task1)
+        sqlite_task_repo.delete(task2.id)
+        assert sqlite_task_repo.search("budget") == []
+        assert [t.id for t in sqlite_task_repo.search("lunch")] == [task1.id]
+
+    def test_search_without_fts(self, sqlite_task_repo):
+        """Test search falls back to a scan when FTS5 is unavailable."""
+        task = sqlite_task_repo.add(Task(title="Budget review", project_id=1))
+        sqlite_task_repo._has_search_index = False
+
+        assert sqlite_task_repo.search("budg*") == [task]
+        assert sqlite_task_repo.search("budget", status=TaskStatus.DONE.value) == []
+
+    def test_update_and_delete_non_existent(self, sqlite_task_repo):
+        """Test updating or deleting a missing task raises error."""
+        with pytest.raises(ResourceNotFoundError):
+            sqlite_task_repo.update(Task(title="Test", project_id=1))
+        with pytest.raises(ResourceNotFoundError):
+            sqlite_task_repo.delete(999)
+
+    def test_compare_and_swap_update(self, sqlite_task_repo):
+        """Test that updates store new versions and reject stale ones."""
+        task = sqlite_task_repo.add(Task(title="Task 1", project_id=1))
+        stale = sqlite_task_repo.get_by_id(task.id)
+
+        task.update_status(TaskStatus.DONE.value)
+        sqlite_task_repo.update(task, expected_version=1)
+        stale.update_details(title="Stale")
+
+        with pytest.raises(VersionConflictError):
+            sqlite_task_repo.update(stale, expected_version=1)
+        assert sqlite_task_repo.get_by_id(task.id) == task
+        assert task.version == 2
+
+    def test_version_column_added_to_old_database(self, tmp_path):
+        """Test that databases created before versions load with version 1."""
+        path = str(tmp_path / "old.db")
+        old = sqlite3.connect(path)
+        old.executescript("""
+            CREATE TABLE tasks (
+                id INTEGER PRIMARY KEY, project_id INTEGER NOT NULL,
+                title TEXT NOT NULL, description TEXT NOT NULL DEFAULT '',
+                status TEXT NOT NULL, deadline TEXT,
+                created_at TEXT NOT NULL, updated_at TEXT NOT NULL
+            );
+            INSERT INTO tasks VALUES (
+                1, 1, 'Old task', '', 'TODO', NULL,
+                '2024-01-01T00:00:00.000000', '2024-01-01T00:00:00.000000'
+            );
+        """)
+        old.close()
+
+        connection = connect(path)
+        repository = SQLiteTaskRepository(connection)
+        task = repository.get_by_id(1)
+
+        assert task.version == 1
+        assert repository.update(task, expected_version=1).version == 2
+        connection.close()
+
+    def test_add_many_respects_limit(self, sqlite_task_repo, monkeypatch):
+        """Test that a batch exceeding the limit is rejected as a whole."""
+        from src.todolist.config import settings
+
+        monkeypatch.setattr(settings, "max_number_of_task", 2)
+        tasks = [Task(title=f"Task {i}", project_id=1) for i in range(3)]
+
+        with pytest.raises(LimitExceededError):
+            sqlite_task_repo.add_many(tasks)
+        assert sqlite_task_repo.count() == 0
+
+    def test_duplicate_id_is_rejected(self, sqlite_task_repo):
+        """Test that re-adding a stored ID fails cleanly and keeps the count."""
+        task = Task(title="Task 1", project_id=1)
+        sqlite_task_repo.add(task)
+        fresh = Task(title="Task 2", project_id=1)
+
+        with pytest.raises(DuplicateResourceError):
+            sqlite_task_repo.add(task)
+        with pytest.raises(DuplicateResourceError, match=str(task.id)):
+            sqlite_task_repo.add_many([fresh, task])
+        with pytest.raises(DuplicateResourceError, match=str(fresh.id)):
+            sqlite_task_repo.add_many([fresh, fresh])
+        assert sqlite_task_repo.count() == 1
+        assert not sqlite_task_repo.exists(fresh.id)
+
+    def test_cached_count_follows_writes(self, connection, sqlite_task_repo):
+        """Test the row count kept by the repository against the table."""
+        tasks = [Task(title=f"Task {i}", project_id=1 + i % 2) for i in range(5)]
+        sqlite_task_repo.add_many(tasks)
+        sqlite_task_repo.delete(tasks[0].id)
+        sqlite_task_repo.delete_by_project_id(2)
+
+        assert sqlite_task_repo.count() == 2
+        assert SQLiteTaskRepository(connection).count() == 2
+        sqlite_task_repo.clear()
+        assert sqlite_task_repo.count() == 0
+
+    def test_close_closes_connection(self, tmp_path):
+        """Test that closing both repositories closes the shared connection once."""
+        connection = connect(str(tmp_path / "todo.db"))
+        repositories = [SQLiteProjectRepository(connection), SQLiteTaskRepository(connection)]
+        repositories[1].count_by_project_id(1)
+
+        for repository in repositories:
+            repository.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+        assert connection._readers == []
+
+    def test_reload_task_with_past_deadline(self, connection, sqlite_task_repo):
+        """Test that stored tasks load even after their deadline has passed."""
+        task = Task(title="Task 1", project_id=1, deadline=datetime.now() + timedelta(days=1))
+        sqlite_task_repo.add(task)
+        connection.execute(
+            "UPDATE tasks SET deadline = ? WHERE id = ?",
+            ((datetime.now() - timedelta(days=1)).isoformat(), task.id),
+        )
+
+        loaded = sqlite_task_repo.get_by_id(task.id)
+
+        assert loaded.deadline < datetime.now()
+
+    def test_ids_continue_after_reopen(self, connection, sqlite_task_repo):
+        """Test that a new session does not reuse stored IDs."""
+        task = Task(title="Task 1", project_id=1)
+        sqlite_task_repo.add(task)
+        id_generator.reset()
+
+        SQLiteTaskRepository(connection)
+
+        assert Task(title="Task 2", project_id=1).id == task.id + 1
+
+
+class TestSQLiteProjectRepository:
+    """Test suite for SQLiteProjectRepository."""
+
+    def test_get_by_title_case_insensitive(self, sqlite_project_repo):
+        """Test title lookup ignores case."""
+        project = Project(title="Test Project")
+        sqlite_project_repo.add(project)
+
+        assert sqlite_project_repo.get_by_title("TEST project") == project
+        assert sqlite_project_repo.exists_by_title("test project")
+        assert sqlite_project_repo.get_by_title("Other") is None
+
+    def test_rename_updates_title_lookup(self, sqlite_project_repo):
+        """Test that renaming a project updates title lookups."""
+        project = Project(title="Old Name")
+        sqlite_project_repo.add(project)
+        project.update_details(title="New Name")
+        sqlite_project_repo.update(project)
+
+        assert not sqlite_project_repo.exists_by_title("Old Name")
+        assert sqlite_project_repo.get_by_title("new name") == project
+
+    def test_delete(self, sqlite_project_repo):
+        """Test deleting a project."""
+        project = Project(title="Test Project")
+        sqlite_project_repo.add(project)
+        sqlite_project_repo.delete(project.id)
+
+        assert not sqlite_project_repo.exists(project.id)
+        with pytest.raises(ResourceNotFoundError):
+            sqlite_project_repo.delete(project.id)
+
+    def test_iter_all_with_cursor(self, sqlite_project_repo):
+        """Test keyset iteration over projects."""
+        projects = sqlite_project_repo.add_many([Project(title=f"Project {i}") for i in range(3)])
+
+        assert list(sqlite_project_repo.iter_all(after_id=projects[0].id)) == projects[1:]
+
+
+    def test_find_by_title(self, connection, sqlite_project_repo):
+        """Test title lookups work after reopening and follow deletes."""
+        groceries = sqlite_project_repo.add(Project(title="Weekly groceries"))
+        garden = sqlite_project_repo.add(Project(title="Garden"))
+
+        reopened = SQLiteProjectRepository(connection)
+        assert [p.id for p in reopened.find_by_title("groc")] == [groceries.id]
+        assert [p.id for p in reopened.find_by_title("gardn")] == [garden.id]
+
+        reopened.delete(garden.id)
+        assert reopened.find_by_title("garden") == []
+    def test_add_unique(self, sqlite_project_repo):
+        """Test that add_unique rejects a title that differs only in case."""
+        sqlite_project_repo.add_unique(Project(title="Garden"))
+
+        with pytest.raises(DuplicateResourceError):
+            sqlite_project_repo.add_unique(Project(title="GARDEN"))
+        assert sqlite_project_repo.count() == 1
+
+    def test_update_unique(self, sqlite_project_repo):
+        """Test that update_unique rejects another project's title but keeps its own."""
+        garden = sqlite_project_repo.add(Project(title="Garden"))
+        kitchen = sqlite_project_repo.add(Project(title="Kitchen"))
+
+        kitchen.update_details(title="garden")
+        with pytest.raises(DuplicateResourceError):
+            sqlite_project_repo.update_unique(kitchen)
+        garden.update_details(description="Same title")
+        sqlite_project_repo.update_unique(garden, expected_version=1)
+
+        assert sqlite_project_repo.get_by_title("kitchen").version == 1
+        assert sqlite_project_repo.get_by_title("garden").version == 2
+
+
+class TestSQLiteThreadSafety:
+    """Test sharing a file database between threads."""
+
+    def test_readers_see_committed_writes(self, tmp_path, monkeypatch):
+        """Test that reads on per-thread connections run alongside a writer."""
+        monkeypatch.setattr("src.todolist.config.settings.max_number_of_task", 1000)
+        connection = connect(str(tmp_path / "todo.db"))
+        repository = SQLiteTaskRepository(connection)
+        errors = []
+        counts = []
+
+        def read():
+            try:
+                for _ in range(50):
+                    counts.append(repository.count())
+                    list(repository.iter_all(limit=5))
+            except Exception as e:
+                errors.append(e)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for index in range(200):
+            repository.add(Task(title=f"Task {index}", project_id=1))
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+        assert all(0 <= count <= 200 for count in counts)
+        assert repository.count() == 200
+        assert len(list(repository.iter_all())) == 200
+        # One reading connection per reader thread, plus one for this thread
+        assert len(connection._readers) == 5
+        connection.close()
+
+
+class TestSQLiteServices:
+    """Test that the services run unchanged on the SQLite backend."""
+
+    def test_cascade_delete_through_services(self, sqlite_project_repo, sqlite_task_repo):
+        """Test project deletion cascades to stored tasks."""
+        project_service = ProjectService(sqlite_project_repo, sqlite_task_repo)
+        task_service = TaskService(sqlite_task_repo)
+
+        project = project_service.create_project("My Project")
+        task = task_service.create_task("Task 1", project.id)
+        task_service.update_task_status(task.id, TaskStatus.DOING.value)
+
+        summary = project_service.get_project_summary(project.id)
+        assert summary["status_breakdown"][TaskStatus.DOING.value] == 1
+
+        result = project_service.delete_project(project.id)
+        assert result["deleted_tasks"] == 1
+        assert task_service.count_tasks() == 0
@@ -0,0 +1,237 @@
+"""
+Unit tests for TaskQuery and query planning in the task repositories.
+"""
+
+import random
+import pytest
+from datetime import datetime, timedelta
+from src.todolist.models.task import Task, TaskStatus
+from src.todolist.config import settings
+from src.todolist.repositories.sqlite_database import connect
+from src.todolist.repositories.sqlite_task_repository import SQLiteTaskRepository
+from src.todolist.repositories.task_query import TaskQuery
+from src.todolist.repositories.task_repository import TaskRepository
+from src.todolist.utils.exceptions import ValidationError
+
+BASE = datetime(2030, 1, 1)
+WORDS = ["report", "budget", "review", "draft", "invoice", "meeting"]
+
+
+def make_tasks(count=300, seed=7):
+    """Build tasks with a mix of projects, statuses, deadlines and words."""
+    rng = random.Random(seed)
+    statuses = TaskStatus.values()
+    tasks = []
+    for number in range(count):
+        deadline = None if number % 4 == 0 else BASE + timedelta(days=rng.randrange(60))
+        task = Task(
+            title=f"{rng.choice(WORDS)} {rng.choice(WORDS)}",
+            project_id=rng.randrange(1, 6),
+            description=rng.choice(WORDS),
+            deadline=deadline,
+        )
+        task.status = rng.choice(statuses)
+        tasks.append(task)
+    return tasks
+
+
+def expected(tasks, task_query):
+    """Answer a query without indexes, for comparison."""
+    matches = [
+        task for task in tasks
+        if (task_query.project_id is None or task.project_id == task_query.project_id)
+        and (task_query.statuses is None or task.status in task_query.statuses)
+        and (task_query.deadline_start is None
+             or (task.deadline is not None and task.deadline >= task_query.deadline_start))
+        and (task_query.deadline_end is None
+             or (task.deadline is not None and task.deadline < task_query.deadline_end))
+    ]
+    sort_by = task_query.effective_sort
+    if sort_by == "deadline":
+        dated = [task for task in matches if task.deadline is not None]
+        undated = [task for task in matches if task.deadline is None]
+        dated.sort(key=lambda task: (task.deadline, task.id), reverse=task_query.descending)
+        undated.sort(key=lambda task: task.id, reverse=task_query.descending)
+        matches = dated + undated
+    else:
+        key = {
+            "id": lambda task: task.id,
+            "title": lambda task: (task.title.casefold(), task.id),
+            "created_at": lambda task: (task.created_at, task.id),
+        }[sort_by]
+        matches.sort(key=key, reverse=task_query.descending)
+
+    stop = None if task_query.max_results is None else task_query.skip + task_query.max_results
+    return [task.id for task in matches[task_query.skip:stop]]
+
+
+QUERIES = [
+    TaskQuery(),
+    TaskQuery().order_by("id", descending=True).limit(7).offset(3),
+    TaskQuery().in_project(2),
+    TaskQuery().in_project(2).with_status("DOING").order_by("deadline").limit(5),
+    TaskQuery().with_status("TODO", "DONE").order_by("title").offset(10).limit(10),
+    TaskQuery().due_between(BASE + timedelta(days=10), BASE + timedelta(days=12)),
+    TaskQuery().due_between(BASE + timedelta(days=5), BASE + timedelta(days=40))
+    .with_status("DOING").order_by("deadline", descending=True).limit(8),
+    TaskQuery().due_between(start=BASE + timedelta(days=30)).order_by("created_at"),
+    TaskQuery().in_project(4).order_by("deadline", descending=True),
+    TaskQuery().in_project(99),
+]
+
+
+@pytest.fixture(params=["memory", "compact", "sqlite"])
+def repository(request, monkeypatch):
+    """Provide each task repository implementation."""
+    monkeypatch.setattr(settings, "max_number_of_task", 1000)
+    if request.param == "sqlite":
+        connection = connect(":memory:")
+        yield SQLiteTaskRepository(connection)
+        connection.close()
+    else:
+        yield TaskRepository(compact_models=request.param == "compact")
+
+
+@pytest.fixture
+def connection():
+    """Provide an in-memory SQLite connection with the schema."""
+    connection = connect(":memory:")
+    yield connection
+    connection.close()
+
+
+class TestTaskQuery:
+    """Test suite for the TaskQuery builder."""
+
+    def test_builder_returns_new_queries(self):
+        """Test that builder methods leave the original query unchanged."""
+        base = TaskQuery().in_project(1)
+        limited = base.limit(5)
+
+        assert base.max_results is None
+        assert limited.project_id == 1
+        assert limited.max_results == 5
+
+    def test_effective_sort(self):
+        """Test the default sort with and without a text filter."""
+        assert TaskQuery().effective_sort == "id"
+        assert TaskQuery().matching("report").effective_sort == "relevance"
+        assert TaskQuery().matching("report").order_by("id").effective_sort == "id"
+
+    @pytest.mark.parametrize("build", [
+        lambda: TaskQuery().with_status("LATER"),
+        lambda: TaskQuery().with_status(),
+        lambda: TaskQuery().matching("  "),
+        lambda: TaskQuery().order_by("priority"),
+        lambda: TaskQuery().limit(0),
+        lambda: TaskQuery().offset(-1),
+        lambda: TaskQuery().due_between(BASE, BASE - timedelta(days=1)),
+    ])
+    def test_invalid_arguments(self, build):
+        """Test that invalid builder arguments are rejected."""
+        with pytest.raises(ValidationError):
+            build()
+
+    def test_relevance_requires_text(self, task_repo):
+        """Test that relevance sorting without text is rejected."""
+        with pytest.raises(ValidationError):
+            task_repo.query(TaskQuery().order_by("relevance"))
+
+
+class TestQueryExecution:
+    """Test suite for running queries against the repositories."""
+
+    @pytest.mark.parametrize("task_query", QUERIES)
+    def test_matches_unindexed_answer(self, repository, task_query):
+        """Test that every backend returns the same rows as a plain filter."""
+        tasks = make_tasks()
+        repository.add_many(tasks)
+
+        result = [task.id for task in repository.query(task_query)]
+
+        assert result == expected(tasks, task_query)
+
+    def test_text_filter(self, repository):
+        """Test text queries alone and combined with other filters."""
+        tasks = [
+            Task(title="Budget report", project_id=1, description="report"),
+            Task(title="Budget review", project_id=1),
+            Task(title="Report", project_id=2),
+            Task(title="Invoice", project_id=1, description="report"),
+        ]
+        repository.add_many(tasks)
+
+        ranked = repository.query(TaskQuery().matching("report"))
+        in_project = repository.query(TaskQuery().matching("report").in_project(1).order_by("id"))
+
+        assert {task.id for task in ranked} == {tasks[0].id, tasks[2].id, tasks[3].id}
+        assert [task.id for task in in_project] == [tasks[0].id, tasks[3].id]
+
+    def test_sqlite_text_filter_without_fts(self, connection):
+        """Test that SQLite text queries work without the FTS5 index."""
+        repository = SQLiteTaskRepository(connection)
+        repository._has_search_index = False
+        repository.add_many([
+            Task(title="Budget report", project_id=1),
+            Task(title="Report", project_id=2),
+        ])
+
+        tasks = repository.query(TaskQuery().matching("report").in_project(1))
+
+        assert [task.title for task in tasks] == ["Budget report"]
+        assert repository.get_query_stats()["recent"][0].plan.endswith("text index scan")
+
+    def test_query_follows_updates(self, task_repo):
+        """Test that queries see tasks moved between projects and statuses."""
+        task = task_repo.add(Task(title="Moving task", project_id=1))
+        task.project_id = 2
+        task.status = TaskStatus.DONE.value
+        task_repo.update(task)
+
+        assert task_repo.query(TaskQuery().in_project(1)) == []
+        assert task_repo.query(TaskQuery().in_project(2).with_status("DONE")) == [task]
+
+
+class TestQueryPlanning:
+    """Test suite for plan selection and query statistics."""
+
+    def test_most_selective_index_drives_query(self, task_repo):
+        """Test that the index with the fewest matches is chosen."""
+        task_repo.add_many([Task(title=f"Task {n}", project_id=1) for n in range(20)])
+        task_repo.add(Task(title="Other", project_id=2))
+
+        task_repo.query(TaskQuery().in_project(2).with_status("TODO"))
+        task_repo.query(TaskQuery().in_project(1).with_status("DONE"))
+        task_repo.query(TaskQuery())
+
+        stats = task_repo.get_query_stats()
+        assert stats["plans"] == {"project": 1, "status": 1, "scan": 1}
+        first = stats["recent"][0]
+        assert first.estimates == {"project": 1, "status": 21}
+        assert first.candidates == 1
+        assert first.returned == 1
+
+    def test_deadline_ordered_scan_stops_early(self, task_repo):
+        """Test that a deadline-sorted range query stops after the limit."""
+        task_repo.add_many([
+            Task(title=f"Task {n}", project_id=1, deadline=BASE + timedelta(hours=n))
+            for n in range(50)
+        ])
+
+        tasks = task_repo.query(
+            TaskQuery().due_between(BASE, BASE + timedelta(hours=10)).order_by("deadline").limit(3)
+        )
+
+        assert [task.deadline for task in tasks] == [BASE + timedelta(hours=n) for n in range(3)]
+        assert task_repo.get_query_stats()["recent"][-1].candidates == 3
+
+    def test_sqlite_reports_database_plan(self, repository):
+        """Test that every backend records a plan per query."""
+        repository.add(Task(title="Task", project_id=1))
+
+        repository.query(TaskQuery().in_project(1))
+
+        stats = repository.get_query_stats()
+        assert sum(stats["plans"].values()) == 1
+        if isinstance(repository, SQLiteTaskRepository):
+            assert "idx_tasks_project_id" in stats["recent"][0].plan
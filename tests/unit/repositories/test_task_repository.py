@@ -2,10 +2,16 @@
 Unit tests for TaskRepository.
 """
 
+import copy
 import pytest
-from src.todolist.models.task import Task
+from datetime import datetime, timedelta
+from src.todolist.models.task import Task, TaskStatus
 from src.todolist.repositories.task_repository import TaskRepository
-from src.todolist.utils.exceptions import ResourceNotFoundError
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    ResourceNotFoundError,
+    VersionConflictError,
+)
 
 
 class TestTaskRepository:
@@ -24,6 +30,17 @@ class TestTaskRepository:
         assert retrieved.id == sample_task.id
         assert retrieved.title == sample_task.title
 
+    def test_add_duplicate_id(self, task_repo, sample_task):
+        """Test that adding a stored ID is rejected like on the SQLite backend."""
+        task_repo.add(sample_task)
+        other = Task(title="Other", project_id=1)
+
+        with pytest.raises(DuplicateResourceError):
+            task_repo.add(copy.copy(sample_task))
+        with pytest.raises(DuplicateResourceError):
+            task_repo.add_many([other, other])
+        assert task_repo.count() == 1
+
     def test_get_by_id_not_exists(self, task_repo):
         """Test getting task by ID when it doesn't exist."""
         with pytest.raises(ResourceNotFoundError):
@@ -66,6 +83,29 @@ class TestTaskRepository:
         updated = task_repo.update(sample_task)
         assert updated.title == "Updated Title"
 
+    def test_update_increments_version(self, task_repo, sample_task):
+        """Test that every update stores a new version."""
+        task_repo.add(sample_task)
+
+        task_repo.update(sample_task)
+        updated = task_repo.update(sample_task, expected_version=2)
+
+        assert updated.version == 3
+        assert task_repo.get_by_id(sample_task.id).version == 3
+
+    def test_update_with_stale_version_conflicts(self, task_repo, sample_task):
+        """Test that an update based on an outdated copy is rejected."""
+        task_repo.add(sample_task)
+        stale = copy.copy(sample_task)
+        task_repo.update(sample_task, expected_version=1)
+
+        stale.title = "Stale title"
+        with pytest.raises(VersionConflictError) as excinfo:
+            task_repo.update(stale, expected_version=1)
+
+        assert excinfo.value.actual_version == 2
+        assert task_repo.get_by_id(sample_task.id).title == "Test Task"
+
     def test_update_non_existent(self, task_repo):
         """Test updating non-existent task raises error."""
         task = Task(title="Test", project_id=1)
@@ -122,3 +162,228 @@ class TestTaskRepository:
         task_repo.add(task2)
         task_repo.clear()
         assert task_repo.count() == 0
+
+    def test_count_by_project_id(self, task_repo):
+        """Test counting tasks per project."""
+        task_repo.add(Task(title="Task 1", project_id=1))
+        task_repo.add(Task(title="Task 2", project_id=1))
+        task_repo.add(Task(title="Task 3", project_id=2))
+
+        assert task_repo.count_by_project_id(1) == 2
+        assert task_repo.count_by_project_id(2) == 1
+        assert task_repo.count_by_project_id(999) == 0
+
+    def test_project_index_follows_project_change(self, task_repo):
+        """Test that moving a task to another project updates the index."""
+        task = Task(title="Task 1", project_id=1)
+        task_repo.add(task)
+
+        task.project_id = 2
+        task_repo.update(task)
+
+        assert task_repo.get_by_project_id(1) == []
+        assert task_repo.get_by_project_id(2) == [task]
+        assert task_repo.count_by_project_id(1) == 0
+        assert task_repo.count_by_project_id(2) == 1
+
+    def test_project_index_after_delete(self, task_repo):
+        """Test that deleted tasks disappear from the project index."""
+        task1 = Task(title="Task 1", project_id=1)
+        task2 = Task(title="Task 2", project_id=1)
+        task_repo.add(task1)
+        task_repo.add(task2)
+
+        task_repo.delete(task1.id)
+
+        assert task_repo.get_by_project_id(1) == [task2]
+        assert task_repo.delete_by_project_id(1) == 1
+        assert task_repo.count_by_project_id(1) == 0
+
+    def test_project_index_after_clear(self, task_repo):
+        """Test that clearing the repository resets the project index."""
+        task_repo.add(Task(title="Task 1", project_id=1))
+        task_repo.clear()
+
+        assert task_repo.get_by_project_id(1) == []
+        assert task_repo.count_by_project_id(1) == 0
+
+    def test_get_by_status(self, task_repo):
+        """Test getting tasks by status."""
+        task1 = Task(title="Task 1", project_id=1)
+        task2 = Task(title="Task 2", project_id=1, status=TaskStatus.DONE.value)
+        task_repo.add(task1)
+        task_repo.add(task2)
+
+        assert task_repo.get_by_status(TaskStatus.TODO.value) == [task1]
+        assert task_repo.get_by_status(TaskStatus.DONE.value) == [task2]
+        assert task_repo.get_by_status(TaskStatus.DOING.value) == []
+
+    def test_count_by_status_tracks_transitions(self, task_repo):
+        """Test that status counters follow status updates and deletes."""
+        task1 = Task(title="Task 1", project_id=1)
+        task2 = Task(title="Task 2", project_id=1)
+        task_repo.add(task1)
+        task_repo.add(task2)
+
+        task1.update_status(TaskStatus.DOING.value)
+        task_repo.update(task1)
+
+        assert task_repo.count_by_status() == {
+            TaskStatus.TODO.value: 1,
+            TaskStatus.DOING.value: 1,
+            TaskStatus.DONE.value: 0,
+        }
+
+        task_repo.delete(task2.id)
+        task_repo.delete_by_project_id(1)
+
+        assert task_repo.count_by_status() == {
+            TaskStatus.TODO.value: 0,
+            TaskStatus.DOING.value: 0,
+            TaskStatus.DONE.value: 0,
+        }
+
+    def test_count_by_status_in_project_tracks_writes(self, task_repo):
+        """Test that per-project status counts follow every write path."""
+        task1 = Task(title="Task 1", project_id=1)
+        task2 = Task(title="Task 2", project_id=1)
+        task3 = Task(title="Task 3", project_id=2, status=TaskStatus.DOING.value)
+        task_repo.add_many([task1, task2, task3])
+
+        task1.update_status(TaskStatus.DONE.value)
+        task_repo.update(task1)
+        moved = copy.copy(task2)
+        moved.project_id = 2
+        task_repo.update(moved)
+
+        assert task_repo.count_by_status_in_project(1) == {"TODO": 0, "DOING": 0, "DONE": 1}
+        assert task_repo.count_by_status_in_project(2) == {"TODO": 1, "DOING": 1, "DONE": 0}
+
+        task_repo.delete(task1.id)
+        task_repo.delete_by_project_id(2)
+
+        assert task_repo.count_by_status_in_project(1) == {"TODO": 0, "DOING": 0, "DONE": 0}
+        assert task_repo.count_by_status_in_project(2) == {"TODO": 0, "DOING": 0, "DONE": 0}
+        assert task_repo._status_counts_by_project == {}
+
+    def test_get_by_deadline_range(self, task_repo):
+        """Test range queries over the deadline index."""
+        base = datetime.now() + timedelta(days=1)
+        early = Task(title="Early", project_id=1, deadline=base)
+        middle = Task(title="Middle", project_id=1, deadline=base + timedelta(days=1))
+        late = Task(title="Late", project_id=1, deadline=base + timedelta(days=2))
+        no_deadline = Task(title="Whenever", project_id=1)
+        for task in (late, no_deadline, early, middle):
+            task_repo.add(task)
+
+        assert task_repo.get_by_deadline_range() == [early, middle, late]
+        assert task_repo.get_by_deadline_range(
+            start=base + timedelta(hours=1), end=base + timedelta(days=2)
+        ) == [middle]
+        assert task_repo.get_by_deadline_range(limit=2) == [early, middle]
+        assert task_repo.get_by_deadline_range(
+            statuses={TaskStatus.DONE.value}
+        ) == []
+
+    def test_deadline_index_follows_updates_and_deletes(self, task_repo):
+        """Test that deadline changes and deletes keep the index ordered."""
+        base = datetime.now() + timedelta(days=1)
+        task1 = Task(title="Task 1", project_id=1, deadline=base)
+        task2 = Task(title="Task 2", project_id=1, deadline=base + timedelta(days=1))
+        task_repo.add(task1)
+        task_repo.add(task2)
+
+        task1.update_details(deadline=base + timedelta(days=3))
+        task_repo.update(task1)
+        assert task_repo.get_by_deadline_range() == [task2, task1]
+
+        task_repo.delete(task2.id)
+        assert task_repo.get_by_deadline_range() == [task1]
+
+    def test_deadline_range_by_status(self, task_repo):
+        """Test that status filters follow status changes and merge in deadline order."""
+        base = datetime.now() + timedelta(days=1)
+        tasks = [
+            Task(title=f"Task {days}", project_id=1, deadline=base + timedelta(days=days))
+            for days in range(4)
+        ]
+        task_repo.add_many(tasks)
+        tasks[1].update_status(TaskStatus.DONE.value)
+        task_repo.update(tasks[1])
+        tasks[2].update_status(TaskStatus.DOING.value)
+        task_repo.update(tasks[2])
+
+        open_statuses = {TaskStatus.TODO.value, TaskStatus.DOING.value}
+        assert task_repo.get_by_deadline_range(statuses=open_statuses) == [
+            tasks[0], tasks[2], tasks[3]
+        ]
+        assert task_repo.get_by_deadline_range(
+            start=base + timedelta(hours=1), limit=1, statuses=open_statuses
+        ) == [tasks[2]]
+        assert task_repo.get_by_deadline_range(statuses={TaskStatus.DONE.value}) == [tasks[1]]
+        assert task_repo.get_by_deadline_range(statuses=set()) == []
+
+    def test_add_many(self, task_repo):
+        """Test adding a batch of tasks."""
+        tasks = [Task(title=f"Task {i}", project_id=1) for i in range(3)]
+
+        task_repo.add_many(tasks)
+
+        assert task_repo.count() == 3
+        assert task_repo.count_by_project_id(1) == 3
+
+    def test_iter_all_with_cursor(self, task_repo):
+        """Test iterating tasks by ID from a cursor with a limit."""
+        tasks = task_repo.add_many([Task(title=f"Task {i}", project_id=1) for i in range(5)])
+
+        assert list(task_repo.iter_all()) == tasks
+        assert list(task_repo.iter_all(after_id=tasks[1].id, limit=2)) == tasks[2:4]
+        assert list(task_repo.iter_all(after_id=tasks[-1].id)) == []
+
+    def test_iter_all_survives_deletes(self, task_repo):
+        """Test deleting tasks while iterating neither repeats nor breaks."""
+        tasks = task_repo.add_many([Task(title=f"Task {i}", project_id=1) for i in range(4)])
+
+        seen = []
+        for task in task_repo.iter_all():
+            seen.append(task)
+            if task is tasks[0]:
+                task_repo.delete(tasks[0].id)
+                task_repo.delete(tasks[2].id)
+
+        assert seen == [tasks[0], tasks[1], tasks[3]]
+
+    def test_iter_by_project_id(self, task_repo):
+        """Test iterating one project's tasks from a cursor."""
+        tasks = task_repo.add_many([
+            Task(title=f"Task {i}", project_id=1 + i % 2) for i in range(6)
+        ])
+
+        assert list(task_repo.iter_by_project_id(1)) == tasks[0::2]
+        assert list(task_repo.iter_by_project_id(1, after_id=tasks[0].id, limit=1)) == [tasks[2]]
+
+    def test_cascade_delete_keeps_id_order(self, task_repo):
+        """Test cascade delete leaves the remaining tasks iterable in order."""
+        tasks = task_repo.add_many([
+            Task(title=f"Task {i}", project_id=1 + i % 2) for i in range(6)
+        ])
+
+        task_repo.delete_by_project_id(1)
+
+        assert list(task_repo.iter_all()) == tasks[1::2]
+
+    def test_search_follows_updates_and_deletes(self, task_repo):
+        """Test the text index tracks in-place edits and deletions."""
+        task1 = task_repo.add(Task(title="Write report", project_id=1))
+        task2 = task_repo.add(Task(title="Review report", project_id=2))
+
+        assert task_repo.search("report") == [task1, task2]
+        assert task_repo.search("report", project_id=2) == [task2]
+
+        task1.update_details(title="Write summary")
+        task_repo.update(task1)
+        assert task_repo.search("report") == [task2]
+        assert task_repo.search("summ*") == [task1]
+
+        task_repo.delete(task2.id)
+        assert task_repo.search("report") == []
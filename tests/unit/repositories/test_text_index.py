@@ -0,0 +1,72 @@
+"""
+Unit tests for the inverted full-text index.
+"""
+
+from src.todolist.repositories.text_index import TextIndex, parse_query, tokenize
+
+
+class TestTextIndex:
+    """Test suite for TextIndex."""
+
+    def test_tokenize_and_parse_query(self):
+        """Test terms are case-folded and queries split into OR groups."""
+        assert tokenize("Write the RÉSUMÉ, today!") == ["write", "the", "résumé", "today"]
+        assert parse_query("report draft OR summ*") == [
+            [("report", False), ("draft", False)],
+            [("summ", True)],
+        ]
+
+    def test_and_or_prefix(self):
+        """Test AND, OR and prefix matching."""
+        index = TextIndex()
+        index.add(1, "Quarterly report", "first draft")
+        index.add(2, "Report summary", "")
+        index.add(3, "Groceries", "milk and bread")
+
+        assert index.search("report draft") == [1]
+        assert sorted(index.search("draft OR milk")) == [1, 3]
+        assert index.search("summ*") == [2]
+        assert index.search("missing") == []
+
+    def test_ranking_prefers_title_matches(self):
+        """Test a title match outranks a description match."""
+        index = TextIndex()
+        index.add(1, "Plan", "budget meeting")
+        index.add(2, "Budget", "plan")
+
+        assert index.search("budget") == [2, 1]
+        assert index.search("budget", limit=1) == [2]
+
+    def test_reindex_and_remove(self):
+        """Test changed text replaces old terms and removal drops them."""
+        index = TextIndex()
+        index.add(1, "Old title", "")
+        index.add(1, "New title", "")
+
+        assert index.search("old") == []
+        assert index.search("new") == [1]
+
+        index.remove(1)
+        assert index.search("title") == []
+        assert len(index) == 0
+
+    def test_accept_filter(self):
+        """Test the extra filter limits results."""
+        index = TextIndex()
+        index.add(1, "Task", "")
+        index.add(2, "Task", "")
+
+        assert index.search("task", accept=lambda doc_id: doc_id == 2) == [2]
+
+    def test_prefix_search_after_bulk_adds_and_removes(self):
+        """Test that terms added in bulk are found by prefix and can be removed."""
+        index = TextIndex()
+        for doc_id in range(1, 201):
+            index.add(doc_id, f"Task {doc_id}", "")
+        index.remove(150)
+        index.add(201, "Task 15x", "")
+
+        assert sorted(index.search("15*")) == [15, 151, 152, 153, 154, 155, 156, 157, 158, 159, 201]
+        index.remove(201)
+        assert index.search("15x") == []
+        assert sorted(index.search("15*")) == [15, 151, 152, 153, 154, 155, 156, 157, 158, 159]
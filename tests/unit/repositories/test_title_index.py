@@ -0,0 +1,63 @@
+"""
+Unit tests for the prefix and fuzzy title index.
+"""
+
+from src.todolist.repositories.title_index import TitleIndex
+
+
+class TestTitleIndex:
+    """Test suite for TitleIndex."""
+
+    def test_find_prefix(self):
+        """Test prefix matches on the title and on later words."""
+        index = TitleIndex()
+        index.add(1, "Groceries")
+        index.add(2, "Weekly groceries")
+        index.add(3, "Garden")
+
+        assert index.find_prefix("gro") == [1, 2]
+        assert index.find_prefix("WEEK") == [2]
+        assert index.find_prefix("gx") == []
+
+    def test_find_prefix_prefers_shorter_titles(self):
+        """Test shorter completions come first and the limit applies."""
+        index = TitleIndex()
+        index.add(1, "Home renovation")
+        index.add(2, "Home")
+        index.add(3, "Homework")
+
+        assert index.find_prefix("home") == [2, 3, 1]
+        assert index.find_prefix("home", limit=2) == [2, 3]
+
+    def test_find_similar(self):
+        """Test misspelled titles are found by trigram similarity."""
+        index = TitleIndex()
+        index.add(1, "Vacation planning")
+        index.add(2, "Tax return")
+
+        matches = index.find_similar("vacaton planing")
+
+        assert [doc_id for doc_id, _ in matches] == [1]
+        assert 0 < matches[0][1] <= 1
+
+    def test_find_combines_prefix_and_fuzzy(self):
+        """Test prefix candidates come before fuzzy ones."""
+        index = TitleIndex()
+        index.add(1, "Marketing")
+        index.add(2, "Market research")
+
+        assert index.find("market") == [1, 2]
+        assert index.find("reserch") == [2]
+
+    def test_rename_and_remove(self):
+        """Test renaming replaces old entries and removal prunes them."""
+        index = TitleIndex()
+        index.add(1, "Old name")
+        index.add(1, "New name")
+
+        assert index.find_prefix("old") == []
+        assert index.find_prefix("new") == [1]
+
+        index.remove(1)
+        assert index.find("new name") == []
+        assert len(index) == 0
@@ -0,0 +1,225 @@
+"""
+Unit tests for AsyncTaskService and AsyncProjectService.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from src.todolist.models.task import TaskStatus
+from src.todolist.repositories.async_repository import (
+    AsyncProjectRepositoryAdapter,
+    AsyncTaskRepositoryAdapter,
+    InMemoryAsyncProjectRepository,
+    InMemoryAsyncTaskRepository,
+    ThreadPoolRunner,
+)
+from src.todolist.repositories.sqlite_database import connect
+from src.todolist.repositories.sqlite_project_repository import SQLiteProjectRepository
+from src.todolist.repositories.sqlite_task_repository import SQLiteTaskRepository
+from src.todolist.repositories.task_query import TaskQuery
+from src.todolist.services.async_project_service import AsyncProjectService
+from src.todolist.services.async_task_service import AsyncTaskService
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    ResourceNotFoundError,
+    ValidationError,
+    VersionConflictError,
+)
+
+
+@pytest.fixture
+def async_services():
+    """Provide async services on in-memory repositories."""
+    project_repo = InMemoryAsyncProjectRepository()
+    task_repo = InMemoryAsyncTaskRepository()
+    return AsyncProjectService(project_repo, task_repo), AsyncTaskService(task_repo)
+
+
+@pytest.fixture
+def sqlite_async_services():
+    """Provide async services on SQLite repositories run in a thread pool."""
+    connection = connect(":memory:")
+    runner = ThreadPoolRunner(max_workers=2)
+    project_repo = AsyncProjectRepositoryAdapter(SQLiteProjectRepository(connection), runner)
+    task_repo = AsyncTaskRepositoryAdapter(SQLiteTaskRepository(connection), runner)
+    yield AsyncProjectService(project_repo, task_repo), AsyncTaskService(task_repo)
+    runner.shutdown()
+    connection.close()
+
+
+class TestAsyncServices:
+    """Test suite for the async services."""
+
+    def test_create_and_get(self, async_services):
+        """Test creating and reading back a project and a task."""
+        project_service, task_service = async_services
+
+        async def scenario():
+            project = await project_service.create_project("Async project")
+            task = await task_service.create_task("Async task", project.id)
+            return project, task, await task_service.get_task(task.id)
+
+        project, task, fetched = asyncio.run(scenario())
+
+        assert fetched == task
+        assert task.project_id == project.id
+
+    def test_concurrent_duplicate_titles(self, sqlite_async_services):
+        """Test that only one of many concurrent creates with a title wins."""
+        project_service, _ = sqlite_async_services
+
+        async def scenario():
+            return await asyncio.gather(
+                *(project_service.create_project("Shared title") for _ in range(20)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(scenario())
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        assert len(errors) == 19
+        assert all(isinstance(error, DuplicateResourceError) for error in errors)
+
+    def test_concurrent_renames_and_creates(self, sqlite_async_services, monkeypatch):
+        """Test that renames and creates on pool threads never share a title."""
+        project_service, _ = sqlite_async_services
+        repository = project_service._project_repo._repository
+        get_by_title = repository.get_by_title
+
+        def slow_get_by_title(title):
+            # Widen the window between a title check and the write
+            project = get_by_title(title)
+            time.sleep(0.05)
+            return project
+
+        monkeypatch.setattr(repository, "get_by_title", slow_get_by_title)
+
+        async def create_later():
+            # Lands while the first rename is between its check and its write
+            await asyncio.sleep(0.02)
+            return await project_service.create_project("shared TITLE")
+
+        async def scenario():
+            projects = [await project_service.create_project(f"Project {i}") for i in range(3)]
+            await asyncio.gather(
+                *(project_service.update_project(project.id, title="Shared title") for project in projects),
+                create_later(),
+                return_exceptions=True,
+            )
+            return await project_service.get_all_projects()
+
+        projects = asyncio.run(scenario())
+
+        assert [project.title.casefold() for project in projects].count("shared title") == 1
+
+    def test_rename_checks_title(self, async_services):
+        """Test that a rename is checked against the other titles and stored once."""
+        project_service, _ = async_services
+
+        async def scenario():
+            first = await project_service.create_project("First")
+            await project_service.create_project("Second")
+            with pytest.raises(DuplicateResourceError):
+                await project_service.update_project(first.id, title="second")
+            return await project_service.update_project(first.id, title="Renamed")
+
+        renamed = asyncio.run(scenario())
+
+        assert (renamed.title, renamed.version) == ("Renamed", 2)
+
+    def test_cascade_delete(self, sqlite_async_services):
+        """Test that deleting a project deletes its tasks."""
+        project_service, task_service = sqlite_async_services
+
+        async def scenario():
+            project = await project_service.create_project("Doomed")
+            await task_service.create_tasks(
+                {"title": f"Task {i}", "project_id": project.id} for i in range(3)
+            )
+            result = await project_service.delete_project(project.id)
+            return result, await task_service.count_tasks()
+
+        result, remaining = asyncio.run(scenario())
+
+        assert result["deleted_tasks"] == 3
+        assert remaining == 0
+
+    def test_errors_match_sync_services(self, async_services):
+        """Test that validation and lookup errors are raised as in the sync services."""
+        project_service, task_service = async_services
+
+        with pytest.raises(ResourceNotFoundError):
+            asyncio.run(project_service.get_project(999))
+        with pytest.raises(ValidationError):
+            asyncio.run(task_service.create_task("", 1))
+        with pytest.raises(ValidationError):
+            asyncio.run(task_service.get_tasks_by_status("LATER"))
+
+    def test_pages_search_and_queries(self, sqlite_async_services):
+        """Test paged, searched and composed reads through the thread pool."""
+        project_service, task_service = sqlite_async_services
+
+        async def scenario():
+            project = await project_service.create_project("Reports")
+            for i in range(3):
+                await task_service.create_task(f"Report {i}", project.id)
+            await task_service.update_task_status(1, TaskStatus.DONE.value)
+            return (
+                await task_service.get_tasks_page(limit=2),
+                await task_service.search("report"),
+                await task_service.query_tasks(TaskQuery().with_status("TODO")),
+                await project_service.get_project_summary(project.id),
+            )
+
+        page, found, todo, summary = asyncio.run(scenario())
+
+        assert page["next_after_id"] == 2
+        assert len(found) == 3
+        assert [task.id for task in todo] == [2, 3]
+        assert summary["status_breakdown"][TaskStatus.DONE.value] == 1
+
+    def test_many_requests_on_bounded_pool(self, sqlite_async_services):
+        """Test that thousands of concurrent calls share a fixed set of threads."""
+        project_service, task_service = sqlite_async_services
+        threads_before = threading.active_count()
+
+        async def scenario():
+            project = await project_service.create_project("Busy")
+            task = await task_service.create_task("Hot task", project.id)
+            results = await asyncio.gather(
+                *(task_service.get_task(task.id) for _ in range(2000))
+            )
+            return task, results, threading.active_count()
+
+        task, results, threads_during = asyncio.run(scenario())
+
+        assert all(result.id == task.id for result in results)
+        assert threads_during - threads_before <= 2
+
+    def test_concurrent_updates_keep_every_change(self, sqlite_async_services):
+        """Test that concurrent optimistic updates retry instead of losing changes."""
+        project_service, task_service = sqlite_async_services
+
+        async def scenario():
+            project = await project_service.create_project("Contended")
+            task = await task_service.create_task("Hot task", project.id)
+            await asyncio.gather(
+                *(
+                    task_service.modify_task(
+                        task.id,
+                        lambda task, word=f"w{i}": task.update_details(
+                            description=f"{task.description} {word}".strip()
+                        ),
+                    )
+                    for i in range(20)
+                )
+            )
+            with pytest.raises(VersionConflictError):
+                await task_service.update_task(task.id, title="Stale", expected_version=1)
+            return await task_service.get_task(task.id)
+
+        task = asyncio.run(scenario())
+
+        assert sorted(task.description.split()) == sorted(f"w{i}" for i in range(20))
+        assert task.version == 21
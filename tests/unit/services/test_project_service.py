@@ -0,0 +1,187 @@
+"""
+Unit tests for ProjectService.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from src.todolist.utils.exceptions import (
+    DuplicateResourceError,
+    ResourceNotFoundError,
+    ValidationError,
+    VersionConflictError,
+)
+
+
+class TestProjectService:
+    """Test ProjectService functionality."""
+
+    def test_create_project(self, project_service):
+        """Test creating a project through service."""
+        project = project_service.create_project("Service Project", "Description")
+
+        assert project.title == "Service Project"
+        assert project_service.count_projects() == 1
+
+    def test_create_project_duplicate_title(self, project_service):
+        """Test creating a project with an existing title raises error."""
+        project_service.create_project("Project")
+
+        with pytest.raises(DuplicateResourceError):
+            project_service.create_project("project")
+
+    def test_create_projects_bulk(self, project_service):
+        """Test creating projects in one batch with contiguous IDs."""
+        result = project_service.create_projects(
+            {"title": f"Project {i}"} for i in range(3)
+        )
+
+        ids = [project.id for project in result["created"]]
+        assert ids == list(range(ids[0], ids[0] + 3))
+        assert result["errors"] == []
+        assert project_service.count_projects() == 3
+
+    def test_create_projects_reports_duplicates(self, project_service):
+        """Test duplicates against the repository and within the batch are reported."""
+        project_service.create_project("Existing")
+
+        result = project_service.create_projects([
+            {"title": "existing"},
+            {"title": "New"},
+            {"title": "NEW"},
+            {"title": ""},
+        ])
+
+        assert [project.title for project in result["created"]] == ["New"]
+        errors = {error["index"]: error["error"] for error in result["errors"]}
+        assert isinstance(errors[0], DuplicateResourceError)
+        assert isinstance(errors[2], DuplicateResourceError)
+        assert isinstance(errors[3], ValidationError)
+        # Rejected items use no IDs
+        assert project_service.create_project("After").id == result["created"][0].id + 1
+
+    def test_get_projects_page(self, project_service):
+        """Test the projects page reports a cursor only while more remain."""
+        project_service.create_projects({"title": f"Project {i}"} for i in range(3))
+
+        first = project_service.get_projects_page(limit=2)
+        second = project_service.get_projects_page(limit=2, after_id=first["next_after_id"])
+
+        assert [project.title for project in first["items"]] == ["Project 0", "Project 1"]
+        assert [project.title for project in second["items"]] == ["Project 2"]
+        assert second["next_after_id"] is None
+
+    def test_find_projects(self, project_service):
+        """Test finding projects by prefix and by approximate title."""
+        project_service.create_projects([
+            {"title": "Home renovation"},
+            {"title": "Homework"},
+            {"title": "Tax return"},
+        ])
+
+        assert [p.title for p in project_service.find_projects("home")] == [
+            "Homework", "Home renovation",
+        ]
+        assert [p.title for p in project_service.find_projects("tax retrun")] == ["Tax return"]
+        assert len(project_service.find_projects("home", limit=1)) == 1
+        with pytest.raises(ValidationError):
+            project_service.find_projects("")
+
+    def test_concurrent_creates_with_same_title(self, project_service):
+        """Test that exactly one of many threads creating a title wins."""
+        def create(_):
+            try:
+                return project_service.create_project("Shared title")
+            except DuplicateResourceError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(create, range(32)))
+
+        errors = [result for result in results if isinstance(result, DuplicateResourceError)]
+        assert len(errors) == 31
+        assert project_service.count_projects() == 1
+
+    def test_project_summaries_follow_task_writes(self, project_service, task_service):
+        """Test that summaries reflect creates, status changes and deletes."""
+        launch = project_service.create_project("Launch")
+        empty = project_service.create_project("Empty")
+        tasks = [task_service.create_task(f"Task {i}", launch.id) for i in range(3)]
+        task_service.update_task_status(tasks[0].id, "DONE")
+        task_service.update_task_status(tasks[1].id, "DOING")
+        task_service.delete_task(tasks[2].id)
+
+        summary, empty_summary = project_service.get_project_summaries([launch, empty])
+
+        assert summary == project_service.get_project_summary(launch.id)
+        assert summary["total_tasks"] == 2
+        assert summary["status_breakdown"] == {"TODO": 0, "DOING": 1, "DONE": 1}
+        assert empty_summary["total_tasks"] == 0
+
+        task_service.delete_tasks_by_project(launch.id)
+        assert project_service.get_project_summary(launch.id)["total_tasks"] == 0
+        with pytest.raises(ResourceNotFoundError):
+            project_service.get_project_summary(999)
+
+    def test_concurrent_cascade_deletes(self, project_service, task_service):
+        """Test that a project deleted from several threads is deleted once with its tasks."""
+        project = project_service.create_project("Doomed")
+        task_service.create_tasks({"title": f"Task {i}", "project_id": project.id} for i in range(10))
+
+        def delete(_):
+            try:
+                return project_service.delete_project(project.id)["deleted_tasks"]
+            except ResourceNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(delete, range(8)))
+
+        assert sorted(results, key=lambda result: result is None)[:2] == [10, None]
+        assert results.count(None) == 7
+        assert task_service.count_tasks() == 0
+
+    def test_update_with_stale_version(self, project_service):
+        """Test that a project update based on an old version is rejected."""
+        sample_project = project_service.create_project("Versioned")
+        project_service.update_project(sample_project.id, description="First", expected_version=1)
+
+        with pytest.raises(VersionConflictError):
+            project_service.update_project(sample_project.id, description="Second", expected_version=1)
+        assert project_service.get_project(sample_project.id).description == "First"
+
+    def test_concurrent_renames_to_same_title(self, project_service):
+        """Test that only one of several projects can be renamed to a title."""
+        projects = [project_service.create_project(f"Project {i}") for i in range(8)]
+
+        def rename(project):
+            try:
+                return project_service.update_project(project.id, title="Shared title")
+            except DuplicateResourceError as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(rename, projects))
+
+        errors = [result for result in results if isinstance(result, DuplicateResourceError)]
+        assert len(errors) == 7
+        assert project_service.get_project_by_title("Shared title").version == 2
+
+    def test_rename_retries_without_holding_the_lock(self, project_service, project_repo, monkeypatch):
+        """Test that a conflicting rename backs off without holding the write lock."""
+        project = project_service.create_project("Original")
+        update_unique, conflicts, sleeps = project_repo.update_unique, [1], []
+
+        def conflicting_update(stale, expected_version=None):
+            if conflicts:
+                conflicts.pop()
+                raise VersionConflictError("Project", str(stale.id), expected_version, expected_version + 1)
+            return update_unique(stale, expected_version)
+
+        monkeypatch.setattr(project_repo, "update_unique", conflicting_update)
+        monkeypatch.setattr(
+            "src.todolist.services.optimistic.time.sleep",
+            lambda _: sleeps.append(project_repo._lock.owns_write()),
+        )
+
+        assert project_service.update_project(project.id, title="Renamed").title == "Renamed"
+        assert sleeps == [False]
@@ -3,10 +3,18 @@ Unit tests for TaskService.
 """
 
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from src.todolist.services.task_service import TaskService
 from src.todolist.models.task import TaskStatus
-from src.todolist.utils.exceptions import ResourceNotFoundError, ValidationError
+from src.todolist.repositories.task_query import TaskQuery
+from src.todolist.config import settings
+from src.todolist.utils.exceptions import (
+    LimitExceededError,
+    ResourceNotFoundError,
+    ValidationError,
+    VersionConflictError,
+)
 
 
 class TestTaskService:
@@ -136,3 +144,215 @@ class TestTaskService:
 
         with pytest.raises(ValidationError, match="cannot be in the past"):
             task_service.update_task(task.id, deadline=past_deadline)
+
+    def test_count_tasks_by_status(self, task_service, sample_project):
+        """Test counting tasks per status."""
+        task1 = task_service.create_task("Task 1", sample_project.id)
+        task_service.create_task("Task 2", sample_project.id)
+        task_service.update_task_status(task1.id, TaskStatus.DONE.value)
+
+        counts = task_service.count_tasks_by_status()
+
+        assert counts[TaskStatus.TODO.value] == 1
+        assert counts[TaskStatus.DOING.value] == 0
+        assert counts[TaskStatus.DONE.value] == 1
+
+    def test_get_tasks_due_between(self, task_service, sample_project):
+        """Test retrieving tasks due within a window."""
+        now = datetime.now()
+        soon = task_service.create_task(
+            "Soon", sample_project.id, deadline=now + timedelta(days=1)
+        )
+        task_service.create_task(
+            "Later", sample_project.id, deadline=now + timedelta(days=10)
+        )
+
+        due = task_service.get_tasks_due_between(now, now + timedelta(days=2))
+
+        assert due == [soon]
+
+    def test_get_tasks_due_between_invalid_window(self, task_service):
+        """Test that an inverted window raises error."""
+        now = datetime.now()
+        with pytest.raises(ValidationError):
+            task_service.get_tasks_due_between(now, now - timedelta(days=1))
+
+    def test_get_overdue_tasks(self, task_service, sample_project):
+        """Test that overdue tasks exclude finished ones."""
+        deadline = datetime.now() + timedelta(days=1)
+        open_task = task_service.create_task(
+            "Open", sample_project.id, deadline=deadline
+        )
+        done_task = task_service.create_task(
+            "Done", sample_project.id, deadline=deadline
+        )
+        task_service.update_task_status(done_task.id, TaskStatus.DONE.value)
+
+        assert task_service.get_overdue_tasks() == []
+        later = deadline + timedelta(days=1)
+        assert task_service.get_overdue_tasks(now=later) == [open_task]
+
+    def test_get_next_due_tasks(self, task_service, sample_project):
+        """Test retrieving the next N due tasks."""
+        now = datetime.now()
+        tasks = [
+            task_service.create_task(
+                f"Task {days}", sample_project.id, deadline=now + timedelta(days=days)
+            )
+            for days in (3, 1, 2)
+        ]
+
+        next_due = task_service.get_next_due_tasks(2, now=now)
+
+        assert next_due == [tasks[1], tasks[2]]
+        with pytest.raises(ValidationError):
+            task_service.get_next_due_tasks(0, now=now)
+
+    def test_create_tasks_bulk(self, task_service, sample_project):
+        """Test creating tasks in one batch with contiguous IDs."""
+        result = task_service.create_tasks(
+            {"title": f"Task {i}", "project_id": sample_project.id} for i in range(3)
+        )
+
+        ids = [task.id for task in result["created"]]
+        assert ids == list(range(ids[0], ids[0] + 3))
+        assert result["errors"] == []
+        assert task_service.count_tasks() == 3
+
+    def test_create_tasks_reports_invalid_items(self, task_service, sample_project):
+        """Test invalid items are reported per index and skipped."""
+        result = task_service.create_tasks([
+            {"title": "Valid", "project_id": sample_project.id},
+            {"title": "", "project_id": sample_project.id},
+            {"title": "Typo", "project": sample_project.id},
+        ])
+
+        assert [task.title for task in result["created"]] == ["Valid"]
+        assert [error["index"] for error in result["errors"]] == [1, 2]
+        assert all(isinstance(error["error"], ValidationError) for error in result["errors"])
+
+    def test_create_tasks_ids_and_timestamp_after_validation(self, task_service, sample_project):
+        """Test that rejected items use no IDs and the batch shares one timestamp."""
+        deadline = datetime.now() + timedelta(days=1)
+        result = task_service.create_tasks([
+            {"title": "First", "project_id": sample_project.id, "deadline": deadline},
+            {"title": "Late", "project_id": sample_project.id,
+             "deadline": datetime.now() - timedelta(days=1)},
+            {"title": "Second", "project_id": sample_project.id, "status": "DONE"},
+        ])
+        first, second = result["created"]
+        after = task_service.create_task("After", sample_project.id)
+
+        assert [first.id + 1, second.id + 1] == [second.id, after.id]
+        assert first.created_at == first.updated_at == second.created_at
+        assert (first.deadline, second.status) == (deadline, "DONE")
+        assert [error["index"] for error in result["errors"]] == [1]
+
+    def test_create_tasks_over_limit_inserts_nothing(
+        self, task_service, sample_project, monkeypatch
+    ):
+        """Test a batch exceeding the task limit is rejected as a whole."""
+        monkeypatch.setattr(settings, "max_number_of_task", 2)
+
+        with pytest.raises(LimitExceededError):
+            task_service.create_tasks(
+                {"title": f"Task {i}", "project_id": sample_project.id} for i in range(3)
+            )
+
+        assert task_service.count_tasks() == 0
+
+    def test_get_tasks_page(self, task_service, sample_project):
+        """Test walking through tasks page by page with the returned cursor."""
+        task_service.create_tasks(
+            {"title": f"Task {i}", "project_id": sample_project.id} for i in range(5)
+        )
+
+        titles = []
+        after_id = None
+        while True:
+            page = task_service.get_tasks_page(limit=2, after_id=after_id)
+            titles.extend(task.title for task in page["items"])
+            after_id = page["next_after_id"]
+            if after_id is None:
+                break
+
+        assert titles == [f"Task {i}" for i in range(5)]
+        with pytest.raises(ValidationError):
+            task_service.get_tasks_page(limit=0)
+
+    def test_get_tasks_page_by_project(self, task_service):
+        """Test paging is limited to one project when requested."""
+        task_service.create_tasks(
+            {"title": f"Task {i}", "project_id": 1 + i % 2} for i in range(4)
+        )
+
+        page = task_service.get_tasks_page(limit=5, project_id=2)
+
+        assert [task.title for task in page["items"]] == ["Task 1", "Task 3"]
+        assert page["next_after_id"] is None
+
+    def test_search(self, task_service, sample_project):
+        """Test searching tasks through the service."""
+        task = task_service.create_task("Prepare budget", sample_project.id)
+        task_service.create_task("Buy milk", sample_project.id)
+
+        assert task_service.search("BUDGET") == [task]
+        assert task_service.search("budget", status=TaskStatus.DONE.value) == []
+        with pytest.raises(ValidationError):
+            task_service.search("  ")
+        with pytest.raises(ValidationError):
+            task_service.search("budget", status="LATER")
+
+    def test_query_tasks(self, task_service):
+        """Test running a composed query and reading its statistics."""
+        first = task_service.create_task("Write report", 1, deadline=datetime(2030, 1, 3))
+        task_service.create_task("Review report", 2, deadline=datetime(2030, 1, 2))
+        second = task_service.create_task("Send report", 1, deadline=datetime(2030, 1, 1))
+        second = task_service.update_task_status(second.id, TaskStatus.DOING.value)
+        first = task_service.update_task_status(first.id, TaskStatus.DOING.value)
+
+        tasks = task_service.query_tasks(
+            TaskQuery().in_project(1).with_status("DOING").order_by("deadline").limit(20)
+        )
+
+        assert tasks == [second, first]
+        assert task_service.get_query_stats()["plans"] == {"project": 1}
+        with pytest.raises(ValidationError):
+            task_service.query_tasks({"project_id": 1})
+
+    def test_update_returns_new_version(self, task_service, sample_project):
+        """Test that updates store a new version and leave the caller's copy alone."""
+        task = task_service.create_task("Versioned", sample_project.id)
+        updated = task_service.update_task_status(task.id, TaskStatus.DOING.value)
+
+        assert updated.version == 2
+        assert task.status == TaskStatus.TODO.value
+        assert task_service.get_task(task.id) == updated
+
+    def test_update_with_stale_version(self, task_service, sample_project):
+        """Test that an update based on an old version is rejected."""
+        original = task_service.create_task("Versioned", sample_project.id)
+        task_service.update_task(original.id, title="First", expected_version=1)
+
+        with pytest.raises(VersionConflictError) as excinfo:
+            task_service.update_task(original.id, title="Second", expected_version=1)
+
+        assert excinfo.value.actual_version == 2
+        assert task_service.get_task(original.id).title == "First"
+
+    def test_concurrent_modifications_are_kept(self, task_service, sample_project):
+        """Test that concurrent read-modify-write updates do not lose changes."""
+        original = task_service.create_task("Versioned", sample_project.id)
+
+        def append(word):
+            task_service.modify_task(
+                original.id,
+                lambda task: task.update_details(description=f"{task.description} {word}".strip()),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(append, (f"w{i}" for i in range(40))))
+
+        task = task_service.get_task(original.id)
+        assert sorted(task.description.split()) == sorted(f"w{i}" for i in range(40))
+        assert task.version == 41
@@ -0,0 +1,158 @@
+"""
+Unit tests for streaming import and export.
+"""
+
+import io
+import json
+import pytest
+from src.todolist.config import settings
+from src.todolist.repositories.project_repository import ProjectRepository
+from src.todolist.repositories.task_repository import TaskRepository
+from src.todolist.services.project_service import ProjectService
+from src.todolist.services.task_service import TaskService
+from src.todolist.services.transfer import DataTransfer, format_for_path, iter_lines
+from src.todolist.utils.exceptions import ValidationError
+
+
+@pytest.fixture
+def transfer(project_service, task_service):
+    """Provide a DataTransfer on in-memory services."""
+    return DataTransfer(project_service, task_service)
+
+
+class TestDataTransfer:
+    """Test suite for DataTransfer."""
+
+    def test_export_ndjson_and_csv(self, transfer, project_service, task_service):
+        """Test exporting one record per line in both formats."""
+        project = project_service.create_project("Launch", "Q3")
+        task_service.create_task("Write post", project.id, description='Say "hi", twice')
+
+        ndjson, csv_output = io.StringIO(), io.StringIO()
+        assert transfer.export_tasks(ndjson) == 1
+        assert transfer.export_tasks(csv_output, "csv") == 1
+
+        assert json.loads(ndjson.getvalue())["description"] == 'Say "hi", twice'
+        lines = csv_output.getvalue().splitlines()
+        assert lines[0] == "id,project_id,title,description,status,deadline,created_at,updated_at,version"
+        assert lines[1].startswith('1,1,Write post,"Say ""hi"", twice",TODO,,')
+
+    def test_export_compact_models(self):
+        """Test exporting tasks and projects stored as compact objects."""
+        task_repo = TaskRepository(compact_models=True)
+        project_service = ProjectService(ProjectRepository(compact_models=True), task_repo)
+        task_service = TaskService(task_repo)
+        project = project_service.create_project("Launch")
+        task = task_service.create_task("Write post", project.id)
+        transfer = DataTransfer(project_service, task_service)
+
+        projects, tasks = io.StringIO(), io.StringIO()
+        transfer.export_projects(projects)
+        transfer.export_tasks(tasks)
+
+        assert json.loads(projects.getvalue()) == project.to_project().to_dict()
+        assert json.loads(tasks.getvalue()) == task.to_task().to_dict()
+
+    def test_export_is_lazy(self):
+        """Test that lines are produced as records are consumed."""
+        def records():
+            yield {"id": 1}
+            raise AssertionError("read past the first record")
+
+        lines = iter_lines(records(), ("id",), "csv")
+
+        assert next(lines) == "id\n1\n"
+
+    def test_round_trip(self, transfer, project_service, task_service):
+        """Test that exported projects and tasks import into an empty store."""
+        project_service.create_project("Launch")
+        project_service.create_project("Cleanup", "Old stuff")
+        task_service.create_task("Write post", 1, status="DOING")
+        task_service.create_task("Archive", 2, deadline=None)
+        projects, tasks = io.StringIO(), io.StringIO()
+        transfer.export_projects(projects, "csv")
+        transfer.export_tasks(tasks)
+        for project in project_service.get_all_projects():
+            project_service.delete_project(project.id)
+
+        project_result = transfer.import_projects(io.StringIO(projects.getvalue()), "csv")
+        # Projects get new IDs, so point the tasks at them
+        renumbered = tasks.getvalue().replace('"project_id":1', '"project_id":3').replace(
+            '"project_id":2', '"project_id":4'
+        )
+        task_result = transfer.import_tasks(io.StringIO(renumbered))
+
+        assert project_result["imported"] == 2
+        assert task_result["imported"] == 2
+        assert [project.title for project in project_service.get_all_projects()] == [
+            "Launch", "Cleanup"
+        ]
+        assert [(task.title, task.project_id, task.status) for task in task_service.get_all_tasks()] == [
+            ("Write post", 3, "DOING"), ("Archive", 4, "TODO")
+        ]
+
+    def test_rejects_and_progress(self, transfer, project_service, task_service):
+        """Test that bad rows go to the reject stream and progress is reported per chunk."""
+        project_service.create_project("Launch")
+        source = io.StringIO("\n".join([
+            json.dumps({"project_id": 1, "title": "Good 1"}),
+            "not json",
+            json.dumps({"project_id": 9, "title": "Unknown project"}),
+            "",
+            json.dumps({"project_id": 1, "title": ""}),
+            json.dumps({"project_id": 1, "title": "Good 2", "status": "LATER"}),
+            json.dumps({"project_id": "x", "title": "Bad id"}),
+            json.dumps({"project_id": 1, "title": "Good 3", "deadline": "soon"}),
+            json.dumps({"project_id": 1, "title": "Good 4", "deadline": "2099-01-01T09:00"}),
+        ]))
+        rejects = io.StringIO()
+        progress = []
+
+        result = transfer.import_tasks(
+            source, rejects=rejects, chunk_size=3,
+            progress=lambda rows, rate: progress.append(rows),
+        )
+
+        rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+        assert result["rows"] == 8
+        assert result["imported"] == 2
+        assert result["rejected"] == 6
+        assert [row["line"] for row in rejected] == [2, 3, 5, 6, 7, 8]
+        assert rejected[0]["row"] == "not json"
+        assert "not found" in rejected[1]["error"]
+        assert progress == [3, 6, 8]
+        assert [task.title for task in task_service.get_all_tasks()] == ["Good 1", "Good 4"]
+
+    def test_chunk_over_limit_is_rejected(self, transfer, project_service, monkeypatch):
+        """Test that a chunk over the limit is rejected while later chunks still load."""
+        monkeypatch.setattr(settings, "max_number_of_project", 3)
+        source = io.StringIO("title\n" + "".join(f"Project {i}\n" for i in range(5)))
+        rejects = io.StringIO()
+
+        result = transfer.import_projects(source, "csv", rejects, chunk_size=2)
+
+        rejected = [json.loads(line) for line in rejects.getvalue().splitlines()]
+        assert result["imported"] == 3
+        assert [row["line"] for row in rejected] == [4, 5]
+        assert all("limit" in row["error"] for row in rejected)
+
+    def test_large_import_in_chunks(self, transfer, project_service, task_service, monkeypatch):
+        """Test importing more rows than fit in one chunk."""
+        monkeypatch.setattr(settings, "max_number_of_task", 10_000)
+        project_service.create_project("Bulk")
+        source = io.StringIO("project_id,title\n" + "".join(f"1,Task {i}\n" for i in range(5000)))
+
+        result = transfer.import_tasks(source, "csv", chunk_size=1000)
+
+        assert result["imported"] == 5000
+        assert task_service.count_tasks() == 5000
+        assert len(task_service.search("4999")) == 1
+
+    def test_formats(self, transfer):
+        """Test format detection and rejection of unknown formats."""
+        assert format_for_path("tasks.CSV") == "csv"
+        assert format_for_path("tasks.jsonl") == "ndjson"
+        with pytest.raises(ValidationError):
+            transfer.export_tasks(io.StringIO(), "xml")
+        with pytest.raises(ValidationError):
+            transfer.import_tasks(io.StringIO("{}"), "xml")
@@ -0,0 +1,129 @@
+"""
+Unit tests for ReadWriteLock and the thread-safe IDGenerator.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.todolist.utils.id_generator import id_generator
+from src.todolist.utils.locks import ReadWriteLock
+
+TIMEOUT = 5
+
+
+def _start(target) -> threading.Thread:
+    """Start a daemon thread running target."""
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestReadWriteLock:
+    """Test suite for ReadWriteLock."""
+
+    def test_readers_share_the_lock(self):
+        """Test that several threads hold the read lock at once."""
+        lock = ReadWriteLock()
+        barrier = threading.Barrier(3, timeout=TIMEOUT)
+
+        def read():
+            with lock.read():
+                barrier.wait()
+
+        threads = [_start(read) for _ in range(2)]
+        barrier.wait()
+        for thread in threads:
+            thread.join(TIMEOUT)
+
+        assert not barrier.broken
+
+    def test_writer_excludes_readers(self):
+        """Test that a reader waits until the writer releases the lock."""
+        lock = ReadWriteLock()
+        entered = threading.Event()
+
+        def read():
+            with lock.read():
+                entered.set()
+
+        lock.acquire_write()
+        thread = _start(read)
+        assert not entered.wait(0.1)
+        lock.release_write()
+        thread.join(TIMEOUT)
+
+        assert entered.is_set()
+
+    def test_waiting_writer_blocks_new_readers(self):
+        """Test that readers arriving after a waiting writer go after it."""
+        lock = ReadWriteLock()
+        order = []
+
+        def write():
+            with lock.write():
+                order.append("write")
+
+        def read():
+            with lock.read():
+                order.append("read")
+
+        lock.acquire_read()
+        writer = _start(write)
+        while not lock._waiting_writers:
+            pass
+        reader = _start(read)
+        assert order == []
+        lock.release_read()
+        writer.join(TIMEOUT)
+        reader.join(TIMEOUT)
+
+        assert order == ["write", "read"]
+
+    def test_waiting_readers_go_before_next_writer(self):
+        """Test that readers waiting on a writer are not overtaken by the next one."""
+        lock = ReadWriteLock()
+        order = []
+
+        def read():
+            with lock.read():
+                order.append("read")
+
+        lock.acquire_write()
+        reader = _start(read)
+        while not lock._waiting_readers:
+            pass
+        lock.release_write()
+        with lock.write():
+            order.append("write")
+        reader.join(TIMEOUT)
+
+        assert order == ["read", "write"]
+
+    def test_write_lock_is_reentrant(self):
+        """Test that the writer may take the write and read locks again."""
+        lock = ReadWriteLock()
+
+        with lock.write():
+            with lock.write():
+                with lock.read():
+                    assert lock.owns_write()
+            assert lock.owns_write()
+
+        assert not lock.owns_write()
+
+
+class TestIDGeneratorThreadSafety:
+    """Test suite for concurrent ID allocation."""
+
+    def test_concurrent_ids_are_unique(self):
+        """Test that IDs generated from many threads never repeat."""
+        def allocate(_):
+            ids = [id_generator.generate("task") for _ in range(500)]
+            ids.extend(id_generator.generate_block("task", 50))
+            return ids
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            batches = list(executor.map(allocate, range(16)))
+
+        ids = [task_id for batch in batches for task_id in batch]
+        assert len(set(ids)) == len(ids) == 16 * 550
+        assert id_generator.get_current("task") == len(ids)
@@ -0,0 +1,157 @@
+"""
+Unit tests for call metrics and their Prometheus export.
+"""
+
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.todolist.utils.exceptions import ResourceNotFoundError
+from src.todolist.utils.metrics import (
+    LatencyHistogram,
+    MetricsRegistry,
+    exporting,
+    instrument,
+    serve_prometheus,
+)
+
+
+@pytest.fixture
+def metrics():
+    """Provide an empty registry."""
+    return MetricsRegistry()
+
+
+class TestLatencyHistogram:
+    """Test suite for LatencyHistogram."""
+
+    def test_percentiles_are_within_bucket_precision(self):
+        """Test that percentiles are close to the exact values at every scale."""
+        histogram = LatencyHistogram()
+        values = [value * 1_000 for value in range(1, 10_001)]
+        for value in values:
+            histogram.record(value)
+
+        assert histogram.count == 10_000
+        assert histogram.max == 10_000_000
+        for fraction in (0.5, 0.9, 0.99):
+            exact = values[int(fraction * len(values)) - 1]
+            assert abs(histogram.percentile(fraction) - exact) <= exact * 0.035
+
+    def test_small_values_are_exact(self):
+        """Test that values below the linear range keep their own bucket."""
+        histogram = LatencyHistogram()
+        for value in (3, 3, 7, 40):
+            histogram.record(value)
+
+        assert histogram.percentile(0.5) == 3
+        assert histogram.percentile(1.0) == 40
+        assert histogram.cumulative_counts((2, 3, 39, 100)) == [0, 2, 3, 4]
+        assert LatencyHistogram().percentile(0.99) == 0
+
+
+class TestInstrument:
+    """Test suite for instrument and MetricsRegistry."""
+
+    def test_records_calls_and_errors(self, metrics, project_service, task_service):
+        """Test that calls are counted and errors are counted by class."""
+        instrument(task_service, "task_service", metrics)
+        project_service.create_project("Launch")
+        task_service.create_task("Write post", 1)
+        task_service.get_task(1)
+        with pytest.raises(ResourceNotFoundError):
+            task_service.get_task(99)
+
+        operations = {row["operation"]: row for row in metrics.snapshot()}
+        assert operations["task_service.get_task"]["calls"] == 2
+        assert operations["task_service.get_task"]["errors"] == {"ResourceNotFoundError": 1}
+        assert operations["task_service.create_task"]["calls"] == 1
+        assert operations["task_service.create_task"]["p99_us"] > 0
+        # Only called operations are listed, and private methods are not wrapped
+        assert "task_service.delete_task" not in operations
+        assert not any(name.startswith("task_service._") for name in operations)
+
+    def test_repositories_are_recorded_under_services(
+        self, metrics, project_service, task_repo, task_service
+    ):
+        """Test that an instrumented repository records the calls services make."""
+        instrument(task_repo, "task_repository", metrics)
+        instrument(task_repo, "task_repository", metrics)
+        project_service.create_project("Launch")
+        task_service.create_task("Write post", 1)
+
+        operations = {row["operation"]: row["calls"] for row in metrics.snapshot()}
+        assert operations["task_repository.add"] == 1
+
+    def test_threads_record_independently(self, metrics):
+        """Test that calls recorded from several threads are all merged."""
+        operation = metrics.operation("task_service.get_task")
+
+        def record(thread: int) -> None:
+            for _ in range(1000):
+                operation.record(1_000 * (thread + 1), "ValidationError" if thread == 0 else None)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(record, range(4)))
+
+        assert operation.calls == 4000
+        assert operation.errors == {"ValidationError": 1000}
+        assert operation.histogram.max == 4_000
+        assert operation.histogram.percentile(0.5) == pytest.approx(2_000, rel=0.035)
+
+    def test_paused_registry_records_nothing(self, metrics, project_service):
+        """Test that clearing enabled stops recording, and reset clears counts."""
+        instrument(project_service, "project_service", metrics)
+        project_service.create_project("Launch")
+        metrics.enabled = False
+        project_service.create_project("Cleanup")
+
+        assert metrics.snapshot()[0]["calls"] == 1
+        metrics.reset()
+        assert metrics.snapshot() == []
+        metrics.enabled = True
+        project_service.count_projects()
+        assert [row["operation"] for row in metrics.snapshot()] == ["project_service.count_projects"]
+
+
+class TestPrometheusExport:
+    """Test suite for the Prometheus text format export."""
+
+    def test_text_format(self, metrics):
+        """Test counters, error counters and cumulative histogram buckets."""
+        operation = metrics.operation("task_service.get_task")
+        operation.record(800)
+        operation.record(3_000_000, "ResourceNotFoundError")
+
+        lines = metrics.to_prometheus().splitlines()
+
+        assert "# TYPE todolist_calls_total counter" in lines
+        assert 'todolist_calls_total{operation="task_service.get_task"} 2' in lines
+        assert (
+            'todolist_errors_total{operation="task_service.get_task",'
+            'error="ResourceNotFoundError"} 1'
+        ) in lines
+        assert 'todolist_call_duration_seconds_bucket{operation="task_service.get_task",le="1e-06"} 1' in lines
+        assert 'todolist_call_duration_seconds_bucket{operation="task_service.get_task",le="0.0025"} 1' in lines
+        assert 'todolist_call_duration_seconds_bucket{operation="task_service.get_task",le="0.005"} 2' in lines
+        assert 'todolist_call_duration_seconds_count{operation="task_service.get_task"} 2' in lines
+        assert 'todolist_call_duration_seconds_sum{operation="task_service.get_task"} 0.003000800' in lines
+
+    def test_exporting_to_file_and_port(self, metrics, tmp_path):
+        """Test serving metrics during a block and writing them when it ends."""
+        path = tmp_path / "todolist.prom"
+        metrics.operation("task_service.count_tasks").record(1_000)
+
+        with exporting(port=0, path=str(path), metrics=metrics):
+            assert not path.exists()
+        assert "todolist_calls_total" in path.read_text()
+
+        server = serve_prometheus(0, metrics=metrics)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode()
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+        finally:
+            server.shutdown()
+            server.server_close()
+        assert 'todolist_calls_total{operation="task_service.count_tasks"} 1' in body
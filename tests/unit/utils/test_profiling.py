@@ -0,0 +1,97 @@
+"""
+Unit tests for sampled CPU and memory profiling.
+"""
+
+import io
+import os
+import pstats
+import pytest
+from src.todolist.cli.batch import BatchRunner
+from src.todolist.utils.profiling import Profiler
+
+
+def _files(directory) -> list[str]:
+    """Return the sorted file names in a directory, or [] if it is missing."""
+    return sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+
+
+class TestProfiler:
+    """Test suite for Profiler."""
+
+    def test_cpu_profile_is_saved_as_pstats(self, tmp_path):
+        """Test that a profiled block leaves a loadable .pstats file."""
+        profiler = Profiler("cpu", str(tmp_path))
+
+        with profiler.profile("task_service.search"):
+            sorted(range(10_000), key=lambda value: -value)
+
+        [name] = _files(tmp_path)
+        assert name == f"task_service.search.{os.getpid()}.1.pstats"
+        stats = pstats.Stats(str(tmp_path / name))
+        assert any(function[2] == "<lambda>" for function in stats.stats)
+
+    def test_only_one_call_in_n_is_profiled(self, tmp_path):
+        """Test sampling per name, starting with the first call."""
+        profiler = Profiler("cpu", str(tmp_path), sample_every=3)
+
+        for _ in range(7):
+            with profiler.profile("cli.list_projects"):
+                pass
+        with profiler.profile("cli.search_tasks"):
+            pass
+
+        calls = [name.split(".")[-2] for name in _files(tmp_path) if name.startswith("cli.list")]
+        assert sorted(calls, key=int) == ["1", "4", "7"]
+        assert len(_files(tmp_path)) == 4
+
+    def test_memory_report_lists_allocations(self, tmp_path):
+        """Test that a mem profile reports the lines that allocated."""
+        profiler = Profiler("mem", str(tmp_path), top=5)
+        retained = []
+
+        with profiler.profile("task_service.create_tasks"):
+            retained.append([str(value) * 10 for value in range(20_000)])
+
+        [name] = _files(tmp_path)
+        lines = (tmp_path / name).read_text().splitlines()
+        assert name.endswith(".1.txt")
+        assert lines[0].startswith("# task_service.create_tasks call 1: +")
+        assert "test_profiling.py" in lines[1]
+        assert len(lines) <= 6
+
+    def test_profiles_do_not_nest(self, tmp_path, project_service):
+        """Test that calls made inside a profiled call get no profile of their own."""
+        profiler = Profiler("cpu", str(tmp_path))
+        profiler.wrap(project_service, "project_service")
+
+        with profiler.profile("cli.create_project"):
+            project_service.create_project("Launch")
+        project_service.count_projects()
+
+        assert [name.split(".")[1] for name in _files(tmp_path)] == [
+            "create_project", "count_projects"
+        ]
+
+    def test_off_profiles_nothing(self, tmp_path, project_service):
+        """Test that the default profiler writes nothing and wraps nothing."""
+        profiler = Profiler(directory=str(tmp_path / "profiles"))
+        create_project = project_service.create_project
+
+        assert profiler.wrap(project_service, "project_service") is project_service
+        with profiler.profile("cli.create_project"):
+            project_service.create_project("Launch")
+
+        assert project_service.create_project == create_project
+        assert _files(tmp_path / "profiles") == []
+        with pytest.raises(ValueError):
+            Profiler("io")
+
+    def test_batch_commands_are_profiled(self, tmp_path, project_service, task_service):
+        """Test that each batch command gets its own profile."""
+        runner = BatchRunner(project_service, task_service, profiler=Profiler("cpu", str(tmp_path)))
+
+        runner.run(io.StringIO("project.create title=Launch\nstats\n"), io.StringIO())
+
+        assert [name.split(f".{os.getpid()}")[0] for name in _files(tmp_path)] == [
+            "batch.project.create", "batch.stats"
+        ]